@@ -4,28 +4,27 @@ ClaudeChain - GitHub Actions Helper Script
 
 Entry point for the ClaudeChain automation tool.
 Run with: python3 -m claudechain <command>
+
+Each workflow step runs a single subcommand, so command modules (and the
+services they pull in) are imported inside their dispatch branch rather than
+at module level. Keep top-level imports to the parser, constants and GitHub
+Actions helpers; tests/unit/cli/test_startup.py enforces the startup budget.
 """
 
 import os
 import sys
 
-from claudechain.cli.commands.auto_start import cmd_auto_start, cmd_auto_start_summary
-from claudechain.cli.commands.create_artifact import cmd_create_artifact
-from claudechain.cli.commands.discover import main as cmd_discover
-from claudechain.cli.commands.discover_ready import main as cmd_discover_ready
-from claudechain.cli.commands.finalize import cmd_finalize
-from claudechain.cli.commands.format_slack_notification import cmd_format_slack_notification
-from claudechain.cli.commands.parse_claude_result import cmd_parse_claude_result
-from claudechain.cli.commands.parse_event import main as cmd_parse_event
-from claudechain.cli.commands.post_pr_comment import cmd_post_pr_comment
-from claudechain.cli.commands.prepare import cmd_prepare
-from claudechain.cli.commands.prepare_summary import cmd_prepare_summary
-from claudechain.cli.commands.run_action_script import cmd_run_action_script
-from claudechain.cli.commands.setup import cmd_setup
-from claudechain.cli.commands.statistics import cmd_statistics
 from claudechain.cli.parser import create_parser
-from claudechain.domain.constants import DEFAULT_ALLOWED_TOOLS, DEFAULT_BASE_BRANCH
+from claudechain.domain.constants import (
+    DEFAULT_ALLOWED_TOOLS,
+    DEFAULT_BASE_BRANCH,
+    DEFAULT_POOL_MAX_TASKS,
+    DEFAULT_POOL_MEMORY_PER_TASK_MB,
+    DEFAULT_STATS_MAX_WORKERS,
+)
 from claudechain.infrastructure.github.actions import GitHubActionsHelper
+from claudechain.infrastructure.github.rate_limiter import get_rate_limiter
+from claudechain.infrastructure.tracing.tracer import get_trace_file, get_tracer
 
 
 def main():
@@ -40,13 +39,50 @@ def main():
     # Initialize GitHub Actions helper
     gh = GitHubActionsHelper()
 
-    # Route to appropriate command handler
+    tracer = get_tracer()
+    try:
+        with tracer.span(f"claudechain {args.command}", "command"):
+            return _run_command(args, gh)
+    finally:
+        # Report the GitHub API budget this command consumed
+        budget = get_rate_limiter().budget
+        if budget.requests:
+            print(budget.format_line(args.command))
+        _write_trace(args.command, gh)
+
+
+def _write_trace(command: str, gh: GitHubActionsHelper) -> None:
+    """Append this command's spans to the trace file and summarize the slowest calls
+
+    Does nothing unless CLAUDECHAIN_TRACE_FILE is set; failures are logged, not raised.
+    """
+    trace_file = get_trace_file()
+    if not trace_file:
+        return
+
+    tracer = get_tracer()
+    try:
+        tracer.append_chrome_trace(trace_file, f"claudechain {command}")
+    except OSError as e:
+        print(f"Warning: Failed to write trace file {trace_file}: {e}")
+        return
+
+    slowest = tracer.format_slowest_summary()
+    if slowest:
+        gh.write_step_summary(f"{slowest}\n")
+
+
+def _run_command(args, gh: GitHubActionsHelper) -> int:
+    """Route parsed arguments to the command handler and return its exit code"""
     if args.command == "discover":
+        from claudechain.cli.commands.discover import main as cmd_discover
         cmd_discover()
         return 0
     elif args.command == "discover-ready":
+        from claudechain.cli.commands.discover_ready import main as cmd_discover_ready
         return cmd_discover_ready()
     elif args.command == "prepare":
+        from claudechain.cli.commands.prepare import cmd_prepare
         # Use env var if set and non-empty, otherwise fall back to constant
         env_allowed_tools = os.environ.get("CLAUDE_ALLOWED_TOOLS", "")
         return cmd_prepare(
@@ -56,8 +92,10 @@ def main():
             default_pr_labels=os.environ.get("PR_LABELS", "")
         )
     elif args.command == "finalize":
+        from claudechain.cli.commands.finalize import cmd_finalize
         return cmd_finalize(args, gh)
     elif args.command == "prepare-summary":
+        from claudechain.cli.commands.prepare_summary import cmd_prepare_summary
         return cmd_prepare_summary(
             gh=gh,
             pr_number=os.environ.get("PR_NUMBER", ""),
@@ -68,6 +106,7 @@ def main():
             base_branch=os.environ.get("BASE_BRANCH", "")
         )
     elif args.command == "post-pr-comment":
+        from claudechain.cli.commands.post_pr_comment import cmd_post_pr_comment
         return cmd_post_pr_comment(
             gh=gh,
             pr_number=os.environ.get("PR_NUMBER", "").strip(),
@@ -79,6 +118,7 @@ def main():
             task=os.environ.get("TASK_DESCRIPTION", ""),
         )
     elif args.command == "create-artifact":
+        from claudechain.cli.commands.create_artifact import cmd_create_artifact
         return cmd_create_artifact(
             gh=gh,
             cost_breakdown_json=os.environ.get("COST_BREAKDOWN", ""),
@@ -90,8 +130,10 @@ def main():
             branch_name=os.environ.get("BRANCH_NAME", ""),
             assignee=os.environ.get("ASSIGNEE", ""),
             run_id=os.environ.get("GITHUB_RUN_ID", ""),
+            batch_prs_json=os.environ.get("BATCH_PRS", ""),
         )
     elif args.command == "format-slack-notification":
+        from claudechain.cli.commands.format_slack_notification import cmd_format_slack_notification
         return cmd_format_slack_notification(
             gh=gh,
             pr_number=os.environ.get("PR_NUMBER", ""),
@@ -103,18 +145,16 @@ def main():
             assignee=os.environ.get("ASSIGNEE", ""),
         )
     elif args.command == "statistics":
-        # Read workflow_file - required for artifact discovery
-        workflow_file = os.environ.get("INPUT_WORKFLOW_FILE", "")
-        if not workflow_file:
-            print("Error: workflow_file input is required for statistics")
-            return 1
+        from claudechain.cli.commands.statistics import cmd_statistics
+        # workflow_file is deprecated: artifacts are discovered from the repo-wide listing
+        if os.environ.get("INPUT_WORKFLOW_FILE"):
+            print("Warning: the workflow_file input is deprecated and ignored")
 
         # Use env var if set and non-empty, otherwise fall back to constant
         env_base_branch = args.base_branch or os.environ.get("BASE_BRANCH", "")
         return cmd_statistics(
             gh=gh,
             repo=args.repo or os.environ.get("GITHUB_REPOSITORY", ""),
-            workflow_file=workflow_file,
             base_branch=env_base_branch if env_base_branch else DEFAULT_BASE_BRANCH,
             config_path=args.config_path or os.environ.get("CONFIG_PATH"),
             days_back=args.days_back or int(os.environ.get("STATS_DAYS_BACK", "30")),
@@ -122,8 +162,10 @@ def main():
             slack_webhook_url=os.environ.get("SLACK_WEBHOOK_URL", ""),
             show_assignee_stats=args.show_assignee_stats or os.environ.get("SHOW_ASSIGNEE_STATS", "").lower() == "true",
             run_url=os.environ.get("GITHUB_RUN_URL", ""),
+            max_workers=args.max_workers or int(os.environ.get("STATS_MAX_WORKERS") or DEFAULT_STATS_MAX_WORKERS),
         )
     elif args.command == "auto-start":
+        from claudechain.cli.commands.auto_start import cmd_auto_start
         # Parse auto_start_enabled from argument or environment variable
         # Default to True if not set. Convert string "false" to boolean False.
         auto_start_enabled_str = getattr(args, 'auto_start_enabled', None)
@@ -144,29 +186,50 @@ def main():
             auto_start_enabled=auto_start_enabled,
         )
     elif args.command == "auto-start-summary":
+        from claudechain.cli.commands.auto_start import cmd_auto_start_summary
         return cmd_auto_start_summary(
             gh=gh,
             triggered_projects=args.triggered_projects or os.environ.get("TRIGGERED_PROJECTS", ""),
             failed_projects=args.failed_projects or os.environ.get("FAILED_PROJECTS", ""),
         )
     elif args.command == "parse-claude-result":
+        from claudechain.cli.commands.parse_claude_result import cmd_parse_claude_result
         return cmd_parse_claude_result(
             gh=gh,
             execution_file=os.environ.get("EXECUTION_FILE", ""),
             result_type=os.environ.get("RESULT_TYPE", "main"),
         )
     elif args.command == "run-action-script":
+        from claudechain.cli.commands.run_action_script import cmd_run_action_script
         return cmd_run_action_script(
             gh=gh,
             script_type=args.type,
             project_path=args.project_path,
             working_directory=os.getcwd(),
         )
+    elif args.command == "run-pool":
+        from claudechain.cli.commands.run_pool import cmd_run_pool
+        env_max_workers = args.max_workers or os.environ.get("POOL_MAX_WORKERS")
+        return cmd_run_pool(
+            gh=gh,
+            projects=(args.projects or os.environ.get("POOL_PROJECTS", "")).split(),
+            base_branch=args.base_branch or os.environ.get("BASE_BRANCH") or DEFAULT_BASE_BRANCH,
+            max_workers=int(env_max_workers) if env_max_workers else None,
+            max_tasks=args.max_tasks or int(os.environ.get("POOL_MAX_TASKS") or DEFAULT_POOL_MAX_TASKS),
+            memory_per_task_mb=args.memory_per_task_mb or int(
+                os.environ.get("POOL_MEMORY_PER_TASK_MB") or DEFAULT_POOL_MEMORY_PER_TASK_MB
+            ),
+            worktree_root=args.worktree_root or os.environ.get("POOL_WORKTREE_ROOT", ""),
+            claude_command=os.environ.get("CLAUDE_COMMAND") or "claude",
+            claude_model=os.environ.get("CLAUDE_MODEL", ""),
+        )
     elif args.command == "parse-event":
+        from claudechain.cli.commands.parse_event import main as cmd_parse_event
         # parse-event reads from environment variables
         # This allows it to work with the action.yml which sets env vars
         return cmd_parse_event()
     elif args.command == "setup":
+        from claudechain.cli.commands.setup import cmd_setup
         return cmd_setup(repo_path=args.repo_path)
     else:
         gh.set_error(f"Unknown command: {args.command}")
@@ -1,5 +1,15 @@
-"""ClaudeChain command handlers"""
+"""ClaudeChain command handlers
 
-from .auto_start import cmd_auto_start, cmd_auto_start_summary
+Command modules are imported on first attribute access so that importing one
+command (e.g. from `python -m claudechain`) does not load every other one.
+"""
 
 __all__ = ["cmd_auto_start", "cmd_auto_start_summary"]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        from . import auto_start
+
+        return getattr(auto_start, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
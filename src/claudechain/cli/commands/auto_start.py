@@ -27,9 +27,11 @@ def cmd_auto_start(
 
     This command orchestrates the auto-start workflow:
     1. Detect changed spec.md files
-    2. Determine which projects are new (no existing PRs)
+    2. Determine which projects are new (no existing PRs), from one listing
+       of open PRs that step 3 reuses
     3. Make auto-trigger decisions based on business logic
-    4. Trigger ClaudeChain workflows for approved projects
+    4. Trigger ClaudeChain workflows for approved projects, several at a
+       time under the WorkflowService dispatch budget
 
     GitHub Actions outputs:
         triggered_projects: Space-separated list of successfully triggered projects
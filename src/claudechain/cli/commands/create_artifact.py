@@ -12,7 +12,8 @@ from datetime import datetime, timezone
 
 from claudechain.domain.cost_breakdown import CostBreakdown
 from claudechain.domain.formatting import format_usd
-from claudechain.domain.models import AITask, TaskMetadata
+from claudechain.domain.models import AITask, BatchTaskCost, TaskMetadata
+from claudechain.domain.task_batch import allocate_cost
 from claudechain.infrastructure.github.actions import GitHubActionsHelper
 
 
@@ -27,6 +28,7 @@ def cmd_create_artifact(
     branch_name: str,
     assignee: str,
     run_id: str,
+    batch_prs_json: str = "",
 ) -> int:
     """
     Create TaskMetadata artifact with cost data for statistics.
@@ -44,6 +46,8 @@ def cmd_create_artifact(
         branch_name: Branch name
         assignee: Assignee username
         run_id: Workflow run ID
+        batch_prs_json: JSON array of the PRs finalize created in batch mode
+            (empty for a single task); the session's cost is split across them
 
     Outputs:
         artifact_path: Path to the created artifact file (if created)
@@ -113,6 +117,22 @@ def cmd_create_artifact(
                 tokens_output=summary_output_tokens,
             ))
 
+        # Batch mode: attribute the session's cost to each task's PR by lines changed
+        batch_tasks = []
+        batch_prs = json.loads(batch_prs_json) if batch_prs_json.strip() else []
+        if len(batch_prs) > 1:
+            shares = allocate_cost(cost_breakdown.total_cost, [pr.get("lines_changed", 0) for pr in batch_prs])
+            for pr, share in zip(batch_prs, shares):
+                batch_tasks.append(BatchTaskCost(
+                    task_index=int(pr["task_index"]),
+                    task_description=pr["task_description"],
+                    task_hash=pr["task_hash"],
+                    pr_number=int(pr["pr_number"]),
+                    branch_name=pr["branch_name"],
+                    cost_usd=share,
+                    lines_changed=int(pr.get("lines_changed", 0)),
+                ))
+
         # Create TaskMetadata
         metadata = TaskMetadata(
             task_index=int(task_index),
@@ -125,6 +145,8 @@ def cmd_create_artifact(
             pr_number=int(pr_number),
             pr_state="open",
             ai_tasks=ai_tasks,
+            batch_tasks=batch_tasks,
+            cache_usage=cost_breakdown.get_cache_usage_by_model(),
         )
 
         # Write to temp file
@@ -138,6 +160,11 @@ def cmd_create_artifact(
         print(f"✅ Created task metadata artifact: {artifact_filename}")
         print(f"   - Total cost: {format_usd(metadata.get_total_cost())}")
         print(f"   - AI tasks: {len(ai_tasks)}")
+        cache_usage = cost_breakdown.cache_usage
+        if cache_usage.prompt_tokens:
+            print(f"   - Prompt cache: {cache_usage.hit_ratio:.0%} hit ratio, {format_usd(cache_usage.savings_usd)} saved (net of cache writes)")
+        for batch_task in batch_tasks:
+            print(f"   - PR #{batch_task.pr_number}: {format_usd(batch_task.cost_usd)} ({batch_task.task_description})")
 
         gh.write_output("artifact_path", artifact_path)
         gh.write_output("artifact_name", artifact_name)
@@ -3,20 +3,39 @@
 Orchestrates Service Layer classes to coordinate project discovery workflow.
 This command instantiates services and coordinates their operations but
 does not implement business logic directly.
+
+All projects share one set of services: open ClaudeChain PRs are fetched
+once and partitioned by project, so checking N projects costs a constant
+number of GitHub API calls instead of two per project.
 """
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
 
 from claudechain.cli.commands.discover import find_all_projects
-from claudechain.domain.config import validate_spec_format
+from claudechain.domain.config import validate_spec_format_from_string
+from claudechain.domain.constants import DEFAULT_DISCOVER_MAX_WORKERS, DEFAULT_PR_LABEL
+from claudechain.domain.exceptions import GitHubAPIError
+from claudechain.domain.github_models import GitHubPullRequest
 from claudechain.domain.project import Project
+from claudechain.domain.project_configuration import ProjectConfiguration
+from claudechain.domain.spec_content import SpecContent
 from claudechain.infrastructure.github.actions import GitHubActionsHelper
+from claudechain.infrastructure.tracing.tracer import in_current_context
 from claudechain.services.core.assignee_service import AssigneeService
+from claudechain.services.core.pr_service import PRService
 from claudechain.services.core.task_service import TaskService
 
 
-def check_project_ready(project_name: str, repo: str) -> bool:
+def check_project_ready(
+    project_name: str,
+    repo: str,
+    assignee_service: Optional[AssigneeService] = None,
+    task_service: Optional[TaskService] = None,
+    open_prs: Optional[List[GitHubPullRequest]] = None,
+) -> bool:
     """Orchestrate project readiness check using Service Layer classes.
 
     This function instantiates services and coordinates their operations but
@@ -25,39 +44,70 @@ def check_project_ready(project_name: str, repo: str) -> bool:
     A project is ready if:
     1. spec.md exists (required)
     2. Spec format is valid (contains checklist items)
-    3. Has capacity (only 1 open PR per project allowed)
-    4. Has available tasks
+    3. Has capacity (fewer open PRs than the project's maxOpenPRs, default 1)
+    4. Has a task whose prerequisites are completed
 
     Configuration is optional - projects without configuration.yml use default settings.
 
     Args:
         project_name: Name of the project to check
         repo: GitHub repository (owner/name)
+        assignee_service: Optional shared AssigneeService (created when omitted)
+        task_service: Optional shared TaskService (created when omitted)
+        open_prs: Optional pre-fetched open PRs of the project; when omitted
+            they are queried from GitHub
 
     Returns:
         True if project is ready for work, False otherwise
     """
+    ready, message = evaluate_project(project_name, repo, assignee_service, task_service, open_prs)
+    print(message)
+    return ready
+
+
+def evaluate_project(
+    project_name: str,
+    repo: str,
+    assignee_service: Optional[AssigneeService] = None,
+    task_service: Optional[TaskService] = None,
+    open_prs: Optional[List[GitHubPullRequest]] = None,
+) -> Tuple[bool, str]:
+    """Check whether a project is ready and describe the outcome.
+
+    Same checks as check_project_ready(), but the outcome line is returned
+    rather than printed so concurrent checks can be reported in order.
+
+    Args:
+        project_name: Name of the project to check
+        repo: GitHub repository (owner/name)
+        assignee_service: Optional shared AssigneeService (created when omitted)
+        task_service: Optional shared TaskService (created when omitted)
+        open_prs: Optional pre-fetched open PRs of the project
+
+    Returns:
+        Tuple of (is ready, outcome line)
+    """
     try:
         # Create Project domain model
         project = Project(project_name)
 
-        # Check if spec.md exists (required)
-        if not os.path.exists(project.spec_path):
-            print(f"  ⏭️  No spec.md found")
-            return False
+        # Read spec.md once (required); it is validated and parsed from memory
+        try:
+            with open(project.spec_path, 'r') as f:
+                spec_content = f.read()
+        except FileNotFoundError:
+            return False, "  ⏭️  No spec.md found"
 
         # Validate spec format
         try:
-            validate_spec_format(project.spec_path)
+            validate_spec_format_from_string(spec_content, project.spec_path)
         except Exception as e:
-            print(f"  ⏭️  Invalid spec format: {str(e)}")
-            return False
+            return False, f"  ⏭️  Invalid spec format: {str(e)}"
 
         # Use single 'claudechain' label for all projects
-        label = "claudechain"
+        label = DEFAULT_PR_LABEL
 
         # Load configuration (optional - uses defaults if not found)
-        from claudechain.domain.project_configuration import ProjectConfiguration
         if os.path.exists(project.config_path):
             with open(project.config_path, 'r') as f:
                 config_content = f.read()
@@ -65,49 +115,46 @@ def check_project_ready(project_name: str, repo: str) -> bool:
         else:
             project_config = ProjectConfiguration.default(project)
 
-        # Initialize services
-        from claudechain.services.core.pr_service import PRService
-        pr_service = PRService(repo)
-        assignee_service = AssigneeService(repo, pr_service)
-        task_service = TaskService(repo, pr_service)
+        # Initialize services unless shared ones were passed in
+        if assignee_service is None or task_service is None:
+            pr_service = PRService(repo)
+            assignee_service = assignee_service or AssigneeService(repo, pr_service)
+            task_service = task_service or TaskService(repo, pr_service)
 
-        # Check capacity (only 1 open PR per project allowed)
+        # Check capacity (maxOpenPRs, 1 open PR by default)
         capacity_result = assignee_service.check_capacity(
-            project_config, label, project_name
+            project_config, label, project_name, open_prs=open_prs
         )
 
         if not capacity_result.has_capacity:
-            print(f"  ⏭️  Project at capacity (1 open PR limit)")
-            return False
+            return False, f"  ⏭️  Project at capacity ({capacity_result.max_open_prs} open PR limit)"
 
-        # Load spec and check for available tasks
-        with open(project.spec_path, 'r') as f:
-            spec_content = f.read()
-        from claudechain.domain.spec_content import SpecContent
+        # In-progress tasks are the task hashes of the open PRs just checked
         spec = SpecContent(project, spec_content)
+        in_progress_hashes = {
+            pr_info["task_hash"] for pr_info in capacity_result.open_prs if pr_info["task_hash"]
+        }
+        ready_tasks = task_service.find_ready_tasks(spec, in_progress_hashes, limit=1)
 
-        # Get in-progress tasks
-        in_progress_hashes = task_service.get_in_progress_tasks(label, project_name)
-        next_task = task_service.find_next_available_task(spec, in_progress_hashes)
-
-        if not next_task:
-            print(f"  ⏭️  No available tasks")
-            return False
+        if not ready_tasks:
+            return False, "  ⏭️  No available tasks"
 
         # Get stats for logging
         uncompleted = spec.pending_tasks
-        open_prs = len(capacity_result.open_prs)
+        open_count = capacity_result.open_count
 
-        print(f"  ✅ Ready for work ({open_prs}/1 PRs, {uncompleted} tasks remaining)")
-        return True
+        return True, f"  ✅ Ready for work ({open_count}/{capacity_result.max_open_prs} PRs, {uncompleted} tasks remaining)"
 
     except Exception as e:
-        print(f"  ❌ Error checking project: {str(e)}")
-        return False
+        return False, f"  ❌ Error checking project: {str(e)}"
 
 
-def main():
-    """Discover all projects ready for work and output as JSON array"""
+def main(max_workers: int = DEFAULT_DISCOVER_MAX_WORKERS):
+    """Discover all projects ready for work and output as JSON array
+
+    Args:
+        max_workers: Projects checked concurrently (1 = sequential)
+    """
     print("========================================================================")
     print("ClaudeChain Discovery Mode")
     print("========================================================================")
@@ -136,12 +183,38 @@ def main():
         gh.write_output("project_count", "0")
         return 0
 
+    # Shared services: one open-PR listing serves every project
+    pr_service = PRService(repo)
+    assignee_service = AssigneeService(repo, pr_service)
+    task_service = TaskService(repo, pr_service)
+
+    try:
+        open_prs_by_project = pr_service.get_open_prs_by_project(all_projects, label=DEFAULT_PR_LABEL)
+    except GitHubAPIError as e:
+        # Same fallback as a failed per-project query: treat projects as having no open PRs
+        print(f"Warning: Failed to list open PRs: {e}")
+        open_prs_by_project = {project: [] for project in all_projects}
+    print("")
+
     # Check each project for capacity and tasks
-    ready_projects = []
+    def evaluate(project: str) -> Tuple[bool, str]:
+        return evaluate_project(
+            project, repo, assignee_service, task_service, open_prs=open_prs_by_project[project]
+        )
 
-    for project in all_projects:
+    workers = max(1, min(max_workers, len(all_projects)))
+    if workers == 1:
+        results = [evaluate(project) for project in all_projects]
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="discover-ready") as executor:
+            # map() yields results in input order, keeping the output deterministic
+            results = list(executor.map(in_current_context(evaluate), all_projects))
+
+    ready_projects = []
+    for project, (ready, message) in zip(all_projects, results):
         print(f"Checking project: {project}")
-        if check_project_ready(project, repo):
+        print(message)
+        if ready:
             ready_projects.append(project)
 
     # Output results
@@ -8,6 +8,7 @@ import json
 import os
 from typing import Any
 
+from claudechain.domain.execution_log import find_last_record
 from claudechain.infrastructure.github.actions import GitHubActionsHelper
 
 
@@ -42,8 +43,8 @@ def cmd_parse_claude_result(
         return 0  # Not an error in the parsing itself
 
     try:
-        with open(execution_file, "r") as f:
-            execution_data = json.load(f)
+        # Stream the file and keep only the last record with structured output
+        execution_data = find_last_record(execution_file, _has_structured_output)
     except json.JSONDecodeError as e:
         print(f"Failed to parse execution file as JSON: {e}")
         gh.write_output("success", "false")
@@ -126,3 +127,18 @@ def _extract_structured_output(execution_data: Any) -> dict[str, Any] | None:
             return result["structured_output"]
 
     return None
+
+
+def _has_structured_output(record: Any) -> bool:
+    """Check whether an execution record carries structured_output.
+
+    Args:
+        record: One record of the execution file
+
+    Returns:
+        True if the record has structured_output directly or under result
+    """
+    if not isinstance(record, dict):
+        return False
+    result = record.get("result", {})
+    return "structured_output" in record or (isinstance(result, dict) and "structured_output" in result)
@@ -14,6 +14,8 @@ from claudechain.domain.config import validate_spec_format_from_string
 from claudechain.domain.constants import DEFAULT_BASE_BRANCH
 from claudechain.domain.exceptions import ConfigurationError, FileNotFoundError, GitError, GitHubAPIError
 from claudechain.domain.project import Project
+from claudechain.domain.task_batch import BatchTask, TaskBatch, commit_marker
+from claudechain.infrastructure.cache.run_state_store import get_run_state_store
 from claudechain.infrastructure.git.operations import run_git_command
 from claudechain.infrastructure.github.actions import GitHubActionsHelper
 from claudechain.infrastructure.github.operations import add_label_to_pr, ensure_label_exists
@@ -22,6 +24,13 @@ from claudechain.services.core.pr_service import PRService
 from claudechain.services.core.assignee_service import AssigneeService
 from claudechain.services.core.task_service import TaskService
 
+# Instructions shared by every prompt, kept first so Claude's prompt cache can serve them
+_PROMPT_INSTRUCTIONS = """You are completing tasks from the spec.md file below.
+
+Instructions: Read the entire spec.md file below to understand both WHAT to do and HOW to do it. Follow all guidelines and patterns specified in the document. The task to complete is named after the spec.
+
+"""
+
 
 def cmd_prepare(args: argparse.Namespace, gh: GitHubActionsHelper, default_allowed_tools: str, default_pr_labels: str) -> int:
     """Orchestrate preparation workflow using Service Layer classes.
@@ -47,6 +56,8 @@ def cmd_prepare(args: argparse.Namespace, gh: GitHubActionsHelper, default_allow
 
         # Initialize infrastructure
         project_repository = ProjectRepository(repo)
+        run_state_store = get_run_state_store()
+        run_state = run_state_store.load()
 
         # Initialize services
         pr_service = PRService(repo)
@@ -159,11 +170,29 @@ Please ensure your spec.md file exists and the checkout was successful."""
         gh.write_step_summary(summary)
         print("\n" + summary)
 
+        # Record what later steps would otherwise re-derive
+        if run_state_store.enabled:
+            run_state.project_name = project_name
+            run_state.base_branch = base_branch
+            run_state.spec_path = project.spec_path
+            run_state.spec_content = spec.content
+            run_state.base_sha = None  # Set once the branch is created
+            run_state_store.save(run_state)
+
+        # Tasks claimed by other worktrees of a run-pool run count as in progress
+        claimed_hashes = {h.strip() for h in os.environ.get("CLAIMED_TASK_HASHES", "").split(",") if h.strip()}
+        available_slots = capacity_result.available_slots
+        if claimed_hashes:
+            available_slots = max(available_slots - len(claimed_hashes), 0)
+            print(f"{len(claimed_hashes)} task(s) claimed by other worktrees, {available_slots} PR slot(s) left")
+
         # Check capacity
-        if not capacity_result.has_capacity:
+        if not capacity_result.has_capacity or (claimed_hashes and available_slots == 0):
             gh.write_output("has_capacity", "false")
             gh.write_output("assignee", "")
-            gh.set_notice("Project at capacity (1 open PR limit), skipping PR creation")
+            gh.set_notice(
+                f"Project at capacity ({capacity_result.max_open_prs} open PR limit), skipping PR creation"
+            )
             return 0  # Not an error, just no capacity
 
         gh.write_output("has_capacity", "true")
@@ -218,28 +247,71 @@ Please ensure your spec.md file exists and the checkout was successful."""
 
         # Get in-progress tasks
         in_progress_hashes = task_service.get_in_progress_tasks(label, project_name)
+        if claimed_hashes:
+            in_progress_hashes = set(in_progress_hashes) | claimed_hashes
 
         if in_progress_hashes:
             print(f"Found in-progress tasks: {sorted(in_progress_hashes)}")
 
-        result = task_service.find_next_available_task(spec, in_progress_hashes)
+        # Tasks whose prerequisites are done, up to the number of free PR slots
+        ready_tasks = task_service.find_ready_tasks(
+            spec, in_progress_hashes, limit=available_slots
+        )
 
-        if not result:
+        if not ready_tasks:
             gh.write_output("has_task", "false")
             gh.write_output("all_tasks_done", "true")
-            gh.set_notice("No available tasks (all completed or in progress)")
+            gh.set_notice("No available tasks (all completed, in progress or waiting on prerequisites)")
             return 0  # Not an error, just no tasks
 
-        task_index, task, task_hash = result
+        next_task = ready_tasks[0]
+        task_index, task, task_hash = next_task.index, next_task.description, next_task.task_hash
         print(f"✅ Found task {task_index}: {task}")
         print(f"   Task hash: {task_hash}")
 
+        # Batch mode: complete several consecutive tasks in one session (one PR each)
+        batch = TaskBatch(tasks=[])
+        batch_size = config.get_batch_size()
+        if batch_size > 1:
+            batch_tasks = task_service.find_task_batch(
+                spec, in_progress_hashes, size=min(batch_size, available_slots)
+            )
+            if len(batch_tasks) > 1:
+                batch = TaskBatch(tasks=[
+                    BatchTask(
+                        task_index=t.index,
+                        task_description=t.description,
+                        task_hash=t.task_hash,
+                        branch_name=pr_service.format_branch_name(project_name, t.task_hash),
+                    )
+                    for t in batch_tasks
+                ])
+                print(f"✅ Batch of {len(batch)} tasks for this session:")
+                for t in batch_tasks:
+                    print(f"   - Task {t.index}: {t.description}")
+
+        # Free PR slots this run leaves open are filled by a follow-up run, which
+        # dispatches the next one in turn; one run at a time, so no two runs
+        # pick the same ready task
+        run_hashes = batch.task_hashes if len(batch) > 1 else [task_hash]
+        dispatch_next_run = False
+        if available_slots > len(run_hashes) and not claimed_hashes:
+            dispatch_next_run = bool(task_service.find_ready_tasks(
+                spec, set(in_progress_hashes) | set(run_hashes), limit=1
+            ))
+            if dispatch_next_run:
+                print("   More independent tasks ready - a follow-up run will fill the remaining PR slots")
+
         # === STEP 5: Create Branch ===
         print("\n=== Step 5/6: Creating branch ===")
         # Use standard ClaudeChain branch format: claude-chain-{project}-{task_hash}
         branch_name = pr_service.format_branch_name(project_name, task_hash)
 
         try:
+            if run_state_store.enabled:
+                # Lets finalize reuse spec.md if the base branch has not moved
+                run_state.base_sha = run_git_command(["rev-parse", "HEAD"])
+                run_state_store.save(run_state)
             run_git_command(["checkout", "-b", branch_name])
             print(f"✅ Created branch: {branch_name}")
         except GitError as e:
@@ -249,18 +321,11 @@ Please ensure your spec.md file exists and the checkout was successful."""
         # === STEP 6: Prepare Claude Prompt ===
         print("\n=== Step 6/6: Preparing Claude prompt ===")
 
-        # Create the prompt using spec content
-        claude_prompt = f"""Complete the following task from spec.md:
-
-Task: {task}
-
-Instructions: Read the entire spec.md file below to understand both WHAT to do and HOW to do it. Follow all guidelines and patterns specified in the document.
-
---- BEGIN spec.md ---
-{spec.content}
---- END spec.md ---
-
-Now complete the task '{task}' following all the details and instructions in the spec.md file above."""
+        # Create the prompt using spec content (stable spec prefix, task-specific suffix)
+        if len(batch) > 1:
+            claude_prompt = _build_batch_prompt(batch, spec.content)
+        else:
+            claude_prompt = _build_task_prompt(task, spec.content)
 
         print(f"✅ Prompt prepared ({len(claude_prompt)} characters)")
 
@@ -289,6 +354,9 @@ Now complete the task '{task}' following all the details and instructions in the
         gh.write_output("branch_name", branch_name)
         gh.write_output("claude_prompt", claude_prompt)
         gh.write_output("json_schema", get_main_task_schema_json())
+        if len(batch) > 1:
+            gh.write_output("batch_tasks", batch.to_json())
+        gh.write_output("dispatch_next_run", "true" if dispatch_next_run else "false")
 
         print("\n✅ Preparation complete - ready to run Claude Code")
         return 0
@@ -306,6 +374,72 @@ Now complete the task '{task}' following all the details and instructions in the
 # --- Private helper functions ---
 
 
+def _build_prompt_prefix(spec_content: str) -> str:
+    """Build the part of the prompt that comes before the task-specific text.
+
+    The static instructions come first, then the spec as it is on the base
+    branch (completed tasks stay checked), then the task to complete.
+
+    Args:
+        spec_content: Full spec.md content
+
+    Returns:
+        Prompt prefix ending with the spec
+    """
+    return _PROMPT_INSTRUCTIONS + f"""--- BEGIN spec.md ---
+{spec_content}
+--- END spec.md ---
+
+"""
+
+
+def _build_task_prompt(task: str, spec_content: str) -> str:
+    """Build the prompt for completing a single task.
+
+    Args:
+        task: Task description
+        spec_content: Full spec.md content
+
+    Returns:
+        Prompt text for Claude Code
+    """
+    return _build_prompt_prefix(spec_content) + f"""Complete the following task from spec.md:
+
+Task: {task}
+
+Now complete the task '{task}' following all the details and instructions in the spec.md file above."""
+
+
+def _build_batch_prompt(batch: TaskBatch, spec_content: str) -> str:
+    """Build the prompt for completing several tasks in one session.
+
+    Each task must end with a commit tagged with the task's marker so that
+    finalize can split the session's work into one PR per task.
+
+    Args:
+        batch: Tasks to complete, in order
+        spec_content: Full spec.md content
+
+    Returns:
+        Prompt text for Claude Code
+    """
+    task_list = "\n".join(
+        f"{position}. {commit_marker(t.task_hash)} {t.task_description}"
+        for position, t in enumerate(batch.tasks, start=1)
+    )
+    return _build_prompt_prefix(spec_content) + f"""Complete the following {len(batch)} tasks from spec.md, one at a time and in this order:
+
+{task_list}
+
+Each task becomes its own pull request, so keep the tasks separate:
+- Finish one task completely before starting the next.
+- When a task is done, commit all of its changes before starting the next task.
+- Start every commit message with the tag shown before the task, e.g. "{commit_marker(batch.tasks[0].task_hash)} {batch.tasks[0].task_description}".
+- Do not mix changes for different tasks in one commit.
+
+Now complete the {len(batch)} tasks above in order, with one tagged commit per task, following all the details and instructions in the spec.md file above."""
+
+
 def _validate_base_branch_for_pr_merge(
     gh: GitHubActionsHelper,
     project_name: str,
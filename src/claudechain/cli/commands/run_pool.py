@@ -0,0 +1,107 @@
+"""CLI command for running several tasks concurrently on one runner.
+
+Orchestrates WorktreePoolService: each task runs prepare, the project's
+action scripts, Claude Code and finalize in its own git worktree and opens
+its own PR. This command sizes the pool, starts it and reports the results.
+"""
+
+import os
+import tempfile
+from typing import List, Optional
+
+from claudechain.domain.constants import DEFAULT_POOL_MAX_TASKS, DEFAULT_POOL_MEMORY_PER_TASK_MB
+from claudechain.domain.worktree_pool import POOL_STATUS_CREATED, POOL_STATUS_FAILED, POOL_STATUS_NO_CHANGES
+from claudechain.infrastructure.github.actions import GitHubActionsHelper
+from claudechain.services.composite.worktree_pool_service import DEFAULT_CLAUDE_COMMAND, WorktreePoolService
+
+_STATUS_LABELS = {
+    POOL_STATUS_CREATED: "✅ PR created",
+    POOL_STATUS_NO_CHANGES: "ℹ️ No changes",
+    POOL_STATUS_FAILED: "❌ Failed",
+}
+
+
+def cmd_run_pool(
+    gh: GitHubActionsHelper,
+    projects: List[str],
+    base_branch: str,
+    max_workers: Optional[int] = None,
+    max_tasks: int = DEFAULT_POOL_MAX_TASKS,
+    memory_per_task_mb: int = DEFAULT_POOL_MEMORY_PER_TASK_MB,
+    worktree_root: str = "",
+    claude_command: str = DEFAULT_CLAUDE_COMMAND,
+    claude_model: str = "",
+) -> int:
+    """Run ready tasks of several projects in a pool of git worktrees.
+
+    GitHub Actions outputs:
+        pr_urls: Space-separated URLs of the created PRs
+        created_count: Number of created PRs
+        failed_count: Number of failed tasks
+
+    Args:
+        gh: GitHub Actions helper instance
+        projects: Projects to take tasks from (default: every project in the repository)
+        base_branch: Default base branch for prepare
+        max_workers: Upper bound for tasks run at once (default: bounded by CPU and memory only)
+        max_tasks: Tasks started in total
+        memory_per_task_mb: Memory budgeted for one task when sizing the pool
+        worktree_root: Directory for the worktrees (default: $RUNNER_TEMP or a temporary directory)
+        claude_command: Claude Code CLI executable
+        claude_model: Model passed to Claude Code (optional)
+
+    Returns:
+        Exit code (0 if no task failed, 1 otherwise)
+    """
+    try:
+        print("=== ClaudeChain Worktree Pool ===\n")
+
+        if not projects:
+            from claudechain.cli.commands.discover import find_all_projects
+            projects = find_all_projects()
+        if not projects:
+            print("No projects to run")
+            gh.write_output("pr_urls", "")
+            gh.write_output("created_count", "0")
+            gh.write_output("failed_count", "0")
+            return 0
+
+        pool_size = WorktreePoolService.pool_size(max_workers, memory_per_task_mb)
+        if not worktree_root:
+            worktree_root = os.path.join(os.environ.get("RUNNER_TEMP") or tempfile.gettempdir(), "claudechain-worktrees")
+        print(f"Projects: {' '.join(projects)}")
+        print(f"Pool size: {pool_size} (CPU and memory bound, {memory_per_task_mb} MB per task)")
+        print(f"Worktrees: {worktree_root}\n")
+
+        service = WorktreePoolService(base_branch, worktree_root, claude_command, claude_model)
+        results = service.run(projects, max_workers=pool_size, max_tasks=max_tasks)
+
+        created = [r for r in results if r.status == POOL_STATUS_CREATED]
+        failed = [r for r in results if r.status == POOL_STATUS_FAILED]
+        gh.write_output("pr_urls", " ".join(r.pr_url for r in created))
+        gh.write_output("created_count", str(len(created)))
+        gh.write_output("failed_count", str(len(failed)))
+
+        gh.write_step_summary("## ClaudeChain Worktree Pool")
+        gh.write_step_summary("")
+        if results:
+            gh.write_step_summary("| Project | Task | Result | PR |")
+            gh.write_step_summary("|---|---|---|---|")
+            for r in results:
+                task = r.task_description.replace("|", "\\|") or "-"
+                detail = r.pr_url or r.message.replace("|", "\\|").replace("\n", " ") or "-"
+                gh.write_step_summary(f"| {r.project_name} | {task} | {_STATUS_LABELS[r.status]} | {detail} |")
+        else:
+            gh.write_step_summary("ℹ️ No ready tasks with free capacity")
+        gh.write_step_summary("")
+
+        print(f"\n✅ Pool finished: {len(created)} PR(s) created, {len(failed)} task(s) failed")
+        for r in failed:
+            gh.set_error(f"Task failed for project '{r.project_name}': {r.message}")
+        return 1 if failed else 0
+
+    except Exception as e:
+        gh.set_error(f"Worktree pool failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return 1
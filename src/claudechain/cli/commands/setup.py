@@ -583,7 +583,6 @@ jobs:
       - uses: actions/checkout@v4
       - uses: gestrich/claude-chain/statistics@main
         with:
-          workflow_file: 'claudechain.yml'
           github_token: ${{ github.token }}
           days_back: 7
           slack_webhook_url: ${{ secrets.CLAUDE_CHAIN_SLACK_WEBHOOK_URL }}
@@ -9,8 +9,13 @@ import json
 from datetime import datetime, timezone
 from typing import List, Optional, Tuple
 
+from claudechain.domain.constants import DEFAULT_STATS_MAX_WORKERS
 from claudechain.domain.project import Project
+from claudechain.infrastructure.cache.artifact_store import get_artifact_store
+from claudechain.infrastructure.cache.pr_snapshot import get_pr_snapshot_store
 from claudechain.infrastructure.github.actions import GitHubActionsHelper
+from claudechain.infrastructure.github.client import get_http_cache
+from claudechain.infrastructure.github.rate_limiter import get_rate_limiter
 from claudechain.infrastructure.repositories.project_repository import ProjectRepository
 from claudechain.services.composite.statistics_service import StatisticsService
 from claudechain.services.core.pr_service import PRService
@@ -19,7 +24,6 @@ from claudechain.services.core.pr_service import PRService
 def cmd_statistics(
     gh: GitHubActionsHelper,
     repo: str,
-    workflow_file: str,
     base_branch: str = "main",
     config_path: Optional[str] = None,
     days_back: int = 30,
@@ -27,6 +31,7 @@ def cmd_statistics(
     slack_webhook_url: str = "",
     show_assignee_stats: bool = False,
     run_url: str = "",
+    max_workers: int = DEFAULT_STATS_MAX_WORKERS,
 ) -> int:
     """Orchestrate statistics workflow using Service Layer classes.
 
@@ -37,7 +42,6 @@ def cmd_statistics(
     Args:
         gh: GitHub Actions helper instance
         repo: GitHub repository (owner/name)
-        workflow_file: Name of the workflow that creates PRs (for artifact discovery)
         base_branch: Base branch for single-project mode (default: "main")
         config_path: Optional path to configuration file (single-project mode)
         days_back: Days to look back for statistics (default: 30)
@@ -45,6 +49,7 @@ def cmd_statistics(
         slack_webhook_url: Slack webhook URL for posting statistics (default: "")
         show_assignee_stats: Whether to show assignee leaderboard (default: False)
         run_url: GitHub Actions run URL for "See details" footer (default: "")
+        max_workers: Projects collected concurrently (default: 8)
 
     Returns:
         Exit code (0 for success, 1 for failure)
@@ -56,8 +61,8 @@ def cmd_statistics(
 
         # Initialize services (dependency injection pattern)
         project_repository = ProjectRepository(repo)
-        pr_service = PRService(repo)
-        statistics_service = StatisticsService(repo, project_repository, pr_service, workflow_file)
+        pr_service = PRService(repo, snapshot_store=get_pr_snapshot_store())
+        statistics_service = StatisticsService(repo, project_repository, pr_service)
 
         # Discover projects (CLI handles discovery, service handles collection)
         projects = _discover_projects(config_path, base_branch, pr_service)
@@ -74,6 +79,7 @@ def cmd_statistics(
             projects=projects,
             days_back=days_back,
             show_assignee_stats=show_assignee_stats,
+            max_workers=max_workers,
         )
 
         print(f"\n=== Collection Complete ===")
@@ -130,6 +136,12 @@ def cmd_statistics(
                 gh.write_step_summary(warnings_section)
                 gh.write_step_summary("")
 
+            # Add prompt cache effectiveness (only when artifacts recorded cache usage)
+            cache_section = report.format_cache_section(for_slack=False)
+            if cache_section:
+                gh.write_step_summary(cache_section)
+                gh.write_step_summary("")
+
             # Add detailed task view with orphaned PRs
             gh.write_step_summary("## Detailed Task View")
             gh.write_step_summary("")
@@ -159,6 +171,27 @@ def cmd_statistics(
                 gh.write_step_summary("*No team member activity found*")
                 gh.write_step_summary("")
 
+        # Add the GitHub API budget this run consumed
+        gh.write_step_summary(get_rate_limiter().budget.format_summary())
+        gh.write_step_summary("")
+
+        # Add HTTP cache effectiveness (only when the on-disk cache is enabled)
+        http_cache = get_http_cache()
+        if http_cache is not None and http_cache.stats.requests:
+            print(f"HTTP cache: {http_cache.stats.hits} hit(s), {http_cache.stats.misses} miss(es)")
+            gh.write_step_summary(http_cache.stats.format_summary())
+            gh.write_step_summary("")
+
+        # Add artifact cache effectiveness (metadata served without downloading)
+        artifact_stats = get_artifact_store().stats
+        if artifact_stats.requests:
+            print(
+                f"Artifact cache: {artifact_stats.hits}/{artifact_stats.requests} hit(s) "
+                f"({artifact_stats.hit_rate:.0%}), {artifact_stats.bytes_saved / 1024:.1f} KiB not downloaded"
+            )
+            gh.write_step_summary(artifact_stats.format_summary())
+            gh.write_step_summary("")
+
         print("✅ Statistics generated successfully")
         return 0
 
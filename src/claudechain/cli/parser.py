@@ -82,6 +82,11 @@ def create_parser() -> argparse.ArgumentParser:
         action="store_true",  # Flag presence = True, absence = False
         help="Show assignee leaderboard statistics (default: hidden)"
     )
+    parser_statistics.add_argument(
+        "--max-workers",
+        type=int,
+        help="Projects to collect concurrently (default: 8)"
+    )
     parser_auto_start = subparsers.add_parser(
         "auto-start",
         help="Detect new projects and trigger workflows"
@@ -141,6 +146,38 @@ def create_parser() -> argparse.ArgumentParser:
         help="Path to the project directory"
     )
 
+    parser_run_pool = subparsers.add_parser(
+        "run-pool",
+        help="Run tasks of several projects concurrently in git worktrees"
+    )
+    parser_run_pool.add_argument(
+        "--projects",
+        help="Space-separated projects to take tasks from (default: all projects)"
+    )
+    parser_run_pool.add_argument(
+        "--base-branch",
+        help="Base branch to create PRs against (default: main)"
+    )
+    parser_run_pool.add_argument(
+        "--max-workers",
+        type=int,
+        help="Upper bound for tasks run at once (default: bounded by CPU and memory)"
+    )
+    parser_run_pool.add_argument(
+        "--max-tasks",
+        type=int,
+        help="Tasks started in total (default: 10)"
+    )
+    parser_run_pool.add_argument(
+        "--memory-per-task-mb",
+        type=int,
+        help="Memory budgeted for one task when sizing the pool (default: 2048)"
+    )
+    parser_run_pool.add_argument(
+        "--worktree-root",
+        help="Directory for the worktrees (default: $RUNNER_TEMP/claudechain-worktrees)"
+    )
+
     parser_setup = subparsers.add_parser(
         "setup",
         help="Interactive setup wizard for ClaudeChain"
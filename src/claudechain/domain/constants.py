@@ -16,9 +16,27 @@ DEFAULT_METADATA_BRANCH = "claudechain-metadata"
 # Default statistics lookback period (days)
 DEFAULT_STATS_DAYS_BACK = 30
 
+# Default number of projects collected concurrently by the statistics command
+DEFAULT_STATS_MAX_WORKERS = 8
+
+# Default number of projects checked concurrently by the discover-ready command
+DEFAULT_DISCOVER_MAX_WORKERS = 8
+
+# Memory budgeted for one task (Claude Code plus project scripts) in the run-pool command
+DEFAULT_POOL_MEMORY_PER_TASK_MB = 2048
+
+# Default number of tasks the run-pool command starts in one run
+DEFAULT_POOL_MAX_TASKS = 10
+
 # Default number of days before a PR is considered stale
 DEFAULT_STALE_PR_DAYS = 7
 
+# Default number of PRs a project may have open at once
+DEFAULT_MAX_OPEN_PRS = 1
+
+# Default number of tasks completed per Claude Code session
+DEFAULT_BATCH_SIZE = 1
+
 # Default allowed tools for Claude Code execution
 # Minimal permissions: file operations + git staging/committing (required by ClaudeChain prompt)
 # Users can override via CLAUDE_ALLOWED_TOOLS env var or project's allowedTools config
@@ -6,6 +6,8 @@ import os
 from dataclasses import dataclass, field
 from typing import Self
 
+from claudechain.domain.execution_log import iter_execution_records
+
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +51,24 @@ class ClaudeModel:
             + cache_read_tokens * self.cache_read_rate
         ) / 1_000_000
 
+    def calculate_cache_savings(self, cache_read_tokens: int, cache_write_tokens: int = 0) -> float:
+        """Calculate what prompt caching saved over uncached input, net of its premium.
+
+        Cache reads are cheaper than uncached input, but writing a prompt to
+        the cache costs more than sending it uncached, so the write premium
+        is subtracted from what the reads saved.
+
+        Args:
+            cache_read_tokens: Number of cache read tokens
+            cache_write_tokens: Number of cache write tokens
+
+        Returns:
+            Net savings in USD (negative if the writes cost more than the reads saved)
+        """
+        read_savings = cache_read_tokens * (self.input_rate - self.cache_read_rate)
+        write_premium = cache_write_tokens * (self.cache_write_rate - self.input_rate)
+        return (read_savings - write_premium) / 1_000_000
+
 
 # Claude model pricing registry
 # Source: https://docs.anthropic.com/en/docs/about-claude/pricing
@@ -175,6 +195,19 @@ class ModelUsage:
             cache_read_tokens=self.cache_read_tokens,
         )
 
+    def calculate_cache_savings(self) -> float:
+        """Calculate what this model's prompt caching saved, net of the cache write premium.
+
+        Returns:
+            Net savings in USD, or 0.0 if the model has no known pricing
+        """
+        try:
+            return get_model(self.model).calculate_cache_savings(
+                self.cache_read_tokens, self.cache_write_tokens
+            )
+        except UnknownModelError:
+            return 0.0
+
     @classmethod
     def from_dict(cls, model: str, data: dict) -> Self:
         """Parse model usage from execution file modelUsage entry.
@@ -202,6 +235,79 @@ class ModelUsage:
         )
 
 
+@dataclass
+class CacheUsage:
+    """Prompt cache usage aggregated over one or more executions.
+
+    The hit ratio is the share of prompt tokens served from the cache:
+    cache reads over all prompt tokens (uncached input, cache writes and
+    cache reads). Savings are what the cache reads would have cost as
+    uncached input, minus the premium paid for the cache writes.
+    """
+
+    input_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    savings_usd: float = 0.0
+
+    @property
+    def prompt_tokens(self) -> int:
+        """All prompt tokens, cached or not."""
+        return self.input_tokens + self.cache_read_tokens + self.cache_write_tokens
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of prompt tokens read from the cache (0.0 when there are none)."""
+        if self.prompt_tokens == 0:
+            return 0.0
+        return self.cache_read_tokens / self.prompt_tokens
+
+    def __add__(self, other: Self) -> Self:
+        """Combine cache usage from two sources."""
+        return CacheUsage(
+            input_tokens=self.input_tokens + other.input_tokens,
+            cache_read_tokens=self.cache_read_tokens + other.cache_read_tokens,
+            cache_write_tokens=self.cache_write_tokens + other.cache_write_tokens,
+            savings_usd=self.savings_usd + other.savings_usd,
+        )
+
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-compatible dictionary."""
+        return {
+            "input_tokens": self.input_tokens,
+            "cache_read_tokens": self.cache_read_tokens,
+            "cache_write_tokens": self.cache_write_tokens,
+            "savings_usd": self.savings_usd,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Self:
+        """Parse a dictionary produced by to_dict()."""
+        return cls(
+            input_tokens=int(data.get("input_tokens", 0) or 0),
+            cache_read_tokens=int(data.get("cache_read_tokens", 0) or 0),
+            cache_write_tokens=int(data.get("cache_write_tokens", 0) or 0),
+            savings_usd=float(data.get("savings_usd", 0.0) or 0.0),
+        )
+
+    @classmethod
+    def from_model_usage(cls, usage: ModelUsage) -> Self:
+        """Build cache usage from one model's usage.
+
+        Args:
+            usage: ModelUsage with token counts
+
+        Returns:
+            CacheUsage including the savings at the model's pricing
+        """
+        return cls(
+            input_tokens=usage.input_tokens,
+            cache_read_tokens=usage.cache_read_tokens,
+            cache_write_tokens=usage.cache_write_tokens,
+            savings_usd=usage.calculate_cache_savings(),
+        )
+
+
 @dataclass
 class ExecutionUsage:
     """Usage data from a single Claude Code execution."""
@@ -259,6 +365,9 @@ class ExecutionUsage:
     def from_execution_file(cls, execution_file: str) -> Self:
         """Extract usage data from a Claude Code execution file.
 
+        The file is read as a stream, so memory use does not grow with
+        the length of the session.
+
         Args:
             execution_file: Path to execution file
 
@@ -276,24 +385,22 @@ class ExecutionUsage:
         if not os.path.exists(execution_file):
             raise FileNotFoundError(f"Execution file not found: {execution_file}")
 
+        # Stream the records instead of loading the whole session log
+        last_item = None
+        last_with_cost = None
+        has_items = False
         with open(execution_file, 'r') as f:
-            data = json.load(f)
-
-        # Handle list format (may have multiple executions)
-        if isinstance(data, list):
-            # Filter to only items that have cost information
-            items_with_cost = [
-                item for item in data
-                if isinstance(item, dict) and 'total_cost_usd' in item
-            ]
+            for item in iter_execution_records(f):
+                has_items = True
+                last_item = item
+                if isinstance(item, dict) and 'total_cost_usd' in item:
+                    last_with_cost = item
 
-            if items_with_cost:
-                data = items_with_cost[-1]
-            elif data:
-                data = data[-1]
-            else:
-                raise ValueError(f"Execution file contains empty list: {execution_file}")
+        if not has_items:
+            raise ValueError(f"Execution file contains empty list: {execution_file}")
 
+        # Prefer the last item with cost information (the final result record)
+        data = last_with_cost if last_with_cost is not None else last_item
         return cls._from_dict(data)
 
     @classmethod
@@ -436,6 +543,22 @@ class CostBreakdown:
 
         return list(aggregated.values())
 
+    @property
+    def cache_usage(self) -> CacheUsage:
+        """Prompt cache usage across all models."""
+        return sum(self.get_cache_usage_by_model().values(), CacheUsage())
+
+    def get_cache_usage_by_model(self) -> dict[str, CacheUsage]:
+        """Prompt cache usage per model across main and summary executions.
+
+        Returns:
+            Dict mapping model name -> CacheUsage
+        """
+        return {
+            m.model: CacheUsage.from_model_usage(m)
+            for m in self.get_aggregated_models()
+        }
+
     def to_model_breakdown_json(self) -> list[dict]:
         """Convert per-model breakdown to JSON-serializable format.
 
@@ -1,5 +1,7 @@
 """Custom exceptions for ClaudeChain operations"""
 
+from typing import Optional
+
 
 class ContinuousRefactoringError(Exception):
     """Base exception for continuous refactoring operations"""
@@ -23,7 +25,10 @@ class GitError(ContinuousRefactoringError):
 
 class GitHubAPIError(ContinuousRefactoringError):
     """GitHub API call failures"""
-    pass
+
+    def __init__(self, message: str = "", status_code: Optional[int] = None):
+        self.status_code = status_code  # HTTP status when the failure came from the REST client
+        super().__init__(message)
 
 
 class ActionScriptError(ContinuousRefactoringError):
@@ -0,0 +1,163 @@
+"""Streaming reader for Claude Code execution files.
+
+In verbose mode claude-code-action writes the whole session as one JSON
+array of events, which reaches hundreds of MB for long sessions. Callers
+only need a few records from it (the final result with cost, usage and
+structured output), so the array is decoded one element at a time and
+each element is dropped once the caller has looked at it. Memory use is
+bounded by the largest single event instead of the whole session.
+
+Non-verbose execution files contain a single result object; it is yielded
+as the only record.
+"""
+
+import json
+from typing import Any, Callable, Iterator, Optional, TextIO
+
+# Characters read per chunk; a larger element grows the read size as needed
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = " \t\n\r"
+
+
+def iter_execution_records(file: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Any]:
+    """Yield the top-level records of an execution file one at a time.
+
+    Args:
+        file: Execution file opened in text mode
+        chunk_size: Characters to read at a time
+
+    Yields:
+        Each element of a top-level JSON array, or the top-level value
+        itself when the file does not contain an array
+
+    Raises:
+        json.JSONDecodeError: If the file does not contain valid JSON
+    """
+    decoder = json.JSONDecoder()
+    buffer = file.read(chunk_size)
+    eof = not buffer
+    pos = _skip_whitespace(buffer, 0)
+
+    while pos == len(buffer) and not eof:
+        more = file.read(chunk_size)
+        eof = not more
+        buffer += more
+        pos = _skip_whitespace(buffer, pos)
+
+    if pos == len(buffer):
+        raise json.JSONDecodeError("Expecting value", buffer, pos)
+
+    if buffer[pos] != "[":
+        # Single result object (non-verbose output): small, decode it whole
+        yield json.loads(buffer + file.read())
+        return
+
+    pos += 1
+    expect_separator = False
+    after_separator = False
+    read_size = chunk_size
+    while True:
+        pos = _skip_whitespace(buffer, pos)
+        if pos == len(buffer):
+            if eof:
+                raise json.JSONDecodeError("Unterminated array", buffer, pos)
+            more = file.read(chunk_size)
+            eof = not more
+            buffer = buffer[pos:] + more
+            pos = 0
+            continue
+
+        char = buffer[pos]
+        if char == "]":
+            if after_separator:
+                # Trailing comma: "[{...},]"
+                raise json.JSONDecodeError("Expecting value", buffer, pos)
+            _expect_end(file, buffer, pos + 1, chunk_size)
+            return
+        if expect_separator:
+            if char != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos)
+            pos += 1
+            expect_separator = False
+            after_separator = True
+            continue
+
+        try:
+            record, end = decoder.raw_decode(buffer, pos)
+            # A scalar cut off at the end of the buffer decodes as a shorter value
+            truncated = end == len(buffer) and not eof
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            truncated = True
+
+        if truncated:
+            # Keep the partial element and read at least as much again, so a
+            # large element is re-decoded a logarithmic number of times
+            more = file.read(max(read_size, len(buffer) - pos))
+            eof = not more
+            buffer = buffer[pos:] + more
+            pos = 0
+            read_size = len(buffer)
+            continue
+
+        yield record
+        pos = end
+        expect_separator = True
+        after_separator = False
+        read_size = chunk_size
+        if pos >= chunk_size:
+            # Drop consumed elements so the buffer does not grow with the file
+            buffer = buffer[pos:]
+            pos = 0
+
+
+def find_last_record(
+    execution_file: str,
+    predicate: Callable[[Any], bool],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Optional[Any]:
+    """Find the last record of an execution file that matches a predicate.
+
+    Args:
+        execution_file: Path to execution file
+        predicate: Called with each record; True to keep it as the candidate
+        chunk_size: Characters to read at a time
+
+    Returns:
+        The last matching record, or None if no record matches
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        json.JSONDecodeError: If the file does not contain valid JSON
+    """
+    last = None
+    with open(execution_file, "r") as f:
+        for record in iter_execution_records(f, chunk_size):
+            if predicate(record):
+                last = record
+    return last
+
+
+def _expect_end(file: TextIO, buffer: str, pos: int, chunk_size: int) -> None:
+    """Check that only whitespace follows the closing bracket of the array.
+
+    Raises:
+        json.JSONDecodeError: If anything else follows, as json.load would
+    """
+    while True:
+        pos = _skip_whitespace(buffer, pos)
+        if pos < len(buffer):
+            raise json.JSONDecodeError("Extra data", buffer, pos)
+        buffer = file.read(chunk_size)
+        if not buffer:
+            return
+        pos = 0
+
+
+def _skip_whitespace(buffer: str, pos: int) -> int:
+    """Return the index of the first non-whitespace character at or after pos."""
+    while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+        pos += 1
+    return pos
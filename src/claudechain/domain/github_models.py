@@ -95,6 +95,7 @@ class GitHubPullRequest:
     head_ref_name: Optional[str] = None  # Branch name (source branch)
     base_ref_name: Optional[str] = None  # Target branch (branch PR was merged into)
     url: Optional[str] = None  # PR URL (e.g., https://github.com/owner/repo/pull/123)
+    updated_at: Optional[datetime] = None  # Last update (only fetched by GraphQL listings)
 
     @classmethod
     def from_dict(cls, data: dict) -> 'GitHubPullRequest':
@@ -155,6 +156,11 @@ class GitHubPullRequest:
         # Get PR URL if available
         url = data.get("url")
 
+        # Parse updated_at (optional)
+        updated_at = data.get("updatedAt")
+        if updated_at and isinstance(updated_at, str):
+            updated_at = datetime.fromisoformat(updated_at.replace("Z", "+00:00"))
+
         return cls(
             number=data["number"],
             title=data["title"],
@@ -165,9 +171,34 @@ class GitHubPullRequest:
             labels=labels,
             head_ref_name=head_ref_name,
             base_ref_name=base_ref_name,
-            url=url
+            url=url,
+            updated_at=updated_at
         )
 
+    def to_dict(self) -> dict:
+        """Serialize to the `gh pr list --json` shape accepted by from_dict()
+
+        Returns:
+            Dictionary representation suitable for JSON serialization
+
+        Example:
+            >>> GitHubPullRequest.from_dict(pr.to_dict()) == pr
+            True
+        """
+        return {
+            "number": self.number,
+            "title": self.title,
+            "state": self.state.upper(),
+            "createdAt": self.created_at.isoformat(),
+            "mergedAt": self.merged_at.isoformat() if self.merged_at else None,
+            "updatedAt": self.updated_at.isoformat() if self.updated_at else None,
+            "assignees": [{"login": a.login, "name": a.name, "avatar_url": a.avatar_url} for a in self.assignees],
+            "labels": [{"name": label} for label in self.labels],
+            "headRefName": self.head_ref_name,
+            "baseRefName": self.base_ref_name,
+            "url": self.url,
+        }
+
     def is_merged(self) -> bool:
         """Check if PR was merged
 
@@ -506,6 +537,98 @@ class GitHubPullRequestList:
         return iter(self.pull_requests)
 
 
+@dataclass
+class PullRequestIndex:
+    """ClaudeChain PRs indexed by project name and task hash
+
+    Built once from a bulk fetch of every labeled PR so that per-project
+    lookups are dictionary reads instead of repeated GitHub queries. PRs whose
+    branch does not follow the claude-chain-{project}-{hash} convention are
+    kept in all_prs but not indexed.
+    """
+
+    all_prs: List[GitHubPullRequest] = field(default_factory=list)
+    by_project: Dict[str, Dict[str, List[GitHubPullRequest]]] = field(default_factory=dict)
+
+    @classmethod
+    def from_pull_requests(cls, prs: List[GitHubPullRequest]) -> 'PullRequestIndex':
+        """Build the index from a list of PRs
+
+        Args:
+            prs: PRs to index (typically every PR with the ClaudeChain label)
+
+        Returns:
+            PullRequestIndex keyed by project name, then task hash
+
+        Example:
+            >>> index = PullRequestIndex.from_pull_requests(prs)
+            >>> index.get_task_prs("my-refactor", "a3f2b891")
+        """
+        by_project: Dict[str, Dict[str, List[GitHubPullRequest]]] = {}
+        for pr in prs:
+            project_name = pr.project_name
+            task_hash = pr.task_hash
+            if not project_name or not task_hash:
+                continue
+            by_project.setdefault(project_name, {}).setdefault(task_hash, []).append(pr)
+        return cls(all_prs=list(prs), by_project=by_project)
+
+    @property
+    def project_names(self) -> List[str]:
+        """Sorted names of all projects with at least one PR"""
+        return sorted(self.by_project)
+
+    def get_project_prs(self, project_name: str, state: Optional[str] = None) -> List[GitHubPullRequest]:
+        """Get PRs for a project, optionally filtered by state
+
+        Args:
+            project_name: Project name
+            state: Optional state filter ("open", "closed", "merged")
+
+        Returns:
+            List of PRs for the project (empty if none)
+        """
+        prs = [pr for task_prs in self.by_project.get(project_name, {}).values() for pr in task_prs]
+        if state:
+            prs = [pr for pr in prs if pr.state == state.lower()]
+        return prs
+
+    def get_task_prs(self, project_name: str, task_hash: str) -> List[GitHubPullRequest]:
+        """Get all PRs created for a task
+
+        Args:
+            project_name: Project name
+            task_hash: 8-character task hash
+
+        Returns:
+            List of PRs for the task (empty if none)
+        """
+        return list(self.by_project.get(project_name, {}).get(task_hash, []))
+
+    def get_open_prs(self, project_name: str) -> List[GitHubPullRequest]:
+        """Get open PRs for a project"""
+        return self.get_project_prs(project_name, state="open")
+
+    def get_merged_prs(self, project_name: str, since: Optional[datetime] = None) -> List[GitHubPullRequest]:
+        """Get merged PRs for a project, optionally merged on or after a date
+
+        Args:
+            project_name: Project name
+            since: Optional minimum merged_at date
+
+        Returns:
+            List of merged PRs for the project
+        """
+        prs = self.get_project_prs(project_name, state="merged")
+        if since:
+            prs = [pr for pr in prs if pr.merged_at and pr.merged_at >= since]
+        return prs
+
+    def __len__(self) -> int:
+        """Number of PRs in the index (including unindexed branches)"""
+        return len(self.all_prs)
+
+
 @dataclass
 class WorkflowRun:
     """Domain model for GitHub Actions workflow run
@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Dict, List, Literal, Optional
+from claudechain.domain.cost_breakdown import CacheUsage
 from claudechain.domain.formatters.report_elements import (
     Header,
     TextBlock,
@@ -250,19 +251,25 @@ def parse_iso_timestamp(timestamp_str: str) -> datetime:
 class CapacityResult:
     """Result of project capacity check.
 
-    ClaudeChain allows only 1 open PR per project at a time.
+    A project may have up to max_open_prs open PRs at a time (1 by default).
     """
 
     has_capacity: bool
     assignee: Optional[str]
     open_prs: List[Dict]
     project_name: str
+    max_open_prs: int = 1
 
     @property
     def open_count(self) -> int:
         """Number of currently open PRs"""
         return len(self.open_prs)
 
+    @property
+    def available_slots(self) -> int:
+        """Number of PRs that can still be opened"""
+        return max(self.max_open_prs - self.open_count, 0)
+
     def format_summary(self) -> str:
         """Generate formatted summary for GitHub Actions output"""
         lines = ["## Capacity Check", ""]
@@ -273,8 +280,8 @@ class CapacityResult:
         lines.append("")
 
         # Capacity info
-        lines.append(f"**Max PRs Allowed:** 1")
-        lines.append(f"**Currently Open:** {self.open_count}/1")
+        lines.append(f"**Max PRs Allowed:** {self.max_open_prs}")
+        lines.append(f"**Currently Open:** {self.open_count}/{self.max_open_prs}")
         lines.append("")
 
         # List open PRs with details
@@ -427,6 +434,7 @@ class ProjectStats:
         in_progress_tasks: Number of tasks with open PRs
         pending_tasks: Number of tasks without PRs
         total_cost_usd: Total AI cost for this project
+        cache_usage: Prompt cache usage per model for this project
         open_prs: List of open PRs for this project
         stale_pr_count: Number of PRs that are stale
         tasks: Detailed list of tasks with their PR associations
@@ -441,6 +449,7 @@ class ProjectStats:
         self.in_progress_tasks = 0
         self.pending_tasks = 0
         self.total_cost_usd = 0.0
+        self.cache_usage: Dict[str, CacheUsage] = {}
         self.open_prs: List[GitHubPullRequest] = []
         self.stale_pr_count: int = 0
         # New: Detailed task-PR mapping
@@ -454,6 +463,11 @@ class ProjectStats:
             return 0.0
         return (self.completed_tasks / self.total_tasks) * 100
 
+    @property
+    def total_cache_usage(self) -> CacheUsage:
+        """Prompt cache usage across all models"""
+        return sum(self.cache_usage.values(), CacheUsage())
+
     @property
     def has_remaining_tasks(self) -> bool:
         """Check if project has remaining tasks but no open PRs.
@@ -727,6 +741,47 @@ class StatisticsReport:
         section.add(Table(columns=columns, rows=tuple(rows), in_code_block=True))
         return section
 
+    def to_cache_section(self) -> Section:
+        """Build prompt cache section with hit ratio and savings per project and model.
+
+        Returns:
+            Section containing the cache tables (empty if no project has cache data)
+        """
+        section = Section(header=Header("Prompt Cache", level=2))
+
+        by_project: Dict[str, CacheUsage] = {}
+        by_model: Dict[str, CacheUsage] = {}
+        for project_name in sorted(self.project_stats.keys()):
+            stats = self.project_stats[project_name]
+            if not stats.cache_usage:
+                continue
+            by_project[project_name] = stats.total_cache_usage
+            for model, usage in stats.cache_usage.items():
+                by_model[model] = by_model.get(model, CacheUsage()) + usage
+
+        if not by_project:
+            return section
+
+        for label, usages in (("Project", by_project), ("Model", by_model)):
+            columns = (
+                TableColumn(label, align="left"),
+                TableColumn("Hit Ratio", align="right"),
+                TableColumn("Cache Read", align="right"),
+                TableColumn("Net Saved", align="right"),
+            )
+            rows = tuple(
+                TableRow((
+                    name[:30],
+                    f"{usage.hit_ratio:.0%}",
+                    f"{usage.cache_read_tokens:,}",
+                    format_usd(usage.savings_usd),
+                ))
+                for name, usage in sorted(usages.items())
+            )
+            section.add(Table(columns=columns, rows=rows, in_code_block=True))
+
+        return section
+
     def to_warnings_section(self, stale_pr_days: int = 7) -> Section:
         """Build warnings section for projects needing attention.
 
@@ -928,6 +983,22 @@ class StatisticsReport:
         formatter = SlackReportFormatter() if for_slack else MarkdownReportFormatter()
         return formatter.format_section(section)
 
+    def format_cache_section(self, for_slack: bool = False) -> str:
+        """Format prompt cache hit ratio and savings per project and model.
+
+        Args:
+            for_slack: If True, use Slack mrkdwn format; otherwise GitHub markdown
+
+        Returns:
+            Formatted cache section or empty string if there is no cache data
+        """
+        section = self.to_cache_section()
+        if section.is_empty():
+            return ""
+
+        formatter = SlackReportFormatter() if for_slack else MarkdownReportFormatter()
+        return formatter.format_section(section)
+
     def format_for_slack(
         self,
         show_assignee_stats: bool = False,
@@ -1102,6 +1173,16 @@ class StatisticsReport:
                 "pending_tasks": stats.pending_tasks,
                 "completion_percentage": stats.completion_percentage
             }
+            if stats.cache_usage:
+                cache_usage = stats.total_cache_usage
+                data["projects"][project_name]["cache"] = {
+                    "hit_ratio": cache_usage.hit_ratio,
+                    "savings_usd": cache_usage.savings_usd,
+                    "models": {
+                        model: {**usage.to_dict(), "hit_ratio": usage.hit_ratio}
+                        for model, usage in stats.cache_usage.items()
+                    },
+                }
 
         # Serialize team member stats
         for username, stats in self.team_stats.items():
@@ -1193,6 +1274,59 @@ class AITask:
         }
 
 
+@dataclass
+class BatchTaskCost:
+    """Share of a batch session attributed to one of its tasks
+
+    When several tasks are completed in one Claude Code session, the
+    session's cost is apportioned across the tasks' PRs.
+    """
+
+    task_index: int
+    task_description: str
+    task_hash: str
+    pr_number: int
+    branch_name: str
+    cost_usd: float  # Share of the session's cost
+    lines_changed: int = 0  # Lines added + deleted by the task's commits
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BatchTaskCost":
+        """Parse from JSON dictionary
+
+        Args:
+            data: Dictionary containing batch task data
+
+        Returns:
+            BatchTaskCost instance
+        """
+        return cls(
+            task_index=data["task_index"],
+            task_description=data["task_description"],
+            task_hash=data["task_hash"],
+            pr_number=data["pr_number"],
+            branch_name=data["branch_name"],
+            cost_usd=data["cost_usd"],
+            lines_changed=data.get("lines_changed", 0),
+        )
+
+    def to_dict(self) -> dict:
+        """Serialize to JSON dictionary
+
+        Returns:
+            Dictionary representation suitable for JSON serialization
+        """
+        return {
+            "task_index": self.task_index,
+            "task_description": self.task_description,
+            "task_hash": self.task_hash,
+            "pr_number": self.pr_number,
+            "branch_name": self.branch_name,
+            "cost_usd": self.cost_usd,
+            "lines_changed": self.lines_changed,
+        }
+
+
 @dataclass
 class TaskMetadata:
     """Metadata for a single task/PR in ClaudeChain
@@ -1221,10 +1355,20 @@ class TaskMetadata:
     pr_summary_cost_usd: float = 0.0  # Deprecated: Use ai_tasks instead
     total_cost_usd: float = 0.0  # Deprecated: Use ai_tasks instead
 
+    # Per-task cost split when the session completed several tasks (batch mode)
+    batch_tasks: List["BatchTaskCost"] = None  # type: ignore
+
+    # Prompt cache usage per model (from CostBreakdown.get_cache_usage_by_model())
+    cache_usage: Dict[str, CacheUsage] = None  # type: ignore
+
     def __post_init__(self):
         """Initialize ai_tasks list if not provided and validate timezone-aware datetimes"""
         if self.ai_tasks is None:
             self.ai_tasks = []
+        if self.batch_tasks is None:
+            self.batch_tasks = []
+        if self.cache_usage is None:
+            self.cache_usage = {}
         if self.created_at.tzinfo is None:
             raise ValueError(f"created_at must be timezone-aware, got: {self.created_at}")
 
@@ -1247,6 +1391,11 @@ class TaskMetadata:
         ai_tasks = []
         if "ai_tasks" in data:
             ai_tasks = [AITask.from_dict(task_data) for task_data in data["ai_tasks"]]
+        batch_tasks = [BatchTaskCost.from_dict(task_data) for task_data in data.get("batch_tasks", [])]
+        cache_usage = {
+            model: CacheUsage.from_dict(usage_data)
+            for model, usage_data in data.get("cache_usage", {}).items()
+        }
 
         return cls(
             task_index=data["task_index"],
@@ -1259,6 +1408,8 @@ class TaskMetadata:
             pr_number=data["pr_number"],
             pr_state=data.get("pr_state", "open"),
             ai_tasks=ai_tasks,
+            batch_tasks=batch_tasks,
+            cache_usage=cache_usage,
             # Legacy fields for backward compatibility
             model=data.get("model", "claude-sonnet-4"),
             main_task_cost_usd=data.get("main_task_cost_usd", 0.0),
@@ -1287,6 +1438,10 @@ class TaskMetadata:
         # Include AI tasks array (new format)
         if self.ai_tasks:
             result["ai_tasks"] = [task.to_dict() for task in self.ai_tasks]
+        if self.batch_tasks:
+            result["batch_tasks"] = [task.to_dict() for task in self.batch_tasks]
+        if self.cache_usage:
+            result["cache_usage"] = {model: usage.to_dict() for model, usage in self.cache_usage.items()}
 
         # Include legacy fields for backward compatibility
         # Auto-calculate from ai_tasks if available
@@ -1343,6 +1498,22 @@ class TaskMetadata:
             return sum(task.cost_usd for task in self.ai_tasks)
         return self.total_cost_usd
 
+    def get_costs_by_pr(self) -> Dict[int, float]:
+        """Attribute the session's cost to the PRs it created
+
+        A batch session records each task's share in batch_tasks; any other
+        session charges its whole cost to pr_number.
+
+        Returns:
+            Dict mapping PR number -> cost in USD
+        """
+        if self.batch_tasks:
+            costs: Dict[int, float] = {}
+            for task in self.batch_tasks:
+                costs[task.pr_number] = costs.get(task.pr_number, 0.0) + task.cost_usd
+            return costs
+        return {self.pr_number: self.get_total_cost()}
+
     def get_primary_model(self) -> str:
         """Get the primary AI model used for this PR
 
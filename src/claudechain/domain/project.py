@@ -51,6 +51,19 @@ class Project:
         project_name = os.path.basename(os.path.dirname(config_path))
         return cls(project_name)
 
+    @classmethod
+    def from_spec_path(cls, spec_path: str) -> 'Project':
+        """Factory: Extract project from spec path
+
+        Args:
+            spec_path: Path like 'claude-chain/my-project/spec.md'
+
+        Returns:
+            Project instance
+        """
+        project_name = os.path.basename(os.path.dirname(spec_path))
+        return cls(project_name)
+
     @classmethod
     def from_branch_name(cls, branch_name: str) -> Optional['Project']:
         """Factory: Parse project from branch name
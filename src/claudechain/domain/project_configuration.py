@@ -3,7 +3,8 @@
 from dataclasses import dataclass
 from typing import Optional
 
-from claudechain.domain.constants import DEFAULT_STALE_PR_DAYS
+from claudechain.domain.constants import DEFAULT_BATCH_SIZE, DEFAULT_MAX_OPEN_PRS, DEFAULT_STALE_PR_DAYS
+from claudechain.domain.exceptions import ConfigurationError
 from claudechain.domain.project import Project
 
 
@@ -11,8 +12,9 @@ from claudechain.domain.project import Project
 class ProjectConfiguration:
     """Domain model for parsed project configuration
 
-    ClaudeChain enforces a single open PR per project. The optional assignee
-    is assigned to PRs when created.
+    By default ClaudeChain keeps a single open PR per project; maxOpenPRs
+    raises that limit for specs whose tasks declare independent groups or
+    dependencies. The optional assignee is assigned to PRs when created.
     """
 
     project: Project
@@ -21,6 +23,8 @@ class ProjectConfiguration:
     allowed_tools: Optional[str] = None  # Optional override for Claude's allowed tools
     stale_pr_days: Optional[int] = None  # Days before a PR is considered stale
     labels: Optional[str] = None  # Optional comma-separated labels to apply to PRs
+    max_open_prs: Optional[int] = None  # Optional limit of concurrently open PRs
+    batch_size: Optional[int] = None  # Optional number of tasks per Claude Code session
 
     @classmethod
     def default(cls, project: Project) -> 'ProjectConfiguration':
@@ -31,6 +35,8 @@ class ProjectConfiguration:
         - No base branch override (uses workflow default)
         - No allowed tools override (uses workflow default)
         - No labels override (uses workflow default)
+        - One open PR at a time
+        - One task per Claude Code session
 
         Args:
             project: Project domain model
@@ -44,7 +50,9 @@ class ProjectConfiguration:
             base_branch=None,
             allowed_tools=None,
             stale_pr_days=None,
-            labels=None
+            labels=None,
+            max_open_prs=None,
+            batch_size=None
         )
 
     @classmethod
@@ -57,6 +65,9 @@ class ProjectConfiguration:
 
         Returns:
             ProjectConfiguration instance
+
+        Raises:
+            ConfigurationError: If maxOpenPRs or batchSize is not a positive integer
         """
         from claudechain.domain.config import load_config_from_string
 
@@ -66,6 +77,14 @@ class ProjectConfiguration:
         allowed_tools = config.get("allowedTools")
         stale_pr_days = config.get("stalePRDays")
         labels = config.get("labels")
+        max_open_prs = config.get("maxOpenPRs")
+        batch_size = config.get("batchSize")
+
+        for field_name, value in (("maxOpenPRs", max_open_prs), ("batchSize", batch_size)):
+            if value is not None and (isinstance(value, bool) or not isinstance(value, int) or value < 1):
+                raise ConfigurationError(
+                    f"Invalid {field_name} in {project.config_path}: expected a positive integer, got {value!r}"
+                )
 
         return cls(
             project=project,
@@ -73,7 +92,9 @@ class ProjectConfiguration:
             base_branch=base_branch,
             allowed_tools=allowed_tools,
             stale_pr_days=stale_pr_days,
-            labels=labels
+            labels=labels,
+            max_open_prs=max_open_prs,
+            batch_size=batch_size
         )
 
     def get_base_branch(self, default_base_branch: str) -> str:
@@ -115,6 +136,32 @@ class ProjectConfiguration:
             return self.stale_pr_days
         return default
 
+    def get_max_open_prs(self, default: int = DEFAULT_MAX_OPEN_PRS) -> int:
+        """Get the number of PRs the project may have open at once.
+
+        Args:
+            default: Default value if not configured (default: DEFAULT_MAX_OPEN_PRS)
+
+        Returns:
+            maxOpenPRs from config if set, otherwise the default
+        """
+        if self.max_open_prs is not None:
+            return self.max_open_prs
+        return default
+
+    def get_batch_size(self, default: int = DEFAULT_BATCH_SIZE) -> int:
+        """Get the number of tasks to complete per Claude Code session.
+
+        Args:
+            default: Default value if not configured (default: DEFAULT_BATCH_SIZE)
+
+        Returns:
+            batchSize from config if set, otherwise the default
+        """
+        if self.batch_size is not None:
+            return self.batch_size
+        return default
+
     def get_labels(self, default_labels: str) -> str:
         """Resolve labels from project config or fall back to default.
 
@@ -147,4 +194,8 @@ class ProjectConfiguration:
             result["stalePRDays"] = self.stale_pr_days
         if self.labels:
             result["labels"] = self.labels
+        if self.max_open_prs is not None:
+            result["maxOpenPRs"] = self.max_open_prs
+        if self.batch_size is not None:
+            result["batchSize"] = self.batch_size
         return result
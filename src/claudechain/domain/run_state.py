@@ -0,0 +1,68 @@
+"""Domain model for state shared between the steps of one workflow run"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from claudechain.domain.project import Project
+from claudechain.domain.spec_content import SpecContent
+
+
+@dataclass
+class RunState:
+    """Facts resolved by one step that later steps of the same run can reuse
+
+    The composite action runs each command in its own process. prepare
+    records the spec.md it read and the base commit it branched from, so
+    finalize can reuse the spec instead of fetching it from GitHub again.
+    Every field is optional: a step must fall back to its own lookup when a
+    fact is missing or does not match what it needs.
+    """
+
+    run_id: str = ""
+    project_name: Optional[str] = None
+    base_branch: Optional[str] = None
+    base_sha: Optional[str] = None  # Base branch commit the spec was read from
+    spec_path: Optional[str] = None
+    spec_content: Optional[str] = None
+
+    def get_spec(self, base_branch: str, spec_path: str) -> Optional[SpecContent]:
+        """Get the recorded spec if it was read from the same branch and path
+
+        Args:
+            base_branch: Branch the caller would read spec.md from
+            spec_path: Path of spec.md the caller needs
+
+        Returns:
+            SpecContent, or None if no matching spec was recorded
+        """
+        if (
+            self.spec_content is None
+            or not self.project_name
+            or self.base_branch != base_branch
+            or self.spec_path != spec_path
+        ):
+            return None
+        return SpecContent(Project(self.project_name), self.spec_content)
+
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-compatible dictionary"""
+        return {
+            "run_id": self.run_id,
+            "project_name": self.project_name,
+            "base_branch": self.base_branch,
+            "base_sha": self.base_sha,
+            "spec_path": self.spec_path,
+            "spec_content": self.spec_content,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RunState":
+        """Parse a dictionary produced by to_dict()"""
+        return cls(
+            run_id=data.get("run_id", ""),
+            project_name=data.get("project_name"),
+            base_branch=data.get("base_branch"),
+            base_sha=data.get("base_sha"),
+            spec_path=data.get("spec_path"),
+            spec_content=data.get("spec_content"),
+        )
@@ -1,12 +1,64 @@
 """Domain models for spec.md content parsing"""
 
 import hashlib
+import heapq
 import re
 from dataclasses import dataclass
-from typing import List, Optional
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
 
+from claudechain.domain.exceptions import ConfigurationError
 from claudechain.domain.project import Project
 
+# Checklist line: "- [ ] Task", "- [x] Task" or "- [X] Task", optionally indented.
+# [^\S\n] is whitespace other than newline, so one MULTILINE scan over the
+# whole file matches exactly what a per-line `^\s*- \[([xX ])\]\s*(.+)$` would.
+_TASK_LINE_PATTERN = re.compile(r'^[^\S\n]*- \[([xX ])\][^\S\n]*(.+)$', re.MULTILINE)
+
+# Trailing scheduling annotation: "- [ ] Task <!-- id: api; after: schema; group: backend -->"
+_TASK_ANNOTATION_PATTERN = re.compile(r'\s*<!--((?:(?!-->).)*)-->\s*$')
+_TASK_ANNOTATION_KEYS = ('id', 'after', 'group')
+
+
+def parse_task_annotations(description: str) -> Tuple[str, Dict[str, str]]:
+    """Split a trailing scheduling annotation off a task description
+
+    Only a trailing HTML comment made of `key: value` pairs (separated by
+    ";") with the keys id, after and group is treated as an annotation, so
+    other comments stay part of the description. The annotation is not part
+    of the description and therefore does not affect the task hash.
+
+    Args:
+        description: Task description as written after the checkbox
+
+    Returns:
+        Tuple of (description without annotation, annotation values by key)
+
+    Examples:
+        >>> parse_task_annotations("Add API <!-- id: api; after: schema -->")
+        ('Add API', {'id': 'api', 'after': 'schema'})
+        >>> parse_task_annotations("Add API")
+        ('Add API', {})
+    """
+    if '<!--' not in description:
+        return description, {}
+    match = _TASK_ANNOTATION_PATTERN.search(description)
+    if not match:
+        return description, {}
+
+    annotations = {}
+    for part in match.group(1).split(';'):
+        if not part.strip():
+            continue
+        key, sep, value = part.partition(':')
+        key = key.strip()
+        if not sep or key not in _TASK_ANNOTATION_KEYS:
+            return description, {}
+        annotations[key] = value.strip()
+    if not annotations:
+        return description, {}
+    return description[:match.start()].strip(), annotations
+
 
 def generate_task_hash(description: str) -> str:
     """Generate stable hash identifier for a task description.
@@ -38,15 +90,24 @@ def generate_task_hash(description: str) -> str:
     return hash_bytes.hex()[:8]
 
 
-@dataclass
+@dataclass(frozen=True)
 class SpecTask:
-    """Domain model for a task in spec.md"""
+    """Domain model for a task in spec.md
+
+    Tasks are immutable so the SpecIndex built from them stays valid; use
+    SpecContent.complete_tasks() to check tasks off.
+    """
 
     index: int  # 1-based position in file
     description: str
     is_completed: bool
     raw_line: str  # Original markdown line
     task_hash: str  # 8-character hash of task description
+    start: int = 0  # Byte offset of raw_line in the UTF-8 encoded spec
+    end: int = 0  # Byte offset just past raw_line (before the newline)
+    task_id: Optional[str] = None  # Name other tasks can reference in "after"
+    after: Tuple[str, ...] = ()  # Ids or hashes of prerequisite tasks
+    group: Optional[str] = None  # Independent sequence the task belongs to
 
     @classmethod
     def from_markdown_line(cls, line: str, index: int) -> Optional['SpecTask']:
@@ -66,14 +127,15 @@ class SpecTask:
 
         checkbox, description = match.groups()
         is_completed = checkbox.lower() == 'x'
-        description_stripped = description.strip()
+        description_stripped, annotations = parse_task_annotations(description.strip())
 
         return cls(
             index=index,
             description=description_stripped,
             is_completed=is_completed,
             raw_line=line,
-            task_hash=generate_task_hash(description_stripped)
+            task_hash=generate_task_hash(description_stripped),
+            **_annotation_fields(annotations)
         )
 
     def to_markdown_line(self) -> str:
@@ -83,11 +145,271 @@ class SpecTask:
             Markdown string like "- [ ] Task description" or "- [x] Task description"
         """
         checkbox = "[x]" if self.is_completed else "[ ]"
+        annotations = []
+        if self.task_id:
+            annotations.append(f"id: {self.task_id}")
+        if self.after:
+            annotations.append(f"after: {', '.join(self.after)}")
+        if self.group:
+            annotations.append(f"group: {self.group}")
+        if annotations:
+            return f"- {checkbox} {self.description} <!-- {'; '.join(annotations)} -->"
         return f"- {checkbox} {self.description}"
 
 
+def _annotation_fields(annotations: Dict[str, str]) -> dict:
+    """Map parsed annotation values to SpecTask field values"""
+    fields = {}
+    if annotations.get('id'):
+        fields['task_id'] = annotations['id']
+    if annotations.get('after'):
+        fields['after'] = tuple(ref.strip() for ref in annotations['after'].split(',') if ref.strip())
+    if annotations.get('group'):
+        fields['group'] = annotations['group']
+    return fields
+
+
+@dataclass(frozen=True)
+class SpecIndex:
+    """Immutable index of the tasks in one spec.md, built in a single pass
+
+    Answers the queries callers make repeatedly (lookup by hash or index,
+    next pending task, completion counts) without rescanning the task list.
+    """
+
+    tasks: Tuple[SpecTask, ...]
+    by_hash: Mapping[str, SpecTask]  # First task with each hash
+    pending: Tuple[SpecTask, ...]  # Uncompleted tasks in file order
+    completed_count: int
+
+    @classmethod
+    def build(cls, content: str) -> 'SpecIndex':
+        """Parse every task line of a spec in one scan
+
+        Args:
+            content: Raw spec.md content
+
+        Returns:
+            SpecIndex over the tasks, with byte offsets of each task line
+        """
+        ascii_only = content.isascii()
+        tasks: List[SpecTask] = []
+        char_pos = byte_pos = 0
+
+        for match in _TASK_LINE_PATTERN.finditer(content):
+            start, end = match.span()
+            if ascii_only:
+                byte_start, byte_end = start, end
+            else:
+                # Advance the byte cursor incrementally so the total work stays linear
+                byte_start = byte_pos + len(content[char_pos:start].encode('utf-8'))
+                byte_end = byte_start + len(content[start:end].encode('utf-8'))
+                char_pos, byte_pos = end, byte_end
+
+            checkbox, description = match.groups()
+            description, annotations = parse_task_annotations(description.strip())
+            tasks.append(SpecTask(
+                index=len(tasks) + 1,
+                description=description,
+                is_completed=checkbox.lower() == 'x',
+                raw_line=match.group(0),
+                task_hash=generate_task_hash(description),
+                start=byte_start,
+                end=byte_end,
+                **(_annotation_fields(annotations) if annotations else {})
+            ))
+
+        return cls.from_tasks(tasks)
+
+    @classmethod
+    def from_tasks(cls, tasks: Iterable[SpecTask]) -> 'SpecIndex':
+        """Index already parsed tasks
+
+        Args:
+            tasks: Tasks in file order
+
+        Returns:
+            SpecIndex over the tasks
+        """
+        tasks = tuple(tasks)
+        by_hash = {}
+        pending: List[SpecTask] = []
+        for task in tasks:
+            by_hash.setdefault(task.task_hash, task)
+            if not task.is_completed:
+                pending.append(task)
+
+        return cls(
+            tasks=tasks,
+            by_hash=MappingProxyType(by_hash),
+            pending=tuple(pending),
+            completed_count=len(tasks) - len(pending),
+        )
+
+
+@dataclass(frozen=True)
+class TaskGraph:
+    """Dependency graph (DAG) over the tasks of one spec.md
+
+    By default a spec is one sequence: every task depends on the task before
+    it. Annotations relax this:
+
+    - `group: <name>` puts a task in an independent sequence; it depends on
+      the previous task of the same group only (ungrouped tasks form one
+      sequence of their own)
+    - `after: <ref>, <ref>` lists the prerequisites explicitly instead, by
+      another task's `id` or by task hash
+
+    Two tasks are only ready at the same time when neither depends on the
+    other, so concurrently open PRs never build on each other's changes.
+    """
+
+    tasks: Tuple[SpecTask, ...]
+    dependencies: Mapping[int, Tuple[int, ...]]  # Task index -> prerequisite task indices
+
+    @classmethod
+    def build(cls, tasks: Iterable[SpecTask]) -> 'TaskGraph':
+        """Resolve the dependencies declared in a spec's tasks
+
+        Args:
+            tasks: Tasks in file order
+
+        Returns:
+            TaskGraph over the tasks
+
+        Raises:
+            ConfigurationError: If a task references an unknown task or the
+                dependencies contain a cycle
+        """
+        tasks = tuple(tasks)
+        ids: Dict[str, int] = {}
+        for task in tasks:
+            if task.task_id:
+                if task.task_id in ids:
+                    raise ConfigurationError(f"Duplicate task id '{task.task_id}' in spec.md")
+                ids[task.task_id] = task.index
+        refs: Dict[str, int] = {}
+        for task in tasks:
+            refs.setdefault(task.task_hash, task.index)
+        refs.update(ids)  # An explicit id wins over a colliding hash
+
+        dependencies: Dict[int, Tuple[int, ...]] = {}
+        last_in_group: Dict[Optional[str], int] = {}
+        for task in tasks:
+            if task.after:
+                prerequisites = []
+                for ref in task.after:
+                    if ref not in refs:
+                        raise ConfigurationError(
+                            f"Task {task.index} ('{task.description}') depends on unknown task '{ref}'"
+                        )
+                    prerequisites.append(refs[ref])
+                dependencies[task.index] = tuple(dict.fromkeys(prerequisites))
+            elif task.group in last_in_group:
+                dependencies[task.index] = (last_in_group[task.group],)
+            else:
+                dependencies[task.index] = ()
+            last_in_group[task.group] = task.index
+
+        graph = cls(tasks=tasks, dependencies=MappingProxyType(dependencies))
+        graph.topological_order()  # Reject cycles up front
+        return graph
+
+    def topological_order(self) -> List[SpecTask]:
+        """Order tasks so every task follows its prerequisites
+
+        Ties are broken by position in the file, so a spec without
+        annotations keeps its written order.
+
+        Returns:
+            All tasks in dependency order
+
+        Raises:
+            ConfigurationError: If the dependencies contain a cycle
+        """
+        dependents: Dict[int, List[int]] = {task.index: [] for task in self.tasks}
+        remaining = {}
+        for index, prerequisites in self.dependencies.items():
+            remaining[index] = len(prerequisites)
+            for prerequisite in prerequisites:
+                dependents[prerequisite].append(index)
+
+        heap = [index for index, count in remaining.items() if count == 0]
+        heapq.heapify(heap)
+        order = []
+        while heap:
+            index = heapq.heappop(heap)
+            order.append(self.tasks[index - 1])
+            for dependent in dependents[index]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    heapq.heappush(heap, dependent)
+
+        if len(order) != len(self.tasks):
+            cyclic = sorted(index for index, count in remaining.items() if count > 0)
+            raise ConfigurationError(f"Task dependencies in spec.md contain a cycle (tasks {cyclic})")
+        return order
+
+    def ready_tasks(self, skip_hashes: Optional[Set[str]] = None, limit: Optional[int] = None) -> List[SpecTask]:
+        """Find pending tasks whose prerequisites are all completed
+
+        Args:
+            skip_hashes: Hashes of tasks already in progress (open PRs)
+            limit: Maximum number of tasks to return (None for all)
+
+        Returns:
+            Ready tasks in topological order
+        """
+        skip_hashes = skip_hashes or set()
+        ready = []
+        for task in self.topological_order():
+            if limit is not None and len(ready) >= limit:
+                break
+            if task.is_completed or task.task_hash in skip_hashes:
+                continue
+            if all(self.tasks[prerequisite - 1].is_completed for prerequisite in self.dependencies[task.index]):
+                ready.append(task)
+        return ready
+
+    def next_batch(self, skip_hashes: Optional[Set[str]] = None, size: int = 1) -> List[SpecTask]:
+        """Pick a chain of tasks that one session can complete in order
+
+        The first task is the first ready task; each further task is the
+        first one that would be ready once the tasks picked before it are
+        complete. Later tasks may therefore build on earlier ones.
+
+        Args:
+            skip_hashes: Hashes of tasks already in progress (open PRs)
+            size: Maximum number of tasks to pick
+
+        Returns:
+            Up to size tasks in the order they should be completed
+        """
+        skip_hashes = skip_hashes or set()
+        picked: List[SpecTask] = []
+        picked_indices: Set[int] = set()
+        order = self.topological_order()
+        while len(picked) < size:
+            for task in order:
+                if task.is_completed or task.index in picked_indices or task.task_hash in skip_hashes:
+                    continue
+                if all(
+                    self.tasks[prerequisite - 1].is_completed or prerequisite in picked_indices
+                    for prerequisite in self.dependencies[task.index]
+                ):
+                    picked.append(task)
+                    picked_indices.add(task.index)
+                    break
+            else:
+                break
+        return picked
+
+
 class SpecContent:
-    """Domain model for parsed spec.md content"""
+    """Domain model for parsed spec.md content
+
+    Tasks are parsed once, on first use, into a SpecIndex.
+    """
 
     def __init__(self, project: Project, content: str):
         """Initialize SpecContent
@@ -98,35 +420,45 @@ class SpecContent:
         """
         self.project = project
         self.content = content
+        self._index: Optional[SpecIndex] = None
         self._tasks: Optional[List[SpecTask]] = None
+        self._graph: Optional[TaskGraph] = None
 
     @property
-    def tasks(self) -> List[SpecTask]:
-        """Lazily parse and return all tasks from spec
+    def index(self) -> SpecIndex:
+        """Lazily build and return the task index
 
         Returns:
-            List of SpecTask instances
+            SpecIndex over all tasks in the spec
         """
-        if self._tasks is None:
-            self._tasks = self._parse_tasks()
-        return self._tasks
+        if self._index is None:
+            self._index = SpecIndex.build(self.content)
+        return self._index
 
-    def _parse_tasks(self) -> List[SpecTask]:
-        """Parse all tasks from markdown content
+    @property
+    def graph(self) -> TaskGraph:
+        """Lazily build and return the task dependency graph
 
         Returns:
-            List of SpecTask instances
+            TaskGraph over all tasks in the spec
+
+        Raises:
+            ConfigurationError: If the task dependencies are invalid
         """
-        tasks = []
-        task_index = 1
+        if self._graph is None:
+            self._graph = TaskGraph.build(self.index.tasks)
+        return self._graph
 
-        for line in self.content.split('\n'):
-            task = SpecTask.from_markdown_line(line, task_index)
-            if task:
-                tasks.append(task)
-                task_index += 1
+    @property
+    def tasks(self) -> List[SpecTask]:
+        """Lazily parse and return all tasks from spec
 
-        return tasks
+        Returns:
+            List of SpecTask instances
+        """
+        if self._tasks is None:
+            self._tasks = list(self.index.tasks)
+        return self._tasks
 
     @property
     def total_tasks(self) -> int:
@@ -144,7 +476,7 @@ class SpecContent:
         Returns:
             Number of completed tasks
         """
-        return sum(1 for task in self.tasks if task.is_completed)
+        return self.index.completed_count
 
     @property
     def pending_tasks(self) -> int:
@@ -153,7 +485,7 @@ class SpecContent:
         Returns:
             Number of uncompleted tasks
         """
-        return self.total_tasks - self.completed_tasks
+        return len(self.index.pending)
 
     def get_task_by_index(self, index: int) -> Optional[SpecTask]:
         """Get task by 1-based index
@@ -164,7 +496,19 @@ class SpecContent:
         Returns:
             SpecTask instance or None if index out of range
         """
-        return self.tasks[index - 1] if 0 < index <= len(self.tasks) else None
+        tasks = self.index.tasks
+        return tasks[index - 1] if 0 < index <= len(tasks) else None
+
+    def get_task_by_hash(self, task_hash: str) -> Optional[SpecTask]:
+        """Get task by its 8-character hash
+
+        Args:
+            task_hash: Task hash (e.g., from a PR branch name)
+
+        Returns:
+            First SpecTask with that hash, or None if no task matches
+        """
+        return self.index.by_hash.get(task_hash)
 
     def get_next_available_task(self, skip_hashes: Optional[set] = None) -> Optional[SpecTask]:
         """Find the next uncompleted task
@@ -177,29 +521,86 @@ class SpecContent:
         """
         skip_hashes = skip_hashes or set()
 
-        for task in self.tasks:
-            # Skip if task is completed
-            if task.is_completed:
-                continue
-            # Skip if task hash is in skip_hashes
-            if task.task_hash in skip_hashes:
-                continue
-            # Found an available task
-            return task
+        for task in self.index.pending:
+            if task.task_hash not in skip_hashes:
+                return task
 
         return None
 
+    def get_ready_tasks(self, skip_hashes: Optional[set] = None, limit: Optional[int] = None) -> List[SpecTask]:
+        """Find pending tasks whose prerequisites are completed
+
+        Args:
+            skip_hashes: Optional set of task hashes to skip (in progress)
+            limit: Maximum number of tasks to return (None for all)
+
+        Returns:
+            Ready SpecTasks in dependency order
+
+        Raises:
+            ConfigurationError: If the task dependencies are invalid
+        """
+        return self.graph.ready_tasks(skip_hashes, limit)
+
+    def get_task_batch(self, skip_hashes: Optional[set] = None, size: int = 1) -> List[SpecTask]:
+        """Pick consecutive tasks to complete together in one session
+
+        Args:
+            skip_hashes: Optional set of task hashes to skip (in progress)
+            size: Maximum number of tasks to pick
+
+        Returns:
+            SpecTasks in completion order
+
+        Raises:
+            ConfigurationError: If the task dependencies are invalid
+        """
+        return self.graph.next_batch(skip_hashes, size)
+
     def get_pending_task_indices(self) -> List[int]:
         """Get indices of all pending tasks
 
         Returns:
             List of task indices (1-based)
         """
-        return [
-            task.index
-            for task in self.tasks
-            if not task.is_completed
-        ]
+        return [task.index for task in self.index.pending]
+
+    def complete_tasks(self, task_hashes: Iterable[str]) -> Tuple[str, List[SpecTask]]:
+        """Check off tasks by hash in one pass over the content
+
+        Only the checkbox character of each task line is rewritten, located
+        through the byte offsets recorded by the index, so everything else in
+        the spec (line endings, indentation, other text) is preserved. When
+        several pending tasks share a hash, the first one is completed.
+
+        Args:
+            task_hashes: Hashes of the tasks to mark complete
+
+        Returns:
+            Tuple of (updated content, tasks that were checked off). Hashes
+            that match no pending task are ignored.
+
+        Example:
+            >>> content, done = spec.complete_tasks({"a3f2b891", "f7c4d3e2"})
+        """
+        remaining = set(task_hashes)
+        completed: List[SpecTask] = []
+        for task in self.index.pending:
+            if not remaining:
+                break
+            if task.task_hash in remaining:
+                remaining.discard(task.task_hash)
+                completed.append(task)
+
+        if not completed:
+            return self.content, []
+
+        data = bytearray(self.content.encode('utf-8'))
+        for task in completed:
+            # The checkbox follows the first "[" of the line ("- [ ] ...")
+            prefix = task.raw_line[:task.raw_line.index('[') + 1]
+            data[task.start + len(prefix.encode('utf-8'))] = ord('x')
+        return data.decode('utf-8'), completed
 
     def to_markdown(self) -> str:
         """Convert all tasks back to markdown format
@@ -0,0 +1,171 @@
+"""Domain models for running several spec tasks in one Claude Code session
+
+In batch mode prepare hands Claude a chain of consecutive tasks and asks for
+one commit per task, each tagged with the task's hash. finalize then splits
+the session's commits by tag into one stacked PR per task: the branch of
+task i is the branch of task i-1 with task i's commits and a spec.md
+commit checking off task i on top. Each PR therefore adds only its own
+task on top of the previous one, so merging the PRs in order lands the
+tasks one at a time, and merging a later PR first lands all earlier ones
+with it.
+"""
+
+import json
+import re
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Sequence, Tuple
+
+# Commit subject tag that attributes a commit to a task: "[task a3f2b891] ..."
+_COMMIT_MARKER_PATTERN = re.compile(r'\[task ([0-9a-f]{8})\]')
+
+
+def commit_marker(task_hash: str) -> str:
+    """Commit subject tag for a task
+
+    Args:
+        task_hash: 8-character task hash
+
+    Returns:
+        Tag such as "[task a3f2b891]"
+    """
+    return f"[task {task_hash}]"
+
+
+@dataclass
+class BatchTask:
+    """One task of a batch, as handed from prepare to finalize"""
+
+    task_index: int
+    task_description: str
+    task_hash: str
+    branch_name: str
+
+
+@dataclass
+class TaskBatch:
+    """Ordered tasks completed together in one Claude Code session"""
+
+    tasks: List[BatchTask]
+
+    def __len__(self) -> int:
+        return len(self.tasks)
+
+    @property
+    def task_hashes(self) -> List[str]:
+        """Hashes of the batch's tasks in order"""
+        return [task.task_hash for task in self.tasks]
+
+    def to_json(self) -> str:
+        """Serialize for a workflow step output"""
+        return json.dumps([asdict(task) for task in self.tasks], separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, json_str: str) -> "TaskBatch":
+        """Parse the output written by to_json()
+
+        Args:
+            json_str: JSON array of tasks (empty string for no batch)
+
+        Returns:
+            TaskBatch (empty if json_str is empty)
+
+        Raises:
+            ValueError: If json_str is not a valid task list
+        """
+        if not json_str.strip():
+            return cls(tasks=[])
+        try:
+            return cls(tasks=[BatchTask(**task) for task in json.loads(json_str)])
+        except (TypeError, json.JSONDecodeError) as e:
+            raise ValueError(f"Invalid task batch: {e}")
+
+    def split_commits(self, commits: Sequence[Tuple[str, str]]) -> Dict[str, List[str]]:
+        """Attribute the session's commits to the batch's tasks
+
+        A commit tagged with a task's marker belongs to that task; untagged
+        commits belong to the task of the closest tagged commit before them
+        (or to the first task if none precedes them). Tags must follow the
+        batch order: a tag of an earlier task than the current one, like a
+        tag of a hash outside the batch, is ignored, so every task's commits
+        come after all commits of the tasks before it.
+
+        Args:
+            commits: (sha, subject) pairs, oldest first
+
+        Returns:
+            Commit shas per task hash, oldest first (every task has an entry)
+        """
+        positions = {}
+        for position, task_hash in enumerate(self.task_hashes):
+            positions.setdefault(task_hash, position)
+        result: Dict[str, List[str]] = {task_hash: [] for task_hash in self.task_hashes}
+        if not self.tasks:
+            return result
+        current = 0
+        for sha, subject in commits:
+            for task_hash in _COMMIT_MARKER_PATTERN.findall(subject):
+                if positions.get(task_hash, -1) >= current:
+                    current = positions[task_hash]
+                    break
+            result[self.task_hashes[current]].append(sha)
+        return result
+
+    def leftover_task(self, commits: Sequence[Tuple[str, str]]) -> BatchTask:
+        """Task that changes Claude left uncommitted belong to
+
+        Claude commits tasks in batch order, so uncommitted changes are the
+        work on the first task after the last tagged commit (the first task
+        if nothing was tagged, the last task if every task was tagged).
+        Tagging them with that task keeps split_commits from leaving the
+        tasks before it without commits.
+
+        Args:
+            commits: (sha, subject) pairs of the session, oldest first
+
+        Returns:
+            Task to tag the leftover commit with
+
+        Raises:
+            ValueError: If the batch is empty
+        """
+        if not self.tasks:
+            raise ValueError("Empty task batch has no leftover task")
+        positions = {}
+        for position, task_hash in enumerate(self.task_hashes):
+            positions.setdefault(task_hash, position)
+        last_tagged = -1
+        for _, subject in commits:
+            for task_hash in _COMMIT_MARKER_PATTERN.findall(subject):
+                if positions.get(task_hash, -1) > last_tagged:
+                    last_tagged = positions[task_hash]
+                    break
+        return self.tasks[min(last_tagged + 1, len(self.tasks) - 1)]
+
+
+def allocate_cost(total: float, weights: Sequence[float]) -> List[float]:
+    """Split a cost across tasks in proportion to their weights
+
+    A Claude Code session reports one usage total, so the cost of a batch is
+    apportioned by how much each task changed (e.g. lines added + deleted).
+    When no task has a positive weight the cost is split evenly.
+
+    Args:
+        total: Cost to split in USD
+        weights: Non-negative weight per task
+
+    Returns:
+        Cost per task, summing to total
+
+    Examples:
+        >>> allocate_cost(0.9, [2, 1])
+        [0.6, 0.3]
+        >>> allocate_cost(1.0, [0, 0])
+        [0.5, 0.5]
+    """
+    if not weights:
+        return []
+    positive = [max(weight, 0) for weight in weights]
+    weight_sum = sum(positive)
+    if weight_sum <= 0:
+        return [total / len(weights)] * len(weights)
+    return [total * weight / weight_sum for weight in positive]
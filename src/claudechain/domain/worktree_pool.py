@@ -0,0 +1,133 @@
+"""Domain models for running several tasks concurrently on one runner"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from claudechain.domain.task_batch import TaskBatch
+
+# Statuses of a pooled task, in the order they are reported
+POOL_STATUS_CREATED = "created"
+POOL_STATUS_NO_CHANGES = "no_changes"
+POOL_STATUS_FAILED = "failed"
+
+_HEREDOC_START = re.compile(r"^([A-Za-z_][A-Za-z0-9_\-]*)<<(.+)$")
+
+
+@dataclass
+class PoolTask:
+    """A task claimed by one worktree of the pool
+
+    Attributes:
+        slot: Sequence number of the task within the pool run (1-based)
+        project_name: Project the task belongs to
+        worktree_path: Checkout the task runs in
+        work_dir: Private directory for the task's outputs, summary and run state
+        outputs: Outputs written by prepare (project_path, branch_name, ...)
+    """
+
+    slot: int
+    project_name: str
+    worktree_path: str
+    work_dir: str
+    outputs: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def task_hashes(self) -> List[str]:
+        """Hashes of every task handed to this session (several in batch mode)"""
+        batch = TaskBatch.from_json(self.outputs.get("batch_tasks", ""))
+        if len(batch) > 1:
+            return batch.task_hashes
+        task_hash = self.outputs.get("task_hash", "")
+        return [task_hash] if task_hash else []
+
+    @property
+    def task_description(self) -> str:
+        """Description of the (first) task"""
+        return self.outputs.get("task_description", "")
+
+
+@dataclass
+class PoolTaskResult:
+    """Outcome of one pooled task
+
+    Attributes:
+        project_name: Project the task belongs to
+        task_description: Task worked on
+        status: POOL_STATUS_CREATED, POOL_STATUS_NO_CHANGES or POOL_STATUS_FAILED
+        pr_url: URL of the created PR (empty unless created)
+        message: Failure reason or other detail
+    """
+
+    project_name: str
+    task_description: str
+    status: str
+    pr_url: str = ""
+    message: str = ""
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the task ran to completion (with or without a PR)"""
+        return self.status != POOL_STATUS_FAILED
+
+
+def compute_pool_size(
+    cpu_count: Optional[int],
+    available_memory_mb: Optional[int],
+    memory_per_task_mb: int,
+    max_workers: Optional[int] = None,
+) -> int:
+    """Number of tasks the runner can execute at once
+
+    Each task runs Claude Code plus the project's scripts, so the pool gets
+    one slot per CPU, reduced to what fits in the available memory.
+
+    Args:
+        cpu_count: CPUs available to the process (None if unknown)
+        available_memory_mb: Memory available for new processes (None if unknown)
+        memory_per_task_mb: Memory budget of one task
+        max_workers: Upper bound requested by the caller (optional)
+
+    Returns:
+        Pool size, at least 1
+    """
+    size = cpu_count or 1
+    if available_memory_mb is not None and memory_per_task_mb > 0:
+        size = min(size, available_memory_mb // memory_per_task_mb)
+    if max_workers is not None:
+        size = min(size, max_workers)
+    return max(size, 1)
+
+
+def parse_github_output(text: str) -> Dict[str, str]:
+    """Parse a $GITHUB_OUTPUT file into a dict
+
+    Supports both "name=value" lines and the "name<<DELIMITER" heredoc form
+    written by GitHubActionsHelper.write_output for multi-line values. Later
+    values of a name replace earlier ones.
+
+    Args:
+        text: File content
+
+    Returns:
+        Dict of output name to value
+    """
+    outputs: Dict[str, str] = {}
+    lines = text.splitlines()
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        heredoc = _HEREDOC_START.match(line)
+        if heredoc:
+            name, delimiter = heredoc.groups()
+            value_lines = []
+            i += 1
+            while i < len(lines) and lines[i] != delimiter:
+                value_lines.append(lines[i])
+                i += 1
+            outputs[name] = "\n".join(value_lines)
+        elif "=" in line:
+            name, value = line.split("=", 1)
+            outputs[name] = value
+        i += 1
+    return outputs
@@ -0,0 +1,185 @@
+"""Permanent local store for downloaded task metadata artifacts
+
+Artifact contents never change once uploaded, so each task-metadata artifact
+only needs to be downloaded and unzipped once. The store keeps the parsed
+metadata of every artifact seen so far as one compact JSON line per artifact,
+keyed by artifact ID. When GitHub reports a content digest for the artifact,
+it is stored alongside and a mismatch is treated as a miss.
+
+With CLAUDECHAIN_CACHE_DIR set the store is a JSONL file persisted across
+workflow runs with actions/cache; otherwise it only lives in memory and
+de-duplicates downloads within one process.
+"""
+
+import json
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+STORE_FILE_NAME = "task-metadata.jsonl"
+
+
+@dataclass
+class ArtifactStoreStats:
+    """Hit/miss counters for one process"""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    bytes_saved: int = 0
+
+    @property
+    def requests(self) -> int:
+        """Total lookups"""
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered without downloading"""
+        return self.hits / self.requests if self.requests else 0.0
+
+    def format_summary(self) -> str:
+        """Format counters as a markdown section for the step summary"""
+        lines = [
+            "## Artifact Cache",
+            "",
+            "| Hits | Downloads | Hit rate | Download saved |",
+            "|-----:|----------:|---------:|---------------:|",
+            f"| {self.hits} | {self.misses} | {self.hit_rate:.0%} | {self.bytes_saved / 1024:.1f} KiB |",
+        ]
+        return "\n".join(lines)
+
+
+class ArtifactStore:
+    """Append-only store of artifact metadata keyed by artifact ID
+
+    Thread-safe: the index and the file are guarded by a lock. The file is
+    loaded lazily on first use; malformed lines (e.g. from an interrupted
+    write) are skipped and later lines win over earlier ones.
+
+    Example:
+        >>> store = ArtifactStore(Path("/tmp/claudechain-cache/artifacts/task-metadata.jsonl"))
+        >>> data = store.get(artifact_id, digest="sha256:...")
+        >>> if data is None:
+        ...     data = download(...)
+        ...     store.put(artifact_id, data, digest="sha256:...")
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """Initialize the store
+
+        Args:
+            path: JSONL file backing the store (created if missing), or None
+                to keep entries in memory only
+        """
+        self.path = Path(path) if path is not None else None
+        self.stats = ArtifactStoreStats()
+        self._entries: Optional[Dict[int, dict]] = None
+        self._lock = threading.Lock()
+
+    # Public API methods
+
+    def get(
+        self, artifact_id: int, digest: Optional[str] = None, size_in_bytes: int = 0
+    ) -> Optional[dict]:
+        """Get the stored metadata for an artifact
+
+        Args:
+            artifact_id: Artifact ID
+            digest: Content digest reported by GitHub, if known
+            size_in_bytes: Download size, counted as saved on a hit
+
+        Returns:
+            Stored metadata dictionary, or None on a miss
+        """
+        with self._lock:
+            entry = self._load().get(artifact_id)
+            if entry is None or (digest and entry.get("digest") and entry["digest"] != digest):
+                self.stats.misses += 1
+                return None
+            self.stats.hits += 1
+            self.stats.bytes_saved += size_in_bytes
+            return entry["data"]
+
+    def put(self, artifact_id: int, data: dict, digest: Optional[str] = None) -> None:
+        """Store the metadata for an artifact
+
+        Args:
+            artifact_id: Artifact ID
+            data: JSON-serializable metadata dictionary
+            digest: Content digest reported by GitHub, if known
+        """
+        entry = {"id": artifact_id, "digest": digest, "data": data}
+        with self._lock:
+            self._load()[artifact_id] = entry
+            self.stats.stores += 1
+            if self.path is None:
+                return
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            except OSError as e:
+                print(f"Warning: Failed to write artifact cache entry: {e}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._load())
+
+    # Private helper methods
+
+    def _load(self) -> Dict[int, dict]:
+        """Read the backing file once (caller holds the lock)"""
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = {}
+        if self.path is None:
+            return self._entries
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        self._entries[int(entry["id"])] = entry
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Warning: Failed to read artifact cache {self.path}: {e}")
+        return self._entries
+
+
+# ============================================================
+# Process-wide store
+# ============================================================
+
+_store: Optional[ArtifactStore] = None
+_store_lock = threading.Lock()
+
+
+def get_artifact_store() -> ArtifactStore:
+    """Get the ArtifactStore shared by this process
+
+    Persisted under $CLAUDECHAIN_CACHE_DIR/artifacts when that is set,
+    in memory otherwise.
+    """
+    global _store
+
+    with _store_lock:
+        if _store is None:
+            cache_dir = os.environ.get("CLAUDECHAIN_CACHE_DIR", "")
+            path = Path(cache_dir) / "artifacts" / STORE_FILE_NAME if cache_dir else None
+            _store = ArtifactStore(path)
+        return _store
+
+
+def reset_artifact_store(store: Optional[ArtifactStore] = None) -> None:
+    """Replace the shared store (used by tests)"""
+    global _store
+
+    with _store_lock:
+        _store = store
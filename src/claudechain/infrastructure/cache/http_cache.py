@@ -0,0 +1,230 @@
+"""On-disk HTTP cache for conditional GitHub GET requests
+
+Stores response bodies together with their ETag / Last-Modified validators so a
+later request can be sent with If-None-Match / If-Modified-Since. GitHub answers
+unchanged resources with 304 Not Modified, which does not count against the
+rate limit, and the body is served from disk.
+
+The cache is a flat directory (one .json metadata file and one .body file per
+entry) so it can be persisted across workflow runs with actions/cache. Size is
+bounded by least-recently-used eviction based on file modification times.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+# Response headers persisted with each entry
+_STORED_HEADERS = ("content-type", "etag", "last-modified", "link")
+
+
+@dataclass
+class CachedResponse:
+    """A cached response body with its validators"""
+
+    url: str
+    body: bytes
+    headers: Dict[str, str]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Request headers that revalidate this entry"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass
+class HttpCacheStats:
+    """Hit/miss counters for one process"""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    bytes_served: int = 0
+
+    @property
+    def requests(self) -> int:
+        """Total cacheable requests seen"""
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of requests answered with 304 from the cache"""
+        return self.hits / self.requests if self.requests else 0.0
+
+    def format_summary(self) -> str:
+        """Format counters as a markdown section for the step summary"""
+        lines = [
+            "## HTTP Cache",
+            "",
+            "| Hits (304) | Misses | Hit rate | Served from cache | Evictions |",
+            "|-----------:|-------:|---------:|------------------:|----------:|",
+            f"| {self.hits} | {self.misses} | {self.hit_rate:.0%} | "
+            f"{self.bytes_served / 1024:.1f} KiB | {self.evictions} |",
+        ]
+        return "\n".join(lines)
+
+
+class HttpCache:
+    """Size-bounded on-disk cache of GET responses keyed by URL
+
+    Thread-safe: entries are written atomically (temp file + rename) and the
+    counters are guarded by a lock.
+
+    Example:
+        >>> cache = HttpCache(Path("/tmp/claudechain-cache/http"))
+        >>> entry = cache.lookup(url)
+        >>> headers = entry.conditional_headers() if entry else {}
+    """
+
+    def __init__(self, directory: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        """Initialize the cache
+
+        Args:
+            directory: Directory holding cache entries (created if missing)
+            max_bytes: Total body size above which least-recently-used entries are evicted
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.stats = HttpCacheStats()
+        self._lock = threading.Lock()
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    # Public API methods
+
+    def lookup(self, url: str) -> Optional[CachedResponse]:
+        """Get the cached entry for a URL, or None if absent or unreadable"""
+        meta_path, body_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text())
+            body = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url:
+            return None
+        return CachedResponse(
+            url=url,
+            body=body,
+            headers=meta.get("headers", {}),
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+        )
+
+    def record_hit(self, entry: CachedResponse) -> None:
+        """Count a 304 served from the cache and mark the entry as recently used"""
+        now = time.time()
+        for path in self._paths(entry.url):
+            try:
+                os.utime(path, (now, now))
+            except OSError:
+                pass
+        with self._lock:
+            self.stats.hits += 1
+            self.stats.bytes_served += len(entry.body)
+
+    def record_miss(self) -> None:
+        """Count a request that had to download the full body"""
+        with self._lock:
+            self.stats.misses += 1
+
+    def store(self, url: str, body: bytes, headers: Dict[str, str]) -> bool:
+        """Store a response if it carries a validator
+
+        Args:
+            url: Request URL (cache key)
+            body: Response body
+            headers: Response headers (lower-cased keys)
+
+        Returns:
+            True if the response was stored
+        """
+        etag = headers.get("etag")
+        last_modified = headers.get("last-modified")
+        if not etag and not last_modified:
+            return False
+        if len(body) > self.max_bytes:
+            return False
+
+        meta = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "headers": {k: v for k, v in headers.items() if k in _STORED_HEADERS},
+        }
+        meta_path, body_path = self._paths(url)
+        try:
+            self._atomic_write(body_path, body)
+            self._atomic_write(meta_path, json.dumps(meta).encode("utf-8"))
+        except OSError as e:
+            print(f"Warning: Failed to write HTTP cache entry: {e}")
+            return False
+
+        with self._lock:
+            self.stats.stores += 1
+        self.evict()
+        return True
+
+    def evict(self) -> int:
+        """Remove least-recently-used entries until the cache fits max_bytes
+
+        Returns:
+            Number of entries evicted
+        """
+        entries = []
+        total = 0
+        for body_path in self.directory.glob("*.body"):
+            try:
+                stat = body_path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, body_path))
+            total += stat.st_size
+
+        evicted = 0
+        for _, size, body_path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            for path in (body_path, body_path.with_suffix(".json")):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            total -= size
+            evicted += 1
+
+        if evicted:
+            with self._lock:
+                self.stats.evictions += evicted
+        return evicted
+
+    # Static utility methods
+
+    @staticmethod
+    def cache_key(url: str) -> str:
+        """Stable file name for a URL"""
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    # Private helper methods
+
+    def _paths(self, url: str):
+        key = self.cache_key(url)
+        return self.directory / f"{key}.json", self.directory / f"{key}.body"
+
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes) -> None:
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
@@ -0,0 +1,164 @@
+"""Persisted snapshots of labeled PR listings for incremental syncs
+
+Listing every labeled PR costs one GraphQL request per 100 PRs on every
+statistics run, although only a handful change between runs. A snapshot keeps
+the PR state from the previous run, keyed by repository and label, together
+with the newest `updatedAt` it has seen. The next run only asks GitHub for PRs
+updated since then (most recently updated first, stopping at the first older
+PR) and merges them in by PR number. That listing is not filtered by label:
+removing a label updates the PR, so a PR that no longer carries the label
+shows up and is dropped from the snapshot.
+
+With CLAUDECHAIN_CACHE_DIR set, snapshots are written under
+$CLAUDECHAIN_CACHE_DIR/snapshots and persisted across workflow runs with
+actions/cache; without it there is nothing to resume from and callers do a
+full listing as before.
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from claudechain.domain.github_models import GitHubPullRequest
+
+SNAPSHOT_FORMAT_VERSION = 1
+
+# Re-fetch this much history before the last sync to tolerate GitHub's
+# eventually consistent updatedAt ordering; merging is idempotent
+SYNC_OVERLAP = timedelta(minutes=5)
+
+
+@dataclass
+class PullRequestSnapshot:
+    """PR state for one (repo, label) as of the newest update seen"""
+
+    repo: str
+    label: str
+    synced_at: Optional[datetime] = None
+    pull_requests: List[GitHubPullRequest] = field(default_factory=list)
+
+    @property
+    def fetch_since(self) -> Optional[datetime]:
+        """Update time to resume from, or None if a full listing is needed"""
+        return self.synced_at - SYNC_OVERLAP if self.synced_at else None
+
+    def merge(self, updated: Iterable[GitHubPullRequest]) -> int:
+        """Replace PRs by number with newer versions and advance synced_at
+
+        PRs without the snapshot's label are removed (or not added).
+
+        Args:
+            updated: PRs fetched from GitHub (new or changed)
+
+        Returns:
+            Number of PRs that were added, removed or differed from the snapshot
+        """
+        by_number = {pr.number: pr for pr in self.pull_requests}
+        changed = 0
+        for pr in updated:
+            if self.label not in pr.labels:
+                if by_number.pop(pr.number, None) is not None:
+                    changed += 1
+            else:
+                if by_number.get(pr.number) != pr:
+                    changed += 1
+                by_number[pr.number] = pr
+            if pr.updated_at and (self.synced_at is None or pr.updated_at > self.synced_at):
+                self.synced_at = pr.updated_at
+
+        self.pull_requests = sorted(by_number.values(), key=lambda pr: pr.created_at, reverse=True)
+        return changed
+
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-compatible dictionary"""
+        return {
+            "version": SNAPSHOT_FORMAT_VERSION,
+            "repo": self.repo,
+            "label": self.label,
+            "synced_at": self.synced_at.isoformat() if self.synced_at else None,
+            "pull_requests": [pr.to_dict() for pr in self.pull_requests],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PullRequestSnapshot":
+        """Parse a dictionary produced by to_dict()
+
+        Raises:
+            ValueError: If the data is not a snapshot in the current format
+        """
+        if data.get("version") != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported snapshot version: {data.get('version')}")
+        synced_at = data.get("synced_at")
+        return cls(
+            repo=data["repo"],
+            label=data["label"],
+            synced_at=datetime.fromisoformat(synced_at) if synced_at else None,
+            pull_requests=[GitHubPullRequest.from_dict(pr) for pr in data.get("pull_requests", [])],
+        )
+
+
+class PullRequestSnapshotStore:
+    """Directory of PR snapshots, one compact JSON file per (repo, label)
+
+    Example:
+        >>> store = PullRequestSnapshotStore(Path("/tmp/claudechain-cache/snapshots"))
+        >>> snapshot = store.load("owner/repo", "claudechain")
+        >>> store.save(snapshot)
+    """
+
+    def __init__(self, directory: Path):
+        """Initialize the store
+
+        Args:
+            directory: Directory holding snapshot files (created on first save)
+        """
+        self.directory = Path(directory)
+
+    # Public API methods
+
+    def load(self, repo: str, label: str) -> Optional[PullRequestSnapshot]:
+        """Load the snapshot for a repo and label
+
+        Returns:
+            The snapshot, or None if missing or unreadable (cold run)
+        """
+        path = self.path_for(repo, label)
+        try:
+            with open(path, encoding="utf-8") as f:
+                snapshot = PullRequestSnapshot.from_dict(json.load(f))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"Warning: Ignoring unreadable PR snapshot {path}: {e}")
+            return None
+
+        if snapshot.repo != repo or snapshot.label != label:
+            return None
+        return snapshot
+
+    def save(self, snapshot: PullRequestSnapshot) -> None:
+        """Write a snapshot atomically (failures are logged, not raised)"""
+        path = self.path_for(snapshot.repo, snapshot.label)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(snapshot.to_dict(), f, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Warning: Failed to write PR snapshot {path}: {e}")
+
+    def path_for(self, repo: str, label: str) -> Path:
+        """Snapshot file for a repo and label"""
+        key = hashlib.sha256(f"{repo}\n{label}".encode("utf-8")).hexdigest()[:16]
+        return self.directory / f"prs-{key}.json"
+
+
+def get_pr_snapshot_store() -> Optional[PullRequestSnapshotStore]:
+    """Get the snapshot store under $CLAUDECHAIN_CACHE_DIR, or None if unset"""
+    cache_dir = os.environ.get("CLAUDECHAIN_CACHE_DIR", "")
+    return PullRequestSnapshotStore(Path(cache_dir) / "snapshots") if cache_dir else None
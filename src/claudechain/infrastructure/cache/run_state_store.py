@@ -0,0 +1,125 @@
+"""Run-state file shared between the steps of one workflow run
+
+The composite action runs each command as a separate process. A command can
+load the RunState written by earlier steps, extend it and save it back: e.g.
+prepare records the spec it read and the commit it branched from, and
+finalize reuses the spec instead of fetching it again. The file lives in
+$RUNNER_TEMP, which GitHub Actions creates per job and removes afterwards.
+
+The file is an envelope around the state:
+
+    {"version": 1, "checksum": "sha256:...", "state": {...}}
+
+A missing file, an unknown version, a checksum mismatch (e.g. a truncated
+write) or state recorded by another run all load as an empty RunState, so
+every consumer falls back to deriving the facts itself.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+from claudechain.domain.run_state import RunState
+
+RUN_STATE_VERSION = 1
+RUN_STATE_FILE_NAME = "claudechain-run-state.json"
+
+
+class RunStateStore:
+    """Load and save the RunState of the current workflow run
+
+    Example:
+        >>> store = get_run_state_store()
+        >>> state = store.load()
+        >>> state.base_sha = "a1b2c3d"
+        >>> store.save(state)
+    """
+
+    def __init__(self, path: Optional[Path] = None, run_id: str = ""):
+        """Initialize the store
+
+        Args:
+            path: State file, or None to disable sharing (load() always
+                returns an empty state and save() does nothing)
+            run_id: Workflow run the state belongs to
+        """
+        self.path = Path(path) if path is not None else None
+        self.run_id = run_id
+
+    # Public API methods
+
+    @property
+    def enabled(self) -> bool:
+        """Whether state is shared with other steps (a state file is configured)"""
+        return self.path is not None
+
+    def load(self) -> RunState:
+        """Load the state written by earlier steps of this run
+
+        Returns:
+            The recorded RunState, or an empty one if none is usable
+        """
+        empty = RunState(run_id=self.run_id)
+        if self.path is None:
+            return empty
+
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                envelope = json.load(f)
+        except FileNotFoundError:
+            return empty
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable run state {self.path}: {e}")
+            return empty
+
+        if not isinstance(envelope, dict) or envelope.get("version") != RUN_STATE_VERSION:
+            print(f"Warning: Ignoring run state with unsupported version in {self.path}")
+            return empty
+        payload = envelope.get("state")
+        if not isinstance(payload, dict) or envelope.get("checksum") != self.checksum(payload):
+            print(f"Warning: Ignoring run state with invalid checksum in {self.path}")
+            return empty
+
+        state = RunState.from_dict(payload)
+        if state.run_id != self.run_id:
+            return empty
+        return state
+
+    def save(self, state: RunState) -> None:
+        """Write the state atomically (failures are logged, not raised)"""
+        if self.path is None:
+            return
+
+        state.run_id = self.run_id
+        payload = state.to_dict()
+        envelope = {"version": RUN_STATE_VERSION, "checksum": self.checksum(payload), "state": payload}
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(envelope, f, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Warning: Failed to write run state {self.path}: {e}")
+
+    # Static utility methods
+
+    @staticmethod
+    def checksum(payload: dict) -> str:
+        """SHA-256 of the canonical JSON encoding of a state payload"""
+        canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        return "sha256:" + hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def get_run_state_store() -> RunStateStore:
+    """Get the store for this run's state file in $RUNNER_TEMP
+
+    Sharing is disabled (in-memory only) outside GitHub Actions, when
+    RUNNER_TEMP is not set.
+    """
+    runner_temp = os.environ.get("RUNNER_TEMP", "")
+    path = Path(runner_temp) / RUN_STATE_FILE_NAME if runner_temp else None
+    run_id = f"{os.environ.get('GITHUB_RUN_ID', '')}-{os.environ.get('GITHUB_RUN_ATTEMPT', '')}"
+    return RunStateStore(path, run_id=run_id)
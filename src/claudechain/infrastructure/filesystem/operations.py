@@ -1,5 +1,8 @@
 """Filesystem operations"""
 
+import os
+import shutil
+import tempfile
 from pathlib import Path
 from typing import Optional
 
@@ -33,6 +36,33 @@ def write_file(path: Path, content: str) -> None:
     path.write_text(content)
 
 
+def write_file_atomic(path: Path, content: str) -> None:
+    """Write string content to file via a temporary file and rename
+
+    Readers never see a partially written file, and an interrupted write
+    leaves the original intact. The original file's permissions are kept.
+
+    Args:
+        path: Path to file to write
+        content: Content to write (encoded as UTF-8, newlines untranslated)
+
+    Raises:
+        IOError: If file cannot be written
+    """
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            f.write(content)
+        if path.exists():
+            shutil.copymode(path, tmp_name)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+        raise
+
+
 def file_exists(path: Path) -> bool:
     """Check if file exists
 
@@ -0,0 +1,166 @@
+"""Long-lived git cat-file process for object and ref lookups
+
+Checking whether a ref or object exists used to start a new `git cat-file -t`
+process per lookup. GitObjectReader keeps one `git cat-file --batch-check`
+process running per repository and sends each lookup over its stdin, so a
+command that resolves dozens of refs starts git once.
+
+The process picks up objects and refs fetched after it started: git
+re-scans packs and refs when a lookup misses.
+
+In a partial clone, a lookup that misses makes git fetch the object lazily
+from the promisor remote. An existence check must not do that, so the
+process runs with GIT_NO_LAZY_FETCH=1 (honoured by git 2.45 and later).
+"""
+
+import atexit
+import os
+import subprocess
+import threading
+from typing import Dict, Optional
+
+from claudechain.domain.exceptions import GitError
+from claudechain.infrastructure.tracing.tracer import get_tracer
+
+
+class GitObjectReader:
+    """Resolve refs and objects through a persistent cat-file process
+
+    Example:
+        >>> reader = GitObjectReader()
+        >>> reader.object_type("HEAD")
+        'commit'
+        >>> reader.object_type("HEAD:claude-chain/my-project/spec.md")
+        'blob'
+    """
+
+    def __init__(self, repo_dir: str = "."):
+        """Initialize the reader (the process starts on first use)
+
+        Args:
+            repo_dir: Repository working directory
+        """
+        self.repo_dir = repo_dir
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+    # Public API methods
+
+    def object_type(self, ref: str) -> Optional[str]:
+        """Get the type of an object or ref, like `git cat-file -t`
+
+        Args:
+            ref: Object name (SHA, ref name, "<rev>:<path>", ...)
+
+        Returns:
+            "commit", "tree", "blob" or "tag", or None if it does not exist
+
+        Raises:
+            GitError: If the cat-file process fails
+        """
+        if not self._is_valid_name(ref):
+            return None
+        with self._lock, get_tracer().span("git cat-file --batch-check", "git", ref=ref):
+            self._process = self._ensure_running()
+            header = self._request(ref)
+            return header.rsplit(" ", 2)[1] if header else None
+
+    def close(self) -> None:
+        """Stop the cat-file process"""
+        with self._lock:
+            process = self._process
+            if process is not None and process.poll() is None:
+                process.stdin.close()
+                try:
+                    process.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+            self._process = None
+
+    def __enter__(self) -> "GitObjectReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # Static utility methods
+
+    @staticmethod
+    def _is_valid_name(ref: str) -> bool:
+        """Whether ref can be sent as one line of batch input"""
+        return bool(ref) and "\n" not in ref and "\r" not in ref
+
+    # Private helper methods
+
+    def _ensure_running(self) -> subprocess.Popen:
+        """Return the process if it is alive, otherwise start a new one"""
+        if self._process is not None and self._process.poll() is None:
+            return self._process
+        try:
+            return subprocess.Popen(
+                ["git", "cat-file", "--batch-check"],
+                cwd=self.repo_dir,
+                env=dict(os.environ, GIT_NO_LAZY_FETCH="1"),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as e:
+            raise GitError(f"Failed to start git cat-file --batch-check: {e}")
+
+    def _request(self, ref: str) -> Optional[str]:
+        """Send one object name and read its header line
+
+        Returns:
+            The header line, or None if the object is missing or ambiguous
+        """
+        try:
+            self._process.stdin.write(ref.encode("utf-8") + b"\n")
+            self._process.stdin.flush()
+            line = self._process.stdout.readline()
+        except (BrokenPipeError, OSError) as e:
+            raise GitError(f"git cat-file failed for {ref}: {e}")
+        if not line:
+            raise GitError(f"git cat-file exited while looking up {ref} (not a git repository?)")
+
+        header = line.decode("utf-8", errors="replace").rstrip("\n")
+        if header.endswith((" missing", " ambiguous")):
+            return None
+        return header
+
+
+# ============================================================
+# Per-repository readers
+# ============================================================
+
+_readers: Dict[str, GitObjectReader] = {}
+_readers_lock = threading.Lock()
+
+
+def get_object_reader(repo_dir: Optional[str] = None) -> GitObjectReader:
+    """Get the shared reader for a repository
+
+    Args:
+        repo_dir: Repository working directory (default: current directory)
+
+    Returns:
+        GitObjectReader reused by every caller in this process
+    """
+    key = os.path.realpath(repo_dir or os.getcwd())
+    with _readers_lock:
+        reader = _readers.get(key)
+        if reader is None:
+            reader = _readers[key] = GitObjectReader(key)
+        return reader
+
+
+def close_object_readers() -> None:
+    """Stop every shared reader (run at exit; also used by tests)"""
+    with _readers_lock:
+        readers = list(_readers.values())
+        _readers.clear()
+    for reader in readers:
+        reader.close()
+
+
+atexit.register(close_object_readers)
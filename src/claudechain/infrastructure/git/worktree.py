@@ -0,0 +1,64 @@
+"""Git worktrees for running tasks side by side in one repository
+
+Every worktree is a separate checkout with its own HEAD, index and working
+files, but all of them share the object store and refs of the main
+checkout, so adding one costs a checkout of the tree rather than a clone.
+"""
+
+import os
+from typing import List
+
+from claudechain.domain.exceptions import GitError
+from claudechain.infrastructure.git.operations import run_git_command
+
+
+def add_worktree(path: str, ref: str) -> str:
+    """Check out a ref into a new worktree with a detached HEAD
+
+    Args:
+        path: Directory to create (must not exist or be empty)
+        ref: Commit or ref to check out (e.g. "origin/main")
+
+    Returns:
+        Absolute path of the worktree
+
+    Raises:
+        GitError: If the worktree cannot be created
+    """
+    path = os.path.abspath(path)
+    run_git_command(["worktree", "add", "--detach", path, ref])
+    return path
+
+
+def remove_worktree(path: str, branch: str = "") -> None:
+    """Remove a worktree, discarding its changes, and optionally its branch
+
+    Failures are logged, not raised, so cleanup never hides the task result.
+
+    Args:
+        path: Worktree directory
+        branch: Local branch created in the worktree to delete as well
+    """
+    try:
+        run_git_command(["worktree", "remove", "--force", os.path.abspath(path)])
+    except GitError as e:
+        print(f"Warning: Failed to remove worktree {path}: {e}")
+        try:
+            run_git_command(["worktree", "prune"])
+        except GitError:
+            pass
+    if branch:
+        try:
+            run_git_command(["branch", "-D", branch])
+        except GitError:
+            pass  # Branch was never created or is already gone
+
+
+def list_worktrees() -> List[str]:
+    """List the paths of all worktrees, the main checkout first
+
+    Raises:
+        GitError: If git fails
+    """
+    output = run_git_command(["worktree", "list", "--porcelain"])
+    return [line[len("worktree "):] for line in output.splitlines() if line.startswith("worktree ")]
@@ -0,0 +1,518 @@
+"""In-process GitHub REST/GraphQL client with keep-alive connection pooling
+
+Every `gh` invocation pays for process startup, an auth lookup and a fresh TLS
+handshake. GitHubClient keeps a small pool of persistent HTTPS connections per
+host so repeated API calls in one command reuse the same socket.
+
+The client is only used when a token is available in GH_TOKEN or GITHUB_TOKEN;
+operations fall back to the gh CLI otherwise (see get_github_client()). When
+CLAUDECHAIN_CACHE_DIR is set, GET requests are revalidated against an on-disk
+HttpCache so unchanged resources come back as 304s.
+"""
+
+import http.client
+import json
+import os
+import queue
+import threading
+import urllib.parse
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from claudechain.domain.exceptions import GitHubAPIError
+from claudechain.infrastructure.cache.http_cache import DEFAULT_MAX_BYTES, CachedResponse, HttpCache
+from claudechain.infrastructure.github.rate_limiter import (
+    RETRYABLE_STATUS_CODES,
+    RateLimiter,
+    get_rate_limiter,
+)
+from claudechain.infrastructure.tracing.tracer import get_tracer
+
+DEFAULT_API_URL = "https://api.github.com"
+DEFAULT_POOL_SIZE = 8
+DEFAULT_TIMEOUT_SECONDS = 30.0
+API_VERSION = "2022-11-28"
+USER_AGENT = "claudechain"
+
+# Methods that can be safely repeated after a server error
+_IDEMPOTENT_METHODS = {"GET", "HEAD", "PUT", "DELETE"}
+
+# Errors raised when a pooled keep-alive socket was closed by the server while idle
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+
+@dataclass
+class GitHubResponse:
+    """Raw HTTP response returned by GitHubClient.request()"""
+
+    status: int
+    headers: Dict[str, str] = field(default_factory=dict)  # Keys are lower-cased
+    body: bytes = b""
+
+    @property
+    def ok(self) -> bool:
+        """True for 2xx and 304 responses"""
+        return 200 <= self.status < 300 or self.status == 304
+
+    def header(self, name: str) -> Optional[str]:
+        """Get a response header (case-insensitive)"""
+        return self.headers.get(name.lower())
+
+    def json(self) -> Any:
+        """Parse the body as JSON, returning {} for empty bodies
+
+        Raises:
+            GitHubAPIError: If the body is not valid JSON
+        """
+        if not self.body:
+            return {}
+        try:
+            return json.loads(self.body)
+        except json.JSONDecodeError as e:
+            raise GitHubAPIError(f"Invalid JSON from API: {str(e)}")
+
+
+class _ConnectionPool:
+    """Thread-safe pool of keep-alive connections to a single host"""
+
+    def __init__(self, scheme: str, host: str, port: Optional[int], size: int, timeout: float):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._idle: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue(maxsize=size)
+
+    def acquire(self) -> Tuple[http.client.HTTPConnection, bool]:
+        """Get an idle connection or open a new one
+
+        Returns:
+            Tuple of (connection, reused) where reused is True for pooled sockets
+        """
+        try:
+            return self._idle.get_nowait(), True
+        except queue.Empty:
+            return self._new_connection(), False
+
+    def release(self, conn: http.client.HTTPConnection) -> None:
+        """Return a connection to the pool, closing it if the pool is full"""
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def close(self) -> None:
+        """Close all idle connections"""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.host, self.port, timeout=self.timeout)
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+
+class GitHubClient:
+    """Talk to the GitHub REST and GraphQL APIs over pooled keep-alive connections
+
+    Example:
+        >>> client = GitHubClient(token="ghp_...")
+        >>> repo = client.api("/repos/owner/repo")
+        >>> data = client.graphql("query { viewer { login } }")
+    """
+
+    def __init__(
+        self,
+        token: str,
+        api_url: str = DEFAULT_API_URL,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        cache: Optional[HttpCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """Initialize the client
+
+        Args:
+            token: GitHub token used for the Authorization header
+            api_url: Base API URL (override for GitHub Enterprise Server)
+            pool_size: Maximum idle connections kept per host
+            timeout: Socket timeout in seconds
+            cache: Optional on-disk cache used to send conditional GET requests
+            rate_limiter: Scheduler for throttling and retries (default: process-wide limiter)
+        """
+        self.token = token
+        self.cache = cache
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.api_url = api_url.rstrip("/")
+        self.pool_size = pool_size
+        self.timeout = timeout
+
+        parsed = urllib.parse.urlsplit(self.api_url)
+        self._api_scheme = parsed.scheme
+        self._api_netloc = parsed.netloc
+        self._api_path_prefix = parsed.path.rstrip("/")
+
+        self._pools: Dict[Tuple[str, str], _ConnectionPool] = {}
+        self._pools_lock = threading.Lock()
+
+    # Public API methods
+
+    def api(self, endpoint: str, method: str = "GET", data: Optional[Any] = None) -> Any:
+        """Call a REST endpoint and return the parsed JSON body
+
+        Args:
+            endpoint: API path, e.g. "/repos/owner/repo/actions/runs?per_page=10"
+            method: HTTP method
+            data: Optional JSON-serializable request body
+
+        Returns:
+            Parsed JSON response ({} for empty bodies)
+
+        Raises:
+            GitHubAPIError: If the request fails or returns an error status
+        """
+        response = self.request(method, endpoint, data=data)
+        self.raise_for_status(response, method, endpoint)
+        return response.json()
+
+    def graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Run a GraphQL query and return its "data" object
+
+        Raises:
+            GitHubAPIError: If the request fails or the response contains errors
+        """
+        payload: Dict[str, Any] = {"query": query}
+        if variables:
+            payload["variables"] = variables
+        # Queries are read-only, so server errors may be retried like GETs
+        response = self.request("POST", "/graphql", data=payload, idempotent=True)
+        self.raise_for_status(response, "POST", "/graphql")
+
+        result = response.json()
+        if result.get("errors"):
+            messages = "; ".join(err.get("message", str(err)) for err in result["errors"])
+            raise GitHubAPIError(f"GraphQL query failed: {messages}")
+        return result.get("data") or {}
+
+    def download(self, endpoint: str, max_bytes: Optional[int] = None) -> bytes:
+        """Download raw bytes, following redirects (e.g. artifact zip archives)
+
+        Args:
+            endpoint: API endpoint or absolute URL
+            max_bytes: Abort the download once the body exceeds this size
+
+        Raises:
+            GitHubAPIError: If the download fails or exceeds max_bytes
+        """
+        response = self.request("GET", endpoint, max_bytes=max_bytes)
+        self.raise_for_status(response, "GET", endpoint)
+        return response.body
+
+    def request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        max_redirects: int = 5,
+        idempotent: Optional[bool] = None,
+        max_bytes: Optional[int] = None,
+    ) -> GitHubResponse:
+        """Send a request and return the raw response without raising on status
+
+        Relative endpoints are resolved against api_url. Redirects are followed;
+        the Authorization header is only sent to the API host so signed
+        redirect targets (artifact storage) never see the token.
+
+        When a cache is configured, plain GET requests carry the cached
+        validators and a 304 is returned as the cached 200 response.
+
+        Every hop is scheduled through the rate limiter, which retries
+        rate-limit rejections and, for idempotent requests, server errors.
+
+        Raises:
+            GitHubAPIError: If the connection fails, retries are exhausted,
+                too many redirects occur or a body exceeds max_bytes
+        """
+        if idempotent is None:
+            idempotent = method.upper() in _IDEMPOTENT_METHODS
+        url = self._resolve_url(endpoint)
+        body = json.dumps(data).encode("utf-8") if data is not None else None
+
+        cache_url = url if (self.cache is not None and method == "GET" and body is None) else None
+        cached = self.cache.lookup(cache_url) if cache_url else None
+        redirected = False
+
+        for _ in range(max_redirects + 1):
+            extra_headers = dict(headers or {})
+            if cached and not redirected:
+                extra_headers.update(cached.conditional_headers())
+            request_headers = self._build_headers(url, body is not None, extra_headers)
+            response = self._send_scheduled(method, url, body, request_headers, idempotent, max_bytes)
+
+            location = response.header("location")
+            if response.status in (301, 302, 303, 307, 308) and location:
+                url = urllib.parse.urljoin(url, location)
+                redirected = True
+                if response.status == 303 or (response.status in (301, 302) and method != "GET"):
+                    method, body = "GET", None
+                continue
+
+            if cache_url and not redirected:
+                response = self._apply_cache(cache_url, cached, response)
+            return response
+
+        raise GitHubAPIError(f"Too many redirects for {method} {endpoint}")
+
+    def close(self) -> None:
+        """Close all pooled connections"""
+        with self._pools_lock:
+            for pool in self._pools.values():
+                pool.close()
+            self._pools.clear()
+
+    # Static utility methods
+
+    @staticmethod
+    def raise_for_status(response: GitHubResponse, method: str, endpoint: str) -> None:
+        """Raise GitHubAPIError for error responses
+
+        The message includes "(HTTP <status>)" and GitHub's error message so that
+        callers matching on e.g. "404" / "Not Found" keep working.
+        """
+        if response.ok:
+            return
+
+        message = ""
+        try:
+            payload = json.loads(response.body) if response.body else {}
+            if isinstance(payload, dict):
+                message = payload.get("message", "")
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            message = response.body[:200].decode("utf-8", errors="replace")
+
+        raise GitHubAPIError(
+            f"GitHub API request failed: {method} {endpoint}\n{message} (HTTP {response.status})",
+            status_code=response.status,
+        )
+
+    # Private helper methods
+
+    def _apply_cache(
+        self, url: str, cached: Optional[CachedResponse], response: GitHubResponse
+    ) -> GitHubResponse:
+        """Serve 304s from the cache and store fresh responses that carry validators"""
+        if response.status == 304 and cached is not None:
+            self.cache.record_hit(cached)
+            merged_headers = dict(cached.headers)
+            merged_headers.update(response.headers)
+            return GitHubResponse(status=200, headers=merged_headers, body=cached.body)
+
+        if response.status == 200:
+            self.cache.record_miss()
+            self.cache.store(url, response.body, response.headers)
+        return response
+
+    def _send_scheduled(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+        idempotent: bool,
+        max_bytes: Optional[int] = None,
+    ) -> GitHubResponse:
+        """Send one request through the rate limiter, raising retryable statuses for retry"""
+
+        def attempt() -> GitHubResponse:
+            response = self._send(method, url, body, headers, max_bytes)
+            self.rate_limiter.update_from_headers(response.headers)
+            if response.status in RETRYABLE_STATUS_CODES or (
+                response.status == 403 and b"rate limit" in response.body.lower()
+            ):
+                self.raise_for_status(response, method, url)
+            return response
+
+        parsed = urllib.parse.urlsplit(url)
+        # Query strings are left out: signed storage URLs carry credentials there
+        with get_tracer().span(f"{method} {parsed.path}", "http", host=parsed.netloc) as span:
+            response = self.rate_limiter.execute(attempt, f"{method} {url}", idempotent=idempotent)
+            span.args["status"] = response.status
+            span.args["bytes"] = len(response.body)
+            return response
+
+    def _resolve_url(self, endpoint: str) -> str:
+        if endpoint.startswith(("http://", "https://")):
+            return endpoint
+        path = endpoint if endpoint.startswith("/") else f"/{endpoint}"
+        return f"{self._api_scheme}://{self._api_netloc}{self._api_path_prefix}{path}"
+
+    def _build_headers(
+        self, url: str, has_body: bool, extra: Optional[Dict[str, str]]
+    ) -> Dict[str, str]:
+        headers = {
+            "Accept": "application/vnd.github+json",
+            "User-Agent": USER_AGENT,
+            "X-GitHub-Api-Version": API_VERSION,
+        }
+        if urllib.parse.urlsplit(url).netloc == self._api_netloc:
+            headers["Authorization"] = f"Bearer {self.token}"
+        if has_body:
+            headers["Content-Type"] = "application/json"
+        if extra:
+            headers.update(extra)
+        return headers
+
+    def _get_pool(self, scheme: str, netloc: str) -> _ConnectionPool:
+        key = (scheme, netloc)
+        with self._pools_lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                parsed = urllib.parse.urlsplit(f"{scheme}://{netloc}")
+                pool = _ConnectionPool(
+                    scheme, parsed.hostname or netloc, parsed.port, self.pool_size, self.timeout
+                )
+                self._pools[key] = pool
+            return pool
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+        max_bytes: Optional[int] = None,
+    ) -> GitHubResponse:
+        parsed = urllib.parse.urlsplit(url)
+        target = parsed.path or "/"
+        if parsed.query:
+            target = f"{target}?{parsed.query}"
+        pool = self._get_pool(parsed.scheme, parsed.netloc)
+
+        conn, reused = pool.acquire()
+        try:
+            try:
+                raw = self._round_trip(conn, method, target, body, headers, max_bytes)
+            except _STALE_CONNECTION_ERRORS:
+                if not reused:
+                    raise
+                # Idle keep-alive socket was closed by the server; retry once on a fresh one
+                conn.close()
+                conn = pool._new_connection()
+                raw = self._round_trip(conn, method, target, body, headers, max_bytes)
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            raise GitHubAPIError(f"GitHub API request failed: {method} {url}\n{e}")
+
+        response, payload = raw
+        if max_bytes is not None and len(payload) > max_bytes:
+            # The rest of the body is still unread, so the socket cannot be reused
+            conn.close()
+            raise GitHubAPIError(f"Response body exceeds {max_bytes} bytes: {method} {url}")
+        if response.will_close:
+            conn.close()
+        else:
+            pool.release(conn)
+
+        return GitHubResponse(
+            status=response.status,
+            headers={k.lower(): v for k, v in response.getheaders()},
+            body=payload,
+        )
+
+    @staticmethod
+    def _round_trip(
+        conn: http.client.HTTPConnection,
+        method: str,
+        target: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+        max_bytes: Optional[int] = None,
+    ) -> Tuple[http.client.HTTPResponse, bytes]:
+        conn.request(method, target, body=body, headers=headers)
+        response = conn.getresponse()
+        if max_bytes is not None:
+            # Read at most one byte past the cap so oversized bodies are detected
+            # without buffering them
+            return response, response.read(max_bytes + 1)
+        # The body must be fully read before the connection can be reused
+        return response, response.read()
+
+
+# ============================================================
+# Process-wide client
+# ============================================================
+
+_client: Optional[GitHubClient] = None
+_client_lock = threading.Lock()
+
+
+def get_github_token() -> str:
+    """Get the GitHub token from GH_TOKEN or GITHUB_TOKEN (empty if unset)"""
+    return os.environ.get("GH_TOKEN", "") or os.environ.get("GITHUB_TOKEN", "")
+
+
+def get_github_client() -> Optional[GitHubClient]:
+    """Get the shared GitHubClient, or None when no token is available
+
+    The client is created lazily and reused for the rest of the process so its
+    connection pool is shared by every operation. Callers fall back to the gh
+    CLI when this returns None.
+    """
+    global _client
+
+    token = get_github_token()
+    if not token:
+        return None
+
+    with _client_lock:
+        if _client is None or _client.token != token:
+            if _client is not None:
+                _client.close()
+            _client = GitHubClient(
+                token=token,
+                api_url=os.environ.get("GITHUB_API_URL", "") or DEFAULT_API_URL,
+                cache=_create_http_cache(),
+            )
+        return _client
+
+
+def get_http_cache() -> Optional[HttpCache]:
+    """Get the HTTP cache of the shared client, if one is configured"""
+    return _client.cache if _client is not None else None
+
+
+def _create_http_cache() -> Optional[HttpCache]:
+    """Create the on-disk HTTP cache from CLAUDECHAIN_CACHE_DIR, if set
+
+    CLAUDECHAIN_HTTP_CACHE_MAX_MB bounds its size (default 50 MB).
+    """
+    cache_dir = os.environ.get("CLAUDECHAIN_CACHE_DIR", "")
+    if not cache_dir:
+        return None
+
+    max_mb = os.environ.get("CLAUDECHAIN_HTTP_CACHE_MAX_MB", "")
+    max_bytes = int(float(max_mb) * 1024 * 1024) if max_mb else DEFAULT_MAX_BYTES
+    try:
+        return HttpCache(Path(cache_dir) / "http", max_bytes=max_bytes)
+    except OSError as e:
+        print(f"Warning: HTTP cache disabled, cannot use {cache_dir}: {e}")
+        return None
+
+
+def reset_github_client() -> None:
+    """Close and discard the shared client (used by tests)"""
+    global _client
+
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+        _client = None
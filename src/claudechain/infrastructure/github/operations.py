@@ -1,24 +1,78 @@
-"""GitHub CLI and API operations"""
+"""GitHub CLI and API operations
+
+API calls go through the in-process GitHubClient (pooled keep-alive HTTPS) when a
+token is available in GH_TOKEN/GITHUB_TOKEN, and fall back to the gh CLI otherwise.
+"""
 
 import base64
+import io
 import json
-import os
 import re
 import subprocess
-import tempfile
 import zipfile
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, cast
 
 from claudechain.domain.exceptions import GitHubAPIError
 from claudechain.domain.github_models import GitHubPullRequest, PRComment, WorkflowRun
 from claudechain.infrastructure.git.operations import run_command
 from claudechain.infrastructure.github.actions import GitHubActionsHelper
+from claudechain.infrastructure.github.client import get_github_client
+from claudechain.infrastructure.github.rate_limiter import get_rate_limiter
+from claudechain.infrastructure.tracing.tracer import Tracer, get_tracer
+
+# Fields requested for pull requests, matching `gh pr list --json` output
+PR_JSON_FIELDS = "number,title,state,createdAt,mergedAt,assignees,labels,headRefName,baseRefName,url"
+
+# Upper bound for a task metadata artifact zip (they are a few KB in practice)
+MAX_ARTIFACT_ZIP_BYTES = 5 * 1024 * 1024
+
+# Files fetched per GraphQL query by get_files_from_branch
+FILES_PER_GRAPHQL_QUERY = 50
+
+# GraphQL states for each `gh pr list --state` value (None = no state filter)
+_PR_GRAPHQL_STATES: Dict[str, Optional[List[str]]] = {
+    "open": ["OPEN"],
+    "closed": ["CLOSED", "MERGED"],
+    "merged": ["MERGED"],
+    "all": None,
+}
+
+_PULL_REQUESTS_QUERY = """
+query($owner: String!, $name: String!, $first: Int!, $after: String,
+      $states: [PullRequestState!], $labels: [String!]) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(first: $first, after: $after, states: $states, labels: $labels,
+                 orderBy: {field: CREATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number title state createdAt mergedAt updatedAt headRefName baseRefName url
+        assignees(first: 10) { nodes { login } }
+        labels(first: 20) { nodes { name } }
+      }
+    }
+  }
+}
+"""
+
+# Same selection, most recently updated first (for incremental syncs)
+_PULL_REQUESTS_BY_UPDATED_QUERY = _PULL_REQUESTS_QUERY.replace("field: CREATED_AT", "field: UPDATED_AT")
+
+
+# gh subcommands that change state and must not be repeated after a server error
+_MUTATING_GH_COMMANDS = {
+    ("pr", "create"), ("pr", "merge"), ("pr", "close"), ("pr", "edit"), ("pr", "comment"),
+    ("label", "create"), ("workflow", "run"),
+}
 
 
 def run_gh_command(args: List[str]) -> str:
     """Run a GitHub CLI command and return stdout
 
+    The command is scheduled through the shared rate limiter: rate-limit
+    failures are retried with backoff, and transient server errors are
+    retried for read-only commands.
+
     Args:
         args: gh command arguments (without 'gh' prefix)
 
@@ -28,15 +82,43 @@ def run_gh_command(args: List[str]) -> str:
     Raises:
         GitHubAPIError: If gh command fails
     """
-    try:
-        result = run_command(["gh"] + args)
-        return result.stdout.strip()
-    except subprocess.CalledProcessError as e:
-        raise GitHubAPIError(f"GitHub CLI command failed: {' '.join(args)}\n{e.stderr}")
+    def attempt() -> str:
+        try:
+            result = run_command(["gh"] + args)
+            return result.stdout.strip()
+        except subprocess.CalledProcessError as e:
+            raise GitHubAPIError(f"GitHub CLI command failed: {' '.join(args)}\n{e.stderr}")
+
+    name = Tracer.describe_command(["gh"] + args)
+    with get_tracer().span(name, "gh", command=Tracer.redact(" ".join(["gh"] + args))[:300]) as span:
+        output = get_rate_limiter().execute(
+            attempt, f"gh {' '.join(args[:2])}", idempotent=_is_idempotent_gh_command(args)
+        )
+        span.args["bytes"] = len(output)
+        return output
+
+
+def _is_idempotent_gh_command(args: List[str]) -> bool:
+    """Whether a gh invocation is safe to repeat after a transient failure"""
+    if tuple(args[:2]) in _MUTATING_GH_COMMANDS:
+        return False
+    if args[:1] == ["api"]:
+        for flag in ("--method", "-X"):
+            if flag in args:
+                index = args.index(flag)
+                method = args[index + 1].upper() if index + 1 < len(args) else "GET"
+                return method in ("GET", "HEAD", "PUT", "DELETE")
+        # gh api defaults to POST when fields are passed; GraphQL queries are read-only
+        has_fields = any(arg in ("-f", "-F", "--field", "--raw-field") for arg in args)
+        return not has_fields or args[1:2] == ["graphql"]
+    return True
 
 
 def gh_api_call(endpoint: str, method: str = "GET") -> Dict[str, Any]:
-    """Call GitHub REST API using gh CLI
+    """Call GitHub REST API
+
+    Uses the pooled in-process client when a token is available, otherwise
+    shells out to `gh api`.
 
     Args:
         endpoint: API endpoint path (e.g., "/repos/owner/repo/actions/runs")
@@ -48,11 +130,58 @@ def gh_api_call(endpoint: str, method: str = "GET") -> Dict[str, Any]:
     Raises:
         GitHubAPIError: If API call fails
     """
+    path = endpoint.split("?", 1)[0]
+    with get_tracer().span(f"{method} {path}", "api", endpoint=path, method=method):
+        client = get_github_client()
+        if client is not None:
+            return client.api(endpoint, method=method)
+
+        try:
+            output = run_gh_command(["api", endpoint, "--method", method])
+            return json.loads(output) if output else {}
+        except json.JSONDecodeError as e:
+            raise GitHubAPIError(f"Invalid JSON from API: {str(e)}")
+
+
+def gh_graphql_call(query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Run a GitHub GraphQL query
+
+    Args:
+        query: GraphQL query document
+        variables: Optional query variables
+
+    Returns:
+        The "data" object of the GraphQL response
+
+    Raises:
+        GitHubAPIError: If the query fails or returns errors
+    """
+    client = get_github_client()
+    if client is not None:
+        return client.graphql(query, variables)
+
+    args = ["api", "graphql", "-f", f"query={query}"]
+    for key, value in (variables or {}).items():
+        if value is None:
+            continue
+        if isinstance(value, str):
+            args.extend(["-f", f"{key}={value}"])
+        elif isinstance(value, list):
+            for item in value:
+                args.extend(["-f", f"{key}[]={item}"])
+        else:
+            args.extend(["-F", f"{key}={json.dumps(value)}"])
+
     try:
-        output = run_gh_command(["api", endpoint, "--method", method])
-        return json.loads(output) if output else {}
+        output = run_gh_command(args)
+        result = json.loads(output) if output else {}
     except json.JSONDecodeError as e:
-        raise GitHubAPIError(f"Invalid JSON from API: {str(e)}")
+        raise GitHubAPIError(f"Invalid JSON from GraphQL API: {str(e)}")
+
+    if result.get("errors"):
+        messages = "; ".join(err.get("message", str(err)) for err in result["errors"])
+        raise GitHubAPIError(f"GraphQL query failed: {messages}")
+    return result.get("data") or {}
 
 
 def compare_commits(repo: str, base: str, head: str) -> List[str]:
@@ -168,53 +297,60 @@ def detect_project_from_diff(changed_files: List[str]) -> Optional[str]:
         )
 
 
-def download_artifact_json(repo: str, artifact_id: int) -> Optional[Dict[str, Any]]:
+def download_artifact_json(
+    repo: str, artifact_id: int, max_bytes: int = MAX_ARTIFACT_ZIP_BYTES
+) -> Optional[Dict[str, Any]]:
     """Download and parse artifact JSON using GitHub API
 
+    The zip archive is read into memory (no temp files), so downloads can run
+    concurrently from a thread pool. Archives larger than max_bytes are rejected.
+
     Args:
         repo: GitHub repository (owner/name)
         artifact_id: Artifact ID to download
+        max_bytes: Maximum zip archive size to accept
 
     Returns:
         Parsed JSON content or None if download fails
     """
-    try:
-        # Get artifact download URL (returns a redirect)
-        download_endpoint = f"/repos/{repo}/actions/artifacts/{artifact_id}/zip"
-
-        # Create temp file for the zip
-        with tempfile.NamedTemporaryFile(suffix='.zip', delete=False) as tmp_file:
-            tmp_zip_path = tmp_file.name
+    # Artifact download URL (returns a redirect to signed storage)
+    download_endpoint = f"/repos/{repo}/actions/artifacts/{artifact_id}/zip"
 
+    with get_tracer().span(f"download artifact {artifact_id}", "artifact", endpoint=download_endpoint) as span:
         try:
-            # Download the zip file using gh api
-            # The endpoint returns a redirect which gh api should follow
-            subprocess.run(
-                ["gh", "api", download_endpoint, "--method", "GET"],
-                stdout=open(tmp_zip_path, 'wb'),
-                stderr=subprocess.PIPE,
-                check=True
-            )
+            client = get_github_client()
+            if client is not None:
+                payload = client.download(download_endpoint, max_bytes=max_bytes)
+            else:
+                # gh api follows the redirect to signed storage
+                get_rate_limiter().acquire()
+                result = subprocess.run(
+                    ["gh", "api", download_endpoint, "--method", "GET"],
+                    capture_output=True,
+                    check=True
+                )
+                payload = result.stdout
+                if len(payload) > max_bytes:
+                    raise GitHubAPIError(f"Artifact exceeds {max_bytes} bytes")
+            span.args["bytes"] = len(payload)
+
+            with zipfile.ZipFile(io.BytesIO(payload), 'r') as zip_ref:
+                return _read_first_json(zip_ref, artifact_id)
+
+        except Exception as e:
+            span.args["error"] = type(e).__name__
+            print(f"Warning: Failed to download/parse artifact {artifact_id}: {e}")
+            return None
 
-            # Extract and parse the JSON from the zip
-            with zipfile.ZipFile(tmp_zip_path, 'r') as zip_ref:
-                # Get the first JSON file in the zip
-                json_files = [f for f in zip_ref.namelist() if f.endswith('.json')]
-                if json_files:
-                    with zip_ref.open(json_files[0]) as json_file:
-                        return json.load(json_file)
-                else:
-                    print(f"Warning: No JSON file found in artifact {artifact_id}")
-                    return None
-
-        finally:
-            # Clean up temp file
-            if os.path.exists(tmp_zip_path):
-                os.remove(tmp_zip_path)
 
-    except Exception as e:
-        print(f"Warning: Failed to download/parse artifact {artifact_id}: {e}")
+def _read_first_json(zip_ref: zipfile.ZipFile, artifact_id: int) -> Optional[Dict[str, Any]]:
+    """Parse the first JSON file in an artifact zip archive"""
+    json_files = [f for f in zip_ref.namelist() if f.endswith('.json')]
+    if not json_files:
+        print(f"Warning: No JSON file found in artifact {artifact_id}")
         return None
+    with zip_ref.open(json_files[0]) as json_file:
+        return json.load(json_file)
 
 
 def ensure_label_exists(label: str, gh: GitHubActionsHelper) -> None:
@@ -255,6 +391,16 @@ def add_label_to_pr(repo: str, pr_number: int, label: str) -> bool:
         True if label was added successfully, False otherwise
     """
     try:
+        client = get_github_client()
+        if client is not None:
+            # PR labels are managed through the issues API
+            client.api(
+                f"/repos/{repo}/issues/{pr_number}/labels",
+                method="POST",
+                data={"labels": [label]},
+            )
+            return True
+
         run_gh_command([
             "pr", "edit", str(pr_number),
             "--repo", repo,
@@ -302,6 +448,65 @@ def get_file_from_branch(repo: str, branch: str, file_path: str) -> Optional[str
         raise
 
 
+def get_files_from_branch(
+    repo: str, branch: str, file_paths: List[str]
+) -> Dict[str, Optional[str]]:
+    """Fetch several files from one branch with batched GraphQL queries
+
+    Each file becomes an aliased `object(expression: "<branch>:<path>")` field,
+    so up to FILES_PER_GRAPHQL_QUERY files cost a single request instead of
+    one contents API call each. Blobs GitHub reports as binary or truncated
+    are re-fetched individually with get_file_from_branch.
+
+    Args:
+        repo: GitHub repository in format "owner/repo"
+        branch: Branch name to fetch from
+        file_paths: Paths to files within repository
+
+    Returns:
+        Dict mapping each requested path to its content, or None if not found
+
+    Raises:
+        GitHubAPIError: If API call fails
+
+    Example:
+        >>> contents = get_files_from_branch("owner/repo", "main", [
+        ...     "claude-chain/api/spec.md", "claude-chain/api/configuration.yml"])
+        >>> contents["claude-chain/api/configuration.yml"] is None
+        True
+    """
+    owner, name = repo.split("/", 1)
+    unique_paths = list(dict.fromkeys(file_paths))
+    contents: Dict[str, Optional[str]] = {}
+
+    for start in range(0, len(unique_paths), FILES_PER_GRAPHQL_QUERY):
+        batch = unique_paths[start:start + FILES_PER_GRAPHQL_QUERY]
+        variables: Dict[str, Any] = {"owner": owner, "name": name}
+        declarations = ["$owner: String!", "$name: String!"]
+        fields = []
+        for i, path in enumerate(batch):
+            variables[f"e{i}"] = f"{branch}:{path}"
+            declarations.append(f"$e{i}: String!")
+            fields.append(f"f{i}: object(expression: $e{i}) {{ ... on Blob {{ text isBinary isTruncated }} }}")
+        query = (
+            f"query({', '.join(declarations)}) {{ repository(owner: $owner, name: $name) {{ "
+            + " ".join(fields)
+            + " } }"
+        )
+
+        repository = gh_graphql_call(query, variables).get("repository") or {}
+        for i, path in enumerate(batch):
+            blob = repository.get(f"f{i}")
+            if not blob:
+                contents[path] = None
+            elif blob.get("isBinary") or blob.get("isTruncated") or blob.get("text") is None:
+                contents[path] = get_file_from_branch(repo, branch, path)
+            else:
+                contents[path] = blob["text"]
+
+    return contents
+
+
 def file_exists_in_branch(repo: str, branch: str, file_path: str) -> bool:
     """Check if a file exists in a specific branch
 
@@ -376,13 +581,21 @@ def list_pull_requests(
         - list_open_pull_requests(): Convenience wrapper for open PRs
         - GitHubPullRequest: Domain model with type-safe properties
     """
+    client = get_github_client()
+    if client is not None:
+        pr_data = _list_pull_requests_graphql(repo, state, label, assignee, limit)
+        prs = [GitHubPullRequest.from_dict(pr) for pr in pr_data]
+        if since:
+            prs = [pr for pr in prs if pr.created_at >= since]
+        return prs
+
     # Build gh pr list command
     args = [
         "pr", "list",
         "--repo", repo,
         "--state", state,
         "--limit", str(limit),
-        "--json", "number,title,state,createdAt,mergedAt,assignees,labels,headRefName,baseRefName,url"
+        "--json", PR_JSON_FIELDS
     ]
 
     # Add label filter if specified
@@ -410,6 +623,137 @@ def list_pull_requests(
     return prs
 
 
+def list_all_pull_requests(
+    repo: str,
+    label: str,
+    state: str = "all"
+) -> List[GitHubPullRequest]:
+    """Fetch every PR with a label using cursor-paginated GraphQL queries
+
+    Unlike list_pull_requests() there is no result limit: pages of 100 PRs are
+    requested until the connection is exhausted, so a repository with N labeled
+    PRs costs ceil(N / 100) requests. Only the fields GitHubPullRequest.from_dict
+    needs are selected.
+
+    Args:
+        repo: GitHub repository (owner/name)
+        label: Label filter (e.g., "claudechain")
+        state: "open", "closed", "merged", or "all"
+
+    Returns:
+        List of GitHubPullRequest domain models, newest first
+
+    Raises:
+        GitHubAPIError: If a GraphQL request fails
+
+    Example:
+        >>> prs = list_all_pull_requests("owner/repo", label="claudechain")
+        >>> print(f"Fetched {len(prs)} ClaudeChain PRs")
+    """
+    pr_data = _list_pull_requests_graphql(repo, state, label, assignee=None, limit=None)
+    return [GitHubPullRequest.from_dict(pr) for pr in pr_data]
+
+
+def list_pull_requests_updated_since(
+    repo: str,
+    label: Optional[str],
+    since: datetime
+) -> List[GitHubPullRequest]:
+    """Fetch PRs that were updated at or after a timestamp
+
+    PRs are requested most recently updated first and paging stops at the
+    first PR older than `since`, so the cost depends on how many PRs changed,
+    not on how much history the repository has.
+
+    Args:
+        repo: GitHub repository (owner/name)
+        label: Label filter (e.g., "claudechain"), or None for every PR so
+            that PRs whose label was removed are included too
+        since: Oldest update time to include (timezone-aware)
+
+    Returns:
+        List of GitHubPullRequest domain models, most recently updated first
+
+    Raises:
+        GitHubAPIError: If a GraphQL request fails
+
+    Example:
+        >>> changed = list_pull_requests_updated_since("owner/repo", "claudechain", last_sync)
+    """
+    pr_data = _list_pull_requests_graphql(
+        repo, "all", label, assignee=None, limit=None,
+        query=_PULL_REQUESTS_BY_UPDATED_QUERY, updated_since=since
+    )
+    return [GitHubPullRequest.from_dict(pr) for pr in pr_data]
+
+
+def _list_pull_requests_graphql(
+    repo: str,
+    state: str,
+    label: Optional[str],
+    assignee: Optional[str],
+    limit: Optional[int],
+    query: str = _PULL_REQUESTS_QUERY,
+    updated_since: Optional[datetime] = None
+) -> List[Dict[str, Any]]:
+    """Page through PRs with GraphQL, returning dicts shaped like `gh pr list --json`
+
+    GraphQL has no assignee filter, so assignee matching is done client-side
+    while paging until `limit` matches are collected (None = all pages).
+    With `updated_since` (and a query ordered by UPDATED_AT), paging stops at
+    the first PR updated before that time.
+    """
+    if state not in _PR_GRAPHQL_STATES:
+        raise GitHubAPIError(f"Invalid PR state: {state}")
+
+    owner, name = repo.split("/", 1)
+    variables: Dict[str, Any] = {
+        "owner": owner,
+        "name": name,
+        "first": min(limit, 100) if limit is not None else 100,
+        "after": None,
+        "states": _PR_GRAPHQL_STATES[state],
+        "labels": [label] if label else None,
+    }
+
+    results: List[Dict[str, Any]] = []
+    while limit is None or len(results) < limit:
+        data = gh_graphql_call(query, variables)
+        connection = (data.get("repository") or {}).get("pullRequests") or {}
+
+        reached_since = False
+        for node in connection.get("nodes") or []:
+            if updated_since is not None and _parse_graphql_time(node.get("updatedAt")) < updated_since:
+                reached_since = True
+                break
+            pr = _flatten_pr_node(node)
+            if assignee and assignee not in [a["login"] for a in pr["assignees"]]:
+                continue
+            results.append(pr)
+
+        page_info = connection.get("pageInfo") or {}
+        if reached_since or not page_info.get("hasNextPage"):
+            break
+        variables["after"] = page_info.get("endCursor")
+
+    return results if limit is None else results[:limit]
+
+
+def _parse_graphql_time(value: Optional[str]) -> datetime:
+    """Parse a GraphQL DateTime, treating missing values as the oldest time"""
+    if not value:
+        return datetime.min.replace(tzinfo=timezone.utc)
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _flatten_pr_node(node: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a GraphQL pullRequest node to the `gh pr list --json` shape"""
+    pr = dict(node)
+    pr["assignees"] = (node.get("assignees") or {}).get("nodes") or []
+    pr["labels"] = (node.get("labels") or {}).get("nodes") or []
+    return pr
+
+
 def list_merged_pull_requests(
     repo: str,
     since: datetime,
@@ -680,6 +1024,15 @@ def trigger_workflow(
         ...     ref="feature-branch"
         ... )
     """
+    client = get_github_client()
+    if client is not None:
+        client.api(
+            f"/repos/{repo}/actions/workflows/{workflow_name}/dispatches",
+            method="POST",
+            data={"ref": ref, "inputs": inputs},
+        )
+        return
+
     # Build gh workflow run command
     args = [
         "workflow", "run", workflow_name,
@@ -798,6 +1151,11 @@ def close_pull_request(repo: str, pr_number: int) -> None:
         >>> # Close a PR
         >>> close_pull_request("owner/repo", 123)
     """
+    client = get_github_client()
+    if client is not None:
+        client.api(f"/repos/{repo}/pulls/{pr_number}", method="PATCH", data={"state": "closed"})
+        return
+
     # Build gh pr close command
     args = [
         "pr", "close", str(pr_number),
@@ -859,8 +1217,7 @@ def delete_branch(repo: str, branch: str) -> None:
     endpoint = f"/repos/{repo}/git/refs/heads/{branch}"
 
     try:
-        # Use gh api with DELETE method
-        run_gh_command(["api", endpoint, "--method", "DELETE"])
+        gh_api_call(endpoint, method="DELETE")
     except GitHubAPIError as e:
         # Ignore 404 errors (branch already deleted)
         if "404" not in str(e):
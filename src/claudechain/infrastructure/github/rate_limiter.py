@@ -0,0 +1,304 @@
+"""Rate-limit-aware scheduling for GitHub API traffic
+
+All GitHub requests (the in-process GitHubClient and gh CLI invocations) pass
+through one process-wide RateLimiter which:
+
+- Throttles request starts with a token bucket whose refill rate adapts to the
+  X-RateLimit-Remaining / X-RateLimit-Reset headers GitHub returns
+- Pauses every caller when the primary limit is exhausted or Retry-After is sent
+- Retries retryable failures with jittered exponential backoff and fails fast
+  on everything else. Rate-limit rejections (429, 403 "rate limit") are always
+  retried because GitHub did not process the request; 5xx and network errors
+  are only retried for idempotent requests, since e.g. a PR may have been
+  created before the server errored
+- Records the budget each command consumed for the end-of-command report
+"""
+
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, TypeVar
+
+from claudechain.domain.exceptions import GitHubAPIError
+from claudechain.infrastructure.tracing.tracer import get_tracer
+
+T = TypeVar("T")
+
+DEFAULT_BURST = 10
+DEFAULT_RATE_PER_SECOND = 10.0
+DEFAULT_MAX_RETRIES = 4
+DEFAULT_BASE_DELAY_SECONDS = 1.0
+DEFAULT_MAX_DELAY_SECONDS = 60.0
+
+# Start spreading requests over the reset window once remaining budget drops below this
+LOW_BUDGET_THRESHOLD = 100
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Error message patterns (gh CLI stderr, socket errors) that indicate throttling
+_RATE_LIMIT_MESSAGE_PATTERN = re.compile(r"rate limit|abuse detection|HTTP 429\b", re.IGNORECASE)
+
+# Error message patterns that indicate a transient server or network failure
+_TRANSIENT_MESSAGE_PATTERN = re.compile(
+    r"HTTP (500|502|503|504)\b|timed? ?out|connection (reset|refused|aborted)|"
+    r"temporarily unavailable|remote end closed",
+    re.IGNORECASE,
+)
+
+
+@dataclass
+class RateLimitBudget:
+    """Rate-limit budget consumed by one command"""
+
+    requests: int = 0
+    retries: int = 0
+    throttled_seconds: float = 0.0
+    limit: Optional[int] = None
+    remaining: Optional[int] = None
+    starting_remaining: Optional[int] = None
+
+    @property
+    def used(self) -> Optional[int]:
+        """Budget used according to GitHub's own counters (None if unknown)"""
+        if self.starting_remaining is None or self.remaining is None:
+            return None
+        # +1: the first observed response had already been counted
+        return max(0, self.starting_remaining - self.remaining + 1)
+
+    def format_line(self, command: str) -> str:
+        """One-line report printed at the end of every command"""
+        parts = [f"{self.requests} request(s)", f"{self.retries} retr{'y' if self.retries == 1 else 'ies'}"]
+        if self.used is not None:
+            parts.append(f"{self.used} rate-limit point(s) used")
+        if self.remaining is not None:
+            parts.append(f"{self.remaining}/{self.limit or '?'} remaining")
+        if self.throttled_seconds:
+            parts.append(f"throttled {self.throttled_seconds:.1f}s")
+        return f"GitHub API budget ({command}): " + ", ".join(parts)
+
+    def format_summary(self) -> str:
+        """Markdown section for the step summary"""
+        used = self.used if self.used is not None else "n/a"
+        remaining = f"{self.remaining}/{self.limit or '?'}" if self.remaining is not None else "n/a"
+        lines = [
+            "## GitHub API Budget",
+            "",
+            "| Requests | Retries | Points used | Remaining | Throttled |",
+            "|---------:|--------:|------------:|----------:|----------:|",
+            f"| {self.requests} | {self.retries} | {used} | {remaining} | {self.throttled_seconds:.1f}s |",
+        ]
+        return "\n".join(lines)
+
+
+class RateLimiter:
+    """Token bucket plus retry policy shared by all GitHub calls in a process
+
+    Example:
+        >>> limiter = get_rate_limiter()
+        >>> data = limiter.execute(lambda: client_call(), "GET /repos/owner/repo")
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float = DEFAULT_RATE_PER_SECOND,
+        burst: int = DEFAULT_BURST,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        base_delay: float = DEFAULT_BASE_DELAY_SECONDS,
+        max_delay: float = DEFAULT_MAX_DELAY_SECONDS,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the limiter
+
+        Args:
+            rate_per_second: Steady-state request starts per second
+            burst: Bucket capacity (requests that may start back-to-back)
+            max_retries: Retries for retryable failures before giving up
+            base_delay: First backoff delay in seconds
+            max_delay: Upper bound for a single backoff delay
+            sleep: Sleep function (injectable for tests)
+            clock: Monotonic clock (injectable for tests)
+        """
+        self.base_rate = rate_per_second
+        self.rate = rate_per_second
+        self.burst = burst
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = RateLimitBudget()
+        self._sleep = sleep
+        self._clock = clock
+        self._tokens = float(burst)
+        self._last_refill = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    # Public API methods
+
+    def acquire(self) -> None:
+        """Block until a request may start"""
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                wait = max(0.0, self._paused_until - now)
+                if wait == 0.0 and self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    self.budget.requests += 1
+                    return
+                if wait == 0.0:
+                    wait = (1.0 - self._tokens) / self.rate
+                self.budget.throttled_seconds += wait
+            self._sleep(wait)
+
+    def update_from_headers(self, headers: Dict[str, str]) -> None:
+        """Adapt to the rate-limit headers of a response (lower-cased keys)"""
+        remaining = _parse_int(headers.get("x-ratelimit-remaining"))
+        limit = _parse_int(headers.get("x-ratelimit-limit"))
+        reset = _parse_int(headers.get("x-ratelimit-reset"))
+        retry_after = _parse_int(headers.get("retry-after"))
+
+        with self._lock:
+            if remaining is not None:
+                if self.budget.starting_remaining is None:
+                    self.budget.starting_remaining = remaining
+                self.budget.remaining = remaining
+                if limit is not None:
+                    self.budget.limit = limit
+
+                seconds_to_reset = max(1.0, reset - time.time()) if reset else None
+                if remaining == 0 and seconds_to_reset:
+                    self._pause_for(seconds_to_reset)
+                elif remaining < LOW_BUDGET_THRESHOLD and seconds_to_reset:
+                    # Spread what is left evenly over the rest of the window
+                    self.rate = max(remaining / seconds_to_reset, 0.05)
+                else:
+                    self.rate = self.base_rate
+
+            if retry_after is not None:
+                self._pause_for(float(retry_after))
+
+    def execute(
+        self,
+        operation: Callable[[], T],
+        description: str = "GitHub request",
+        idempotent: bool = True,
+    ) -> T:
+        """Run an operation under the limiter, retrying retryable failures
+
+        Args:
+            operation: Callable performing one request; raises GitHubAPIError on failure
+            description: Human-readable request description for log messages
+            idempotent: Whether the request may be repeated after a server error
+
+        Returns:
+            The operation's result
+
+        Raises:
+            GitHubAPIError: For fatal errors, or once retries are exhausted
+        """
+        attempt = 0
+        while True:
+            self.acquire()
+            try:
+                return operation()
+            except GitHubAPIError as e:
+                if attempt >= self.max_retries or not self.is_retryable(e, idempotent):
+                    raise
+                delay = self.backoff_delay(attempt)
+                attempt += 1
+                with self._lock:
+                    self.budget.retries += 1
+                get_tracer().add("retries")
+                print(f"Warning: {description} failed ({_first_line(e)}); retry {attempt}/{self.max_retries} in {delay:.1f}s")
+                self._sleep(delay)
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Jittered exponential delay before retry number `attempt` (0-based)
+
+        Retry-After / exhausted-budget pauses are applied separately by
+        acquire(), so this only spaces out retries of transient failures.
+        """
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return random.uniform(ceiling / 2, ceiling)
+
+    # Static utility methods
+
+    @staticmethod
+    def is_rate_limited(error: GitHubAPIError) -> bool:
+        """Whether GitHub rejected the request for exceeding a rate limit"""
+        status = error.status_code
+        if status == 429:
+            return True
+        if status is not None and status != 403:
+            return False
+        return bool(_RATE_LIMIT_MESSAGE_PATTERN.search(str(error)))
+
+    @staticmethod
+    def is_retryable(error: GitHubAPIError, idempotent: bool = True) -> bool:
+        """Tell transient failures (worth retrying) apart from fatal ones
+
+        Retryable: rate-limit rejections always; 5xx and network errors when
+        the request is idempotent. Fatal: every other status (401, 404, 422, ...).
+        """
+        if RateLimiter.is_rate_limited(error):
+            return True
+        if not idempotent:
+            return False
+        if error.status_code is not None:
+            return error.status_code in RETRYABLE_STATUS_CODES
+        return bool(_TRANSIENT_MESSAGE_PATTERN.search(str(error)))
+
+    # Private helper methods
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+
+    def _pause_for(self, seconds: float) -> None:
+        until = self._clock() + seconds
+        if until > self._paused_until:
+            if seconds >= 5:
+                print(f"Warning: GitHub rate limit reached; pausing requests for {seconds:.0f}s")
+            self._paused_until = until
+
+
+def _parse_int(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _first_line(error: Exception) -> str:
+    lines = str(error).strip().splitlines()
+    return lines[-1] if lines else type(error).__name__
+
+
+# ============================================================
+# Process-wide limiter
+# ============================================================
+
+_limiter: Optional[RateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get the RateLimiter shared by every GitHub call in this process"""
+    global _limiter
+
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = RateLimiter()
+        return _limiter
+
+
+def reset_rate_limiter(limiter: Optional[RateLimiter] = None) -> None:
+    """Replace the shared limiter (used by tests)"""
+    global _limiter
+
+    with _limiter_lock:
+        _limiter = limiter
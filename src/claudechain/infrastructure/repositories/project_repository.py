@@ -1,11 +1,13 @@
 """Repository for loading project data from GitHub or local filesystem"""
 
 import os
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
+from claudechain.domain.exceptions import ConfigurationError
 from claudechain.domain.project import Project
 from claudechain.domain.project_configuration import ProjectConfiguration
 from claudechain.domain.spec_content import SpecContent
+from claudechain.infrastructure.tracing.tracer import traced
 
 
 class ProjectRepository:
@@ -77,6 +79,7 @@ class ProjectRepository:
     # GitHub API Methods (remote fetch)
     # ============================================================
 
+    @traced
     def load_configuration(
         self, project: Project, base_branch: str = "main"
     ) -> ProjectConfiguration:
@@ -105,6 +108,7 @@ class ProjectRepository:
 
         return ProjectConfiguration.from_yaml_string(project, config_content)
 
+    @traced
     def load_configuration_if_exists(
         self, project: Project, base_branch: str = "main"
     ) -> Optional[ProjectConfiguration]:
@@ -132,6 +136,7 @@ class ProjectRepository:
 
         return ProjectConfiguration.from_yaml_string(project, config_content)
 
+    @traced
     def load_spec(
         self, project: Project, base_branch: str = "main"
     ) -> Optional[SpecContent]:
@@ -155,6 +160,7 @@ class ProjectRepository:
 
         return SpecContent(project, spec_content)
 
+    @traced
     def load_project_full(
         self, project_name: str, base_branch: str = "main"
     ) -> Optional[Tuple[Project, ProjectConfiguration, SpecContent]]:
@@ -181,3 +187,58 @@ class ProjectRepository:
         config = self.load_configuration(project, base_branch)
 
         return project, config, spec
+
+    @traced
+    def load_all(
+        self, projects: List[Project], base_branch: str = "main"
+    ) -> Dict[str, Tuple[ProjectConfiguration, Optional[SpecContent]]]:
+        """Load configuration and spec for many projects in bulk
+
+        Fetches every project's spec.md and configuration.yml together through
+        batched GraphQL queries (one request per 25 projects) instead of two
+        contents API calls per project.
+
+        Missing configuration falls back to the default configuration and a
+        missing spec is returned as None, matching load_configuration() and
+        load_spec(). Projects whose configuration is invalid are left out of
+        the result with a warning so one bad file does not fail the batch.
+
+        Args:
+            projects: Project domain models
+            base_branch: Branch to fetch from
+
+        Returns:
+            Dict mapping project name to (ProjectConfiguration, SpecContent or None)
+
+        Raises:
+            GitHubAPIError: If GitHub API fails
+
+        Example:
+            >>> loaded = repository.load_all([Project("api"), Project("web")], "main")
+            >>> config, spec = loaded["api"]
+        """
+        from claudechain.infrastructure.github.operations import get_files_from_branch
+
+        paths = []
+        for project in projects:
+            paths.extend([project.spec_path, project.config_path])
+        contents = get_files_from_branch(self.repo, base_branch, paths)
+
+        loaded: Dict[str, Tuple[ProjectConfiguration, Optional[SpecContent]]] = {}
+        for project in projects:
+            config_content = contents.get(project.config_path)
+            try:
+                config = (
+                    ProjectConfiguration.from_yaml_string(project, config_content)
+                    if config_content
+                    else ProjectConfiguration.default(project)
+                )
+            except ConfigurationError as e:
+                print(f"Warning: Invalid configuration for project {project.name}: {e}")
+                continue
+
+            spec_content = contents.get(project.spec_path)
+            spec = SpecContent(project, spec_content) if spec_content else None
+            loaded[project.name] = (config, spec)
+
+        return loaded
@@ -12,6 +12,8 @@ from claudechain.services.core import (
 )
 from claudechain.services.composite import (
     StatisticsService,
+    download_artifact_metadata,
+    find_artifacts_for_projects,
     find_project_artifacts,
     get_artifact_metadata,
     find_in_progress_tasks,
@@ -28,6 +30,8 @@ __all__ = [
     "AssigneeService",
     # Composite
     "StatisticsService",
+    "download_artifact_metadata",
+    "find_artifacts_for_projects",
     "find_project_artifacts",
     "get_artifact_metadata",
     "find_in_progress_tasks",
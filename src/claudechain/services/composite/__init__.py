@@ -3,6 +3,8 @@ from claudechain.services.composite.statistics_service import StatisticsService
 from claudechain.services.composite.auto_start_service import AutoStartService
 from claudechain.services.composite.workflow_service import WorkflowService
 from claudechain.services.composite.artifact_service import (
+    download_artifact_metadata,
+    find_artifacts_for_projects,
     find_project_artifacts,
     get_artifact_metadata,
     find_in_progress_tasks,
@@ -16,6 +18,8 @@ __all__ = [
     "StatisticsService",
     "AutoStartService",
     "WorkflowService",
+    "download_artifact_metadata",
+    "find_artifacts_for_projects",
     "find_project_artifacts",
     "get_artifact_metadata",
     "find_in_progress_tasks",
@@ -6,13 +6,28 @@ functions supporting the Service Layer rather than a full service class.
 """
 
 import re
-import urllib.parse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional
 
 from claudechain.domain.exceptions import GitHubAPIError
 from claudechain.domain.models import TaskMetadata
+from claudechain.infrastructure.cache.artifact_store import get_artifact_store
 from claudechain.infrastructure.github.operations import download_artifact_json, gh_api_call
+from claudechain.infrastructure.tracing.tracer import in_current_context, traced
+
+# Prefix of every artifact uploaded by the create-artifact step
+ARTIFACT_NAME_PREFIX = "task-metadata-"
+
+# Matches the artifact upload retention-days in action.yml
+DEFAULT_ARTIFACT_DAYS_BACK = 90
+
+# Maximum page size of the artifacts listing API
+ARTIFACTS_PAGE_SIZE = 100
+
+# Concurrent artifact downloads (matches the client's per-host connection pool)
+DEFAULT_DOWNLOAD_CONCURRENCY = 8
 
 
 @dataclass
@@ -23,6 +38,9 @@ class ProjectArtifact:
     artifact_name: str
     workflow_run_id: int
     metadata: Optional[TaskMetadata] = None
+    created_at: Optional[datetime] = None
+    digest: Optional[str] = None
+    size_in_bytes: int = 0
 
     @property
     def task_index(self) -> Optional[int]:
@@ -38,118 +56,197 @@ class ProjectArtifact:
 # ============================================================
 
 
+@traced
 def find_project_artifacts(
     repo: str,
     project: str,
-    workflow_file: str,
-    limit: int = 50,
+    days_back: int = DEFAULT_ARTIFACT_DAYS_BACK,
     download_metadata: bool = False,
+    max_workers: int = DEFAULT_DOWNLOAD_CONCURRENCY,
 ) -> List[ProjectArtifact]:
-    """Find all artifacts for a project from a specific workflow.
+    """Find all task metadata artifacts for a project.
 
     This is the primary API for getting project artifacts.
 
     Args:
         repo: GitHub repository (owner/name)
         project: Project name to filter artifacts
-        workflow_file: Name of the workflow that creates PRs (from workflow's name: property)
-        limit: Maximum number of workflow runs to check
+        days_back: Only include artifacts created within this many days
         download_metadata: Whether to download full metadata JSON
+        max_workers: Maximum concurrent metadata downloads
 
     Returns:
-        List of ProjectArtifact objects, optionally with metadata populated
+        List of ProjectArtifact objects (newest first), optionally with metadata populated
+
+    Note:
+        Every call pages through the repo-wide artifacts listing. Callers that need
+        artifacts for several projects should use find_artifacts_for_projects so the
+        listing is walked once rather than once per project.
 
     Algorithm:
-        1. Query workflow runs for the specific workflow by name
-        2. For each successful run, get its artifacts
-        3. Filter artifacts by project name prefix
-        4. Optionally download and parse metadata JSON
+        1. Page through the repo-wide artifacts listing (newest first) until
+           the time window is exhausted
+        2. Keep unexpired task-metadata artifacts whose name parses to the project
+        3. Optionally download and parse metadata JSON concurrently
     """
-    result_artifacts = []
-    seen_artifact_ids = set()
-
-    # Query workflow runs for the specific workflow
-    # URL-encode the workflow name to handle spaces and special characters
-    workflow_file_encoded = urllib.parse.quote(workflow_file)
     try:
-        api_response = gh_api_call(
-            f"/repos/{repo}/actions/workflows/{workflow_file_encoded}/runs?status=completed&per_page={limit}"
+        artifacts_by_project = find_artifacts_for_projects(
+            repo,
+            [project],
+            days_back=days_back,
+            download_metadata=download_metadata,
+            max_workers=max_workers,
         )
-        runs = api_response.get("workflow_runs", [])
     except GitHubAPIError as e:
-        print(f"Warning: Failed to get workflow runs for '{workflow_file}': {e}")
-        runs = []
+        print(f"Warning: Failed to list artifacts: {e}")
+        return []
+    result_artifacts = artifacts_by_project[project]
+    print(f"Found {len(result_artifacts)} artifact(s) for project '{project}'")
+    return result_artifacts
 
-    print(f"Checking {len(runs)} workflow run(s) from '{workflow_file}' for artifacts")
 
-    # Process workflow runs and collect artifacts
-    for run in runs:
-        if run.get("conclusion") != "success":
-            continue
+@traced
+def find_artifacts_for_projects(
+    repo: str,
+    projects: Iterable[str],
+    days_back: int = DEFAULT_ARTIFACT_DAYS_BACK,
+    download_metadata: bool = False,
+    max_workers: int = DEFAULT_DOWNLOAD_CONCURRENCY,
+) -> Dict[str, List[ProjectArtifact]]:
+    """Find artifacts for several projects with a single artifacts listing.
 
-        run_id = run["id"]
-        artifacts = _get_artifacts_for_run(repo, run_id)
+    Artifact discovery costs ceil(artifacts in window / 100) requests in total,
+    regardless of how many projects are requested.
 
-        # Filter to project-specific artifacts
-        project_artifacts = _filter_project_artifacts(artifacts, project)
+    Args:
+        repo: GitHub repository (owner/name)
+        projects: Project names to collect artifacts for
+        days_back: Only include artifacts created within this many days
+        download_metadata: Whether to download full metadata JSON
+        max_workers: Maximum concurrent metadata downloads
 
-        for artifact in project_artifacts:
-            artifact_id = artifact["id"]
+    Returns:
+        Dict mapping every requested project to its artifacts (newest first)
 
-            # Skip if we've already seen this artifact
-            if artifact_id in seen_artifact_ids:
-                continue
-            seen_artifact_ids.add(artifact_id)
-
-            # Create ProjectArtifact
-            project_artifact = ProjectArtifact(
-                artifact_id=artifact_id,
-                artifact_name=artifact["name"],
-                workflow_run_id=run_id,
-                metadata=None,
-            )
+    Raises:
+        GitHubAPIError: If a page of the artifacts listing cannot be fetched
 
-            # Optionally download metadata
-            if download_metadata:
-                metadata_dict = download_artifact_json(repo, artifact_id)
-                if metadata_dict:
-                    try:
-                        project_artifact.metadata = TaskMetadata.from_dict(
-                            metadata_dict
-                        )
-                    except (KeyError, ValueError) as e:
-                        print(
-                            f"Warning: Failed to parse metadata for artifact {artifact_id}: {e}"
-                        )
-
-            result_artifacts.append(project_artifact)
+    Examples:
+        >>> by_project = find_artifacts_for_projects("owner/repo", ["api", "api-v2"])
+        >>> [a.artifact_name for a in by_project["api"]]
+        ['task-metadata-api-a3f2b891']
+    """
+    wanted = set(projects)
+    result: Dict[str, List[ProjectArtifact]] = {project: [] for project in wanted}
+    since = datetime.now(timezone.utc) - timedelta(days=days_back)
 
-    print(f"Found {len(result_artifacts)} artifact(s) for project '{project}'")
-    return result_artifacts
+    for artifact in _list_metadata_artifacts(repo, since):
+        project = parse_project_from_artifact_name(artifact["name"])
+        if project not in wanted:
+            continue
 
+        project_artifact = ProjectArtifact(
+            artifact_id=artifact["id"],
+            artifact_name=artifact["name"],
+            workflow_run_id=(artifact.get("workflow_run") or {}).get("id", 0),
+            metadata=None,
+            created_at=_parse_timestamp(artifact.get("created_at")),
+            digest=artifact.get("digest"),
+            size_in_bytes=artifact.get("size_in_bytes", 0),
+        )
+        result[project].append(project_artifact)
+
+    if download_metadata:
+        download_artifact_metadata(
+            repo,
+            [a for artifacts in result.values() for a in artifacts],
+            max_workers=max_workers,
+        )
+
+    return result
+
+
+def download_artifact_metadata(
+    repo: str,
+    artifacts: List[ProjectArtifact],
+    max_workers: int = DEFAULT_DOWNLOAD_CONCURRENCY,
+) -> None:
+    """Populate metadata for artifacts using a bounded pool of download workers.
 
-def get_artifact_metadata(repo: str, artifact_id: int) -> Optional[TaskMetadata]:
+    Each worker goes through get_artifact_metadata, so artifacts already in the
+    ArtifactStore are not downloaded and every request is scheduled by the
+    shared GitHub rate limiter. Metadata is assigned as downloads complete.
+
+    Args:
+        repo: GitHub repository (owner/name)
+        artifacts: Artifacts to populate (updated in place)
+        max_workers: Maximum concurrent downloads
+    """
+    if not artifacts:
+        return
+
+    workers = max(1, min(max_workers, len(artifacts)))
+    download = in_current_context(get_artifact_metadata)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="artifact-download") as executor:
+        futures = {
+            executor.submit(
+                download,
+                repo,
+                artifact.artifact_id,
+                digest=artifact.digest,
+                size_in_bytes=artifact.size_in_bytes,
+            ): artifact
+            for artifact in artifacts
+        }
+        for future in as_completed(futures):
+            artifact = futures[future]
+            try:
+                artifact.metadata = future.result()
+            except Exception as e:
+                print(f"Warning: Failed to get metadata for artifact {artifact.artifact_id}: {e}")
+
+
+def get_artifact_metadata(
+    repo: str,
+    artifact_id: int,
+    digest: Optional[str] = None,
+    size_in_bytes: int = 0,
+) -> Optional[TaskMetadata]:
     """Download and parse metadata from a specific artifact.
 
+    Artifacts are immutable, so parsed metadata is kept in the shared
+    ArtifactStore and each artifact is only downloaded once.
+
     Args:
         repo: GitHub repository (owner/name)
         artifact_id: Artifact ID to download
+        digest: Content digest from the artifacts listing, if known
+        size_in_bytes: Artifact size from the artifacts listing (for cache stats)
 
     Returns:
         TaskMetadata object or None if download fails
     """
+    store = get_artifact_store()
+    stored = store.get(artifact_id, digest=digest, size_in_bytes=size_in_bytes)
+    if stored is not None:
+        try:
+            return TaskMetadata.from_dict(stored)
+        except (KeyError, ValueError):
+            pass  # Unreadable entry; download again and overwrite it
+
     metadata_dict = download_artifact_json(repo, artifact_id)
     if metadata_dict:
         try:
-            return TaskMetadata.from_dict(metadata_dict)
+            metadata = TaskMetadata.from_dict(metadata_dict)
         except (KeyError, ValueError) as e:
             print(f"Warning: Failed to parse metadata for artifact {artifact_id}: {e}")
+            return None
+        store.put(artifact_id, metadata.to_dict(), digest=digest)
+        return metadata
     return None
 
 
-def find_in_progress_tasks(
-    repo: str, project: str, workflow_file: str
-) -> set[int]:
+def find_in_progress_tasks(repo: str, project: str) -> set[int]:
     """Get task indices for all in-progress tasks (open PRs).
 
     This is a convenience wrapper around find_project_artifacts.
@@ -157,7 +254,6 @@ def find_in_progress_tasks(
     Args:
         repo: GitHub repository
         project: Project name
-        workflow_file: Name of the workflow that creates PRs
 
     Returns:
         Set of task indices that are currently in progress
@@ -165,22 +261,18 @@ def find_in_progress_tasks(
     artifacts = find_project_artifacts(
         repo=repo,
         project=project,
-        workflow_file=workflow_file,
         download_metadata=False,  # Just need names
     )
 
     return {a.task_index for a in artifacts if a.task_index is not None}
 
 
-def get_assignee_assignments(
-    repo: str, project: str, workflow_file: str
-) -> dict[int, str]:
+def get_assignee_assignments(repo: str, project: str) -> dict[int, str]:
     """Get mapping of PR numbers to assigned assignees.
 
     Args:
         repo: GitHub repository
         project: Project name
-        workflow_file: Name of the workflow that creates PRs
 
     Returns:
         Dict mapping PR number -> assignee username
@@ -188,7 +280,6 @@ def get_assignee_assignments(
     artifacts = find_project_artifacts(
         repo=repo,
         project=project,
-        workflow_file=workflow_file,
         download_metadata=True,
     )
 
@@ -204,6 +295,39 @@ def get_assignee_assignments(
 # ============================================================
 
 
+def parse_project_from_artifact_name(artifact_name: str) -> Optional[str]:
+    """Parse the project name from a task metadata artifact name.
+
+    Expected formats: task-metadata-{project}-{task_hash} and the legacy
+    task-metadata-{project}-{index}.json. The project is everything between
+    the prefix and the last hyphen, so "api" and "api-v2" never collide the
+    way a plain prefix match would.
+
+    Args:
+        artifact_name: Artifact name
+
+    Returns:
+        Project name or None if the name is not a task metadata artifact
+
+    Examples:
+        >>> parse_project_from_artifact_name("task-metadata-api-v2-a3f2b891")
+        'api-v2'
+        >>> parse_project_from_artifact_name("task-metadata-api-3.json")
+        'api'
+        >>> parse_project_from_artifact_name("coverage-report")
+        None
+    """
+    if not artifact_name.startswith(ARTIFACT_NAME_PREFIX):
+        return None
+    stem = artifact_name[len(ARTIFACT_NAME_PREFIX):]
+    if stem.endswith(".json"):
+        stem = stem[: -len(".json")]
+    project, separator, suffix = stem.rpartition("-")
+    if not separator or not project or not suffix:
+        return None
+    return project
+
+
 def parse_task_index_from_name(artifact_name: str) -> Optional[int]:
     """Parse task index from artifact name.
 
@@ -260,39 +384,58 @@ def _get_workflow_runs_for_branch(
         return []
 
 
-def _get_artifacts_for_run(repo: str, run_id: int) -> List[dict]:
-    """Get artifacts from a workflow run
+def _list_metadata_artifacts(repo: str, since: datetime) -> List[dict]:
+    """Page through the repo-wide artifacts listing, newest first
+
+    Stops at the first page that reaches past `since`. Expired artifacts and
+    artifacts without the task-metadata prefix are skipped.
 
     Args:
         repo: GitHub repository (owner/name)
-        run_id: Workflow run ID
+        since: Oldest creation time to include
 
     Returns:
-        List of artifact dictionaries
+        List of artifact dictionaries created on or after `since`
 
     Raises:
-        GitHubAPIError: If API call fails
+        GitHubAPIError: If a page cannot be fetched; a partial listing would
+            silently under-report the window
     """
-    try:
-        artifacts_data = gh_api_call(f"/repos/{repo}/actions/runs/{run_id}/artifacts")
-        return artifacts_data.get("artifacts", [])
-    except GitHubAPIError as e:
-        print(f"Warning: Failed to get artifacts for run {run_id}: {e}")
-        return []
+    artifacts: List[dict] = []
+    page = 1
+    while True:
+        try:
+            response = gh_api_call(
+                f"/repos/{repo}/actions/artifacts?per_page={ARTIFACTS_PAGE_SIZE}&page={page}"
+            )
+        except GitHubAPIError as e:
+            raise GitHubAPIError(f"Failed to list artifacts (page {page}): {e}") from e
+
+        page_artifacts = response.get("artifacts", [])
+        reached_window_end = False
+        for artifact in page_artifacts:
+            created_at = _parse_timestamp(artifact.get("created_at"))
+            if created_at and created_at < since:
+                reached_window_end = True
+                break
+            if artifact.get("expired"):
+                continue
+            if artifact.get("name", "").startswith(ARTIFACT_NAME_PREFIX):
+                artifacts.append(artifact)
 
+        if reached_window_end or len(page_artifacts) < ARTIFACTS_PAGE_SIZE:
+            break
+        page += 1
 
-def _filter_project_artifacts(artifacts: List[dict], project: str) -> List[dict]:
-    """Filter artifacts by project name pattern
+    print(f"Scanned {page} page(s) of artifacts, found {len(artifacts)} task metadata artifact(s)")
+    return artifacts
 
-    Args:
-        artifacts: List of artifact dictionaries
-        project: Project name to filter by
 
-    Returns:
-        List of artifacts matching the project
-    """
-    return [
-        artifact
-        for artifact in artifacts
-        if artifact["name"].startswith(f"task-metadata-{project}-")
-    ]
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse a GitHub ISO 8601 timestamp, returning None if absent or malformed"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
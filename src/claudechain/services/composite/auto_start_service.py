@@ -9,11 +9,11 @@ from typing import List
 
 from claudechain.domain.auto_start import AutoStartProject, AutoStartDecision, ProjectChangeType
 from claudechain.infrastructure.git.operations import (
-    detect_changed_files,
-    detect_deleted_files,
+    detect_file_changes,
     parse_spec_path_to_project
 )
 from claudechain.services.core.pr_service import PRService
+from claudechain.infrastructure.tracing.tracer import traced
 
 
 class AutoStartService:
@@ -38,6 +38,7 @@ class AutoStartService:
 
     # Public API methods
 
+    @traced
     def detect_changed_projects(
         self, ref_before: str, ref_after: str, spec_pattern: str = "claude-chain/*/spec.md"
     ) -> List[AutoStartProject]:
@@ -61,9 +62,11 @@ class AutoStartService:
         """
         changed_projects = []
 
-        # Detect added or modified spec files
-        changed_files = detect_changed_files(ref_before, ref_after, spec_pattern)
-        for file_path in changed_files:
+        # One diff pass classifies added, modified and deleted spec files
+        changes = detect_file_changes(ref_before, ref_after, spec_pattern)
+
+        # Added or modified spec files
+        for file_path in changes.changed:
             project_name = parse_spec_path_to_project(file_path)
             if project_name:
                 # Determine if this is a new file (added) or modified
@@ -77,9 +80,8 @@ class AutoStartService:
                     )
                 )
 
-        # Detect deleted spec files
-        deleted_files = detect_deleted_files(ref_before, ref_after, spec_pattern)
-        for file_path in deleted_files:
+        # Deleted spec files
+        for file_path in changes.deleted:
             project_name = parse_spec_path_to_project(file_path)
             if project_name:
                 changed_projects.append(
@@ -92,6 +94,7 @@ class AutoStartService:
 
         return changed_projects
 
+    @traced
     def determine_new_projects(self, projects: List[AutoStartProject]) -> List[AutoStartProject]:
         """Check which projects have no existing PRs (are truly new)
 
@@ -109,27 +112,29 @@ class AutoStartService:
             1
         """
         new_projects = []
+        candidates = [p for p in projects if p.change_type != ProjectChangeType.DELETED]
+        if not candidates:
+            return new_projects
 
-        for project in projects:
-            # Skip deleted projects
-            if project.change_type == ProjectChangeType.DELETED:
-                continue
-
-            try:
-                # Use PRService to get open PRs for this project
-                prs = self.pr_service.get_project_prs(project.name, state="open")
+        # One listing of open PRs for every changed project; it is snapshotted
+        # in PRService, so should_auto_trigger() reuses it without another query
+        try:
+            open_prs = self.pr_service.get_open_prs_by_project([p.name for p in candidates])
+        except Exception as e:
+            # Log warning, skip every project on API failure
+            for project in candidates:
+                print(f"⚠️  Error querying GitHub API for {project.name}: {e}")
+            return new_projects
 
-                # If no open PRs exist, this project is ready for auto-start
-                if len(prs) == 0:
-                    new_projects.append(project)
-                    print(f"  ✓ {project.name} has no open PRs, ready for auto-start")
-                else:
-                    print(f"  ✗ {project.name} has {len(prs)} open PR(s), skipping")
+        for project in candidates:
+            prs = open_prs.get(project.name, [])
 
-            except Exception as e:
-                # Log warning, skip project on API failure
-                print(f"⚠️  Error querying GitHub API for {project.name}: {e}")
-                continue
+            # If no open PRs exist, this project is ready for auto-start
+            if len(prs) == 0:
+                new_projects.append(project)
+                print(f"  ✓ {project.name} has no open PRs, ready for auto-start")
+            else:
+                print(f"  ✗ {project.name} has {len(prs)} open PR(s), skipping")
 
         return new_projects
 
@@ -5,16 +5,29 @@ for collecting and aggregating project statistics from GitHub API and spec.md fi
 """
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional
 
-from claudechain.domain.constants import DEFAULT_PR_LABEL, DEFAULT_STALE_PR_DAYS, DEFAULT_STATS_DAYS_BACK
+from claudechain.domain.constants import (
+    DEFAULT_PR_LABEL,
+    DEFAULT_STALE_PR_DAYS,
+    DEFAULT_STATS_DAYS_BACK,
+    DEFAULT_STATS_MAX_WORKERS,
+)
+from claudechain.domain.cost_breakdown import CacheUsage
+from claudechain.domain.github_models import PullRequestIndex
 from claudechain.domain.project import Project
-from claudechain.domain.project_configuration import ProjectConfiguration
+from claudechain.domain.spec_content import SpecContent
 from claudechain.infrastructure.repositories.project_repository import ProjectRepository
 from claudechain.services.core.pr_service import PRService
 from claudechain.domain.models import ProjectStats, StatisticsReport, TeamMemberStats, PRReference, TaskWithPR, TaskStatus
-from claudechain.services.composite.artifact_service import find_project_artifacts
+from claudechain.services.composite.artifact_service import (
+    ProjectArtifact,
+    find_artifacts_for_projects,
+    find_project_artifacts,
+)
+from claudechain.infrastructure.tracing.tracer import in_current_context, traced
 
 
 class StatisticsService:
@@ -30,7 +43,6 @@ class StatisticsService:
         repo: str,
         project_repository: ProjectRepository,
         pr_service: PRService,
-        workflow_file: str,
     ):
         """Initialize the statistics service
 
@@ -38,30 +50,35 @@ class StatisticsService:
             repo: GitHub repository (owner/name)
             project_repository: ProjectRepository instance for loading project data
             pr_service: PRService instance for PR operations
-            workflow_file: Name of the workflow that creates PRs (for artifact discovery)
         """
         self.repo = repo
         self.project_repository = project_repository
         self.pr_service = pr_service
-        self.workflow_file = workflow_file
 
     # Public API methods
 
+    @traced
     def collect_all_statistics(
         self,
         projects: List[tuple],
         days_back: int = DEFAULT_STATS_DAYS_BACK,
         label: str = DEFAULT_PR_LABEL,
         show_assignee_stats: bool = False,
+        max_workers: int = DEFAULT_STATS_MAX_WORKERS,
     ) -> StatisticsReport:
         """Collect statistics for provided projects and team members.
 
+        Per-project collection is I/O bound, so projects are fanned out over a
+        thread pool. Results are added to the report in input order, and a
+        failure in one project does not affect the others.
+
         Args:
             projects: List of (project_name, spec_branch) tuples. The caller is
                 responsible for discovering projects (single or multi-project mode).
             days_back: Days to look back for team member stats
             label: GitHub label to filter PRs
             show_assignee_stats: Whether to collect reviewer statistics (default: False)
+            max_workers: Projects collected concurrently (1 = sequential)
 
         Returns:
             Complete StatisticsReport
@@ -78,42 +95,91 @@ class StatisticsService:
             print("No projects provided")
             return report
 
-        # Load configurations for all projects
+        # Load configurations and specs for all projects in bulk
         all_assignees: set = set()
         project_configs: List[tuple] = []  # List of (ProjectConfiguration, spec_branch)
+        specs: Dict[str, Optional[SpecContent]] = {}
 
+        loaded_by_branch = self._load_all_projects(projects)
+        # Loading is batched per spec branch; report projects in the order given
         for project_name, spec_branch in projects:
-            try:
-                config = self._load_project_config(project_name, spec_branch)
-                if config.assignee:
-                    all_assignees.add(config.assignee)
-                project_configs.append((config, spec_branch))
-            except Exception as e:
-                print(f"Warning: Failed to load project {project_name}: {e}")
+            loaded = loaded_by_branch.get(spec_branch, {})
+            if project_name not in loaded:
                 continue
+            config, spec = loaded[project_name]
+            if config.assignee:
+                all_assignees.add(config.assignee)
+            project_configs.append((config, spec_branch))
+            specs[project_name] = spec
 
         print(f"Processing {len(project_configs)} project(s)...")
         print(f"Tracking {len(all_assignees)} unique assignee(s)")
 
+        # Fetch every labeled PR once instead of two label scans per project
+        pr_index: Optional[PullRequestIndex] = None
+        try:
+            pr_index = self.pr_service.get_all_prs_indexed(label=label)
+        except Exception as e:
+            print(f"Warning: Bulk PR fetch failed, falling back to per-project queries: {e}")
+
+        # List artifacts once for every project instead of once per project. Per-project
+        # discovery walks the same repo-wide listing, so a failed bulk listing is not
+        # retried per project: costs and cache usage are reported as unavailable.
+        costs_by_project: Dict[str, Dict[int, float]] = {}
+        cache_by_project: Dict[str, Dict[str, CacheUsage]] = {}
+        try:
+            artifacts_by_project = find_artifacts_for_projects(
+                self.repo,
+                [config.project.name for config, _ in project_configs],
+                download_metadata=True,
+            )
+            costs_by_project = {
+                name: self._sum_costs_by_pr(artifacts)
+                for name, artifacts in artifacts_by_project.items()
+            }
+            cache_by_project = {
+                name: self._sum_cache_usage(artifacts)
+                for name, artifacts in artifacts_by_project.items()
+            }
+        except Exception as e:
+            print(f"Warning: Artifact listing failed, reporting projects without costs: {e}")
+
         # Collect project statistics
-        for config, spec_branch in project_configs:
+        def collect(project_config: tuple) -> Optional[ProjectStats]:
+            config, spec_branch = project_config
             try:
-                project_stats = self.collect_project_stats(
+                return self.collect_project_stats(
                     config.project.name, spec_branch, label,
                     project=config.project,
-                    stale_pr_days=config.get_stale_pr_days()
+                    stale_pr_days=config.get_stale_pr_days(),
+                    pr_index=pr_index,
+                    spec=specs[config.project.name],
+                    costs_by_pr=costs_by_project.get(config.project.name, {}),
+                    cache_usage=cache_by_project.get(config.project.name, {}),
                 )
-                if project_stats:  # Only add if not None (spec exists in spec_branch)
-                    report.add_project(project_stats)
             except Exception as e:
                 print(f"Error collecting stats for {config.project.name}: {e}")
+                return None
+
+        workers = max(1, min(max_workers, len(project_configs)))
+        if workers == 1:
+            results = [collect(project_config) for project_config in project_configs]
+        else:
+            print(f"Collecting {len(project_configs)} project(s) with {workers} worker(s)")
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="stats") as executor:
+                # map() yields results in input order, keeping the report deterministic
+                results = list(executor.map(in_current_context(collect), project_configs))
+
+        for project_stats in results:
+            if project_stats:  # Only add if not None (spec exists in spec_branch)
+                report.add_project(project_stats)
 
         # Collect team member statistics across all projects (only if enabled)
         if show_assignee_stats:
             if all_assignees:
                 try:
                     team_stats = self.collect_team_member_stats(
-                        list(all_assignees), days_back, label
+                        list(all_assignees), days_back, label, pr_index=pr_index
                     )
                     for username, stats in team_stats.items():
                         report.add_team_member(stats)
@@ -130,11 +196,16 @@ class StatisticsService:
 
         return report
 
+    @traced
     def collect_project_stats(
         self, project_name: str, base_branch: str = "main", label: str = DEFAULT_PR_LABEL,
         project: Optional[Project] = None,
         stale_pr_days: int = DEFAULT_STALE_PR_DAYS,
-        days_back: int = DEFAULT_STATS_DAYS_BACK
+        days_back: int = DEFAULT_STATS_DAYS_BACK,
+        pr_index: Optional[PullRequestIndex] = None,
+        costs_by_pr: Optional[Dict[int, float]] = None,
+        spec: Optional[SpecContent] = None,
+        cache_usage: Optional[Dict[str, CacheUsage]] = None
     ) -> ProjectStats:
         """Collect statistics for a single project
 
@@ -145,6 +216,13 @@ class StatisticsService:
             project: Optional pre-loaded Project instance to avoid re-creating
             stale_pr_days: Number of days before a PR is considered stale
             days_back: Days to look back for merged PRs (default: 30)
+            pr_index: Optional pre-fetched PR index; when omitted PRs are
+                queried from GitHub for this project
+            costs_by_pr: Optional pre-computed PR number -> cost mapping; when
+                omitted the project's artifacts are listed from GitHub
+            spec: Optional pre-loaded spec; when omitted it is fetched from base_branch
+            cache_usage: Optional pre-computed model -> prompt cache usage
+                mapping; when omitted it is read from the project's artifacts
 
         Returns:
             ProjectStats object, or None if spec files don't exist in base branch
@@ -157,7 +235,8 @@ class StatisticsService:
 
         # Fetch and parse spec.md using repository
         try:
-            spec = self.project_repository.load_spec(project, base_branch)
+            if spec is None:
+                spec = self.project_repository.load_spec(project, base_branch)
             if not spec:
                 print(f"  Warning: Spec file not found in branch '{base_branch}', skipping project")
                 return None
@@ -169,8 +248,11 @@ class StatisticsService:
             print(f"  Warning: Failed to fetch spec file: {e}")
             return None
 
-        # Get PRs from GitHub (open and merged)
-        open_prs = self.pr_service.get_open_prs_for_project(project_name, label=label)
+        # Get PRs (open and merged) from the shared index or from GitHub
+        if pr_index is not None:
+            open_prs = pr_index.get_open_prs(project_name)
+        else:
+            open_prs = self.pr_service.get_open_prs_for_project(project_name, label=label)
         stats.in_progress_tasks = len(open_prs)
         print(f"  In-progress: {stats.in_progress_tasks}")
 
@@ -183,13 +265,23 @@ class StatisticsService:
         if stats.stale_pr_count > 0:
             print(f"  Stale PRs: {stats.stale_pr_count} (>{stale_pr_days} days)")
 
-        merged_prs = self.pr_service.get_merged_prs_for_project(
-            project_name, label=label, days_back=days_back
-        )
+        if pr_index is not None:
+            cutoff = datetime.now(timezone.utc) - timedelta(days=days_back)
+            merged_prs = pr_index.get_merged_prs(project_name, since=cutoff)
+        else:
+            merged_prs = self.pr_service.get_merged_prs_for_project(
+                project_name, label=label, days_back=days_back
+            )
         print(f"  Merged PRs (last {days_back} days): {len(merged_prs)}")
 
-        # Fetch costs from artifacts (keyed by PR number)
-        costs_by_pr = self._get_costs_by_pr(project_name)
+        # Fetch costs (keyed by PR number) and cache usage (keyed by model) from artifacts
+        if costs_by_pr is None or cache_usage is None:
+            artifacts = self._find_project_artifacts(project_name)
+            if costs_by_pr is None:
+                costs_by_pr = self._sum_costs_by_pr(artifacts)
+            if cache_usage is None:
+                cache_usage = self._sum_cache_usage(artifacts)
+        stats.cache_usage = cache_usage
 
         # Build task-PR mappings (with costs)
         self._build_task_pr_mappings(stats, spec, open_prs, merged_prs, costs_by_pr)
@@ -204,6 +296,9 @@ class StatisticsService:
         stats.total_cost_usd = sum(task.cost_usd for task in stats.tasks)
         if stats.total_cost_usd > 0:
             print(f"  Cost: ${stats.total_cost_usd:.2f}")
+        if cache_usage:
+            total_cache = stats.total_cache_usage
+            print(f"  Prompt cache: {total_cache.hit_ratio:.0%} hit ratio, ${total_cache.savings_usd:.2f} saved (net of cache writes)")
 
         return stats
 
@@ -240,13 +335,8 @@ class StatisticsService:
             if task_hash:
                 pr_by_hash[task_hash] = pr
 
-        # Track which task hashes we've seen (to identify orphaned PRs)
-        spec_task_hashes = set()
-
         # Process each task from spec
         for task in spec.tasks:
-            spec_task_hashes.add(task.task_hash)
-
             # Find matching PR
             matching_pr = pr_by_hash.get(task.task_hash)
 
@@ -276,45 +366,69 @@ class StatisticsService:
         # Identify orphaned PRs (PRs whose task hash doesn't match any spec task)
         for pr in all_prs:
             task_hash = pr.task_hash
-            if task_hash and task_hash not in spec_task_hashes:
+            if task_hash and spec.get_task_by_hash(task_hash) is None:
                 stats.orphaned_prs.append(pr)
 
         if stats.orphaned_prs:
             print(f"  Orphaned PRs: {len(stats.orphaned_prs)}")
 
-    def _get_costs_by_pr(
-        self, project_name: str
-    ) -> Dict[int, float]:
-        """Get costs from task metadata artifacts, keyed by PR number.
-
-        Downloads artifacts for the project and builds a dict mapping PR number
-        to total cost for that PR.
+    def _find_project_artifacts(self, project_name: str) -> List[ProjectArtifact]:
+        """List the project's task metadata artifacts with metadata downloaded.
 
         Args:
             project_name: Name of the project
 
         Returns:
-            Dict mapping PR number -> cost in USD
+            Task metadata artifacts of this project
         """
-        artifacts = find_project_artifacts(
+        return find_project_artifacts(
             repo=self.repo,
             project=project_name,
-            workflow_file=self.workflow_file,
             download_metadata=True,
         )
 
+    @staticmethod
+    def _sum_costs_by_pr(artifacts: List[ProjectArtifact]) -> Dict[int, float]:
+        """Sum artifact metadata costs per PR number.
+
+        Args:
+            artifacts: Artifacts with metadata downloaded
+
+        Returns:
+            Dict mapping PR number -> cost in USD
+        """
         costs_by_pr: Dict[int, float] = {}
         for artifact in artifacts:
             if artifact.metadata and artifact.metadata.pr_number:
-                pr_number = artifact.metadata.pr_number
-                cost = artifact.metadata.get_total_cost()
-                # Sum costs in case there are multiple artifacts for same PR
-                costs_by_pr[pr_number] = costs_by_pr.get(pr_number, 0.0) + cost
+                # A batch session's artifact carries the cost of every PR it created
+                for pr_number, cost in artifact.metadata.get_costs_by_pr().items():
+                    # Sum costs in case there are multiple artifacts for same PR
+                    costs_by_pr[pr_number] = costs_by_pr.get(pr_number, 0.0) + cost
 
         return costs_by_pr
 
+    @staticmethod
+    def _sum_cache_usage(artifacts: List[ProjectArtifact]) -> Dict[str, CacheUsage]:
+        """Sum artifact metadata prompt cache usage per model.
+
+        Args:
+            artifacts: Artifacts with metadata downloaded
+
+        Returns:
+            Dict mapping model name -> CacheUsage
+        """
+        cache_usage: Dict[str, CacheUsage] = {}
+        for artifact in artifacts:
+            if artifact.metadata:
+                for model, usage in artifact.metadata.cache_usage.items():
+                    cache_usage[model] = cache_usage.get(model, CacheUsage()) + usage
+
+        return cache_usage
+
+    @traced
     def collect_team_member_stats(
-        self, assignees: List[str], days_back: int = DEFAULT_STATS_DAYS_BACK, label: str = DEFAULT_PR_LABEL
+        self, assignees: List[str], days_back: int = DEFAULT_STATS_DAYS_BACK, label: str = DEFAULT_PR_LABEL,
+        pr_index: Optional[PullRequestIndex] = None
     ) -> Dict[str, TeamMemberStats]:
         """Collect PR statistics for team members from GitHub API
 
@@ -322,6 +436,7 @@ class StatisticsService:
             assignees: List of GitHub usernames to track
             days_back: Number of days to look back
             label: GitHub label for filtering PRs
+            pr_index: Optional pre-fetched PR index to reuse instead of querying GitHub
 
         Returns:
             Dict of username -> TeamMemberStats
@@ -345,7 +460,10 @@ class StatisticsService:
 
         try:
             # Query all PRs with claudechain label from GitHub using PRService
-            all_prs = self.pr_service.get_all_prs(label=label, state="all", limit=500)
+            if pr_index is not None:
+                all_prs = pr_index.all_prs
+            else:
+                all_prs = self.pr_service.get_all_prs(label=label, state="all", limit=500)
 
             for pr in all_prs:
                 # Skip if no assignee or not a ClaudeChain PR
@@ -393,20 +511,43 @@ class StatisticsService:
 
     # Private helper methods
 
-    def _load_project_config(
-        self, project_name: str, base_branch: str
-    ) -> Optional[ProjectConfiguration]:
-        """Load project configuration using repository
+    def _load_all_projects(
+        self, projects: List[tuple]
+    ) -> Dict[str, Dict[str, tuple]]:
+        """Load configuration and spec for all projects, batched per spec branch
 
         Args:
-            project_name: Name of the project
-            base_branch: Base branch to fetch config from
+            projects: List of (project_name, spec_branch) tuples
 
         Returns:
-            ProjectConfiguration domain model, or None if config couldn't be loaded
+            Dict mapping spec branch -> {project_name: (ProjectConfiguration, SpecContent or None)}.
+            Projects that fail to load are left out with a warning. If the
+            bulk load of a branch fails, its projects are loaded one by one
+            and their spec is left to collect_project_stats.
         """
-        project = Project(project_name)
-        return self.project_repository.load_configuration(project, base_branch)
+        names_by_branch: Dict[str, List[str]] = {}
+        for project_name, spec_branch in projects:
+            names_by_branch.setdefault(spec_branch, []).append(project_name)
+
+        loaded_by_branch: Dict[str, Dict[str, tuple]] = {}
+        for spec_branch, names in names_by_branch.items():
+            try:
+                loaded = self.project_repository.load_all(
+                    [Project(name) for name in names], spec_branch
+                )
+            except Exception as e:
+                print(f"Warning: Bulk load from branch {spec_branch} failed, falling back to per-project queries: {e}")
+                loaded = {}
+                for name in names:
+                    try:
+                        config = self.project_repository.load_configuration(Project(name), spec_branch)
+                        loaded[name] = (config, None)
+                    except Exception as e:
+                        print(f"Warning: Failed to load project {name}: {e}")
+            loaded_by_branch[spec_branch] = {
+                name: loaded[name] for name in names if name in loaded
+            }
+        return loaded_by_branch
 
     # Static utility methods
 
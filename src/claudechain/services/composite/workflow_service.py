@@ -3,12 +3,26 @@
 Provides workflow dispatch capabilities for triggering ClaudeChain workflows
 programmatically. This service wraps the GitHub CLI workflow run command and
 provides error handling for batch workflow triggering.
+
+Batch triggers dispatch several workflows at once under a dispatch budget:
+at most DEFAULT_DISPATCH_CONCURRENCY `gh workflow run` calls in flight, and
+no more than DEFAULT_DISPATCHES_PER_MINUTE started per minute, which keeps
+auto-start below GitHub's secondary rate limit for content-creating requests.
 """
 
-from typing import List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
 
 from claudechain.domain.exceptions import GitHubAPIError
 from claudechain.infrastructure.github.operations import run_gh_command
+from claudechain.infrastructure.github.rate_limiter import RateLimiter
+from claudechain.infrastructure.tracing.tracer import in_current_context, traced
+
+# Workflow dispatches in flight at once
+DEFAULT_DISPATCH_CONCURRENCY = 4
+
+# Workflow dispatches started per minute (GitHub allows 80 content-creating requests)
+DEFAULT_DISPATCHES_PER_MINUTE = 60
 
 
 class WorkflowService:
@@ -29,6 +43,29 @@ class WorkflowService:
         ... )
     """
 
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_DISPATCH_CONCURRENCY,
+        dispatch_limiter: Optional[RateLimiter] = None
+    ):
+        """Initialize the workflow service
+
+        Args:
+            max_workers: Workflow dispatches in flight at once during a batch
+            dispatch_limiter: Limiter every dispatch waits on (default: a
+                DEFAULT_DISPATCHES_PER_MINUTE budget that allows max_workers
+                dispatches back-to-back)
+        """
+        self.max_workers = max(1, max_workers)
+        self.dispatch_limiter = dispatch_limiter or RateLimiter(
+            rate_per_second=DEFAULT_DISPATCHES_PER_MINUTE / 60,
+            burst=self.max_workers,
+            max_retries=0
+        )
+
+    # Public API methods
+
+    @traced
     def trigger_claudechain_workflow(
         self,
         project_name: str,
@@ -53,6 +90,7 @@ class WorkflowService:
             ...     "main"
             ... )
         """
+        self.dispatch_limiter.acquire()
         try:
             run_gh_command([
                 "workflow", "run", "claudechain.yml",
@@ -65,6 +103,7 @@ class WorkflowService:
                 f"Failed to trigger workflow for project '{project_name}': {e}"
             )
 
+    @traced
     def batch_trigger_claudechain_workflows(
         self,
         projects: List[str],
@@ -75,7 +114,8 @@ class WorkflowService:
 
         Attempts to trigger workflows for all projects, collecting both
         successes and failures. Does not raise on individual failures,
-        allowing batch processing to continue.
+        allowing batch processing to continue. Up to max_workers dispatches
+        run concurrently; results are reported in the order of projects.
 
         Args:
             projects: List of project names to trigger
@@ -96,14 +136,27 @@ class WorkflowService:
         """
         successful = []
         failed = []
+        if not projects:
+            return successful, failed
 
-        for project in projects:
+        def dispatch(project: str) -> Optional[GitHubAPIError]:
             try:
                 self.trigger_claudechain_workflow(project, base_branch, checkout_ref)
+                return None
+            except GitHubAPIError as e:
+                return e
+
+        workers = min(self.max_workers, len(projects))
+        print(f"  Dispatching {len(projects)} workflow(s), up to {workers} at a time")
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="workflow-dispatch") as executor:
+            errors = list(executor.map(in_current_context(dispatch), projects))
+
+        for project, error in zip(projects, errors):
+            if error is None:
                 successful.append(project)
                 print(f"  ✅ Successfully triggered workflow for project: {project}")
-            except GitHubAPIError as e:
+            else:
                 failed.append(project)
-                print(f"  ⚠️  Failed to trigger workflow for project '{project}': {e}")
+                print(f"  ⚠️  Failed to trigger workflow for project '{project}': {error}")
 
         return successful, failed
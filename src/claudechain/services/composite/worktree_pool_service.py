@@ -0,0 +1,438 @@
+"""Composite service for running several tasks concurrently on one runner.
+
+Each task gets its own git worktree, created from the runner's checkout so
+all worktrees share one object store. Inside it, the same steps as the
+action run in order: prepare, pre-action script, Claude Code, post-action
+script and finalize. The ClaudeChain steps run as `python -m claudechain`
+subprocesses with the worktree as working directory and private
+$GITHUB_OUTPUT, $GITHUB_STEP_SUMMARY and $RUNNER_TEMP files, so each task
+pushes its own branch and opens its own PR exactly like a single-task run.
+
+Prepare runs one task at a time: tasks claimed by running worktrees are
+passed to it as CLAIMED_TASK_HASHES so two worktrees never pick the same
+task or exceed a project's maxOpenPRs.
+
+All worktrees share .git/config and the shallow file of the main checkout.
+The git identity and the origin URL are therefore set once before the pool
+starts, and finalize runs with GIT_CONFIGURED so it does not rewrite them.
+The base branch is fetched by the pool, one worktree at a time, before
+finalize runs: concurrent fetches would fail on shallow.lock.
+"""
+
+import os
+import subprocess
+import sys
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
+from claudechain.domain.constants import DEFAULT_POOL_MAX_TASKS, DEFAULT_POOL_MEMORY_PER_TASK_MB
+from claudechain.domain.exceptions import ActionScriptError, GitError
+from claudechain.domain.task_batch import TaskBatch
+from claudechain.domain.worktree_pool import (
+    POOL_STATUS_CREATED,
+    POOL_STATUS_FAILED,
+    POOL_STATUS_NO_CHANGES,
+    PoolTask,
+    PoolTaskResult,
+    compute_pool_size,
+    parse_github_output,
+)
+from claudechain.infrastructure.actions.script_runner import run_action_script
+from claudechain.infrastructure.git.operations import (
+    configure_git_identity,
+    configure_git_remote,
+    ensure_ref_available,
+    run_git_command,
+)
+from claudechain.infrastructure.git.worktree import add_worktree, remove_worktree
+from claudechain.infrastructure.tracing.tracer import get_tracer, in_current_context, traced
+
+# Claude Code CLI used for the tasks
+DEFAULT_CLAUDE_COMMAND = "claude"
+
+# Environment of the finalize step, from the outputs of prepare (as wired in action.yml)
+FINALIZE_ENV_FROM_PREPARE = {
+    "BRANCH_NAME": "branch_name",
+    "LABEL": "label",
+    "ASSIGNEE": "assignee",
+    "TASK_DESCRIPTION": "task_description",
+    "TASK_INDEX": "task_index",
+    "PROJECT": "project_name",
+    "PROJECT_PATH": "project_path",
+    "SPEC_PATH": "spec_path",
+    "PR_TEMPLATE_PATH": "pr_template_path",
+    "BASE_BRANCH": "base_branch",
+    "HAS_CAPACITY": "has_capacity",
+    "HAS_TASK": "has_task",
+    "PR_LABELS": "pr_labels",
+    "BATCH_TASKS": "batch_tasks",
+}
+
+# Lines of a failed step's log repeated in the job log
+_LOG_TAIL_LINES = 20
+
+
+class WorktreePoolService:
+    """Composite service running tasks of several projects side by side.
+
+    Example:
+        >>> service = WorktreePoolService("main", "/tmp/claudechain-worktrees")
+        >>> results = service.run(["project-a", "project-b"], max_workers=3)
+        >>> [r.pr_url for r in results if r.pr_url]
+        ['https://github.com/owner/repo/pull/12', 'https://github.com/owner/repo/pull/13']
+    """
+
+    def __init__(
+        self,
+        base_branch: str,
+        worktree_root: str,
+        claude_command: str = DEFAULT_CLAUDE_COMMAND,
+        claude_model: str = "",
+    ):
+        """Initialize the pool
+
+        Args:
+            base_branch: Default base branch handed to prepare
+            worktree_root: Directory the task worktrees and their files are created in
+            claude_command: Claude Code CLI executable
+            claude_model: Model passed to Claude Code (default: the CLI's default)
+        """
+        self.base_branch = base_branch
+        self.worktree_root = os.path.abspath(worktree_root)
+        self.claude_command = claude_command
+        self.claude_model = claude_model
+        self._claim_lock = threading.Lock()
+        self._results_lock = threading.Lock()
+        self._fetch_lock = threading.Lock()
+        self._claimed: Dict[str, Set[str]] = {}
+        self._results: List[Tuple[int, PoolTaskResult]] = []
+        self._next_slot = 1
+
+    # Public API methods
+
+    @traced
+    def run(
+        self,
+        projects: List[str],
+        max_workers: int,
+        max_tasks: int = DEFAULT_POOL_MAX_TASKS,
+    ) -> List[PoolTaskResult]:
+        """Run ready tasks of the projects until none are left
+
+        Projects are served round-robin: a project stays in the queue while
+        prepare finds another task with free capacity for it, so a project
+        with maxOpenPRs > 1 can run several tasks at once.
+
+        Args:
+            projects: Projects to take tasks from
+            max_workers: Tasks executed at once
+            max_tasks: Tasks started in total
+
+        Returns:
+            One result per task (including tasks whose prepare failed), in start order
+        """
+        queue: Deque[str] = deque(dict.fromkeys(p for p in projects if p))
+        budget = [max_tasks]
+        base_ref = run_git_command(["rev-parse", "HEAD"])
+        os.makedirs(self.worktree_root, exist_ok=True)
+        self._configure_git()
+
+        workers = max(1, min(max_workers, max_tasks))
+        print(f"Running up to {max_tasks} task(s) of {len(queue)} project(s), {workers} at a time")
+
+        def work() -> None:
+            while True:
+                task = self._claim_next_task(queue, budget, base_ref)
+                if task is None:
+                    return
+                self._record(task.slot, self._execute_task(task))
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="worktree-pool") as executor:
+            for future in [executor.submit(in_current_context(work)) for _ in range(workers)]:
+                future.result()
+
+        with self._results_lock:
+            return [result for _, result in sorted(self._results, key=lambda entry: entry[0])]
+
+    # Static utility methods
+
+    @staticmethod
+    def pool_size(
+        max_workers: Optional[int] = None,
+        memory_per_task_mb: int = DEFAULT_POOL_MEMORY_PER_TASK_MB,
+    ) -> int:
+        """Tasks this runner can execute at once, bounded by CPU and memory
+
+        Args:
+            max_workers: Upper bound requested by the caller (optional)
+            memory_per_task_mb: Memory budget of one task
+
+        Returns:
+            Pool size, at least 1
+        """
+        return compute_pool_size(
+            WorktreePoolService._cpu_count(),
+            WorktreePoolService._available_memory_mb(),
+            memory_per_task_mb,
+            max_workers,
+        )
+
+    @staticmethod
+    def _cpu_count() -> Optional[int]:
+        """CPUs this process may run on"""
+        if hasattr(os, "sched_getaffinity"):
+            return len(os.sched_getaffinity(0))
+        return os.cpu_count()
+
+    @staticmethod
+    def _available_memory_mb() -> Optional[int]:
+        """Memory available for new processes, or None if unknown"""
+        try:
+            with open("/proc/meminfo", "r") as f:
+                for line in f:
+                    if line.startswith("MemAvailable:"):
+                        return int(line.split()[1]) // 1024
+        except (OSError, ValueError, IndexError):
+            pass
+        try:
+            return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") // (1024 * 1024)
+        except (AttributeError, OSError, ValueError):
+            return None
+
+    # Private helper methods
+
+    def _configure_git(self) -> None:
+        """Set the git identity and origin URL shared by all worktrees
+
+        Raises:
+            GitError: If git config fails
+        """
+        configure_git_identity()
+        gh_token = os.environ.get("GH_TOKEN", "")
+        github_repository = os.environ.get("GITHUB_REPOSITORY", "")
+        if gh_token and github_repository:
+            configure_git_remote(gh_token, github_repository)
+
+    def _fetch_base_branch(self, task: PoolTask, base_branch: str) -> None:
+        """Make origin/<base_branch> available before finalize (one worktree at a time)
+
+        Refs are shared, so finalize finds the ref locally and does not fetch.
+        A failed fetch is left for finalize to retry and report.
+        """
+        with self._fetch_lock:
+            try:
+                ensure_ref_available(f"origin/{base_branch}")
+            except GitError as e:
+                print(f"[task {task.slot}] Warning: Failed to fetch origin/{base_branch}: {e}")
+
+    def _claim_next_task(self, queue: Deque[str], budget: List[int], base_ref: str) -> Optional[PoolTask]:
+        """Prepare the next task in a new worktree (one caller at a time)
+
+        Returns:
+            The prepared task, or None when no project has a ready task left
+        """
+        with self._claim_lock:
+            while queue and budget[0] > 0:
+                project = queue.popleft()
+                task = self._prepare_task(project, base_ref)
+                if task is None:
+                    continue  # Project is done, at capacity or failed to prepare
+                queue.append(project)
+                budget[0] -= 1
+                self._claimed.setdefault(project, set()).update(task.task_hashes)
+                return task
+            return None
+
+    def _prepare_task(self, project: str, base_ref: str) -> Optional[PoolTask]:
+        """Create a worktree and run prepare in it
+
+        Returns:
+            The task if prepare found one, otherwise None (worktree removed)
+        """
+        slot = self._next_slot
+        self._next_slot += 1
+        work_dir = os.path.join(self.worktree_root, f"task-{slot}")
+        os.makedirs(work_dir, exist_ok=True)
+        try:
+            worktree_path = add_worktree(os.path.join(work_dir, "checkout"), base_ref)
+        except GitError as e:
+            self._record(slot, PoolTaskResult(project, "", POOL_STATUS_FAILED, message=f"Worktree not created: {e}"))
+            return None
+
+        task = PoolTask(slot=slot, project_name=project, worktree_path=worktree_path, work_dir=work_dir)
+        claimed = ",".join(sorted(self._claimed.get(project, set())))
+        succeeded, task.outputs = self._run_step(task, "prepare", {
+            "PROJECT_NAME": project,
+            "CLAIMED_TASK_HASHES": claimed,
+        })
+
+        if succeeded and task.outputs.get("has_capacity") == "true" and task.outputs.get("has_task") == "true":
+            print(f"[task {slot}] {project}: {task.task_description}")
+            return task
+
+        if not succeeded:
+            self._record(slot, PoolTaskResult(project, "", POOL_STATUS_FAILED, message="prepare failed"))
+        elif task.outputs.get("has_capacity") != "true":
+            print(f"[task {slot}] {project}: at capacity, no more tasks this run")
+        else:
+            print(f"[task {slot}] {project}: no ready tasks left")
+        self._cleanup(task)
+        return None
+
+    def _execute_task(self, task: PoolTask) -> PoolTaskResult:
+        """Run the pre-action script, Claude Code, the post-action script and finalize
+
+        Failed tasks stay claimed, so the pool does not retry them in this run.
+        """
+        outputs = task.outputs
+        project_path = os.path.join(task.worktree_path, outputs.get("project_path", ""))
+        description = task.task_description
+        try:
+            run_action_script(project_path, "pre", task.worktree_path)
+
+            error = self._run_claude(task)
+            if error:
+                return PoolTaskResult(task.project_name, description, POOL_STATUS_FAILED, message=error)
+
+            run_action_script(project_path, "post", task.worktree_path)
+
+            finalize_env = {name: outputs.get(key, "") for name, key in FINALIZE_ENV_FROM_PREPARE.items()}
+            if not finalize_env["BASE_BRANCH"]:
+                finalize_env["BASE_BRANCH"] = self.base_branch
+            finalize_env["GIT_CONFIGURED"] = "true"
+            self._fetch_base_branch(task, finalize_env["BASE_BRANCH"])
+            succeeded, finalize_outputs = self._run_step(task, "finalize", finalize_env)
+            if not succeeded:
+                return PoolTaskResult(task.project_name, description, POOL_STATUS_FAILED, message="finalize failed")
+
+            pr_url = finalize_outputs.get("pr_url", "")
+            if not pr_url:
+                self._release_claims(task)
+                return PoolTaskResult(task.project_name, description, POOL_STATUS_NO_CHANGES)
+
+            # The task now has an open PR, which prepare counts on its own
+            self._release_claims(task)
+            print(f"[task {task.slot}] {task.project_name}: created {pr_url}")
+            return PoolTaskResult(task.project_name, description, POOL_STATUS_CREATED, pr_url=pr_url)
+        except ActionScriptError as e:
+            return PoolTaskResult(task.project_name, description, POOL_STATUS_FAILED, message=str(e))
+        finally:
+            self._cleanup(task)
+
+    def _run_claude(self, task: PoolTask) -> str:
+        """Run Claude Code on the task's prompt in its worktree
+
+        Returns:
+            Error message, or an empty string if Claude Code reported success
+        """
+        outputs = task.outputs
+        prompt_file = os.path.join(task.work_dir, "prompt.md")
+        execution_file = os.path.join(task.work_dir, "claude-execution.json")
+        with open(prompt_file, "w", encoding="utf-8") as f:
+            f.write(outputs.get("claude_prompt", ""))
+
+        # The prompt goes through stdin: specs can exceed the size of one argument
+        cmd = [
+            self.claude_command, "-p",
+            "--output-format", "json",
+            "--allowedTools", outputs.get("allowed_tools", ""),
+            "--json-schema", outputs.get("json_schema", ""),
+        ]
+        if self.claude_model:
+            cmd.extend(["--model", self.claude_model])
+
+        with get_tracer().span("claude", "subprocess", project=task.project_name, slot=task.slot) as span:
+            try:
+                with open(prompt_file, "r", encoding="utf-8") as stdin, \
+                        open(execution_file, "w", encoding="utf-8") as stdout, \
+                        open(os.path.join(task.work_dir, "claude.log"), "w", encoding="utf-8") as stderr:
+                    returncode = subprocess.run(
+                        cmd, cwd=task.worktree_path, stdin=stdin, stdout=stdout, stderr=stderr
+                    ).returncode
+            except OSError as e:
+                span.args["error"] = type(e).__name__
+                return f"Claude Code could not be started: {e}"
+            span.args["exit_code"] = returncode
+
+        if returncode != 0:
+            self._print_log_tail(task, "claude")
+            return f"Claude Code exited with code {returncode}"
+
+        succeeded, result = self._run_step(task, "parse-claude-result", {
+            "EXECUTION_FILE": execution_file,
+            "RESULT_TYPE": "main",
+        })
+        # parse-claude-result also exits with 1 when Claude Code reported a failure
+        if result.get("success") == "false":
+            return result.get("error_message") or "Claude Code reported failure"
+        if not succeeded:
+            return "Claude Code result could not be parsed"
+        return ""
+
+    def _run_step(self, task: PoolTask, command: str, env: Dict[str, str]) -> Tuple[bool, Dict[str, str]]:
+        """Run a claudechain command in the task's worktree
+
+        Args:
+            task: Task to run the command for
+            command: claudechain subcommand
+            env: Step-specific environment on top of this process's environment
+
+        Returns:
+            Tuple of (whether it exited with 0, the outputs it wrote)
+        """
+        output_file = os.path.join(task.work_dir, f"{command}.out")
+        step_env = dict(os.environ)
+        step_env.update({
+            "GITHUB_OUTPUT": output_file,
+            "GITHUB_STEP_SUMMARY": os.path.join(task.work_dir, "summary.md"),
+            "RUNNER_TEMP": task.work_dir,
+            "BASE_BRANCH": self.base_branch,
+        })
+        step_env.update(env)
+        open(output_file, "w").close()
+
+        cmd = [sys.executable, "-m", "claudechain", command]
+        with get_tracer().span(f"claudechain {command}", "subprocess", project=task.project_name, slot=task.slot) as span:
+            with open(os.path.join(task.work_dir, f"{command}.log"), "w", encoding="utf-8") as log:
+                returncode = subprocess.run(
+                    cmd, cwd=task.worktree_path, env=step_env, stdout=log, stderr=subprocess.STDOUT
+                ).returncode
+            span.args["exit_code"] = returncode
+
+        if returncode != 0:
+            print(f"[task {task.slot}] {task.project_name}: {command} exited with code {returncode}")
+            self._print_log_tail(task, command)
+        with open(output_file, "r", encoding="utf-8") as f:
+            return returncode == 0, parse_github_output(f.read())
+
+    def _release_claims(self, task: PoolTask) -> None:
+        """Stop counting the task as claimed once its outcome is visible on GitHub"""
+        with self._claim_lock:
+            self._claimed.get(task.project_name, set()).difference_update(task.task_hashes)
+
+    def _record(self, slot: int, result: PoolTaskResult) -> None:
+        """Store a task result"""
+        with self._results_lock:
+            self._results.append((slot, result))
+
+    def _cleanup(self, task: PoolTask) -> None:
+        """Remove the task's worktree and the local branches it created"""
+        remove_worktree(task.worktree_path, branch=task.outputs.get("branch_name", ""))
+        batch = TaskBatch.from_json(task.outputs.get("batch_tasks", ""))
+        for batch_task in batch.tasks[1:]:
+            try:
+                run_git_command(["branch", "-D", batch_task.branch_name])
+            except GitError:
+                pass  # Task got no commits, so finalize created no branch
+
+    def _print_log_tail(self, task: PoolTask, command: str) -> None:
+        """Repeat the end of a step's log in the job log"""
+        try:
+            with open(os.path.join(task.work_dir, f"{command}.log"), "r", encoding="utf-8", errors="replace") as f:
+                lines = f.read().splitlines()[-_LOG_TAIL_LINES:]
+        except OSError:
+            return
+        for line in lines:
+            print(f"[task {task.slot}]   {line}")
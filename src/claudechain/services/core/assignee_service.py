@@ -7,39 +7,46 @@ for checking project capacity and providing assignee information.
 from typing import List, Optional
 
 from claudechain.services.core.pr_service import PRService
+from claudechain.domain.github_models import GitHubPullRequest
 from claudechain.domain.models import CapacityResult
 from claudechain.domain.project_configuration import ProjectConfiguration
+from claudechain.infrastructure.tracing.tracer import traced
 
 
 class AssigneeService:
     """Core service for capacity checking and assignee management.
 
-    ClaudeChain enforces a single open PR per project. This service checks
-    whether a project has capacity for a new PR and provides the configured
-    assignee (if any).
+    A project may have up to maxOpenPRs open PRs (1 by default). This service
+    checks whether a project has capacity for a new PR and provides the
+    configured assignee (if any).
     """
 
     def __init__(self, repo: str, pr_service: PRService):
         self.repo = repo
         self.pr_service = pr_service
 
+    @traced
     def check_capacity(
-        self, config: ProjectConfiguration, label: str, project: str
+        self, config: ProjectConfiguration, label: str, project: str,
+        open_prs: Optional[List[GitHubPullRequest]] = None
     ) -> CapacityResult:
         """Check if project has capacity for a new PR.
 
-        ClaudeChain allows only 1 open PR per project at a time.
+        The limit is the project's maxOpenPRs (1 open PR unless configured).
 
         Args:
-            config: ProjectConfiguration domain model with optional assignee
+            config: ProjectConfiguration domain model with optional assignee and maxOpenPRs
             label: GitHub label to filter PRs
             project: Project name to match (used for filtering by branch name pattern)
+            open_prs: Optional pre-fetched open PRs of the project (e.g. from
+                PRService.get_open_prs_by_project); when omitted they are queried
 
         Returns:
             CapacityResult with capacity status, assignee, and open PRs list
         """
         # Get all open PRs for this project (regardless of assignee)
-        open_prs = self.pr_service.get_open_prs_for_project(project, label=label)
+        if open_prs is None:
+            open_prs = self.pr_service.get_open_prs_for_project(project, label=label)
         open_count = len(open_prs)
 
         # Build PR info list for display
@@ -53,10 +60,10 @@ class AssigneeService:
             pr_info_list.append(pr_info)
             print(f"PR #{pr.number}: project={project}")
 
-        # Only 1 open PR allowed per project
-        has_capacity = open_count < 1
+        max_open_prs = config.get_max_open_prs()
+        has_capacity = open_count < max_open_prs
 
-        print(f"Project {project}: {open_count} open PR(s) (max: 1)")
+        print(f"Project {project}: {open_count} open PR(s) (max: {max_open_prs})")
 
         if has_capacity:
             if config.assignee:
@@ -70,5 +77,6 @@ class AssigneeService:
             has_capacity=has_capacity,
             assignee=config.assignee,
             open_prs=pr_info_list,
-            project_name=project
+            project_name=project,
+            max_open_prs=max_open_prs
         )
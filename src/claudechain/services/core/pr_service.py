@@ -6,20 +6,31 @@ Encapsulates business logic for PR-related operations.
 """
 
 import re
+import threading
 from typing import Dict, List, Literal, Optional, Set, Tuple, Union
 
 from claudechain.domain.constants import DEFAULT_STATS_DAYS_BACK
 from claudechain.domain.exceptions import GitHubAPIError
-from claudechain.domain.github_models import GitHubPullRequest
+from claudechain.domain.github_models import GitHubPullRequest, PullRequestIndex
 from claudechain.domain.models import BranchInfo
+from claudechain.infrastructure.cache.pr_snapshot import PullRequestSnapshot, PullRequestSnapshotStore
 from claudechain.infrastructure.github.operations import (
+    list_all_pull_requests,
     list_pull_requests,
+    list_pull_requests_updated_since,
     list_open_pull_requests,
 )
 from claudechain.domain.project import Project
+from claudechain.infrastructure.tracing.tracer import traced
 
 # Re-export for external use and test mocking compatibility
-__all__ = ["PRService", "list_pull_requests", "list_open_pull_requests"]
+__all__ = [
+    "PRService",
+    "list_all_pull_requests",
+    "list_pull_requests",
+    "list_pull_requests_updated_since",
+    "list_open_pull_requests",
+]
 
 
 class PRService:
@@ -28,18 +39,37 @@ class PRService:
     Coordinates PR fetching and branch naming operations by orchestrating
     GitHub API interactions. Implements business logic for ClaudeChain's
     PR management workflows.
+
+    Labeled PR listings are snapshotted for the lifetime of the instance (one
+    command invocation), so services sharing a PRService reuse a single fetch
+    per (state, label). Concurrent callers wait for the in-flight fetch rather
+    than issuing their own. Commands create, close and relabel PRs only
+    after their last read, so the snapshot is never invalidated; use a new
+    instance to see such changes.
+
+    With a snapshot store, get_all_prs_indexed() additionally persists the
+    full PR listing between runs and only fetches PRs updated since then.
     """
 
-    def __init__(self, repo: str):
+    def __init__(self, repo: str, snapshot_store: Optional[PullRequestSnapshotStore] = None):
         """Initialize PR service
 
         Args:
             repo: GitHub repository (owner/name)
+            snapshot_store: Store for persisted PR snapshots (None = always
+                list every PR)
         """
         self.repo = repo
+        self.snapshot_store = snapshot_store
+        self.fetch_count = 0
+        self.fetches_saved = 0
+        self._snapshot: Dict[Tuple[str, str], List[GitHubPullRequest]] = {}
+        self._fetch_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._snapshot_lock = threading.Lock()
 
     # Public API methods
 
+    @traced
     def get_project_prs(
         self, project_name: str, state: str = "all", label: str = "claudechain"
     ) -> List[GitHubPullRequest]:
@@ -71,14 +101,9 @@ class PRService:
             f"Fetching PRs for project '{project_name}' with state='{state}' and label='{label}'"
         )
 
-        # Fetch PRs with the label using infrastructure layer
+        # Fetch PRs with the label (or reuse this invocation's snapshot)
         try:
-            all_prs = list_pull_requests(
-                repo=self.repo,
-                state=state,
-                label=label,
-                limit=100
-            )
+            all_prs = self._get_labeled_prs(state, label)
         except GitHubAPIError as e:
             print(f"Warning: Failed to list PRs: {e}")
             return []
@@ -95,6 +120,7 @@ class PRService:
         )
         return project_prs
 
+    @traced
     def get_open_prs_for_project(
         self, project: str, label: str = "claudechain"
     ) -> List[GitHubPullRequest]:
@@ -117,6 +143,45 @@ class PRService:
         """
         return self.get_project_prs(project, state="open", label=label)
 
+    @traced
+    def get_open_prs_by_project(
+        self, project_names: List[str], label: str = "claudechain"
+    ) -> Dict[str, List[GitHubPullRequest]]:
+        """Fetch open PRs once and partition them by project.
+
+        Replaces one get_open_prs_for_project() call per project when many
+        projects are checked together. Every open labeled PR is fetched with
+        cursor-paginated GraphQL (no result limit) and snapshotted, so later
+        get_open_prs_for_project() calls on this instance reuse the listing.
+
+        Args:
+            project_names: Projects to partition the PRs into
+            label: GitHub label to filter PRs (default: "claudechain")
+
+        Returns:
+            Dict mapping every project name to its open PRs (possibly empty)
+
+        Raises:
+            GitHubAPIError: If the GitHub API call fails
+
+        Examples:
+            >>> service = PRService("owner/repo")
+            >>> open_prs = service.get_open_prs_by_project(["my-refactor", "api-cleanup"])
+            >>> [pr.head_ref_name for pr in open_prs["my-refactor"]]
+            ['claude-chain-my-refactor-a3f2b891']
+        """
+        all_prs = self.get_snapshot("open", label)
+        if all_prs is None:
+            all_prs = list_all_pull_requests(repo=self.repo, label=label, state="open")
+            with self._snapshot_lock:
+                self._snapshot[("open", label)] = all_prs
+                self.fetch_count += 1
+
+        partitions = self.partition_by_project(all_prs, project_names)
+        print(f"Found {len(all_prs)} open PR(s) with label '{label}' across {len(project_names)} project(s)")
+        return partitions
+
+    @traced
     def get_merged_prs_for_project(
         self, project: str, label: str = "claudechain", days_back: int = DEFAULT_STATS_DAYS_BACK
     ) -> List[GitHubPullRequest]:
@@ -152,6 +217,7 @@ class PRService:
 
         return recent_merged
 
+    @traced
     def get_all_prs(
         self, label: str = "claudechain", state: str = "all", limit: int = 500
     ) -> List[GitHubPullRequest]:
@@ -180,6 +246,41 @@ class PRService:
             limit=limit
         )
 
+    @traced
+    def get_all_prs_indexed(self, label: str = "claudechain") -> PullRequestIndex:
+        """Fetch every labeled PR once and index it by project and task hash.
+
+        Replaces per-project get_open_prs_for_project()/get_merged_prs_for_project()
+        calls when many projects are processed together: all PRs are fetched
+        with cursor-paginated GraphQL (one request per 100 PRs) instead of two
+        label scans per project. With a snapshot store, only PRs updated since
+        the previous run are fetched and merged into the stored snapshot.
+
+        Args:
+            label: GitHub label to filter PRs (default: "claudechain")
+
+        Returns:
+            PullRequestIndex keyed by project name, then task hash
+
+        Raises:
+            GitHubAPIError: If the GitHub API call fails
+
+        Examples:
+            >>> service = PRService("owner/repo")
+            >>> index = service.get_all_prs_indexed()
+            >>> open_prs = index.get_open_prs("my-refactor")
+            >>> index.get_task_prs("my-refactor", "a3f2b891")[0].number
+            42
+        """
+        if self.snapshot_store is None:
+            all_prs = list_all_pull_requests(repo=self.repo, label=label, state="all")
+        else:
+            all_prs = self._sync_snapshot(label)
+        index = PullRequestIndex.from_pull_requests(all_prs)
+        print(f"Indexed {len(index)} PR(s) across {len(index.project_names)} project(s) with label '{label}'")
+        return index
+
+    @traced
     def get_unique_projects(self, label: str = "claudechain") -> Dict[str, str]:
         """Extract unique project names and their base branches from labeled PRs.
 
@@ -218,6 +319,11 @@ class PRService:
 
         return projects
 
+    def get_snapshot(self, state: str, label: str) -> Optional[List[GitHubPullRequest]]:
+        """Get the snapshotted listing for (state, label), or None if not fetched yet."""
+        with self._snapshot_lock:
+            return self._snapshot.get((state, label))
+
     # Static utility methods
 
     @staticmethod
@@ -264,6 +370,37 @@ class PRService:
         """
         return f"claude-chain-{project_name}-{task_hash}"
 
+    @staticmethod
+    def partition_by_project(
+        prs: List[GitHubPullRequest], project_names: List[str]
+    ) -> Dict[str, List[GitHubPullRequest]]:
+        """Group PRs by the claude-chain-{project}- prefix of their branch.
+
+        Matches get_project_prs(): a PR belongs to every project whose prefix
+        its branch starts with, and PRs matching no project are dropped.
+
+        Args:
+            prs: PRs to partition
+            project_names: Project names to partition into
+
+        Returns:
+            Dict mapping every project name to its PRs, in input order
+
+        Examples:
+            >>> prs = [pr_on("claude-chain-auth-a3f2b891"), pr_on("feature/x")]
+            >>> {name: len(p) for name, p in PRService.partition_by_project(prs, ["auth", "api"]).items()}
+            {'auth': 1, 'api': 0}
+        """
+        partitions: Dict[str, List[GitHubPullRequest]] = {name: [] for name in project_names}
+        prefixes = [(f"claude-chain-{name}-", name) for name in project_names]
+        for pr in prs:
+            if not pr.head_ref_name:
+                continue
+            for prefix, name in prefixes:
+                if pr.head_ref_name.startswith(prefix):
+                    partitions[name].append(pr)
+        return partitions
+
     @staticmethod
     def parse_branch_name(branch: str) -> Optional[BranchInfo]:
         """Parse branch name for hash-based format.
@@ -286,3 +423,59 @@ class PRService:
             None
         """
         return BranchInfo.from_branch_name(branch)
+
+    # Private helper methods
+
+    def _sync_snapshot(self, label: str) -> List[GitHubPullRequest]:
+        """Bring the persisted PR snapshot up to date and return its PRs
+
+        Cold runs (no usable snapshot) list every labeled PR, exactly like
+        the uncached path; warm runs fetch only PRs updated since the last
+        sync, with or without the label.
+        """
+        snapshot = self.snapshot_store.load(self.repo, label)
+        if snapshot is None or snapshot.fetch_since is None:
+            snapshot = PullRequestSnapshot(repo=self.repo, label=label)
+            snapshot.merge(list_all_pull_requests(repo=self.repo, label=label, state="all"))
+            print(f"PR snapshot: cold sync of {len(snapshot.pull_requests)} PR(s) with label '{label}'")
+        else:
+            since = snapshot.fetch_since
+            # Unfiltered, so PRs whose label was removed are dropped from the snapshot
+            updated = list_pull_requests_updated_since(self.repo, None, since)
+            changed = snapshot.merge(updated)
+            print(
+                f"PR snapshot: {len(updated)} PR(s) updated since {since.isoformat()}, "
+                f"{changed} changed, {len(snapshot.pull_requests)} total"
+            )
+
+        self.snapshot_store.save(snapshot)
+        return snapshot.pull_requests
+
+    def _get_labeled_prs(self, state: str, label: str) -> List[GitHubPullRequest]:
+        """Get labeled PRs from the snapshot, fetching once per (state, label)
+
+        Failed fetches are not snapshotted, so the next call retries.
+        """
+        key = (state, label)
+        with self._snapshot_lock:
+            fetch_lock = self._fetch_locks.setdefault(key, threading.Lock())
+
+        # Single flight: one caller fetches while others wait for its result
+        with fetch_lock:
+            with self._snapshot_lock:
+                cached = self._snapshot.get(key)
+                if cached is not None:
+                    self.fetches_saved += 1
+                    print(f"Using PR snapshot for state='{state}' label='{label}' ({self.fetches_saved} fetch(es) saved)")
+                    return cached
+
+            prs = list_pull_requests(
+                repo=self.repo,
+                state=state,
+                label=label,
+                limit=100
+            )
+            with self._snapshot_lock:
+                self._snapshot[key] = prs
+                self.fetch_count += 1
+            return prs
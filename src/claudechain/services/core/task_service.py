@@ -6,11 +6,15 @@ for task finding, marking, and tracking operations.
 
 import os
 import re
-from typing import Optional
+from pathlib import Path
+from typing import Iterable, List, Optional
 
 from claudechain.domain.exceptions import FileNotFoundError
-from claudechain.domain.spec_content import SpecContent, generate_task_hash
+from claudechain.domain.project import Project
+from claudechain.domain.spec_content import SpecContent, SpecTask, generate_task_hash
+from claudechain.infrastructure.filesystem.operations import write_file_atomic
 from claudechain.services.core.pr_service import PRService
+from claudechain.infrastructure.tracing.tracer import traced
 
 
 class TaskService:
@@ -48,18 +52,57 @@ class TaskService:
         if skip_hashes is None:
             skip_hashes = set()
 
-        task = spec.get_next_available_task(skip_hashes)
-        if task:
-            # Print skip messages for any tasks we're skipping
-            for skipped_task in spec.tasks:
-                if not skipped_task.is_completed and skipped_task.index < task.index:
-                    if skipped_task.task_hash in skip_hashes:
-                        print(f"Skipping task {skipped_task.index} (already in progress - hash {skipped_task.task_hash[:6]}...)")
+        # Walk pending tasks only, remembering the in-progress ones passed over
+        skipped = []
+        for task in spec.index.pending:
+            if task.task_hash in skip_hashes:
+                skipped.append(task)
+                continue
 
+            for skipped_task in skipped:
+                print(f"Skipping task {skipped_task.index} (already in progress - hash {skipped_task.task_hash[:6]}...)")
             return (task.index, task.description, task.task_hash)
 
         return None
 
+    def find_ready_tasks(
+        self, spec: SpecContent, skip_hashes: Optional[set] = None, limit: Optional[int] = None
+    ) -> List[SpecTask]:
+        """Find the next tasks that can be worked on concurrently
+
+        A task is ready when it is unchecked, not in skip_hashes and all of
+        its prerequisites in the spec's dependency graph are completed. Ready
+        tasks never depend on each other, so each can get its own PR.
+
+        Args:
+            spec: SpecContent domain model
+            skip_hashes: Set of task hashes to skip (in-progress tasks)
+            limit: Maximum number of tasks to return (e.g. free PR slots)
+
+        Returns:
+            Ready tasks in dependency order (empty if none)
+
+        Raises:
+            ConfigurationError: If the spec's task dependencies are invalid
+        """
+        return spec.get_ready_tasks(skip_hashes, limit)
+
+    def find_task_batch(self, spec: SpecContent, skip_hashes: Optional[set] = None, size: int = 1) -> List[SpecTask]:
+        """Find consecutive tasks to complete together in one session
+
+        Args:
+            spec: SpecContent domain model
+            skip_hashes: Set of task hashes to skip (in-progress tasks)
+            size: Maximum number of tasks (batchSize, capped by free PR slots)
+
+        Returns:
+            Tasks in completion order; later tasks may build on earlier ones
+
+        Raises:
+            ConfigurationError: If the spec's task dependencies are invalid
+        """
+        return spec.get_task_batch(skip_hashes, size)
+
     @staticmethod
     def mark_task_complete(plan_file: str, task: str) -> None:
         """Mark a task as complete in the spec file
@@ -68,24 +111,43 @@ class TaskService:
             plan_file: Path to spec.md file
             task: Task description to mark complete
 
+        Raises:
+            FileNotFoundError: If spec file doesn't exist
+        """
+        TaskService.mark_tasks_complete(plan_file, [generate_task_hash(task)])
+
+    @staticmethod
+    @traced
+    def mark_tasks_complete(plan_file: str, task_hashes: Iterable[str]) -> List[SpecTask]:
+        """Mark a batch of tasks as complete in the spec file
+
+        Reads the spec once, flips every matching checkbox in a single pass
+        and replaces the file atomically. The file is left untouched when no
+        task matches.
+
+        Args:
+            plan_file: Path to spec.md file
+            task_hashes: Hashes of the tasks to mark complete
+
+        Returns:
+            Tasks that were checked off (hashes matching no pending task are ignored)
+
         Raises:
             FileNotFoundError: If spec file doesn't exist
         """
         if not os.path.exists(plan_file):
             raise FileNotFoundError(f"Spec file not found: {plan_file}")
 
-        with open(plan_file, "r") as f:
-            content = f.read()
+        # newline="" keeps CRLF line endings byte-for-byte
+        with open(plan_file, "r", encoding="utf-8", newline="") as f:
+            spec = SpecContent(Project.from_spec_path(plan_file), f.read())
 
-        # Replace the unchecked task with checked version
-        # Match the task with surrounding whitespace preserved
-        pattern = r'(\s*)- \[ \] ' + re.escape(task)
-        replacement = r'\1- [x] ' + task
-        updated_content = re.sub(pattern, replacement, content, count=1)
-
-        with open(plan_file, "w") as f:
-            f.write(updated_content)
+        updated_content, completed = spec.complete_tasks(task_hashes)
+        if completed:
+            write_file_atomic(Path(plan_file), updated_content)
+        return completed
 
+    @traced
     def get_in_progress_tasks(self, label: str, project: str) -> set:
         """Get task hashes currently being worked on
 
@@ -112,6 +174,7 @@ class TaskService:
             print(f"Error: Failed to query GitHub PRs: {e}")
             return set()
 
+    @traced
     def detect_orphaned_prs(self, label: str, project: str, spec: 'SpecContent') -> list:
         """Detect PRs that reference tasks no longer in spec (orphaned PRs)
 
@@ -130,17 +193,10 @@ class TaskService:
             # Query all open PRs for this project
             open_prs = self.pr_service.get_open_prs_for_project(project, label=label)
 
-            # Build set of valid task hashes from current spec
-            valid_hashes = {task.task_hash for task in spec.tasks}
-
-            orphaned_prs = []
-
-            for pr in open_prs:
-                if pr.task_hash is not None:
-                    if pr.task_hash not in valid_hashes:
-                        orphaned_prs.append(pr)
-
-            return orphaned_prs
+            return [
+                pr for pr in open_prs
+                if pr.task_hash is not None and spec.get_task_by_hash(pr.task_hash) is None
+            ]
         except Exception as e:
             print(f"Warning: Failed to detect orphaned PRs: {e}")
             return []
@@ -188,6 +188,40 @@ def mock_subprocess():
 # ==============================================================================
 
 
+@pytest.fixture(autouse=True)
+def no_github_client(monkeypatch):
+    """Keep tests on the gh CLI code path regardless of the developer's environment
+
+    operations.py routes API calls through the pooled GitHubClient whenever a
+    token is set; tests that exercise the client opt back in explicitly. The
+    shared rate limiter is replaced with one that never sleeps, the shared
+    artifact store and tracer start empty, git cat-file readers are stopped,
+    and no run state is shared between tests.
+    """
+    from claudechain.infrastructure.cache.artifact_store import reset_artifact_store
+    from claudechain.infrastructure.git.object_reader import close_object_readers
+    from claudechain.infrastructure.github.client import reset_github_client
+    from claudechain.infrastructure.github.rate_limiter import RateLimiter, reset_rate_limiter
+    from claudechain.infrastructure.tracing.tracer import reset_tracer
+
+    monkeypatch.delenv("GH_TOKEN", raising=False)
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    monkeypatch.delenv("CLAUDECHAIN_CACHE_DIR", raising=False)
+    monkeypatch.delenv("RUNNER_TEMP", raising=False)
+    monkeypatch.delenv("CLAUDECHAIN_TRACE_FILE", raising=False)
+    reset_github_client()
+    reset_tracer()
+    # Fresh budget per test and no real sleeping on retries
+    reset_rate_limiter(RateLimiter(sleep=lambda seconds: None))
+    reset_artifact_store()
+    yield
+    reset_github_client()
+    reset_rate_limiter()
+    reset_artifact_store()
+    reset_tracer()
+    close_object_readers()
+
+
 @pytest.fixture
 def mock_github_api():
     """Fixture providing a mocked GitHub API client
@@ -0,0 +1,108 @@
+"""Tests for the discover-ready command"""
+
+import json
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from claudechain.cli.commands.discover_ready import check_project_ready, main
+from claudechain.domain.github_models import GitHubPullRequest
+from claudechain.domain.spec_content import generate_task_hash
+
+
+def _open_pr(number: int, branch: str) -> GitHubPullRequest:
+    return GitHubPullRequest(
+        number=number,
+        state="open",
+        head_ref_name=branch,
+        title=f"ClaudeChain: Task {number}",
+        labels=["claudechain"],
+        assignees=[],
+        created_at=datetime.now(timezone.utc),
+        merged_at=None,
+    )
+
+
+@pytest.fixture
+def projects_dir(tmp_path, monkeypatch):
+    """Working directory with a claude-chain/ folder of projects"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GITHUB_REPOSITORY", "owner/repo")
+    base_dir = tmp_path / "claude-chain"
+    base_dir.mkdir()
+
+    def add_project(name: str, spec: str, config: str = None):
+        project_dir = base_dir / name
+        project_dir.mkdir()
+        (project_dir / "spec.md").write_text(spec)
+        if config:
+            (project_dir / "configuration.yml").write_text(config)
+
+    return add_project
+
+
+class TestCheckProjectReady:
+    """Test suite for checking a single project"""
+
+    def test_ready_with_prefetched_open_prs(self, projects_dir, capsys):
+        """Should use the passed open PRs and skip tasks already in progress"""
+        # Arrange
+        projects_dir(
+            "auth",
+            "- [ ] Task 1 <!-- group: a -->\n- [ ] Task 2 <!-- group: b -->\n",
+            config="maxOpenPRs: 2\n",
+        )
+        in_progress = _open_pr(1, f"claude-chain-auth-{generate_task_hash('Task 1')}")
+
+        # Act
+        with patch("claudechain.services.core.pr_service.list_pull_requests") as mock_list:
+            ready = check_project_ready("auth", "owner/repo", open_prs=[in_progress])
+
+        # Assert
+        assert ready is True
+        assert "1/2 PRs" in capsys.readouterr().out
+        mock_list.assert_not_called()
+
+    def test_not_ready_without_checklist(self, projects_dir, capsys):
+        """Should reject a spec without checklist items"""
+        # Arrange
+        projects_dir("docs", "# Notes only\n")
+
+        # Act
+        ready = check_project_ready("docs", "owner/repo", open_prs=[])
+
+        # Assert
+        assert ready is False
+        assert "Invalid spec format" in capsys.readouterr().out
+
+
+class TestDiscoverReadyMain:
+    """Test suite for checking every project with shared services"""
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    @patch("claudechain.cli.commands.discover_ready.GitHubActionsHelper")
+    @patch("claudechain.services.core.pr_service.list_pull_requests")
+    @patch("claudechain.services.core.pr_service.list_all_pull_requests")
+    def test_one_pr_listing_for_all_projects(
+        self, mock_list_all, mock_list_prs, mock_gh_class, projects_dir, max_workers
+    ):
+        """Should list open PRs once and skip projects at capacity or without tasks"""
+        # Arrange
+        for i in range(20):
+            projects_dir(f"project-{i:02d}", "- [ ] Task 1\n")
+        projects_dir("done", "- [x] Task 1\n")
+        mock_list_all.return_value = [_open_pr(7, "claude-chain-project-03-a3f2b891")]
+        mock_gh = mock_gh_class.return_value
+
+        # Act
+        result = main(max_workers=max_workers)
+
+        # Assert
+        assert result == 0
+        mock_list_all.assert_called_once_with(repo="owner/repo", label="claudechain", state="open")
+        mock_list_prs.assert_not_called()
+        outputs = {call.args[0]: call.args[1] for call in mock_gh.write_output.call_args_list}
+        expected = [f"project-{i:02d}" for i in range(20) if i != 3]
+        assert sorted(json.loads(outputs["projects"])) == expected
+        assert outputs["project_count"] == "19"
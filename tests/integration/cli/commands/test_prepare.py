@@ -5,9 +5,12 @@ from unittest.mock import Mock, patch
 import pytest
 
 from claudechain.cli.commands.prepare import cmd_prepare
+from claudechain.domain.models import CapacityResult
 from claudechain.domain.project import Project
 from claudechain.domain.project_configuration import ProjectConfiguration
-from claudechain.domain.spec_content import SpecContent
+from claudechain.domain.spec_content import SpecContent, SpecTask, generate_task_hash
+from claudechain.domain.task_batch import TaskBatch
+from claudechain.infrastructure.cache.run_state_store import get_run_state_store
 
 
 class TestPrepareMergeTargetValidation:
@@ -136,7 +139,9 @@ class TestPrepareMergeTargetValidation:
             mock_task_service = Mock()
             mock_task_service.detect_orphaned_prs.return_value = []
             mock_task_service.get_in_progress_tasks.return_value = set()
-            mock_task_service.find_next_available_task.return_value = (1, "Task 1", "abc123")
+            mock_task_service.find_ready_tasks.return_value = [
+                SpecTask(index=1, description="Task 1", is_completed=False, raw_line="- [ ] Task 1", task_hash="abc123")
+            ]
             mock_task_service_class.return_value = mock_task_service
 
             # Mock AssigneeService
@@ -144,6 +149,7 @@ class TestPrepareMergeTargetValidation:
             mock_capacity_result = Mock()
             mock_capacity_result.format_summary.return_value = "## Capacity Check\n✅ test-project (0/1)"
             mock_capacity_result.has_capacity = True
+            mock_capacity_result.available_slots = 1
             mock_capacity_result.assignee = "reviewer1"
             mock_assignee_service.check_capacity.return_value = mock_capacity_result
             mock_assignee_service_class.return_value = mock_assignee_service
@@ -194,7 +200,9 @@ class TestPrepareMergeTargetValidation:
             mock_task_service = Mock()
             mock_task_service.detect_orphaned_prs.return_value = []
             mock_task_service.get_in_progress_tasks.return_value = set()
-            mock_task_service.find_next_available_task.return_value = (1, "Task 1", "abc123")
+            mock_task_service.find_ready_tasks.return_value = [
+                SpecTask(index=1, description="Task 1", is_completed=False, raw_line="- [ ] Task 1", task_hash="abc123")
+            ]
             mock_task_service_class.return_value = mock_task_service
 
             # Mock AssigneeService
@@ -202,6 +210,7 @@ class TestPrepareMergeTargetValidation:
             mock_capacity_result = Mock()
             mock_capacity_result.format_summary.return_value = "## Capacity Check\n✅ test-project (0/1)"
             mock_capacity_result.has_capacity = True
+            mock_capacity_result.available_slots = 1
             mock_capacity_result.assignee = "reviewer1"
             mock_assignee_service.check_capacity.return_value = mock_capacity_result
             mock_assignee_service_class.return_value = mock_assignee_service
@@ -330,7 +339,9 @@ class TestPrepareBaseBranchResolution:
             mock_task_service = Mock()
             mock_task_service.detect_orphaned_prs.return_value = []
             mock_task_service.get_in_progress_tasks.return_value = set()
-            mock_task_service.find_next_available_task.return_value = (1, "Task 1", "abc123")
+            mock_task_service.find_ready_tasks.return_value = [
+                SpecTask(index=1, description="Task 1", is_completed=False, raw_line="- [ ] Task 1", task_hash="abc123")
+            ]
             mock_task_service_class.return_value = mock_task_service
 
             # Mock AssigneeService
@@ -338,6 +349,7 @@ class TestPrepareBaseBranchResolution:
             mock_capacity_result = Mock()
             mock_capacity_result.format_summary.return_value = "## Capacity Check\n✅ test-project (0/1)"
             mock_capacity_result.has_capacity = True
+            mock_capacity_result.available_slots = 1
             mock_capacity_result.assignee = "reviewer1"
             mock_assignee_service.check_capacity.return_value = mock_capacity_result
             mock_assignee_service_class.return_value = mock_assignee_service
@@ -387,7 +399,9 @@ class TestPrepareBaseBranchResolution:
             mock_task_service = Mock()
             mock_task_service.detect_orphaned_prs.return_value = []
             mock_task_service.get_in_progress_tasks.return_value = set()
-            mock_task_service.find_next_available_task.return_value = (1, "Task 1", "abc123")
+            mock_task_service.find_ready_tasks.return_value = [
+                SpecTask(index=1, description="Task 1", is_completed=False, raw_line="- [ ] Task 1", task_hash="abc123")
+            ]
             mock_task_service_class.return_value = mock_task_service
 
             # Mock AssigneeService
@@ -395,6 +409,7 @@ class TestPrepareBaseBranchResolution:
             mock_capacity_result = Mock()
             mock_capacity_result.format_summary.return_value = "## Capacity Check\n✅ test-project (0/1)"
             mock_capacity_result.has_capacity = True
+            mock_capacity_result.available_slots = 1
             mock_capacity_result.assignee = "reviewer1"
             mock_assignee_service.check_capacity.return_value = mock_capacity_result
             mock_assignee_service_class.return_value = mock_assignee_service
@@ -445,7 +460,9 @@ class TestPrepareBaseBranchResolution:
             mock_task_service = Mock()
             mock_task_service.detect_orphaned_prs.return_value = []
             mock_task_service.get_in_progress_tasks.return_value = set()
-            mock_task_service.find_next_available_task.return_value = (1, "Task 1", "abc123")
+            mock_task_service.find_ready_tasks.return_value = [
+                SpecTask(index=1, description="Task 1", is_completed=False, raw_line="- [ ] Task 1", task_hash="abc123")
+            ]
             mock_task_service_class.return_value = mock_task_service
 
             # Mock AssigneeService
@@ -453,6 +470,7 @@ class TestPrepareBaseBranchResolution:
             mock_capacity_result = Mock()
             mock_capacity_result.format_summary.return_value = "## Capacity Check\n✅ test-project (0/1)"
             mock_capacity_result.has_capacity = True
+            mock_capacity_result.available_slots = 1
             mock_capacity_result.assignee = "reviewer1"
             mock_assignee_service.check_capacity.return_value = mock_capacity_result
             mock_assignee_service_class.return_value = mock_assignee_service
@@ -503,7 +521,9 @@ class TestPrepareBaseBranchResolution:
             mock_task_service = Mock()
             mock_task_service.detect_orphaned_prs.return_value = []
             mock_task_service.get_in_progress_tasks.return_value = set()
-            mock_task_service.find_next_available_task.return_value = (1, "Task 1", "abc123")
+            mock_task_service.find_ready_tasks.return_value = [
+                SpecTask(index=1, description="Task 1", is_completed=False, raw_line="- [ ] Task 1", task_hash="abc123")
+            ]
             mock_task_service_class.return_value = mock_task_service
 
             # Mock AssigneeService
@@ -511,6 +531,7 @@ class TestPrepareBaseBranchResolution:
             mock_capacity_result = Mock()
             mock_capacity_result.format_summary.return_value = "## Capacity Check\n✅ test-project (0/1)"
             mock_capacity_result.has_capacity = True
+            mock_capacity_result.available_slots = 1
             mock_capacity_result.assignee = "reviewer1"
             mock_assignee_service.check_capacity.return_value = mock_capacity_result
             mock_assignee_service_class.return_value = mock_assignee_service
@@ -608,7 +629,9 @@ class TestPrepareAllowedToolsResolution:
             mock_task_service = Mock()
             mock_task_service.detect_orphaned_prs.return_value = []
             mock_task_service.get_in_progress_tasks.return_value = set()
-            mock_task_service.find_next_available_task.return_value = (1, "Task 1", "abc123")
+            mock_task_service.find_ready_tasks.return_value = [
+                SpecTask(index=1, description="Task 1", is_completed=False, raw_line="- [ ] Task 1", task_hash="abc123")
+            ]
             mock_task_service_class.return_value = mock_task_service
 
             # Mock AssigneeService
@@ -616,6 +639,7 @@ class TestPrepareAllowedToolsResolution:
             mock_capacity_result = Mock()
             mock_capacity_result.format_summary.return_value = "## Capacity Check\n✅ test-project (0/1)"
             mock_capacity_result.has_capacity = True
+            mock_capacity_result.available_slots = 1
             mock_capacity_result.assignee = "reviewer1"
             mock_assignee_service.check_capacity.return_value = mock_capacity_result
             mock_assignee_service_class.return_value = mock_assignee_service
@@ -665,7 +689,9 @@ class TestPrepareAllowedToolsResolution:
             mock_task_service = Mock()
             mock_task_service.detect_orphaned_prs.return_value = []
             mock_task_service.get_in_progress_tasks.return_value = set()
-            mock_task_service.find_next_available_task.return_value = (1, "Task 1", "abc123")
+            mock_task_service.find_ready_tasks.return_value = [
+                SpecTask(index=1, description="Task 1", is_completed=False, raw_line="- [ ] Task 1", task_hash="abc123")
+            ]
             mock_task_service_class.return_value = mock_task_service
 
             # Mock AssigneeService
@@ -673,6 +699,7 @@ class TestPrepareAllowedToolsResolution:
             mock_capacity_result = Mock()
             mock_capacity_result.format_summary.return_value = "## Capacity Check\n✅ test-project (0/1)"
             mock_capacity_result.has_capacity = True
+            mock_capacity_result.available_slots = 1
             mock_capacity_result.assignee = "reviewer1"
             mock_assignee_service.check_capacity.return_value = mock_capacity_result
             mock_assignee_service_class.return_value = mock_assignee_service
@@ -773,7 +800,9 @@ class TestPreparePRLabelsResolution:
             mock_task_service = Mock()
             mock_task_service.detect_orphaned_prs.return_value = []
             mock_task_service.get_in_progress_tasks.return_value = set()
-            mock_task_service.find_next_available_task.return_value = (1, "Task 1", "abc123")
+            mock_task_service.find_ready_tasks.return_value = [
+                SpecTask(index=1, description="Task 1", is_completed=False, raw_line="- [ ] Task 1", task_hash="abc123")
+            ]
             mock_task_service_class.return_value = mock_task_service
 
             # Mock AssigneeService
@@ -781,6 +810,7 @@ class TestPreparePRLabelsResolution:
             mock_capacity_result = Mock()
             mock_capacity_result.format_summary.return_value = "## Capacity Check\n✅ test-project (0/1)"
             mock_capacity_result.has_capacity = True
+            mock_capacity_result.available_slots = 1
             mock_capacity_result.assignee = "reviewer1"
             mock_assignee_service.check_capacity.return_value = mock_capacity_result
             mock_assignee_service_class.return_value = mock_assignee_service
@@ -830,7 +860,9 @@ class TestPreparePRLabelsResolution:
             mock_task_service = Mock()
             mock_task_service.detect_orphaned_prs.return_value = []
             mock_task_service.get_in_progress_tasks.return_value = set()
-            mock_task_service.find_next_available_task.return_value = (1, "Task 1", "abc123")
+            mock_task_service.find_ready_tasks.return_value = [
+                SpecTask(index=1, description="Task 1", is_completed=False, raw_line="- [ ] Task 1", task_hash="abc123")
+            ]
             mock_task_service_class.return_value = mock_task_service
 
             # Mock AssigneeService
@@ -838,6 +870,7 @@ class TestPreparePRLabelsResolution:
             mock_capacity_result = Mock()
             mock_capacity_result.format_summary.return_value = "## Capacity Check\n✅ test-project (0/1)"
             mock_capacity_result.has_capacity = True
+            mock_capacity_result.available_slots = 1
             mock_capacity_result.assignee = "reviewer1"
             mock_assignee_service.check_capacity.return_value = mock_capacity_result
             mock_assignee_service_class.return_value = mock_assignee_service
@@ -888,7 +921,9 @@ class TestPreparePRLabelsResolution:
             mock_task_service = Mock()
             mock_task_service.detect_orphaned_prs.return_value = []
             mock_task_service.get_in_progress_tasks.return_value = set()
-            mock_task_service.find_next_available_task.return_value = (1, "Task 1", "abc123")
+            mock_task_service.find_ready_tasks.return_value = [
+                SpecTask(index=1, description="Task 1", is_completed=False, raw_line="- [ ] Task 1", task_hash="abc123")
+            ]
             mock_task_service_class.return_value = mock_task_service
 
             # Mock AssigneeService
@@ -896,6 +931,7 @@ class TestPreparePRLabelsResolution:
             mock_capacity_result = Mock()
             mock_capacity_result.format_summary.return_value = "## Capacity Check\n✅ test-project (0/1)"
             mock_capacity_result.has_capacity = True
+            mock_capacity_result.available_slots = 1
             mock_capacity_result.assignee = "reviewer1"
             mock_assignee_service.check_capacity.return_value = mock_capacity_result
             mock_assignee_service_class.return_value = mock_assignee_service
@@ -912,3 +948,338 @@ class TestPreparePRLabelsResolution:
         # Verify no PR labels message is printed (empty labels don't get logged)
         captured = capsys.readouterr()
         assert "PR labels:" not in captured.out
+
+
+class TestPrepareRunState:
+    """Test suite for sharing resolved facts with later steps through the run state"""
+
+    @pytest.fixture
+    def sample_spec(self):
+        """Fixture providing sample spec content"""
+        return SpecContent(project=Project("test-project"), content="## Tasks\n- [ ] Task 1\n")
+
+    def _run_prepare(self, sample_spec, ensure_label):
+        """Run prepare with mocked services and return its exit code"""
+        with patch("claudechain.cli.commands.prepare.ProjectRepository") as mock_repo_class, \
+             patch("claudechain.cli.commands.prepare.PRService") as mock_pr_service_class, \
+             patch("claudechain.cli.commands.prepare.TaskService") as mock_task_service_class, \
+             patch("claudechain.cli.commands.prepare.AssigneeService") as mock_assignee_service_class, \
+             patch("claudechain.cli.commands.prepare.ensure_label_exists", ensure_label), \
+             patch("claudechain.cli.commands.prepare.validate_spec_format_from_string"), \
+             patch("claudechain.cli.commands.prepare.run_git_command") as mock_git:
+
+            mock_repo = Mock()
+            mock_repo.load_local_configuration.return_value = ProjectConfiguration(project=Project("test-project"))
+            mock_repo.load_local_spec.return_value = sample_spec
+            mock_repo_class.return_value = mock_repo
+
+            mock_pr_service = Mock()
+            mock_pr_service.format_branch_name.return_value = "claude-chain-test-project-abc123"
+            mock_pr_service_class.return_value = mock_pr_service
+
+            mock_task_service = Mock()
+            mock_task_service.detect_orphaned_prs.return_value = []
+            mock_task_service.get_in_progress_tasks.return_value = set()
+            mock_task_service.find_ready_tasks.return_value = [
+                SpecTask(index=1, description="Task 1", is_completed=False, raw_line="- [ ] Task 1", task_hash="abc123")
+            ]
+            mock_task_service_class.return_value = mock_task_service
+
+            mock_capacity_result = Mock()
+            mock_capacity_result.format_summary.return_value = "## Capacity Check"
+            mock_capacity_result.has_capacity = True
+            mock_capacity_result.available_slots = 1
+            mock_capacity_result.assignee = None
+            mock_assignee_service_class.return_value.check_capacity.return_value = mock_capacity_result
+
+            mock_git.return_value = "0123abcd"
+
+            result = cmd_prepare(Mock(), Mock(), default_allowed_tools="Read", default_pr_labels="")
+        return result
+
+    def test_prepare_records_spec_and_base_commit(self, sample_spec, monkeypatch, tmp_path):
+        """Should record the spec and the commit the branch was created from for finalize"""
+        # Arrange
+        monkeypatch.setenv("GITHUB_REPOSITORY", "owner/repo")
+        monkeypatch.setenv("PROJECT_NAME", "test-project")
+        monkeypatch.setenv("RUNNER_TEMP", str(tmp_path))
+        monkeypatch.setenv("GITHUB_RUN_ID", "42")
+
+        # Act
+        result = self._run_prepare(sample_spec, Mock())
+
+        # Assert
+        assert result == 0
+        state = get_run_state_store().load()
+        assert state.project_name == "test-project"
+        assert state.spec_content == sample_spec.content
+        assert state.base_sha == "0123abcd"
+
+
+class TestPrepareBatchMode:
+    """Test suite for completing several tasks in one session (batchSize)"""
+
+    def _run_prepare(self, config, spec, max_open_prs):
+        """Run prepare with real task selection and return the written outputs"""
+        gh = Mock()
+        with patch("claudechain.cli.commands.prepare.ProjectRepository") as mock_repo_class, \
+             patch("claudechain.cli.commands.prepare.PRService") as mock_pr_service_class, \
+             patch("claudechain.cli.commands.prepare.TaskService") as mock_task_service_class, \
+             patch("claudechain.cli.commands.prepare.AssigneeService") as mock_assignee_service_class, \
+             patch("claudechain.cli.commands.prepare.ensure_label_exists"), \
+             patch("claudechain.cli.commands.prepare.run_git_command"):
+
+            mock_repo_class.return_value.load_local_configuration.return_value = config
+            mock_repo_class.return_value.load_local_spec.return_value = spec
+
+            mock_pr_service_class.return_value.format_branch_name.side_effect = (
+                lambda project, task_hash: f"claude-chain-{project}-{task_hash}"
+            )
+
+            mock_task_service = Mock()
+            mock_task_service.detect_orphaned_prs.return_value = []
+            mock_task_service.get_in_progress_tasks.return_value = set()
+            mock_task_service.find_ready_tasks.side_effect = lambda s, skip, limit: s.get_ready_tasks(skip, limit)
+            mock_task_service.find_task_batch.side_effect = lambda s, skip, size: s.get_task_batch(skip, size)
+            mock_task_service_class.return_value = mock_task_service
+
+            mock_assignee_service_class.return_value.check_capacity.return_value = CapacityResult(
+                has_capacity=True, assignee=None, open_prs=[], project_name="test-project",
+                max_open_prs=max_open_prs,
+            )
+
+            result = cmd_prepare(Mock(), gh, default_allowed_tools="Read", default_pr_labels="")
+        outputs = {c.args[0]: c.args[1] for c in gh.write_output.call_args_list}
+        return result, outputs
+
+    def test_prepare_hands_consecutive_tasks_to_one_session(self, monkeypatch):
+        """Should pick batchSize consecutive tasks and ask for one tagged commit per task"""
+        # Arrange
+        monkeypatch.setenv("GITHUB_REPOSITORY", "owner/repo")
+        monkeypatch.setenv("PROJECT_NAME", "test-project")
+        project = Project("test-project")
+        config = ProjectConfiguration(project=project, batch_size=2)
+        spec = SpecContent(project, "- [x] Task 1\n- [ ] Task 2\n- [ ] Task 3\n- [ ] Task 4\n")
+
+        # Act
+        result, outputs = self._run_prepare(config, spec, max_open_prs=3)
+
+        # Assert
+        assert result == 0
+        batch = TaskBatch.from_json(outputs["batch_tasks"])
+        assert [t.task_description for t in batch.tasks] == ["Task 2", "Task 3"]
+        assert batch.tasks[1].branch_name == f"claude-chain-test-project-{generate_task_hash('Task 3')}"
+        assert outputs["task_description"] == "Task 2"
+        assert f"[task {generate_task_hash('Task 3')}] Task 3" in outputs["claude_prompt"]
+
+    def test_prepare_caps_batch_at_free_pr_slots(self, monkeypatch):
+        """Should fall back to a single task when only one PR slot is free"""
+        # Arrange
+        monkeypatch.setenv("GITHUB_REPOSITORY", "owner/repo")
+        monkeypatch.setenv("PROJECT_NAME", "test-project")
+        project = Project("test-project")
+        config = ProjectConfiguration(project=project, batch_size=3)
+        spec = SpecContent(project, "- [ ] Task 1\n- [ ] Task 2\n")
+
+        # Act
+        result, outputs = self._run_prepare(config, spec, max_open_prs=1)
+
+        # Assert
+        assert result == 0
+        assert "batch_tasks" not in outputs
+        assert "Complete the following task from spec.md" in outputs["claude_prompt"]
+        assert "tasks from spec.md, one at a time" not in outputs["claude_prompt"]
+
+
+class TestPrepareClaimedTasks:
+    """Test suite for tasks claimed by other worktrees of a run-pool run"""
+
+    def _run_prepare(self, spec, max_open_prs, open_prs=()):
+        """Run prepare with real task selection and return (result, outputs)"""
+        gh = Mock()
+        project = Project("test-project")
+        with patch("claudechain.cli.commands.prepare.ProjectRepository") as mock_repo_class, \
+             patch("claudechain.cli.commands.prepare.PRService") as mock_pr_service_class, \
+             patch("claudechain.cli.commands.prepare.TaskService") as mock_task_service_class, \
+             patch("claudechain.cli.commands.prepare.AssigneeService") as mock_assignee_service_class, \
+             patch("claudechain.cli.commands.prepare.ensure_label_exists"), \
+             patch("claudechain.cli.commands.prepare.run_git_command"):
+
+            mock_repo_class.return_value.load_local_configuration.return_value = ProjectConfiguration(project=project)
+            mock_repo_class.return_value.load_local_spec.return_value = SpecContent(project, spec)
+            mock_pr_service_class.return_value.format_branch_name.side_effect = (
+                lambda name, task_hash: f"claude-chain-{name}-{task_hash}"
+            )
+
+            mock_task_service = Mock()
+            mock_task_service.detect_orphaned_prs.return_value = []
+            mock_task_service.get_in_progress_tasks.return_value = set()
+            mock_task_service.find_ready_tasks.side_effect = lambda s, skip, limit: s.get_ready_tasks(skip, limit)
+            mock_task_service_class.return_value = mock_task_service
+
+            mock_assignee_service_class.return_value.check_capacity.return_value = CapacityResult(
+                has_capacity=len(open_prs) < max_open_prs, assignee=None, open_prs=list(open_prs),
+                project_name="test-project", max_open_prs=max_open_prs,
+            )
+
+            result = cmd_prepare(Mock(), gh, default_allowed_tools="Read", default_pr_labels="")
+        outputs = {c.args[0]: c.args[1] for c in gh.write_output.call_args_list}
+        return result, outputs
+
+    def test_claimed_tasks_are_skipped(self, monkeypatch):
+        """Should pick the next ready task that no other worktree has claimed"""
+        # Arrange
+        monkeypatch.setenv("GITHUB_REPOSITORY", "owner/repo")
+        monkeypatch.setenv("PROJECT_NAME", "test-project")
+        monkeypatch.setenv("CLAIMED_TASK_HASHES", generate_task_hash("Task 1"))
+        spec = "- [ ] Task 1 <!-- group: a -->\n- [ ] Task 2 <!-- group: b -->\n"
+
+        # Act
+        result, outputs = self._run_prepare(spec, max_open_prs=2)
+
+        # Assert
+        assert result == 0
+        assert outputs["task_description"] == "Task 2"
+
+    def test_claimed_tasks_use_capacity(self, monkeypatch):
+        """Should report no capacity when claimed tasks fill the free PR slots"""
+        # Arrange
+        monkeypatch.setenv("GITHUB_REPOSITORY", "owner/repo")
+        monkeypatch.setenv("PROJECT_NAME", "test-project")
+        monkeypatch.setenv("CLAIMED_TASK_HASHES", generate_task_hash("Task 1"))
+        spec = "- [ ] Task 1 <!-- group: a -->\n- [ ] Task 2 <!-- group: b -->\n"
+
+        # Act
+        result, outputs = self._run_prepare(spec, max_open_prs=1)
+
+        # Assert
+        assert result == 0
+        assert outputs["has_capacity"] == "false"
+        assert "task_description" not in outputs
+
+
+class TestPrepareParallelTasks:
+    """Test suite for filling several PR slots (maxOpenPRs) with independent tasks"""
+
+    SPEC = "- [ ] Task 1 <!-- group: a -->\n- [ ] Task 2 <!-- group: b -->\n"
+
+    def _run_prepare(self, open_task_hashes, max_open_prs):
+        """Run prepare with real task selection while the given tasks have open PRs"""
+        gh = Mock()
+        project = Project("test-project")
+        open_prs = [Mock() for _ in open_task_hashes]
+        with patch("claudechain.cli.commands.prepare.ProjectRepository") as mock_repo_class, \
+             patch("claudechain.cli.commands.prepare.PRService") as mock_pr_service_class, \
+             patch("claudechain.cli.commands.prepare.TaskService") as mock_task_service_class, \
+             patch("claudechain.cli.commands.prepare.AssigneeService") as mock_assignee_service_class, \
+             patch("claudechain.cli.commands.prepare.ensure_label_exists"), \
+             patch("claudechain.cli.commands.prepare.run_git_command"):
+
+            mock_repo_class.return_value.load_local_configuration.return_value = ProjectConfiguration(project=project)
+            mock_repo_class.return_value.load_local_spec.return_value = SpecContent(project, self.SPEC)
+            mock_pr_service_class.return_value.format_branch_name.side_effect = (
+                lambda name, task_hash: f"claude-chain-{name}-{task_hash}"
+            )
+
+            mock_task_service = Mock()
+            mock_task_service.detect_orphaned_prs.return_value = []
+            mock_task_service.get_in_progress_tasks.return_value = set(open_task_hashes)
+            mock_task_service.find_ready_tasks.side_effect = lambda s, skip, limit: s.get_ready_tasks(skip, limit)
+            mock_task_service_class.return_value = mock_task_service
+
+            mock_assignee_service_class.return_value.check_capacity.return_value = CapacityResult(
+                has_capacity=len(open_prs) < max_open_prs, assignee=None, open_prs=open_prs,
+                project_name="test-project", max_open_prs=max_open_prs,
+            )
+
+            result = cmd_prepare(Mock(), gh, default_allowed_tools="Read", default_pr_labels="")
+        outputs = {c.args[0]: c.args[1] for c in gh.write_output.call_args_list}
+        return result, outputs
+
+    def test_two_independent_tasks_get_two_prs(self, monkeypatch):
+        """Should request a follow-up run that opens a PR for the second independent task"""
+        # Arrange
+        monkeypatch.setenv("GITHUB_REPOSITORY", "owner/repo")
+        monkeypatch.setenv("PROJECT_NAME", "test-project")
+
+        # Act - the first run opens a PR for Task 1, then the follow-up run prepares
+        first_result, first = self._run_prepare(open_task_hashes=[], max_open_prs=2)
+        second_result, second = self._run_prepare(
+            open_task_hashes=[generate_task_hash("Task 1")], max_open_prs=2
+        )
+
+        # Assert
+        assert (first_result, second_result) == (0, 0)
+        assert first["task_description"] == "Task 1"
+        assert first["dispatch_next_run"] == "true"
+        assert second["task_description"] == "Task 2"
+        assert second["branch_name"] == f"claude-chain-test-project-{generate_task_hash('Task 2')}"
+        assert second["dispatch_next_run"] == "false"
+
+    def test_no_follow_up_run_with_one_pr_slot(self, monkeypatch):
+        """Should not request a follow-up run when this run takes the only free slot"""
+        # Arrange
+        monkeypatch.setenv("GITHUB_REPOSITORY", "owner/repo")
+        monkeypatch.setenv("PROJECT_NAME", "test-project")
+
+        # Act
+        result, outputs = self._run_prepare(open_task_hashes=[], max_open_prs=1)
+
+        # Assert
+        assert result == 0
+        assert outputs["task_description"] == "Task 1"
+        assert outputs["dispatch_next_run"] == "false"
+
+
+class TestPreparePromptLayout:
+    """Test suite for the prompt layout that keeps a cacheable prefix"""
+
+    def test_prompts_share_spec_prefix_and_end_with_task(self):
+        """Should put the instructions and spec first and the task-specific text last"""
+        from claudechain.cli.commands.prepare import (
+            _build_batch_prompt,
+            _build_prompt_prefix,
+            _build_task_prompt,
+        )
+        from claudechain.domain.task_batch import BatchTask
+
+        # Arrange
+        spec_content = "# Spec\n\n- [ ] Task 1\n- [ ] Task 2\n- [ ] Task 3\n"
+        batch = TaskBatch(tasks=[
+            BatchTask(2, "Task 2", generate_task_hash("Task 2"), "b2"),
+            BatchTask(3, "Task 3", generate_task_hash("Task 3"), "b3"),
+        ])
+
+        # Act
+        prefix = _build_prompt_prefix(spec_content)
+        prompts = [
+            _build_task_prompt("Task 1", spec_content),
+            _build_task_prompt("Task 2", spec_content),
+            _build_batch_prompt(batch, spec_content),
+        ]
+
+        # Assert
+        assert "--- END spec.md ---" in prefix
+        assert "Task:" not in prefix
+        for prompt in prompts:
+            assert prompt.startswith(prefix)
+        assert prompts[0].endswith("following all the details and instructions in the spec.md file above.")
+        assert "Task: Task 1" in prompts[0][len(prefix):]
+
+    def test_prompts_start_with_static_instructions_and_keep_completed_tasks(self):
+        """Should share the instructions across projects and show the spec with its real checkboxes"""
+        from claudechain.cli.commands.prepare import _PROMPT_INSTRUCTIONS, _build_task_prompt
+
+        # Arrange
+        spec_a = "# Spec\n\n- [x] Task 1\n  - [ ] Task 2\n"
+        spec_b = "# Other\n\n- [ ] Step 1\n"
+
+        # Act
+        prompt_a = _build_task_prompt("Task 2", spec_a)
+        prompt_b = _build_task_prompt("Step 1", spec_b)
+
+        # Assert
+        assert prompt_a.startswith(_PROMPT_INSTRUCTIONS)
+        assert prompt_b.startswith(_PROMPT_INSTRUCTIONS)
+        assert "spec.md ---" not in _PROMPT_INSTRUCTIONS
+        assert "- [x] Task 1\n  - [ ] Task 2" in prompt_a
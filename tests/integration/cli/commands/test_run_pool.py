@@ -0,0 +1,102 @@
+"""Integration tests for the run-pool command"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from claudechain.cli.commands.run_pool import cmd_run_pool
+from claudechain.domain.worktree_pool import (
+    POOL_STATUS_CREATED,
+    POOL_STATUS_FAILED,
+    POOL_STATUS_NO_CHANGES,
+    PoolTaskResult,
+)
+
+
+class TestCmdRunPool:
+    """Test suite for cmd_run_pool functionality"""
+
+    @pytest.fixture
+    def mock_github_helper(self):
+        """Fixture providing mocked GitHubActionsHelper"""
+        return Mock()
+
+    def _outputs(self, gh):
+        return {c.args[0]: c.args[1] for c in gh.write_output.call_args_list}
+
+    def _summary(self, gh):
+        return "\n".join(c.args[0] for c in gh.write_step_summary.call_args_list)
+
+    def test_reports_created_prs(self, mock_github_helper, tmp_path):
+        """Should size the pool, run it and report one row per task"""
+        # Arrange
+        with patch("claudechain.cli.commands.run_pool.WorktreePoolService") as mock_service_class:
+            mock_service_class.pool_size.return_value = 3
+            mock_service_class.return_value.run.return_value = [
+                PoolTaskResult("alpha", "Task 1", POOL_STATUS_CREATED, pr_url="https://github.com/o/r/pull/1"),
+                PoolTaskResult("beta", "Task 1", POOL_STATUS_NO_CHANGES),
+            ]
+
+            # Act
+            result = cmd_run_pool(
+                mock_github_helper, ["alpha", "beta"], "main",
+                max_workers=4, max_tasks=5, worktree_root=str(tmp_path),
+            )
+
+        # Assert
+        assert result == 0
+        mock_service_class.pool_size.assert_called_once_with(4, 2048)
+        mock_service_class.return_value.run.assert_called_once_with(["alpha", "beta"], max_workers=3, max_tasks=5)
+        assert self._outputs(mock_github_helper) == {
+            "pr_urls": "https://github.com/o/r/pull/1",
+            "created_count": "1",
+            "failed_count": "0",
+        }
+        summary = self._summary(mock_github_helper)
+        assert "| alpha | Task 1 | ✅ PR created | https://github.com/o/r/pull/1 |" in summary
+        assert "| beta | Task 1 | ℹ️ No changes | - |" in summary
+
+    def test_failed_task_fails_command(self, mock_github_helper, tmp_path):
+        """Should return 1 and annotate each failed task"""
+        # Arrange
+        with patch("claudechain.cli.commands.run_pool.WorktreePoolService") as mock_service_class:
+            mock_service_class.pool_size.return_value = 1
+            mock_service_class.return_value.run.return_value = [
+                PoolTaskResult("alpha", "Task 1", POOL_STATUS_FAILED, message="Claude Code exited with code 1"),
+            ]
+
+            # Act
+            result = cmd_run_pool(mock_github_helper, ["alpha"], "main", worktree_root=str(tmp_path))
+
+        # Assert
+        assert result == 1
+        assert self._outputs(mock_github_helper)["failed_count"] == "1"
+        mock_github_helper.set_error.assert_called_once_with(
+            "Task failed for project 'alpha': Claude Code exited with code 1"
+        )
+
+    def test_defaults_to_all_projects(self, mock_github_helper, tmp_path):
+        """Should take tasks from every project when none are given"""
+        # Arrange
+        with patch("claudechain.cli.commands.run_pool.WorktreePoolService") as mock_service_class, \
+                patch("claudechain.cli.commands.discover.find_all_projects", return_value=["alpha", "beta"]):
+            mock_service_class.pool_size.return_value = 2
+            mock_service_class.return_value.run.return_value = []
+
+            # Act
+            result = cmd_run_pool(mock_github_helper, [], "main", worktree_root=str(tmp_path))
+
+        # Assert
+        assert result == 0
+        mock_service_class.return_value.run.assert_called_once_with(["alpha", "beta"], max_workers=2, max_tasks=10)
+        assert "No ready tasks with free capacity" in self._summary(mock_github_helper)
+
+    def test_no_projects(self, mock_github_helper):
+        """Should succeed without starting a pool when the repository has no projects"""
+        with patch("claudechain.cli.commands.run_pool.WorktreePoolService") as mock_service_class, \
+                patch("claudechain.cli.commands.discover.find_all_projects", return_value=[]):
+            result = cmd_run_pool(mock_github_helper, [], "main")
+
+        assert result == 0
+        mock_service_class.assert_not_called()
+        assert self._outputs(mock_github_helper)["created_count"] == "0"
@@ -103,7 +103,6 @@ class TestCmdStatistics:
             result = cmd_statistics(
                 gh=mock_github_helper,
                 repo="owner/repo",
-                workflow_file="Claude Chain",
                 base_branch="main",
                 config_path=None,
                 days_back=30,
@@ -114,7 +113,7 @@ class TestCmdStatistics:
         # Assert
         assert result == 0
         mock_service.collect_all_statistics.assert_called_once_with(
-            projects=discovered_projects, days_back=30, show_assignee_stats=False
+            projects=discovered_projects, days_back=30, show_assignee_stats=False, max_workers=8
         )
 
         # Verify Slack output was written
@@ -159,7 +158,6 @@ class TestCmdStatistics:
             result = cmd_statistics(
                 gh=mock_github_helper,
                 repo="owner/repo",
-                workflow_file="Claude Chain",
                 base_branch="main",
                 config_path="/path/to/config.yml",
                 days_back=7,
@@ -170,7 +168,7 @@ class TestCmdStatistics:
         # Assert
         assert result == 0
         mock_service.collect_all_statistics.assert_called_once_with(
-            projects=discovered_projects, days_back=7, show_assignee_stats=False
+            projects=discovered_projects, days_back=7, show_assignee_stats=False, max_workers=8
         )
 
         # Verify JSON output was written
@@ -208,13 +206,12 @@ class TestCmdStatistics:
             result = cmd_statistics(
                 gh=mock_github_helper,
                 repo="owner/repo",
-                workflow_file="Claude Chain",
                 format_type="slack"
             )
 
         # Assert
         assert result == 0
-        mock_collect.assert_called_once_with(projects=discovered_projects, days_back=30, show_assignee_stats=False)
+        mock_collect.assert_called_once_with(projects=discovered_projects, days_back=30, show_assignee_stats=False, max_workers=8)
 
     def test_cmd_statistics_writes_leaderboard_when_present(
         self, mock_github_helper, sample_statistics_report
@@ -243,7 +240,6 @@ class TestCmdStatistics:
             result = cmd_statistics(
                 gh=mock_github_helper,
                 repo="owner/repo",
-                workflow_file="Claude Chain",
                 format_type="slack",
                 show_assignee_stats=True
             )
@@ -276,7 +272,6 @@ class TestCmdStatistics:
             result = cmd_statistics(
                 gh=mock_github_helper,
                 repo="owner/repo",
-                workflow_file="Claude Chain",
                 format_type="slack"
             )
 
@@ -317,7 +312,6 @@ class TestCmdStatistics:
             result = cmd_statistics(
                 gh=mock_github_helper,
                 repo="owner/repo",
-                workflow_file="Claude Chain",
                 format_type="slack",
                 show_assignee_stats=True
             )
@@ -359,7 +353,6 @@ class TestCmdStatistics:
             result = cmd_statistics(
                 gh=mock_github_helper,
                 repo="owner/repo",
-                workflow_file="Claude Chain",
                 format_type="slack",
                 show_assignee_stats=True
             )
@@ -393,7 +386,6 @@ class TestCmdStatistics:
             result = cmd_statistics(
                 gh=mock_github_helper,
                 repo="owner/repo",
-                workflow_file="Claude Chain",
                 format_type="slack"
             )
 
@@ -437,7 +429,6 @@ class TestCmdStatistics:
             result = cmd_statistics(
                 gh=mock_github_helper,
                 repo="owner/repo",
-                workflow_file="Claude Chain",
                 config_path="/path/to/config.yml",
                 days_back=15,
                 format_type="slack"
@@ -476,7 +467,6 @@ class TestCmdStatistics:
             result = cmd_statistics(
                 gh=mock_github_helper,
                 repo="owner/repo",
-                workflow_file="Claude Chain",
                 config_path=None,
                 format_type="slack"
             )
@@ -520,7 +510,6 @@ class TestCmdStatistics:
             result = cmd_statistics(
                 gh=mock_github_helper,
                 repo="owner/repo",
-                workflow_file="Claude Chain",
                 format_type="slack"
             )
 
@@ -563,7 +552,6 @@ class TestCmdStatistics:
             result = cmd_statistics(
                 gh=mock_github_helper,
                 repo="owner/repo",
-                workflow_file="Claude Chain",
                 format_type="slack"
             )
 
@@ -611,7 +599,6 @@ class TestCmdStatistics:
                 result = cmd_statistics(
                     gh=mock_github_helper,
                     repo="owner/repo",
-                    workflow_file="Claude Chain",
                     format_type="slack"
                 )
 
@@ -643,7 +630,6 @@ class TestCmdStatistics:
             result = cmd_statistics(
                 gh=mock_github_helper,
                 repo="owner/repo",
-                workflow_file="Claude Chain",
                 format_type="json"
             )
 
@@ -682,14 +668,13 @@ class TestCmdStatistics:
             result = cmd_statistics(
                 gh=mock_github_helper,
                 repo="owner/repo",
-                workflow_file="Claude Chain",
                 days_back=90,
                 format_type="json"
             )
 
         # Assert
         assert result == 0
-        mock_collect.assert_called_once_with(projects=discovered_projects, days_back=90, show_assignee_stats=False)
+        mock_collect.assert_called_once_with(projects=discovered_projects, days_back=90, show_assignee_stats=False, max_workers=8)
 
     def test_cmd_statistics_no_leaderboard_when_empty(
         self, mock_github_helper, sample_statistics_report
@@ -716,7 +701,6 @@ class TestCmdStatistics:
             result = cmd_statistics(
                 gh=mock_github_helper,
                 repo="owner/repo",
-                workflow_file="Claude Chain",
                 format_type="slack"
             )
 
@@ -0,0 +1,92 @@
+"""Tests for the create-artifact command"""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from claudechain.cli.commands.create_artifact import cmd_create_artifact
+from claudechain.domain.cost_breakdown import CostBreakdown, ModelUsage
+from claudechain.domain.models import TaskMetadata
+
+
+def _outputs(gh):
+    return {c.args[0]: c.args[1] for c in gh.write_output.call_args_list}
+
+
+class TestCreateArtifactBatch:
+    """Tests for attributing a batch session's cost to each task"""
+
+    def test_splits_session_cost_across_batch_prs(self, tmp_path, monkeypatch):
+        """Should record each PR's share of the session cost, weighted by lines changed"""
+        # Arrange
+        monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+        cost_breakdown = CostBreakdown(main_cost=0.75, summary_cost=0.15)
+        batch_prs = [
+            {"task_index": 2, "task_description": "Task 2", "task_hash": "aaaaaaaa",
+             "pr_number": 11, "branch_name": "b2", "lines_changed": 20},
+            {"task_index": 3, "task_description": "Task 3", "task_hash": "bbbbbbbb",
+             "pr_number": 12, "branch_name": "b3", "lines_changed": 10},
+        ]
+        gh = Mock()
+
+        # Act
+        result = cmd_create_artifact(
+            gh, cost_breakdown.to_json(), "11", "Task 2", "2", "aaaaaaaa", "my-project",
+            "b2", "", "42", batch_prs_json=json.dumps(batch_prs),
+        )
+
+        # Assert
+        assert result == 0
+        with open(_outputs(gh)["artifact_path"]) as f:
+            metadata = TaskMetadata.from_dict(json.load(f))
+        assert [(t.pr_number, t.lines_changed) for t in metadata.batch_tasks] == [(11, 20), (12, 10)]
+        assert [t.cost_usd for t in metadata.batch_tasks] == pytest.approx([0.6, 0.3])
+        assert metadata.get_costs_by_pr() == pytest.approx({11: 0.6, 12: 0.3})
+
+    def test_single_task_has_no_batch_split(self, tmp_path, monkeypatch):
+        """Should leave batch_tasks empty outside batch mode"""
+        # Arrange
+        monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+        gh = Mock()
+
+        # Act
+        cmd_create_artifact(
+            gh, CostBreakdown(main_cost=0.5, summary_cost=0.1).to_json(), "11", "Task 2", "2",
+            "aaaaaaaa", "my-project", "b2", "", "42",
+        )
+
+        # Assert
+        with open(_outputs(gh)["artifact_path"]) as f:
+            data = json.load(f)
+        assert "batch_tasks" not in data
+
+
+class TestCreateArtifactCacheUsage:
+    """Tests for recording prompt cache usage in the artifact"""
+
+    def test_records_cache_usage_per_model(self, tmp_path, monkeypatch):
+        """Should store each model's cache tokens and savings for statistics"""
+        # Arrange
+        monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+        cost_breakdown = CostBreakdown(
+            main_cost=0.5,
+            summary_cost=0.1,
+            main_models=[ModelUsage(model="claude-sonnet-4-20250514", input_tokens=100, cache_read_tokens=1_000_000)],
+            summary_models=[ModelUsage(model="claude-3-haiku-20240307", input_tokens=40, cache_write_tokens=60)],
+        )
+        gh = Mock()
+
+        # Act
+        cmd_create_artifact(
+            gh, cost_breakdown.to_json(), "11", "Task 2", "2",
+            "aaaaaaaa", "my-project", "b2", "", "42",
+        )
+
+        # Assert
+        with open(_outputs(gh)["artifact_path"]) as f:
+            metadata = TaskMetadata.from_dict(json.load(f))
+        sonnet = metadata.cache_usage["claude-sonnet-4-20250514"]
+        assert sonnet.cache_read_tokens == 1_000_000
+        assert sonnet.savings_usd == pytest.approx(2.70)
+        assert metadata.cache_usage["claude-3-haiku-20240307"].cache_write_tokens == 60
@@ -0,0 +1,319 @@
+"""Tests for finalize command helpers"""
+
+import json
+import shutil
+import subprocess
+from unittest.mock import Mock, patch
+
+import pytest
+
+from claudechain.cli.commands.finalize import (
+    _commit_uncommitted_changes,
+    _dispatch_next_run,
+    _finalize_batch,
+    _get_base_spec_content,
+)
+from claudechain.domain.exceptions import GitHubAPIError
+from claudechain.domain.run_state import RunState
+from claudechain.domain.spec_content import generate_task_hash
+from claudechain.domain.task_batch import BatchTask, TaskBatch, commit_marker
+
+SPEC_PATH = "claude-chain/my-project/spec.md"
+
+
+def _git(cwd, *args) -> str:
+    return subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+def _recorded_state():
+    return RunState(
+        project_name="my-project",
+        base_branch="main",
+        base_sha="abc123",
+        spec_path=SPEC_PATH,
+        spec_content="- [ ] Task 1\n",
+    )
+
+
+class TestGetBaseSpecContent:
+    """Tests for _get_base_spec_content"""
+
+    @patch("claudechain.cli.commands.finalize.get_file_from_branch")
+    @patch("claudechain.cli.commands.finalize.run_git_command")
+    def test_reuses_recorded_spec_when_base_branch_unchanged(self, mock_git, mock_get_file):
+        """Should skip the API call when the base branch still points at the recorded commit"""
+        # Arrange
+        mock_git.return_value = "abc123\trefs/heads/main"
+
+        # Act
+        result = _get_base_spec_content(_recorded_state(), "owner/repo", "main", SPEC_PATH)
+
+        # Assert
+        assert result == "- [ ] Task 1\n"
+        mock_git.assert_called_once_with(["ls-remote", "origin", "refs/heads/main"])
+        mock_get_file.assert_not_called()
+
+    @patch("claudechain.cli.commands.finalize.get_file_from_branch")
+    @patch("claudechain.cli.commands.finalize.run_git_command")
+    def test_fetches_spec_when_base_branch_moved(self, mock_git, mock_get_file):
+        """Should fetch spec.md again when the base branch has new commits"""
+        # Arrange
+        mock_git.return_value = "def456\trefs/heads/main"
+        mock_get_file.return_value = "- [x] Task 0\n- [ ] Task 1\n"
+
+        # Act
+        result = _get_base_spec_content(_recorded_state(), "owner/repo", "main", SPEC_PATH)
+
+        # Assert
+        assert result == "- [x] Task 0\n- [ ] Task 1\n"
+        mock_get_file.assert_called_once_with("owner/repo", "main", SPEC_PATH)
+
+    @patch("claudechain.cli.commands.finalize.get_file_from_branch")
+    @patch("claudechain.cli.commands.finalize.run_git_command")
+    def test_fetches_spec_without_run_state(self, mock_git, mock_get_file):
+        """Should fall back to the API when nothing was recorded"""
+        # Arrange
+        mock_get_file.return_value = "- [ ] Task 1\n"
+
+        # Act
+        result = _get_base_spec_content(RunState(), "owner/repo", "main", SPEC_PATH)
+
+        # Assert
+        assert result == "- [ ] Task 1\n"
+        mock_git.assert_not_called()
+
+
+class TestFinalizeBatch:
+    """Tests for _finalize_batch"""
+
+    def _batch(self):
+        return TaskBatch(tasks=[
+            BatchTask(1, "Task 1", generate_task_hash("Task 1"), "claude-chain-my-project-1"),
+            BatchTask(2, "Task 2", generate_task_hash("Task 2"), "claude-chain-my-project-2"),
+            BatchTask(3, "Task 3", generate_task_hash("Task 3"), "claude-chain-my-project-3"),
+        ])
+
+    def _git(self, calls, log_output):
+        def run(args):
+            calls.append(args)
+            if args[0] == "rev-parse":
+                return "base"
+            if args[0] == "log":
+                return log_output
+            if args[0] == "diff" and args[1] == "--numstat":
+                return "3\t1\tsrc/a.py"
+            if args[0] == "diff":
+                return SPEC_PATH
+            return ""
+        return run
+
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+    @patch("claudechain.cli.commands.finalize.run_gh_command")
+    @patch("claudechain.cli.commands.finalize._get_base_spec_content")
+    def test_stacked_branches_merge_in_order(self, mock_spec, mock_gh, tmp_path, monkeypatch):
+        """Should stack each task's branch on the previous one so merging them in order does not conflict"""
+        # Arrange
+        base_spec = "- [ ] Task 1\n- [ ] Task 2\n- [ ] Task 3\n"
+        origin = tmp_path / "origin.git"
+        work = tmp_path / "work"
+        _git(tmp_path, "init", "-q", "--bare", str(origin))
+        _git(tmp_path, "init", "-q", "-b", "main", str(work))
+        _git(work, "remote", "add", "origin", str(origin))
+        _git(work, "config", "user.name", "Test")
+        _git(work, "config", "user.email", "test@example.com")
+        (work / SPEC_PATH).parent.mkdir(parents=True)
+        (work / SPEC_PATH).write_text(base_spec)
+        (work / "a.py").write_text("a = 1\n")
+        _git(work, "add", "-A")
+        _git(work, "commit", "-qm", "Initial")
+        _git(work, "push", "-q", "origin", "main")
+        batch = self._batch()
+        _git(work, "checkout", "-q", "-b", "claude-chain-my-project-1")
+        (work / "a.py").write_text("a = 2\n")
+        _git(work, "commit", "-qam", f"{commit_marker(batch.tasks[0].task_hash)} Task 1")
+        (work / "b.py").write_text("b = 1\n")
+        _git(work, "add", "b.py")
+        _git(work, "commit", "-qm", f"{commit_marker(batch.tasks[1].task_hash)} Task 2")
+        monkeypatch.chdir(work)
+        mock_spec.return_value = base_spec
+        pr_numbers = iter([11, 12])
+
+        def gh_command(args):
+            if args[:2] == ["pr", "create"]:
+                return f"https://github.com/owner/repo/pull/{args[args.index('--head') + 1]}"
+            return json.dumps({"number": next(pr_numbers), "title": "t"})
+        mock_gh.side_effect = gh_command
+        gh = Mock()
+
+        # Act
+        result = _finalize_batch(
+            gh, batch, RunState(), "owner/repo", "main", SPEC_PATH, "my-project",
+            "claudechain", "", "", "missing-template.md", "",
+        )
+        _git(work, "checkout", "-q", "-b", "merged", "origin/main")
+        _git(work, "merge", "-q", "--no-ff", "-m", "Merge PR 11", "origin/claude-chain-my-project-1")
+        _git(work, "merge", "-q", "--no-ff", "-m", "Merge PR 12", "origin/claude-chain-my-project-2")
+
+        # Assert
+        assert result == 0
+        assert (work / SPEC_PATH).read_text() == "- [x] Task 1\n- [x] Task 2\n- [ ] Task 3\n"
+        assert (work / "a.py").read_text() == "a = 2\n"
+        assert (work / "b.py").read_text() == "b = 1\n"
+        second_pr_diff = _git(
+            work, "diff", "--name-only", "origin/claude-chain-my-project-1", "origin/claude-chain-my-project-2"
+        )
+        assert second_pr_diff.split() == ["b.py", SPEC_PATH]
+        outputs = {c.args[0]: c.args[1] for c in gh.write_output.call_args_list}
+        assert outputs["pr_number"] == "11"
+        batch_prs = json.loads(outputs["batch_prs"])
+        assert [(pr["pr_number"], pr["task_index"], pr["lines_changed"]) for pr in batch_prs] == [(11, 1, 2), (12, 2, 1)]
+
+    @patch("claudechain.cli.commands.finalize.ensure_ref_available")
+    @patch("claudechain.cli.commands.finalize.run_gh_command")
+    @patch("claudechain.cli.commands.finalize._get_base_spec_content")
+    @patch("claudechain.cli.commands.finalize.run_git_command")
+    def test_stops_at_first_task_without_commits(
+        self, mock_git, mock_spec, mock_gh, _mock_ensure, tmp_path, monkeypatch
+    ):
+        """Should leave a task without commits and every later task pending"""
+        # Arrange
+        monkeypatch.chdir(tmp_path)
+        batch = self._batch()
+        calls = []
+        mock_git.side_effect = self._git(calls, "\n".join([
+            f"c1\t{commit_marker(batch.tasks[0].task_hash)} Task 1",
+            f"c3\t{commit_marker(batch.tasks[2].task_hash)} Task 3",
+        ]))
+        mock_spec.return_value = "- [ ] Task 1\n- [ ] Task 2\n- [ ] Task 3\n"
+
+        def gh_command(args):
+            if args[:2] == ["pr", "create"]:
+                return "https://github.com/owner/repo/pull/11"
+            return json.dumps({"number": 11, "title": "t"})
+        mock_gh.side_effect = gh_command
+        gh = Mock()
+
+        # Act
+        result = _finalize_batch(
+            gh, batch, RunState(), "owner/repo", "main", SPEC_PATH, "my-project",
+            "claudechain", "", "", "missing-template.md", "",
+        )
+
+        # Assert
+        assert result == 0
+        assert [c for c in calls if c[0] == "checkout"] == [["checkout", "-B", "claude-chain-my-project-1", "c1"]]
+        assert (tmp_path / SPEC_PATH).read_text() == "- [x] Task 1\n- [ ] Task 2\n- [ ] Task 3\n"
+        outputs = {c.args[0]: c.args[1] for c in gh.write_output.call_args_list}
+        assert [pr["task_index"] for pr in json.loads(outputs["batch_prs"])] == [1]
+
+    @patch("claudechain.cli.commands.finalize.ensure_ref_available")
+    @patch("claudechain.cli.commands.finalize.run_gh_command")
+    @patch("claudechain.cli.commands.finalize._get_base_spec_content")
+    @patch("claudechain.cli.commands.finalize.run_git_command")
+    def test_no_commits_creates_no_prs(self, mock_git, mock_spec, mock_gh, _mock_ensure):
+        """Should warn and skip PR creation when the session made no commits"""
+        # Arrange
+        mock_git.side_effect = self._git([], "")
+        mock_spec.return_value = None
+        gh = Mock()
+
+        # Act
+        result = _finalize_batch(
+            gh, self._batch(), RunState(), "owner/repo", "main", SPEC_PATH, "my-project",
+            "claudechain", "", "", "missing-template.md", "",
+        )
+
+        # Assert
+        assert result == 0
+        gh.set_warning.assert_called_once()
+        mock_gh.assert_not_called()
+
+    @patch("claudechain.cli.commands.finalize.ensure_ref_available")
+    @patch("claudechain.cli.commands.finalize.run_gh_command")
+    @patch("claudechain.cli.commands.finalize._get_base_spec_content")
+    @patch("claudechain.cli.commands.finalize.run_git_command")
+    def test_uncommitted_session_opens_pr_for_first_task(
+        self, mock_git, mock_spec, mock_gh, _mock_ensure, tmp_path, monkeypatch
+    ):
+        """Should attribute a session's uncommitted work to the first task instead of dropping it"""
+        # Arrange
+        monkeypatch.chdir(tmp_path)
+        batch = self._batch()
+        calls = []
+        commits = []
+
+        def run(args):
+            calls.append(args)
+            if args[0] == "status":
+                return "" if commits else " M src/a.py"
+            if args[0] == "commit":
+                commits.append(f"c{len(commits) + 1}\t{args[2]}")
+                return ""
+            if args[0] == "log":
+                return "\n".join(commits)
+            if args[0] == "rev-parse":
+                return "base"
+            if args[0] == "diff" and args[1] == "--numstat":
+                return "3\t1\tsrc/a.py"
+            if args[0] == "diff":
+                return "src/a.py"
+            return ""
+        mock_git.side_effect = run
+        mock_spec.return_value = "- [ ] Task 1\n- [ ] Task 2\n- [ ] Task 3\n"
+
+        def gh_command(args):
+            if args[:2] == ["pr", "create"]:
+                return "https://github.com/owner/repo/pull/11"
+            return json.dumps({"number": 11, "title": "t"})
+        mock_gh.side_effect = gh_command
+        gh = Mock()
+
+        # Act
+        _commit_uncommitted_changes("Task 1", batch, "main")
+        result = _finalize_batch(
+            gh, batch, RunState(), "owner/repo", "main", SPEC_PATH, "my-project",
+            "claudechain", "", "", "missing-template.md", "",
+        )
+
+        # Assert
+        assert result == 0
+        assert commits[0] == f"c1\t{commit_marker(batch.tasks[0].task_hash)} Complete task: Task 1"
+        assert [c for c in calls if c[0] == "checkout"] == [["checkout", "-B", "claude-chain-my-project-1", "c1"]]
+        gh.set_warning.assert_not_called()
+        outputs = {c.args[0]: c.args[1] for c in gh.write_output.call_args_list}
+        assert [pr["task_index"] for pr in json.loads(outputs["batch_prs"])] == [1]
+
+
+class TestDispatchNextRun:
+    """Tests for _dispatch_next_run"""
+
+    @patch("claudechain.cli.commands.finalize.WorkflowService")
+    def test_starts_run_for_project(self, mock_workflow_service_class):
+        """Should dispatch the ClaudeChain workflow for the project on its base branch"""
+        # Arrange
+        gh = Mock()
+
+        # Act
+        _dispatch_next_run(gh, "my-project", "main")
+
+        # Assert
+        mock_workflow_service_class.return_value.trigger_claudechain_workflow.assert_called_once_with(
+            "my-project", "main", "main"
+        )
+        gh.set_warning.assert_not_called()
+
+    @patch("claudechain.cli.commands.finalize.WorkflowService")
+    def test_failed_dispatch_only_warns(self, mock_workflow_service_class):
+        """Should warn instead of failing when the workflow cannot be dispatched"""
+        # Arrange
+        gh = Mock()
+        mock_workflow_service_class.return_value.trigger_claudechain_workflow.side_effect = GitHubAPIError("403")
+
+        # Act
+        _dispatch_next_run(gh, "my-project", "main")
+
+        # Assert
+        gh.set_warning.assert_called_once()
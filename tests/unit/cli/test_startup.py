@@ -0,0 +1,71 @@
+"""Startup-time budget for `python -m claudechain`
+
+Every workflow step starts a fresh interpreter, so the cost of importing the
+CLI entry point is paid once per step. These tests run `-X importtime` in a
+subprocess and fail when the entry point eagerly imports command modules or
+its cold import exceeds the budget.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+import claudechain
+
+# Cumulative import time of claudechain.__main__ (best of several runs).
+# Importing every command eagerly took ~120-190ms; lazy dispatch takes ~30ms.
+STARTUP_BUDGET_MS = float(os.environ.get("CLAUDECHAIN_STARTUP_BUDGET_MS", "80"))
+STARTUP_RUNS = 3
+
+# Package prefixes that must only be imported once a subcommand is dispatched
+LAZY_PREFIXES = ("claudechain.cli.commands.", "claudechain.services")
+
+
+def _import_times() -> Dict[str, int]:
+    """Import claudechain.__main__ in a fresh interpreter and return cumulative µs per module"""
+    env = dict(os.environ)
+    src_dir = str(Path(claudechain.__file__).resolve().parent.parent)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src_dir, env.get("PYTHONPATH")]))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import claudechain.__main__"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line.split("|")
+        if cumulative.strip().isdigit():
+            times[module.strip()] = int(cumulative)
+    return times
+
+
+class TestStartupImports:
+    """Test suite for the import cost of the CLI entry point"""
+
+    def test_entry_point_does_not_import_commands_or_services(self):
+        """Should defer command and service imports until dispatch"""
+        # Act
+        times = _import_times()
+
+        # Assert
+        eager = sorted(module for module in times if module.startswith(LAZY_PREFIXES))
+        assert "claudechain.__main__" in times
+        assert eager == []
+
+    def test_entry_point_import_within_budget(self):
+        """Should import claudechain.__main__ within the startup budget"""
+        # Act
+        best_ms = min(_import_times()["claudechain.__main__"] for _ in range(STARTUP_RUNS)) / 1000
+
+        # Assert
+        assert best_ms <= STARTUP_BUDGET_MS, (
+            f"Cold import of claudechain.__main__ took {best_ms:.1f}ms "
+            f"(budget {STARTUP_BUDGET_MS:.0f}ms); import command modules lazily"
+        )
@@ -9,6 +9,7 @@ import pytest
 
 from claudechain.domain.cost_breakdown import (
     CLAUDE_MODELS,
+    CacheUsage,
     ClaudeModel,
     CostBreakdown,
     ExecutionUsage,
@@ -1503,3 +1504,108 @@ class TestCostBreakdownSerialization:
         assert len(parsed["models"]) == 1
         assert parsed["models"][0]["input_tokens"] == 300
         assert parsed["models"][0]["output_tokens"] == 150
+
+
+class TestCacheUsage:
+    """Test suite for prompt cache hit ratio and savings"""
+
+    def test_model_cache_savings_uses_input_minus_cache_read_rate(self):
+        """Savings should be what the cache reads would have cost as input"""
+        # Arrange
+        usage = ModelUsage(model="claude-sonnet-4-20250514", cache_read_tokens=1_000_000)
+
+        # Act
+        savings = usage.calculate_cache_savings()
+
+        # Assert - $3.00 input rate minus $0.30 cache read rate
+        assert savings == pytest.approx(2.70)
+
+    def test_model_cache_savings_subtracts_cache_write_premium(self):
+        """Savings should be net of what the cache writes cost over uncached input"""
+        # Arrange
+        usage = ModelUsage(
+            model="claude-sonnet-4-20250514", cache_read_tokens=1_000_000, cache_write_tokens=1_000_000
+        )
+
+        # Act
+        savings = usage.calculate_cache_savings()
+
+        # Assert - $2.70 saved on reads minus $0.75 write premium ($3.75 - $3.00)
+        assert savings == pytest.approx(1.95)
+
+    def test_model_cache_savings_is_negative_when_writes_are_never_read(self):
+        """Cache writes without reads should show up as a net loss"""
+        # Arrange
+        usage = ModelUsage(model="claude-3-haiku-20240307", cache_write_tokens=1_000_000)
+
+        # Act / Assert - $0.30 write rate minus $0.25 input rate
+        assert usage.calculate_cache_savings() == pytest.approx(-0.05)
+
+    def test_model_cache_savings_is_zero_for_unknown_model(self):
+        """Unknown models should not break cache reporting"""
+        # Arrange
+        usage = ModelUsage(model="some-future-model", cache_read_tokens=1000)
+
+        # Act / Assert
+        assert usage.calculate_cache_savings() == 0.0
+
+    def test_hit_ratio_is_cache_reads_over_all_prompt_tokens(self):
+        """Hit ratio should count uncached input and cache writes as misses"""
+        # Arrange
+        usage = CacheUsage(input_tokens=100, cache_read_tokens=600, cache_write_tokens=300)
+
+        # Act / Assert
+        assert usage.prompt_tokens == 1000
+        assert usage.hit_ratio == pytest.approx(0.6)
+
+    def test_hit_ratio_is_zero_without_prompt_tokens(self):
+        """Empty usage should report a zero hit ratio"""
+        assert CacheUsage().hit_ratio == 0.0
+
+    def test_add_combines_tokens_and_savings(self):
+        """Adding usage should sum every field"""
+        # Arrange
+        a = CacheUsage(input_tokens=1, cache_read_tokens=2, cache_write_tokens=3, savings_usd=0.5)
+        b = CacheUsage(input_tokens=10, cache_read_tokens=20, cache_write_tokens=30, savings_usd=1.0)
+
+        # Act
+        total = a + b
+
+        # Assert
+        assert total == CacheUsage(input_tokens=11, cache_read_tokens=22, cache_write_tokens=33, savings_usd=1.5)
+
+    def test_dict_round_trip(self):
+        """from_dict should restore to_dict output"""
+        # Arrange
+        usage = CacheUsage(input_tokens=5, cache_read_tokens=50, cache_write_tokens=7, savings_usd=0.25)
+
+        # Act / Assert
+        assert CacheUsage.from_dict(usage.to_dict()) == usage
+
+    def test_cost_breakdown_cache_usage_by_model(self):
+        """CostBreakdown should aggregate cache usage per model across executions"""
+        # Arrange
+        breakdown = CostBreakdown(
+            main_cost=1.0,
+            summary_cost=0.1,
+            main_models=[
+                ModelUsage(model="claude-sonnet-4-20250514", input_tokens=100, cache_read_tokens=900),
+                ModelUsage(model="claude-3-haiku-20240307", input_tokens=50, cache_write_tokens=50),
+            ],
+            summary_models=[
+                ModelUsage(model="claude-sonnet-4-20250514", input_tokens=100, cache_read_tokens=900),
+            ],
+        )
+
+        # Act
+        by_model = breakdown.get_cache_usage_by_model()
+        total = breakdown.cache_usage
+
+        # Assert
+        sonnet = by_model["claude-sonnet-4-20250514"]
+        assert sonnet.cache_read_tokens == 1800
+        assert sonnet.hit_ratio == pytest.approx(0.9)
+        assert sonnet.savings_usd == pytest.approx(1800 * 2.70 / 1_000_000)
+        assert by_model["claude-3-haiku-20240307"].hit_ratio == 0.0
+        assert total.cache_read_tokens == 1800
+        assert total.prompt_tokens == 2100
@@ -143,6 +143,17 @@ class TestGitHubAPIError:
         with pytest.raises(ContinuousRefactoringError):
             raise GitHubAPIError("API call failed")
 
+    def test_carries_optional_status_code(self):
+        """Should expose the HTTP status code when provided"""
+        # Act
+        with_status = GitHubAPIError("Not Found", status_code=404)
+        without_status = GitHubAPIError("gh failed")
+
+        # Assert
+        assert with_status.status_code == 404
+        assert str(with_status) == "Not Found"
+        assert without_status.status_code is None
+
 
 class TestExceptionCatchPatterns:
     """Test suite for common exception catching patterns"""
@@ -0,0 +1,157 @@
+"""Tests for the streaming execution file reader"""
+
+import io
+import json
+import tracemalloc
+
+import pytest
+
+from claudechain.domain.execution_log import find_last_record, iter_execution_records
+
+
+# Events resembling a verbose Claude Code session, including strings with
+# JSON punctuation and numbers that can be split across chunk boundaries
+SAMPLE_EVENTS = [
+    {"type": "system", "subtype": "init", "tools": ["Read", "Write"]},
+    {"type": "assistant", "message": {"content": [{"type": "text", "text": "a ] b [ c } d { \", e"}]}},
+    {"type": "user", "tool_result": "line 1\nline 2 \\ \"quoted\" ,]"},
+    12345678,
+    "plain string",
+    None,
+    [1, [2, [3]]],
+    {"type": "result", "total_cost_usd": 0.123456, "modelUsage": {"claude-sonnet-4": {"inputTokens": 1000}}},
+]
+
+
+def _write_session(path, event_count, payload_size):
+    """Write a synthetic verbose execution file of roughly event_count * payload_size bytes"""
+    payload = "x" * payload_size
+    with open(path, "w") as f:
+        f.write("[\n")
+        for i in range(event_count):
+            event = {"type": "assistant", "index": i, "message": {"content": [{"type": "text", "text": payload}]}}
+            f.write(json.dumps(event))
+            f.write(",\n")
+        f.write(json.dumps({"type": "result", "total_cost_usd": 1.5, "num_turns": event_count}))
+        f.write("\n]\n")
+
+
+class TestIterExecutionRecords:
+    """Test suite for decoding execution files one record at a time"""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 1 << 16])
+    def test_yields_array_elements_for_any_chunk_size(self, chunk_size):
+        """Should decode every element regardless of where chunks split the text"""
+        # Arrange
+        text = json.dumps(SAMPLE_EVENTS, indent=2)
+
+        # Act
+        records = list(iter_execution_records(io.StringIO(text), chunk_size=chunk_size))
+
+        # Assert
+        assert records == SAMPLE_EVENTS
+
+    @pytest.mark.parametrize("chunk_size", [1, 5, 1 << 16])
+    def test_yields_single_object(self, chunk_size):
+        """Should yield a non-array top-level value as the only record"""
+        # Arrange
+        data = {"type": "result", "total_cost_usd": 0.5}
+
+        # Act
+        records = list(iter_execution_records(io.StringIO("\n  " + json.dumps(data)), chunk_size=chunk_size))
+
+        # Assert
+        assert records == [data]
+
+    def test_empty_array_yields_nothing(self):
+        """Should yield no records for an empty array"""
+        assert list(iter_execution_records(io.StringIO(" [ ] "))) == []
+
+    @pytest.mark.parametrize("text", ["", "   ", "[{\"a\": 1}", "[{\"a\": 1} {\"b\": 2}]", "[{\"a\": }]", "{\"a\": 1"])
+    def test_invalid_json_raises(self, text):
+        """Should raise JSONDecodeError for empty, truncated or malformed files"""
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_execution_records(io.StringIO(text), chunk_size=4))
+
+    @pytest.mark.parametrize("chunk_size", [1, 4, 1 << 16])
+    @pytest.mark.parametrize("text", ["[{}, ]", "[1,\n]", "[{}]xyz", "[{}]  \n  ]", "[,{}]"])
+    def test_rejects_what_json_load_rejects(self, text, chunk_size):
+        """Should not accept a trailing comma or data after the closing bracket"""
+        # Arrange
+        with pytest.raises(json.JSONDecodeError):
+            json.loads(text)
+
+        # Act & Assert
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_execution_records(io.StringIO(text), chunk_size=chunk_size))
+
+    def test_element_larger_than_chunk(self):
+        """Should decode an element much larger than the read size"""
+        # Arrange
+        events = [{"text": "y" * 100_000}, {"type": "result", "total_cost_usd": 2.0}]
+
+        # Act
+        records = list(iter_execution_records(io.StringIO(json.dumps(events)), chunk_size=16))
+
+        # Assert
+        assert records == events
+
+
+class TestFindLastRecord:
+    """Test suite for finding the final result record of a session"""
+
+    def test_returns_last_matching_record(self, tmp_path):
+        """Should return the last record accepted by the predicate"""
+        # Arrange
+        path = tmp_path / "execution.json"
+        path.write_text(json.dumps([
+            {"total_cost_usd": 1.0},
+            {"type": "assistant"},
+            {"total_cost_usd": 2.0},
+            {"type": "user"},
+        ]))
+
+        # Act
+        record = find_last_record(str(path), lambda r: isinstance(r, dict) and "total_cost_usd" in r)
+
+        # Assert
+        assert record == {"total_cost_usd": 2.0}
+
+    def test_returns_none_without_match(self, tmp_path):
+        """Should return None when no record matches"""
+        # Arrange
+        path = tmp_path / "execution.json"
+        path.write_text(json.dumps([{"type": "assistant"}]))
+
+        # Act / Assert
+        assert find_last_record(str(path), lambda r: False) is None
+
+    def test_memory_stays_flat_as_session_grows(self, tmp_path):
+        """Peak memory should depend on the largest event, not the file size"""
+        # Arrange - sessions of ~1 MB and ~16 MB made of 4 KB events
+        small = tmp_path / "small.json"
+        large = tmp_path / "large.json"
+        _write_session(small, event_count=256, payload_size=4096)
+        _write_session(large, event_count=4096, payload_size=4096)
+
+        def is_result(record):
+            return isinstance(record, dict) and record.get("type") == "result"
+
+        def peak_memory(path):
+            tracemalloc.start()
+            try:
+                record = find_last_record(str(path), is_result)
+                return record, tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        # Act
+        small_record, small_peak = peak_memory(small)
+        large_record, large_peak = peak_memory(large)
+
+        # Assert
+        assert small_record["num_turns"] == 256
+        assert large_record["num_turns"] == 4096
+        assert large.stat().st_size > 16 * small_peak
+        assert large_peak < 1024 * 1024
+        assert large_peak < 2 * small_peak + 64 * 1024
@@ -10,6 +10,7 @@ from claudechain.domain.github_models import (
     GitHubUser,
     GitHubPullRequest,
     GitHubPullRequestList,
+    PullRequestIndex,
 )
 
 
@@ -916,3 +917,85 @@ class TestGitHubPullRequestPropertyEnhancements:
 
         # Act & Assert
         assert pr.is_claudechain_pr is False
+
+
+class TestPullRequestIndex:
+    """Tests for PullRequestIndex"""
+
+    def _pr(self, number, branch, state="open", merged_at=None):
+        return GitHubPullRequest(
+            number=number,
+            title=f"PR {number}",
+            state=state,
+            created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            merged_at=merged_at,
+            assignees=[],
+            labels=["claudechain"],
+            head_ref_name=branch,
+        )
+
+    def test_indexes_by_project_and_task_hash(self):
+        """Should group PRs by parsed project name and task hash"""
+        # Arrange
+        prs = [
+            self._pr(1, "claude-chain-api-a1b2c3d4"),
+            self._pr(2, "claude-chain-api-e5f6a7b8", state="merged"),
+            self._pr(3, "claude-chain-api-a1b2c3d4", state="closed"),
+            self._pr(4, "claude-chain-api-v2-11111111"),
+        ]
+
+        # Act
+        index = PullRequestIndex.from_pull_requests(prs)
+
+        # Assert
+        assert index.project_names == ["api", "api-v2"]
+        assert [pr.number for pr in index.get_task_prs("api", "a1b2c3d4")] == [1, 3]
+        assert len(index.get_project_prs("api")) == 3
+        assert [pr.number for pr in index.get_project_prs("api-v2")] == [4]
+
+    def test_does_not_mix_projects_sharing_a_prefix(self):
+        """Should not return 'api-v2' PRs when asking for project 'api'"""
+        # Arrange
+        index = PullRequestIndex.from_pull_requests([self._pr(4, "claude-chain-api-v2-11111111")])
+
+        # Act & Assert
+        assert index.get_project_prs("api") == []
+
+    def test_keeps_non_claudechain_branches_unindexed(self):
+        """Should keep PRs with foreign branches in all_prs only"""
+        # Arrange
+        index = PullRequestIndex.from_pull_requests([self._pr(9, "feature/login")])
+
+        # Assert
+        assert len(index) == 1
+        assert index.project_names == []
+
+    def test_get_open_and_merged_prs(self):
+        """Should filter by state and merge date"""
+        # Arrange
+        recent = datetime.now(timezone.utc) - timedelta(days=1)
+        old = datetime.now(timezone.utc) - timedelta(days=90)
+        index = PullRequestIndex.from_pull_requests([
+            self._pr(1, "claude-chain-p-00000001"),
+            self._pr(2, "claude-chain-p-00000002", state="merged", merged_at=recent),
+            self._pr(3, "claude-chain-p-00000003", state="merged", merged_at=old),
+        ])
+        cutoff = datetime.now(timezone.utc) - timedelta(days=30)
+
+        # Act
+        open_prs = index.get_open_prs("p")
+        merged_prs = index.get_merged_prs("p", since=cutoff)
+
+        # Assert
+        assert [pr.number for pr in open_prs] == [1]
+        assert [pr.number for pr in merged_prs] == [2]
+        assert len(index.get_merged_prs("p")) == 2
+
+    def test_unknown_project_returns_empty(self):
+        """Should return empty lists for projects without PRs"""
+        # Arrange
+        index = PullRequestIndex.from_pull_requests([])
+
+        # Assert
+        assert index.get_open_prs("missing") == []
+        assert index.get_task_prs("missing", "deadbeef") == []
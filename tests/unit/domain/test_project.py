@@ -129,6 +129,33 @@ class TestProjectFromConfigPath:
         assert project.name == "my-project"
 
 
+class TestProjectFromSpecPath:
+    """Test suite for Project.from_spec_path factory method"""
+
+    def test_from_spec_path_standard_format(self):
+        """Should extract project name from standard spec path"""
+        # Arrange
+        spec_path = "claude-chain/my-project/spec.md"
+
+        # Act
+        project = Project.from_spec_path(spec_path)
+
+        # Assert
+        assert project.name == "my-project"
+        assert project.spec_path == spec_path
+
+    def test_from_spec_path_absolute_path(self):
+        """Should extract project name from an absolute spec path"""
+        # Arrange
+        spec_path = "/home/runner/work/repo/claude-chain/my-project/spec.md"
+
+        # Act
+        project = Project.from_spec_path(spec_path)
+
+        # Assert
+        assert project.name == "my-project"
+
+
 class TestProjectFromBranchName:
     """Test suite for Project.from_branch_name factory method"""
 
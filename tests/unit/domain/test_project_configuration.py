@@ -2,7 +2,8 @@
 
 import pytest
 
-from claudechain.domain.constants import DEFAULT_STALE_PR_DAYS
+from claudechain.domain.constants import DEFAULT_MAX_OPEN_PRS, DEFAULT_STALE_PR_DAYS
+from claudechain.domain.exceptions import ConfigurationError
 from claudechain.domain.project import Project
 from claudechain.domain.project_configuration import ProjectConfiguration
 
@@ -688,6 +689,78 @@ labels: team-backend, needs-review, priority
         assert config.labels == "team-backend, needs-review, priority"
 
 
+
+class TestProjectConfigurationMaxOpenPRs:
+    """Test suite for ProjectConfiguration max_open_prs functionality"""
+
+    def test_from_yaml_string_parses_max_open_prs(self):
+        """Should parse maxOpenPRs from YAML configuration"""
+        # Arrange
+        project = Project("my-project")
+        yaml_content = """
+assignee: alice
+maxOpenPRs: 3
+"""
+
+        # Act
+        config = ProjectConfiguration.from_yaml_string(project, yaml_content)
+
+        # Assert
+        assert config.max_open_prs == 3
+        assert config.get_max_open_prs() == 3
+
+    def test_get_max_open_prs_returns_default_when_not_set(self):
+        """Should allow one open PR when maxOpenPRs is not configured"""
+        # Arrange
+        config = ProjectConfiguration.default(Project("my-project"))
+
+        # Act
+        result = config.get_max_open_prs()
+
+        # Assert
+        assert result == DEFAULT_MAX_OPEN_PRS == 1
+
+    @pytest.mark.parametrize("value", ["0", "-2", "two", "1.5", "true"])
+    def test_from_yaml_string_rejects_invalid_max_open_prs(self, value):
+        """Should raise ConfigurationError unless maxOpenPRs is a positive integer"""
+        # Arrange
+        project = Project("my-project")
+
+        # Act & Assert
+        with pytest.raises(ConfigurationError, match="maxOpenPRs"):
+            ProjectConfiguration.from_yaml_string(project, f"maxOpenPRs: {value}\n")
+
+    def test_from_yaml_string_parses_batch_size(self):
+        """Should parse batchSize and default to one task per session"""
+        # Arrange
+        project = Project("my-project")
+
+        # Act
+        config = ProjectConfiguration.from_yaml_string(project, "batchSize: 4\n")
+
+        # Assert
+        assert config.get_batch_size() == 4
+        assert ProjectConfiguration.default(project).get_batch_size() == 1
+        assert config.to_dict()["batchSize"] == 4
+
+    def test_from_yaml_string_rejects_invalid_batch_size(self):
+        """Should raise ConfigurationError unless batchSize is a positive integer"""
+        with pytest.raises(ConfigurationError, match="batchSize"):
+            ProjectConfiguration.from_yaml_string(Project("my-project"), "batchSize: 0\n")
+
+    def test_to_dict_serializes_max_open_prs_only_when_set(self):
+        """Should serialize maxOpenPRs only when set"""
+        # Arrange
+        config = ProjectConfiguration(project=Project("my-project"), max_open_prs=4)
+
+        # Act
+        data = config.to_dict()
+
+        # Assert
+        assert data["maxOpenPRs"] == 4
+        assert "maxOpenPRs" not in ProjectConfiguration.default(Project("my-project")).to_dict()
+
+
 class TestProjectConfigurationIntegration:
     """Integration tests for ProjectConfiguration with various scenarios"""
 
@@ -0,0 +1,58 @@
+"""Tests for the RunState domain model"""
+
+from claudechain.domain.run_state import RunState
+
+
+class TestRunState:
+    """Test suite for RunState"""
+
+    def test_get_spec_returns_spec_for_matching_branch_and_path(self):
+        """Should rebuild the recorded spec when branch and path match"""
+        # Arrange
+        state = RunState(
+            project_name="my-project",
+            base_branch="main",
+            spec_path="claude-chain/my-project/spec.md",
+            spec_content="- [ ] Task 1\n",
+        )
+
+        # Act
+        spec = state.get_spec("main", "claude-chain/my-project/spec.md")
+
+        # Assert
+        assert spec.project.name == "my-project"
+        assert spec.content == "- [ ] Task 1\n"
+
+    def test_get_spec_returns_none_for_other_branch(self):
+        """Should not serve a spec read from a different base branch"""
+        # Arrange
+        state = RunState(
+            project_name="my-project",
+            base_branch="develop",
+            spec_path="claude-chain/my-project/spec.md",
+            spec_content="- [ ] Task 1\n",
+        )
+
+        # Act
+        spec = state.get_spec("main", "claude-chain/my-project/spec.md")
+
+        # Assert
+        assert spec is None
+
+    def test_round_trips_through_dict(self):
+        """Should rebuild every recorded field from to_dict() output"""
+        # Arrange
+        state = RunState(
+            run_id="42-1",
+            project_name="my-project",
+            base_branch="main",
+            base_sha="0123abcd",
+            spec_path="claude-chain/my-project/spec.md",
+            spec_content="- [ ] Task 1\n",
+        )
+
+        # Act
+        restored = RunState.from_dict(state.to_dict())
+
+        # Assert
+        assert restored == state
@@ -1,9 +1,19 @@
 """Unit tests for SpecContent and SpecTask domain models"""
 
+from dataclasses import FrozenInstanceError
+
 import pytest
 
+from claudechain.domain.exceptions import ConfigurationError
 from claudechain.domain.project import Project
-from claudechain.domain.spec_content import SpecTask, SpecContent, generate_task_hash
+from claudechain.domain.spec_content import (
+    SpecIndex,
+    SpecTask,
+    SpecContent,
+    TaskGraph,
+    generate_task_hash,
+    parse_task_annotations,
+)
 
 
 class TestSpecTaskFromMarkdownLine:
@@ -513,6 +523,359 @@ class TestSpecContentGetTaskByIndex:
         assert task is None
 
 
+class TestSpecContentGetTaskByHash:
+    """Test suite for SpecContent.get_task_by_hash method"""
+
+    def test_get_task_by_hash_returns_matching_task(self):
+        """Should find a task by the hash of its description"""
+        # Arrange
+        spec = SpecContent(Project("my-project"), "- [x] Task 1\n- [ ] Task 2\n")
+
+        # Act
+        task = spec.get_task_by_hash(generate_task_hash("Task 2"))
+
+        # Assert
+        assert task.index == 2
+        assert task.description == "Task 2"
+
+    def test_get_task_by_hash_returns_none_for_unknown_hash(self):
+        """Should return None when no task has the hash"""
+        spec = SpecContent(Project("my-project"), "- [ ] Task 1\n")
+        assert spec.get_task_by_hash("00000000") is None
+
+    def test_get_task_by_hash_prefers_first_duplicate(self):
+        """Should return the first of several tasks with the same description"""
+        # Arrange
+        spec = SpecContent(Project("my-project"), "- [x] Same\n- [ ] Same\n")
+
+        # Act
+        task = spec.get_task_by_hash(generate_task_hash("Same"))
+
+        # Assert
+        assert task.index == 1
+
+
+
+class TestSpecContentCompleteTasks:
+    """Test suite for SpecContent.complete_tasks method"""
+
+    def test_complete_tasks_flips_only_requested_checkboxes(self):
+        """Should check off every requested task and leave the rest untouched"""
+        # Arrange
+        content = "# Spec\n\n- [ ] Task 1\n- [ ] Task 2\n  - [ ] Task 3\nNotes\n"
+        spec = SpecContent(Project("my-project"), content)
+
+        # Act
+        updated, completed = spec.complete_tasks(
+            {generate_task_hash("Task 1"), generate_task_hash("Task 3")}
+        )
+
+        # Assert
+        assert updated == "# Spec\n\n- [x] Task 1\n- [ ] Task 2\n  - [x] Task 3\nNotes\n"
+        assert [task.index for task in completed] == [1, 3]
+
+    def test_complete_tasks_preserves_crlf_and_non_ascii(self):
+        """Should rewrite only the checkbox byte in CRLF and non-ASCII content"""
+        # Arrange
+        content = "# Spéc ✓\r\n- [ ] Café ☕\r\n- [ ] Task 2\r\n"
+        spec = SpecContent(Project("my-project"), content)
+
+        # Act
+        updated, completed = spec.complete_tasks([generate_task_hash("Task 2")])
+
+        # Assert
+        assert updated == "# Spéc ✓\r\n- [ ] Café ☕\r\n- [x] Task 2\r\n"
+        assert len(completed) == 1
+
+    def test_complete_tasks_does_not_match_description_prefix(self):
+        """Should not complete a task whose description merely starts with another"""
+        # Arrange
+        spec = SpecContent(Project("my-project"), "- [ ] Add API endpoint\n- [ ] Add API\n")
+
+        # Act
+        updated, _ = spec.complete_tasks([generate_task_hash("Add API")])
+
+        # Assert
+        assert updated == "- [ ] Add API endpoint\n- [x] Add API\n"
+
+    def test_complete_tasks_completes_first_pending_duplicate(self):
+        """Should complete the first pending task when descriptions repeat"""
+        # Arrange
+        spec = SpecContent(Project("my-project"), "- [x] Same\n- [ ] Same\n- [ ] Same\n")
+
+        # Act
+        updated, completed = spec.complete_tasks([generate_task_hash("Same")])
+
+        # Assert
+        assert updated == "- [x] Same\n- [x] Same\n- [ ] Same\n"
+        assert completed[0].index == 2
+
+    def test_complete_tasks_ignores_unknown_and_completed_hashes(self):
+        """Should return the content unchanged when nothing is pending for the hashes"""
+        # Arrange
+        content = "- [x] Done\n- [ ] Task\n"
+        spec = SpecContent(Project("my-project"), content)
+
+        # Act
+        updated, completed = spec.complete_tasks([generate_task_hash("Done"), "00000000"])
+
+        # Assert
+        assert updated == content
+        assert completed == []
+
+
+class TestSpecIndex:
+    """Test suite for SpecIndex"""
+
+    def test_build_indexes_pending_tasks_and_counts(self):
+        """Should collect pending tasks in order and count completed ones"""
+        # Act
+        index = SpecIndex.build("# Spec\n- [x] Task 1\n- [ ] Task 2\ntext\n- [ ] Task 3\n")
+
+        # Assert
+        assert [task.index for task in index.tasks] == [1, 2, 3]
+        assert [task.description for task in index.pending] == ["Task 2", "Task 3"]
+        assert index.completed_count == 1
+
+    def test_build_records_byte_offsets_of_task_lines(self):
+        """Should record UTF-8 byte offsets of each task line"""
+        # Arrange
+        content = "# Spécification\n- [ ] Tâche 1\n  - [x] Task 2\n"
+        encoded = content.encode("utf-8")
+
+        # Act
+        index = SpecIndex.build(content)
+
+        # Assert
+        assert [encoded[task.start:task.end].decode("utf-8") for task in index.tasks] == [
+            "- [ ] Tâche 1",
+            "  - [x] Task 2",
+        ]
+
+    def test_index_is_read_only(self):
+        """Should not allow the hash lookup to be modified"""
+        # Arrange
+        index = SpecIndex.build("- [ ] Task 1\n")
+
+        # Act & Assert
+        with pytest.raises(TypeError):
+            index.by_hash["deadbeef"] = index.tasks[0]
+
+    def test_completed_tasks_are_not_pending(self):
+        """Should leave checked-off tasks out of the pending queries"""
+        # Arrange
+        spec = SpecContent(Project("my-project"), "- [x] Task 1\n- [ ] Task 2\n")
+
+        # Act
+        task = spec.get_task_by_index(1)
+
+        # Assert
+        assert task.is_completed
+        assert spec.get_next_available_task().description == "Task 2"
+        assert spec.get_pending_task_indices() == [2]
+
+    def test_tasks_are_immutable(self):
+        """Should reject in-place edits that would leave the index stale"""
+        # Arrange
+        spec = SpecContent(Project("my-project"), "- [ ] Task 1\n")
+
+        # Act & Assert
+        with pytest.raises(FrozenInstanceError):
+            spec.tasks[0].is_completed = True
+
+
+class TestParseTaskAnnotations:
+    """Test suite for parse_task_annotations function"""
+
+    def test_parse_task_annotations_splits_trailing_comment(self):
+        """Should separate the annotation from the description"""
+        # Act
+        description, annotations = parse_task_annotations(
+            "Add User model <!-- id: user; after: schema, db; group: models -->"
+        )
+
+        # Assert
+        assert description == "Add User model"
+        assert annotations == {"id": "user", "after": "schema, db", "group": "models"}
+
+    def test_parse_task_annotations_keeps_other_comments(self):
+        """Should leave comments that are not scheduling annotations in the description"""
+        # Act
+        description, annotations = parse_task_annotations("Add API <!-- TODO: ask Bob -->")
+
+        # Assert
+        assert description == "Add API <!-- TODO: ask Bob -->"
+        assert annotations == {}
+
+    def test_annotation_does_not_change_task_hash(self):
+        """Should hash the description without the annotation"""
+        # Act
+        task = SpecTask.from_markdown_line("- [ ] Add API <!-- after: schema -->", 1)
+
+        # Assert
+        assert task.description == "Add API"
+        assert task.after == ("schema",)
+        assert task.task_hash == generate_task_hash("Add API")
+
+    def test_spec_index_parses_annotations(self):
+        """Should read annotations into task fields when indexing a spec"""
+        # Arrange
+        content = "- [ ] Schema <!-- id: schema -->\n- [ ] Docs <!-- group: docs -->\n"
+
+        # Act
+        tasks = SpecIndex.build(content).tasks
+
+        # Assert
+        assert (tasks[0].description, tasks[0].task_id) == ("Schema", "schema")
+        assert (tasks[1].description, tasks[1].group) == ("Docs", "docs")
+
+    def test_to_markdown_line_round_trips_annotations(self):
+        """Should write annotations back in the canonical form"""
+        # Arrange
+        line = "- [ ] Add API <!-- id: api; after: schema; group: backend -->"
+
+        # Act
+        result = SpecTask.from_markdown_line(line, 1).to_markdown_line()
+
+        # Assert
+        assert result == line
+
+
+class TestTaskGraph:
+    """Test suite for TaskGraph dependency resolution"""
+
+    def _spec(self, content):
+        return SpecContent(Project("my-project"), content)
+
+    def test_unannotated_spec_is_a_sequence(self):
+        """Should make every task depend on the one before it"""
+        # Arrange
+        spec = self._spec("- [x] Task 1\n- [ ] Task 2\n- [ ] Task 3\n")
+
+        # Act
+        graph = spec.graph
+
+        # Assert
+        assert dict(graph.dependencies) == {1: (), 2: (1,), 3: (2,)}
+        assert [t.index for t in spec.get_ready_tasks()] == [2]
+
+    def test_groups_progress_independently(self):
+        """Should only chain tasks within the same group"""
+        # Arrange
+        spec = self._spec(
+            "- [ ] Core 1\n"
+            "- [ ] Docs 1 <!-- group: docs -->\n"
+            "- [ ] Core 2\n"
+            "- [ ] Docs 2 <!-- group: docs -->\n"
+        )
+
+        # Act
+        ready = spec.get_ready_tasks()
+
+        # Assert
+        assert [t.description for t in ready] == ["Core 1", "Docs 1"]
+
+    def test_after_references_ids_and_hashes(self):
+        """Should resolve prerequisites by id or task hash"""
+        # Arrange
+        spec = self._spec(
+            "- [x] Schema <!-- id: schema -->\n"
+            "- [ ] User model <!-- after: schema -->\n"
+            f"- [ ] Order model <!-- after: {generate_task_hash('Schema')} -->\n"
+        )
+
+        # Act
+        ready = spec.get_ready_tasks()
+
+        # Assert
+        assert spec.graph.dependencies[2] == (1,)
+        assert spec.graph.dependencies[3] == (1,)
+        assert [t.description for t in ready] == ["User model", "Order model"]
+
+    def test_ready_tasks_skips_in_progress_and_their_dependents(self):
+        """Should not offer in-progress tasks or tasks waiting on them"""
+        # Arrange
+        spec = self._spec(
+            "- [ ] A <!-- id: a -->\n"
+            "- [ ] B <!-- after: a -->\n"
+            "- [ ] C <!-- group: other -->\n"
+        )
+
+        # Act
+        ready = spec.get_ready_tasks({generate_task_hash("A")})
+
+        # Assert
+        assert [t.description for t in ready] == ["C"]
+
+    def test_ready_tasks_respects_limit(self):
+        """Should return at most limit tasks"""
+        # Arrange
+        spec = self._spec("- [ ] A <!-- group: a -->\n- [ ] B <!-- group: b -->\n- [ ] C <!-- group: c -->\n")
+
+        # Act
+        ready = spec.get_ready_tasks(limit=2)
+
+        # Assert
+        assert [t.description for t in ready] == ["A", "B"]
+
+    def test_topological_order_places_prerequisites_first(self):
+        """Should order a task after prerequisites declared later in the file"""
+        # Arrange
+        spec = self._spec("- [ ] Use helper <!-- after: helper -->\n- [ ] Add helper <!-- id: helper; group: h -->\n")
+
+        # Act
+        order = spec.graph.topological_order()
+
+        # Assert
+        assert [t.description for t in order] == ["Add helper", "Use helper"]
+
+    def test_next_batch_chains_consecutive_tasks(self):
+        """Should pick tasks that become ready as earlier picks complete"""
+        # Arrange
+        spec = self._spec("- [x] Task 1\n- [ ] Task 2\n- [ ] Task 3\n- [ ] Task 4\n")
+
+        # Act
+        batch = spec.get_task_batch(size=2)
+
+        # Assert
+        assert [t.description for t in batch] == ["Task 2", "Task 3"]
+
+    def test_next_batch_stops_at_in_progress_dependency(self):
+        """Should not pick tasks that wait on an in-progress task"""
+        # Arrange
+        spec = self._spec("- [ ] A\n- [ ] B\n- [ ] C <!-- group: other -->\n")
+
+        # Act
+        batch = spec.get_task_batch({generate_task_hash("A")}, size=3)
+
+        # Assert
+        assert [t.description for t in batch] == ["C"]
+
+    def test_unknown_reference_raises(self):
+        """Should reject references to tasks that do not exist"""
+        spec = self._spec("- [ ] A <!-- after: missing -->\n")
+        with pytest.raises(ConfigurationError, match="unknown task 'missing'"):
+            spec.graph
+
+    def test_duplicate_id_raises(self):
+        """Should reject two tasks with the same id"""
+        spec = self._spec("- [ ] A <!-- id: x -->\n- [ ] B <!-- id: x -->\n")
+        with pytest.raises(ConfigurationError, match="Duplicate task id"):
+            spec.graph
+
+    def test_cycle_raises(self):
+        """Should reject dependency cycles"""
+        # Arrange
+        tasks = [
+            SpecTask.from_markdown_line("- [ ] A <!-- id: a; after: b -->", 1),
+            SpecTask.from_markdown_line("- [ ] B <!-- id: b; after: a -->", 2),
+        ]
+
+        # Act & Assert
+        with pytest.raises(ConfigurationError, match="cycle"):
+            TaskGraph.build(tasks)
+
+
 class TestSpecContentGetNextAvailableTask:
     """Test suite for SpecContent.get_next_available_task method"""
 
@@ -751,15 +1114,14 @@ Remember to update documentation.
         assert 4 in pending_indices
         assert 5 in pending_indices
 
-    def test_updating_task_completion_status(self):
-        """Should be able to modify task completion and regenerate markdown"""
+    def test_task_completion_status_regenerates_markdown(self):
+        """Should regenerate markdown with each task's completion status"""
         # Arrange
         project = Project("my-project")
-        content = "- [ ] Task 1\n- [ ] Task 2\n- [ ] Task 3"
+        content = "- [ ] Task 1\n- [x] Task 2\n- [ ] Task 3"
         spec = SpecContent(project, content)
 
-        # Act - Mark second task as completed
-        spec.tasks[1].is_completed = True
+        # Act
         markdown = spec.to_markdown()
 
         # Assert
@@ -0,0 +1,149 @@
+"""Unit tests for task batch domain models"""
+
+import pytest
+
+from claudechain.domain.task_batch import BatchTask, TaskBatch, allocate_cost, commit_marker
+
+
+def _batch(*hashes):
+    return TaskBatch(tasks=[
+        BatchTask(task_index=i, task_description=f"Task {i}", task_hash=h, branch_name=f"claude-chain-p-{h}")
+        for i, h in enumerate(hashes, start=1)
+    ])
+
+
+class TestTaskBatchSerialization:
+    """Test suite for TaskBatch JSON round trip"""
+
+    def test_to_json_round_trips(self):
+        """Should parse what to_json() writes"""
+        # Arrange
+        batch = _batch("aaaaaaaa", "bbbbbbbb")
+
+        # Act
+        restored = TaskBatch.from_json(batch.to_json())
+
+        # Assert
+        assert restored == batch
+        assert restored.task_hashes == ["aaaaaaaa", "bbbbbbbb"]
+
+    def test_from_json_empty_string_is_empty_batch(self):
+        """Should treat a missing step output as no batch"""
+        assert len(TaskBatch.from_json("")) == 0
+
+    def test_from_json_invalid_raises_value_error(self):
+        """Should reject malformed batch JSON"""
+        with pytest.raises(ValueError):
+            TaskBatch.from_json('[{"task_index": 1}]')
+
+
+class TestTaskBatchSplitCommits:
+    """Test suite for TaskBatch.split_commits"""
+
+    def test_split_commits_by_marker(self):
+        """Should attribute tagged commits and the untagged commits that follow them"""
+        # Arrange
+        batch = _batch("aaaaaaaa", "bbbbbbbb", "cccccccc")
+        commits = [
+            ("c1", f"{commit_marker('aaaaaaaa')} Task 1"),
+            ("c2", "Fix typo"),
+            ("c3", f"{commit_marker('cccccccc')} Task 3"),
+        ]
+
+        # Act
+        result = batch.split_commits(commits)
+
+        # Assert
+        assert result == {"aaaaaaaa": ["c1", "c2"], "bbbbbbbb": [], "cccccccc": ["c3"]}
+
+    def test_split_commits_assigns_leading_untagged_commits_to_first_task(self):
+        """Should give commits before any tag to the first task and ignore foreign tags"""
+        # Arrange
+        batch = _batch("aaaaaaaa", "bbbbbbbb")
+        commits = [("c1", "WIP"), ("c2", f"{commit_marker('dddddddd')} Other"), ("c3", f"{commit_marker('bbbbbbbb')} B")]
+
+        # Act
+        result = batch.split_commits(commits)
+
+        # Assert
+        assert result == {"aaaaaaaa": ["c1", "c2"], "bbbbbbbb": ["c3"]}
+
+    def test_split_commits_ignores_tags_of_earlier_tasks(self):
+        """Should keep a backwards tag in the current task so earlier branches never contain later work"""
+        # Arrange
+        batch = _batch("aaaaaaaa", "bbbbbbbb", "cccccccc")
+        commits = [
+            ("c1", f"{commit_marker('aaaaaaaa')} Task 1"),
+            ("c2", f"{commit_marker('bbbbbbbb')} Task 2"),
+            ("c3", f"{commit_marker('aaaaaaaa')} Task 1 follow-up"),
+            ("c4", f"{commit_marker('cccccccc')} Task 3"),
+        ]
+
+        # Act
+        result = batch.split_commits(commits)
+
+        # Assert
+        assert result == {"aaaaaaaa": ["c1"], "bbbbbbbb": ["c2", "c3"], "cccccccc": ["c4"]}
+
+
+class TestTaskBatchLeftoverTask:
+    """Test suite for TaskBatch.leftover_task"""
+
+    def test_leftover_task_is_first_task_without_tagged_commits(self):
+        """Should attribute leftovers to the first task when nothing was committed"""
+        # Arrange
+        batch = _batch("aaaaaaaa", "bbbbbbbb", "cccccccc")
+
+        # Act
+        result = batch.leftover_task([])
+
+        # Assert
+        assert result.task_hash == "aaaaaaaa"
+
+    def test_leftover_task_follows_last_tagged_commit(self):
+        """Should attribute leftovers to the task after the last tagged one, ignoring untagged commits"""
+        # Arrange
+        batch = _batch("aaaaaaaa", "bbbbbbbb", "cccccccc")
+        commits = [("c1", f"{commit_marker('aaaaaaaa')} Task 1"), ("c2", "Fix typo")]
+
+        # Act
+        result = batch.leftover_task(commits)
+
+        # Assert
+        assert result.task_hash == "bbbbbbbb"
+        assert batch.split_commits(commits + [("c3", f"{commit_marker(result.task_hash)} Task 2")]) == {
+            "aaaaaaaa": ["c1", "c2"], "bbbbbbbb": ["c3"], "cccccccc": [],
+        }
+
+    def test_leftover_task_is_last_task_when_all_tagged(self):
+        """Should attribute leftovers to the last task once every task has a tagged commit"""
+        # Arrange
+        batch = _batch("aaaaaaaa", "bbbbbbbb")
+        commits = [("c1", f"{commit_marker('aaaaaaaa')} A"), ("c2", f"{commit_marker('bbbbbbbb')} B")]
+
+        # Act
+        result = batch.leftover_task(commits)
+
+        # Assert
+        assert result.task_hash == "bbbbbbbb"
+
+    def test_leftover_task_empty_batch_raises_value_error(self):
+        """Should refuse to pick a task from an empty batch"""
+        with pytest.raises(ValueError):
+            TaskBatch(tasks=[]).leftover_task([])
+
+
+class TestAllocateCost:
+    """Test suite for allocate_cost function"""
+
+    def test_allocate_cost_proportional_to_weights(self):
+        """Should split the cost by weight"""
+        assert allocate_cost(0.9, [2, 1]) == pytest.approx([0.6, 0.3])
+
+    def test_allocate_cost_evenly_without_weights(self):
+        """Should split evenly when no task has a positive weight"""
+        assert allocate_cost(1.0, [0, 0, 0]) == pytest.approx([1 / 3] * 3)
+
+    def test_allocate_cost_no_tasks(self):
+        """Should return an empty list for no tasks"""
+        assert allocate_cost(1.0, []) == []
@@ -0,0 +1,84 @@
+"""Tests for worktree pool domain models"""
+
+import pytest
+
+from claudechain.domain.task_batch import BatchTask, TaskBatch
+from claudechain.domain.worktree_pool import (
+    POOL_STATUS_FAILED,
+    POOL_STATUS_NO_CHANGES,
+    PoolTask,
+    PoolTaskResult,
+    compute_pool_size,
+    parse_github_output,
+)
+from claudechain.infrastructure.github.actions import GitHubActionsHelper
+
+
+class TestComputePoolSize:
+    """Test suite for sizing the pool from CPU and memory"""
+
+    @pytest.mark.parametrize("cpus,memory_mb,per_task_mb,max_workers,expected", [
+        (4, 16_000, 2048, None, 4),   # CPU bound
+        (8, 7_000, 2048, None, 3),    # Memory bound
+        (8, 16_000, 2048, 2, 2),      # Caller bound
+        (4, 1_000, 2048, None, 1),    # Always at least one task
+        (None, None, 2048, None, 1),  # Unknown resources
+        (6, None, 2048, None, 6),     # Unknown memory: CPU only
+    ])
+    def test_pool_size(self, cpus, memory_mb, per_task_mb, max_workers, expected):
+        """Should use the smallest of CPU, memory and caller limits"""
+        assert compute_pool_size(cpus, memory_mb, per_task_mb, max_workers) == expected
+
+
+class TestParseGithubOutput:
+    """Test suite for reading outputs written by another claudechain process"""
+
+    def test_round_trips_single_and_multiline_values(self, tmp_path, monkeypatch):
+        """Should read back what GitHubActionsHelper.write_output wrote"""
+        # Arrange
+        output_file = tmp_path / "output"
+        monkeypatch.setenv("GITHUB_OUTPUT", str(output_file))
+        gh = GitHubActionsHelper()
+        gh.write_output("has_task", "true")
+        gh.write_output("claude_prompt", "line 1\nkey=value\nname<<X\n")
+        gh.write_output("empty", "")
+        gh.write_output("has_task", "false")
+
+        # Act
+        outputs = parse_github_output(output_file.read_text())
+
+        # Assert
+        assert outputs == {
+            "has_task": "false",
+            "claude_prompt": "line 1\nkey=value\nname<<X\n",
+            "empty": "",
+        }
+
+
+class TestPoolTask:
+    """Test suite for PoolTask"""
+
+    def test_task_hashes_of_single_task(self):
+        """Should claim the prepared task"""
+        task = PoolTask(1, "proj", "/wt", "/work", outputs={"task_hash": "abc123", "task_description": "Do it"})
+        assert task.task_hashes == ["abc123"]
+        assert task.task_description == "Do it"
+
+    def test_task_hashes_of_batch(self):
+        """Should claim every task of a batch session"""
+        # Arrange
+        batch = TaskBatch(tasks=[
+            BatchTask(task_index=1, task_description="A", task_hash="aaa", branch_name="b-aaa"),
+            BatchTask(task_index=2, task_description="B", task_hash="bbb", branch_name="b-bbb"),
+        ])
+
+        # Act
+        task = PoolTask(1, "proj", "/wt", "/work", outputs={"task_hash": "aaa", "batch_tasks": batch.to_json()})
+
+        # Assert
+        assert task.task_hashes == ["aaa", "bbb"]
+
+    def test_result_succeeded(self):
+        """Should treat only failures as unsuccessful"""
+        assert PoolTaskResult("proj", "A", POOL_STATUS_NO_CHANGES).succeeded is True
+        assert PoolTaskResult("proj", "A", POOL_STATUS_FAILED).succeeded is False
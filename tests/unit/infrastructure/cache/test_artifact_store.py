@@ -0,0 +1,129 @@
+"""Tests for the permanent task metadata artifact store"""
+
+import json
+
+from claudechain.infrastructure.cache.artifact_store import (
+    ArtifactStore,
+    ArtifactStoreStats,
+    get_artifact_store,
+)
+
+
+class TestArtifactStore:
+    """Test suite for ArtifactStore"""
+
+    def test_get_returns_none_for_unknown_artifact(self, tmp_path):
+        """Should count a miss for artifacts never stored"""
+        # Arrange
+        store = ArtifactStore(tmp_path / "task-metadata.jsonl")
+
+        # Act
+        result = store.get(1)
+
+        # Assert
+        assert result is None
+        assert store.stats.misses == 1
+
+    def test_put_then_get_returns_data_and_counts_bytes_saved(self, tmp_path):
+        """Should serve stored metadata and record the download it avoided"""
+        # Arrange
+        store = ArtifactStore(tmp_path / "task-metadata.jsonl")
+        store.put(1, {"pr_number": 42}, digest="sha256:abc")
+
+        # Act
+        result = store.get(1, digest="sha256:abc", size_in_bytes=512)
+
+        # Assert
+        assert result == {"pr_number": 42}
+        assert store.stats.hits == 1
+        assert store.stats.bytes_saved == 512
+
+    def test_digest_mismatch_is_a_miss(self, tmp_path):
+        """Should not serve an entry whose content digest changed"""
+        # Arrange
+        store = ArtifactStore(tmp_path / "task-metadata.jsonl")
+        store.put(1, {"pr_number": 42}, digest="sha256:abc")
+
+        # Act
+        result = store.get(1, digest="sha256:def")
+
+        # Assert
+        assert result is None
+
+    def test_entries_persist_as_compact_json_lines(self, tmp_path):
+        """Should reload entries written by an earlier process"""
+        # Arrange
+        path = tmp_path / "artifacts" / "task-metadata.jsonl"
+        ArtifactStore(path).put(1, {"pr_number": 42})
+        ArtifactStore(path).put(2, {"pr_number": 43})
+
+        # Act
+        reloaded = ArtifactStore(path)
+
+        # Assert
+        lines = path.read_text().splitlines()
+        assert len(lines) == 2
+        assert " " not in lines[0]
+        assert reloaded.get(2) == {"pr_number": 43}
+        assert len(reloaded) == 2
+
+    def test_skips_malformed_lines(self, tmp_path):
+        """Should ignore a truncated line left by an interrupted write"""
+        # Arrange
+        path = tmp_path / "task-metadata.jsonl"
+        path.write_text(json.dumps({"id": 1, "digest": None, "data": {"a": 1}}) + "\n{\"id\": 2, \"da")
+
+        # Act
+        store = ArtifactStore(path)
+
+        # Assert
+        assert store.get(1) == {"a": 1}
+        assert len(store) == 1
+
+    def test_in_memory_store_without_path(self):
+        """Should work without a backing file"""
+        # Arrange
+        store = ArtifactStore()
+
+        # Act
+        store.put(1, {"a": 1})
+
+        # Assert
+        assert store.get(1) == {"a": 1}
+
+
+class TestArtifactStoreStats:
+    """Test suite for ArtifactStoreStats"""
+
+    def test_format_summary_reports_hit_rate_and_bytes_saved(self):
+        """Should render a markdown table with hit rate and saved bytes"""
+        # Arrange
+        stats = ArtifactStoreStats(hits=3, misses=1, bytes_saved=2048)
+
+        # Act
+        summary = stats.format_summary()
+
+        # Assert
+        assert "## Artifact Cache" in summary
+        assert "75%" in summary
+        assert "2.0 KiB" in summary
+
+
+class TestGetArtifactStore:
+    """Test suite for get_artifact_store"""
+
+    def test_uses_cache_dir_env(self, monkeypatch, tmp_path):
+        """Should persist under CLAUDECHAIN_CACHE_DIR/artifacts when set"""
+        # Arrange
+        monkeypatch.setenv("CLAUDECHAIN_CACHE_DIR", str(tmp_path))
+
+        # Act
+        store = get_artifact_store()
+
+        # Assert
+        assert store.path == tmp_path / "artifacts" / "task-metadata.jsonl"
+        assert get_artifact_store() is store
+
+    def test_in_memory_without_cache_dir(self):
+        """Should fall back to an in-memory store"""
+        assert get_artifact_store().path is None
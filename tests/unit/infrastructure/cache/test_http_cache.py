@@ -0,0 +1,102 @@
+"""Tests for the on-disk HTTP cache"""
+
+import os
+
+import pytest
+
+from claudechain.infrastructure.cache.http_cache import HttpCache, HttpCacheStats
+
+
+URL = "https://api.github.com/repos/owner/repo/contents/spec.md?ref=main"
+
+
+class TestHttpCacheStore:
+    """Test suite for HttpCache.store and lookup"""
+
+    def test_round_trips_body_and_validators(self, tmp_path):
+        """Should return stored body, ETag and Last-Modified"""
+        # Arrange
+        cache = HttpCache(tmp_path)
+
+        # Act
+        stored = cache.store(URL, b'{"a": 1}', {"etag": '"v1"', "last-modified": "Mon", "x-other": "dropped"})
+        entry = cache.lookup(URL)
+
+        # Assert
+        assert stored is True
+        assert entry.body == b'{"a": 1}'
+        assert entry.conditional_headers() == {"If-None-Match": '"v1"', "If-Modified-Since": "Mon"}
+        assert "x-other" not in entry.headers
+
+    def test_skips_responses_without_validators(self, tmp_path):
+        """Should not store responses that cannot be revalidated"""
+        # Arrange
+        cache = HttpCache(tmp_path)
+
+        # Act
+        stored = cache.store(URL, b"{}", {"content-type": "application/json"})
+
+        # Assert
+        assert stored is False
+        assert cache.lookup(URL) is None
+
+    def test_lookup_missing_returns_none(self, tmp_path):
+        """Should return None for unknown URLs"""
+        assert HttpCache(tmp_path).lookup(URL) is None
+
+    def test_survives_new_instance(self, tmp_path):
+        """Should read entries written by a previous process"""
+        # Arrange
+        HttpCache(tmp_path).store(URL, b"body", {"etag": '"v1"'})
+
+        # Act
+        entry = HttpCache(tmp_path).lookup(URL)
+
+        # Assert
+        assert entry.body == b"body"
+
+
+class TestHttpCacheEviction:
+    """Test suite for LRU eviction"""
+
+    def test_evicts_least_recently_used_entries(self, tmp_path):
+        """Should drop the oldest entries once max_bytes is exceeded"""
+        # Arrange
+        cache = HttpCache(tmp_path, max_bytes=25)
+        cache.store("https://x/old", b"a" * 10, {"etag": "1"})
+        cache.store("https://x/used", b"b" * 10, {"etag": "2"})
+        old_time = 1_000_000
+        for url in ("https://x/old", "https://x/used"):
+            for path in cache._paths(url):
+                os.utime(path, (old_time, old_time))
+        cache.record_hit(cache.lookup("https://x/used"))
+
+        # Act
+        cache.store("https://x/new", b"c" * 10, {"etag": "3"})
+
+        # Assert
+        assert cache.lookup("https://x/old") is None
+        assert cache.lookup("https://x/used") is not None
+        assert cache.lookup("https://x/new") is not None
+        assert cache.stats.evictions == 1
+
+
+class TestHttpCacheStats:
+    """Test suite for HttpCacheStats"""
+
+    def test_hit_rate_and_summary(self):
+        """Should compute hit rate and render a markdown table"""
+        # Arrange
+        stats = HttpCacheStats(hits=3, misses=1, bytes_served=2048)
+
+        # Act
+        summary = stats.format_summary()
+
+        # Assert
+        assert stats.hit_rate == pytest.approx(0.75)
+        assert "## HTTP Cache" in summary
+        assert "| 3 | 1 | 75% | 2.0 KiB | 0 |" in summary
+
+    def test_hit_rate_without_requests(self):
+        """Should report 0 when nothing was requested"""
+        assert HttpCacheStats().hit_rate == 0.0
@@ -0,0 +1,128 @@
+"""Tests for persisted PR snapshots"""
+
+from datetime import datetime, timezone
+
+from claudechain.domain.github_models import GitHubPullRequest, GitHubUser
+from claudechain.infrastructure.cache.pr_snapshot import (
+    PullRequestSnapshot,
+    PullRequestSnapshotStore,
+    get_pr_snapshot_store,
+)
+
+
+def _pr(number, state="open", updated_day=1):
+    return GitHubPullRequest(
+        number=number,
+        title=f"Task {number}",
+        state=state,
+        created_at=datetime(2024, 1, number, tzinfo=timezone.utc),
+        merged_at=datetime(2024, 3, updated_day, tzinfo=timezone.utc) if state == "merged" else None,
+        assignees=[GitHubUser(login="alice")],
+        labels=["claudechain"],
+        head_ref_name=f"claude-chain-proj-a3f2b89{number}",
+        base_ref_name="main",
+        url=f"https://github.com/owner/repo/pull/{number}",
+        updated_at=datetime(2024, 3, updated_day, tzinfo=timezone.utc),
+    )
+
+
+class TestPullRequestSnapshot:
+    """Test suite for PullRequestSnapshot"""
+
+    def test_merge_replaces_by_number_and_advances_synced_at(self):
+        """Should keep one entry per PR and track the newest update"""
+        # Arrange
+        snapshot = PullRequestSnapshot("owner/repo", "claudechain")
+        snapshot.merge([_pr(1), _pr(2, updated_day=4)])
+
+        # Act
+        changed = snapshot.merge([_pr(2, state="merged", updated_day=6), _pr(1)])
+
+        # Assert
+        assert changed == 1
+        assert [pr.number for pr in snapshot.pull_requests] == [2, 1]
+        assert snapshot.pull_requests[0].is_merged()
+        assert snapshot.synced_at == datetime(2024, 3, 6, tzinfo=timezone.utc)
+
+    def test_merge_drops_prs_without_the_label(self):
+        """Should remove PRs whose label was removed and skip unlabeled new PRs"""
+        # Arrange
+        snapshot = PullRequestSnapshot("owner/repo", "claudechain")
+        snapshot.merge([_pr(1), _pr(2)])
+        unlabeled, other = _pr(2, updated_day=5), _pr(3, updated_day=6)
+        unlabeled.labels = []
+        other.labels = ["other"]
+
+        # Act
+        changed = snapshot.merge([unlabeled, other])
+
+        # Assert
+        assert changed == 1
+        assert [pr.number for pr in snapshot.pull_requests] == [1]
+        assert snapshot.synced_at == datetime(2024, 3, 6, tzinfo=timezone.utc)
+
+    def test_fetch_since_is_none_without_sync(self):
+        """Should require a full listing when no update time is known"""
+        assert PullRequestSnapshot("owner/repo", "claudechain").fetch_since is None
+
+    def test_round_trips_through_dict(self):
+        """Should restore the same PRs from its serialized form"""
+        # Arrange
+        snapshot = PullRequestSnapshot("owner/repo", "claudechain")
+        snapshot.merge([_pr(1), _pr(2, state="merged", updated_day=3)])
+
+        # Act
+        restored = PullRequestSnapshot.from_dict(snapshot.to_dict())
+
+        # Assert
+        assert restored == snapshot
+
+
+class TestPullRequestSnapshotStore:
+    """Test suite for PullRequestSnapshotStore"""
+
+    def test_save_then_load(self, tmp_path):
+        """Should persist snapshots keyed by repo and label"""
+        # Arrange
+        store = PullRequestSnapshotStore(tmp_path)
+        snapshot = PullRequestSnapshot("owner/repo", "claudechain")
+        snapshot.merge([_pr(1)])
+
+        # Act
+        store.save(snapshot)
+
+        # Assert
+        assert store.load("owner/repo", "claudechain") == snapshot
+        assert store.load("owner/repo", "other-label") is None
+        assert list(tmp_path.iterdir()) == [store.path_for("owner/repo", "claudechain")]
+
+    def test_load_ignores_corrupt_file(self, tmp_path):
+        """Should treat an unreadable snapshot as a cold run"""
+        # Arrange
+        store = PullRequestSnapshotStore(tmp_path)
+        store.path_for("owner/repo", "claudechain").write_text('{"version": 1, "repo"')
+
+        # Act
+        result = store.load("owner/repo", "claudechain")
+
+        # Assert
+        assert result is None
+
+
+class TestGetPrSnapshotStore:
+    """Test suite for get_pr_snapshot_store"""
+
+    def test_uses_cache_dir_env(self, monkeypatch, tmp_path):
+        """Should store snapshots under CLAUDECHAIN_CACHE_DIR/snapshots"""
+        # Arrange
+        monkeypatch.setenv("CLAUDECHAIN_CACHE_DIR", str(tmp_path))
+
+        # Act
+        store = get_pr_snapshot_store()
+
+        # Assert
+        assert store.directory == tmp_path / "snapshots"
+
+    def test_none_without_cache_dir(self):
+        """Should disable snapshots when no cache directory is configured"""
+        assert get_pr_snapshot_store() is None
@@ -0,0 +1,106 @@
+"""Tests for the run-state file shared between workflow steps"""
+
+import json
+
+from claudechain.domain.run_state import RunState
+from claudechain.infrastructure.cache.run_state_store import (
+    RUN_STATE_FILE_NAME,
+    RunStateStore,
+    get_run_state_store,
+)
+
+
+class TestRunStateStore:
+    """Test suite for RunStateStore"""
+
+    def test_save_then_load(self, tmp_path):
+        """Should read back the state saved by an earlier step"""
+        # Arrange
+        path = tmp_path / RUN_STATE_FILE_NAME
+        RunStateStore(path, run_id="1-1").save(RunState(project_name="my-project", base_sha="0123abcd"))
+
+        # Act
+        state = RunStateStore(path, run_id="1-1").load()
+
+        # Assert
+        assert state.project_name == "my-project"
+        assert state.base_sha == "0123abcd"
+
+    def test_load_rejects_checksum_mismatch(self, tmp_path):
+        """Should ignore a state file whose payload was modified"""
+        # Arrange
+        path = tmp_path / RUN_STATE_FILE_NAME
+        store = RunStateStore(path, run_id="1-1")
+        store.save(RunState(project_name="my-project"))
+        envelope = json.loads(path.read_text())
+        envelope["state"]["project_name"] = "other-project"
+        path.write_text(json.dumps(envelope))
+
+        # Act
+        state = store.load()
+
+        # Assert
+        assert state.project_name is None
+
+    def test_load_rejects_unknown_version(self, tmp_path):
+        """Should ignore state written in another format version"""
+        # Arrange
+        path = tmp_path / RUN_STATE_FILE_NAME
+        store = RunStateStore(path, run_id="1-1")
+        store.save(RunState(project_name="my-project"))
+        envelope = json.loads(path.read_text())
+        envelope["version"] = 999
+        path.write_text(json.dumps(envelope))
+
+        # Act
+        state = store.load()
+
+        # Assert
+        assert state.project_name is None
+
+    def test_load_ignores_state_from_another_run(self, tmp_path):
+        """Should start empty when the file belongs to a different run"""
+        # Arrange
+        path = tmp_path / RUN_STATE_FILE_NAME
+        RunStateStore(path, run_id="1-1").save(RunState(project_name="my-project"))
+
+        # Act
+        state = RunStateStore(path, run_id="2-1").load()
+
+        # Assert
+        assert state.project_name is None
+        assert state.run_id == "2-1"
+
+    def test_disabled_store_does_not_write(self, tmp_path):
+        """Should keep state in memory only without a path"""
+        # Arrange
+        store = RunStateStore()
+
+        # Act
+        store.save(RunState(project_name="my-project"))
+
+        # Assert
+        assert not store.enabled
+        assert store.load().project_name is None
+
+
+class TestGetRunStateStore:
+    """Test suite for get_run_state_store"""
+
+    def test_uses_runner_temp_and_run_id(self, monkeypatch, tmp_path):
+        """Should keep the state file in RUNNER_TEMP keyed by run and attempt"""
+        # Arrange
+        monkeypatch.setenv("RUNNER_TEMP", str(tmp_path))
+        monkeypatch.setenv("GITHUB_RUN_ID", "123")
+        monkeypatch.setenv("GITHUB_RUN_ATTEMPT", "2")
+
+        # Act
+        store = get_run_state_store()
+
+        # Assert
+        assert store.path == tmp_path / RUN_STATE_FILE_NAME
+        assert store.run_id == "123-2"
+
+    def test_disabled_without_runner_temp(self):
+        """Should disable sharing outside GitHub Actions"""
+        assert not get_run_state_store().enabled
@@ -9,6 +9,7 @@ from claudechain.infrastructure.filesystem.operations import (
     find_file,
     read_file,
     write_file,
+    write_file_atomic,
 )
 
 
@@ -152,6 +153,54 @@ class TestWriteFile:
             write_file(file_path, "content")
 
 
+
+class TestWriteFileAtomic:
+    """Test suite for write_file_atomic function"""
+
+    def test_write_file_atomic_replaces_content(self, tmp_path):
+        """Should replace existing content and leave no temporary files"""
+        # Arrange
+        file_path = tmp_path / "spec.md"
+        file_path.write_text("old")
+
+        # Act
+        write_file_atomic(file_path, "new")
+
+        # Assert
+        assert file_path.read_text() == "new"
+        assert [p.name for p in tmp_path.iterdir()] == ["spec.md"]
+
+    def test_write_file_atomic_keeps_newlines_untranslated(self, tmp_path):
+        """Should write CRLF line endings byte-for-byte"""
+        # Arrange
+        file_path = tmp_path / "spec.md"
+
+        # Act
+        write_file_atomic(file_path, "a\r\nb\n")
+
+        # Assert
+        assert file_path.read_bytes() == b"a\r\nb\n"
+
+    def test_write_file_atomic_preserves_permissions(self, tmp_path):
+        """Should keep the mode of the file it replaces"""
+        # Arrange
+        file_path = tmp_path / "script.sh"
+        file_path.write_text("old")
+        file_path.chmod(0o750)
+
+        # Act
+        write_file_atomic(file_path, "new")
+
+        # Assert
+        assert file_path.stat().st_mode & 0o777 == 0o750
+
+    def test_write_file_atomic_missing_directory_raises(self, tmp_path):
+        """Should raise when the parent directory does not exist"""
+        # Act & Assert
+        with pytest.raises(FileNotFoundError):
+            write_file_atomic(tmp_path / "missing" / "spec.md", "content")
+
+
 class TestFileExists:
     """Test suite for file_exists function"""
 
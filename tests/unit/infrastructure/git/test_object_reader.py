@@ -0,0 +1,134 @@
+"""Tests for the persistent git cat-file reader"""
+
+import shutil
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from claudechain.domain.exceptions import GitError
+from claudechain.infrastructure.git.object_reader import GitObjectReader, get_object_reader
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def _git(cwd, *args) -> str:
+    return subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Repository with one commit containing a spec file"""
+    _git(tmp_path, "init", "-q")
+    (tmp_path / "claude-chain" / "auth").mkdir(parents=True)
+    (tmp_path / "claude-chain" / "auth" / "spec.md").write_text("- [ ] Task 1\n")
+    _git(tmp_path, "add", "-A")
+    _git(tmp_path, "commit", "-qm", "Initial")
+    return tmp_path
+
+
+class TestGitObjectReader:
+    """Test suite for object lookups over cat-file batch processes"""
+
+    def test_object_type(self, repo):
+        """Should resolve refs, paths and SHAs like git cat-file -t"""
+        # Arrange
+        head = _git(repo, "rev-parse", "HEAD")
+
+        # Act / Assert
+        with GitObjectReader(str(repo)) as reader:
+            assert reader.object_type("HEAD") == "commit"
+            assert reader.object_type(head) == "commit"
+            assert reader.object_type("HEAD:claude-chain") == "tree"
+            assert reader.object_type("HEAD:claude-chain/auth/spec.md") == "blob"
+
+    @pytest.mark.parametrize("ref", ["origin/missing", "0" * 40, "HEAD:nope.md", "HEAD\nHEAD", ""])
+    def test_object_type_missing(self, repo, ref):
+        """Should return None for missing objects and unusable names"""
+        with GitObjectReader(str(repo)) as reader:
+            assert reader.object_type(ref) is None
+            # The process stays usable after a miss
+            assert reader.object_type("HEAD") == "commit"
+
+    def test_sees_refs_created_after_start(self, repo):
+        """Should resolve refs and objects written by other git processes"""
+        # Arrange
+        reader = GitObjectReader(str(repo))
+        assert reader.object_type("refs/heads/feature") is None
+
+        # Act
+        _git(repo, "branch", "feature")
+        (repo / "notes.md").write_text("new\n")
+        _git(repo, "add", "notes.md")
+        _git(repo, "commit", "-qm", "Add notes")
+
+        # Assert
+        assert reader.object_type("refs/heads/feature") == "commit"
+        assert reader.object_type("HEAD:notes.md") == "blob"
+        reader.close()
+
+    def test_starts_one_process_for_many_lookups(self, repo):
+        """Should answer every lookup from the same process"""
+        # Arrange
+        with patch(
+            "claudechain.infrastructure.git.object_reader.subprocess.Popen", wraps=subprocess.Popen
+        ) as mock_popen:
+            reader = GitObjectReader(str(repo))
+
+            # Act
+            types = [reader.object_type("HEAD") for _ in range(50)]
+            reader.close()
+
+        # Assert
+        assert set(types) == {"commit"}
+        assert mock_popen.call_count == 1
+
+    def test_restarts_after_close(self, repo):
+        """Should start a new process when used after close()"""
+        # Arrange
+        reader = GitObjectReader(str(repo))
+        reader.object_type("HEAD")
+
+        # Act
+        reader.close()
+
+        # Assert
+        assert reader.object_type("HEAD") == "commit"
+        reader.close()
+
+    def test_existence_checks_never_fetch_lazily(self, repo):
+        """Should start the batch-check process with lazy fetch disabled"""
+        # Arrange
+        reader = GitObjectReader(str(repo))
+
+        # Act
+        with patch("subprocess.Popen", wraps=subprocess.Popen) as mock_popen:
+            reader.object_type("HEAD")
+        reader.close()
+
+        # Assert
+        (check_call,) = mock_popen.call_args_list
+        assert check_call.args[0] == ["git", "cat-file", "--batch-check"]
+        assert check_call.kwargs["env"]["GIT_NO_LAZY_FETCH"] == "1"
+
+    def test_outside_repository_raises(self, tmp_path):
+        """Should raise GitError when git cannot serve lookups"""
+        # Arrange
+        not_a_repo = tmp_path / "plain"
+        not_a_repo.mkdir()
+
+        # Act / Assert
+        with GitObjectReader(str(not_a_repo)) as reader:
+            with pytest.raises(GitError):
+                reader.object_type("HEAD")
+
+    def test_get_object_reader_shared_per_repository(self, repo, monkeypatch):
+        """Should reuse one reader per repository directory"""
+        # Arrange
+        monkeypatch.chdir(repo)
+
+        # Act / Assert
+        assert get_object_reader() is get_object_reader(str(repo))
@@ -1,12 +1,23 @@
 """Tests for git operations"""
 
+import shutil
 import subprocess
 from unittest.mock import Mock, patch
 
 import pytest
 
 from claudechain.domain.exceptions import GitError
-from claudechain.infrastructure.git.operations import run_command, run_git_command
+from claudechain.infrastructure.git.operations import (
+    FileChanges,
+    detect_changed_files,
+    detect_deleted_files,
+    detect_file_changes,
+    ensure_ref_available,
+    is_partial_clone,
+    run_command,
+    run_git_command,
+    _hydrate_partial_clone_blobs,
+)
 
 
 class TestRunCommand:
@@ -188,3 +199,202 @@ class TestRunGitCommand:
             "--author", "Test <test@example.com>"
         ])
         assert result == "success"
+
+
+def _git(cwd, *args) -> str:
+    return subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+def _missing_objects(cwd, ref) -> set:
+    """Objects of ref's tree that are not present locally"""
+    output = _git(cwd, "rev-list", "--objects", "--missing=print", f"{ref}^{{tree}}")
+    return {line[1:] for line in output.split("\n") if line.startswith("?")}
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+class TestPartialCloneHydration:
+    """Test suite for blob hydration in blob-less partial clones"""
+
+    @pytest.fixture
+    def partial_clone(self, tmp_path, monkeypatch):
+        """Shallow blob-less clone of a repo with three commits; cwd is the clone"""
+        origin = tmp_path / "origin"
+        origin.mkdir()
+        _git(origin, "init", "-q")
+        _git(origin, "config", "uploadpack.allowFilter", "true")
+        _git(origin, "config", "uploadpack.allowAnySHA1InWant", "true")
+        (origin / "README.md").write_text("# Repo\n")
+        _git(origin, "add", "-A")
+        _git(origin, "commit", "-qm", "Add README")
+        for name in ("auth", "api"):
+            (origin / "claude-chain" / name).mkdir(parents=True)
+            (origin / "claude-chain" / name / "spec.md").write_text(f"- [ ] {name} task\n")
+        (origin / "app").mkdir()
+        (origin / "app" / "large.bin").write_bytes(b"x" * 50_000)
+        _git(origin, "add", "-A")
+        _git(origin, "commit", "-qm", "Initial")
+        before = _git(origin, "rev-parse", "HEAD")
+        (origin / "claude-chain" / "auth" / "spec.md").write_text("- [x] auth task\n")
+        _git(origin, "commit", "-qam", "Complete auth task")
+        after = _git(origin, "rev-parse", "HEAD")
+
+        clone = tmp_path / "clone"
+        _git(tmp_path, "clone", "-q", "--filter=blob:none", "--depth=1", "--no-checkout", f"file://{origin}", str(clone))
+        monkeypatch.chdir(clone)
+        return clone, before, after
+
+    def test_is_partial_clone(self, partial_clone, tmp_path, monkeypatch):
+        """Should detect the promisor remote of a partial clone only"""
+        # Arrange
+        plain = tmp_path / "plain"
+        plain.mkdir()
+        _git(plain, "init", "-q")
+
+        # Act / Assert
+        assert is_partial_clone() is True
+        monkeypatch.chdir(plain)
+        assert is_partial_clone() is False
+
+    def test_hydration_fetches_only_matching_files(self, partial_clone):
+        """Should fetch spec.md blobs in one request and leave other blobs remote"""
+        # Arrange
+        clone, _, after = partial_clone
+        spec_blobs = {
+            _git(clone, "rev-parse", f"{after}:claude-chain/{name}/spec.md") for name in ("auth", "api")
+        }
+        large_blob = _git(clone, "rev-parse", f"{after}:app/large.bin")
+
+        # Act
+        fetched = _hydrate_partial_clone_blobs(after, "claude-chain/*/spec.md")
+        fetched_again = _hydrate_partial_clone_blobs(after, "claude-chain/*/spec.md")
+
+        # Assert
+        assert fetched == 2
+        assert fetched_again == 0
+        missing = _missing_objects(clone, after)
+        assert not spec_blobs & missing
+        assert large_blob in missing
+
+    def test_detect_changed_files_in_shallow_partial_clone(self, partial_clone):
+        """Should fetch the missing before-ref and diff without hydrating other blobs"""
+        # Arrange
+        clone, before, after = partial_clone
+        large_blob = _git(clone, "rev-parse", f"{after}:app/large.bin")
+
+        # Act
+        changed = detect_changed_files(before, after, "claude-chain/*/spec.md")
+
+        # Assert
+        assert changed == ["claude-chain/auth/spec.md"]
+        assert large_blob in _missing_objects(clone, after)
+
+    def test_ensure_ref_available_fetches_one_commit_in_partial_clone(self, partial_clone):
+        """Should fetch only the missing commit, not its history through a lazy fetch"""
+        # Arrange
+        clone, before, _ = partial_clone
+
+        # Act
+        ensure_ref_available(before)
+
+        # Assert
+        assert _git(clone, "rev-list", "--count", before) == "1"
+
+
+class TestFileChanges:
+    """Test suite for parsing git diff --name-status -z output"""
+
+    def test_from_name_status(self):
+        """Should classify entries and skip renames, copies and type changes"""
+        # Arrange
+        output = "\0".join([
+            "A", "claude-chain/new/spec.md",
+            "M", "claude-chain/auth/spec.md",
+            "R100", "claude-chain/old/spec.md", "claude-chain/moved/spec.md",
+            "D", "claude-chain/gone/spec.md",
+            "C75", "claude-chain/a/spec.md", "claude-chain/b/spec.md",
+            "T", "claude-chain/link/spec.md",
+            "M", "claude-chain/with space/spec.md",
+        ]) + "\0"
+
+        # Act
+        changes = FileChanges.from_name_status(output)
+
+        # Assert
+        assert changes.added == ["claude-chain/new/spec.md"]
+        assert changes.modified == ["claude-chain/auth/spec.md", "claude-chain/with space/spec.md"]
+        assert changes.deleted == ["claude-chain/gone/spec.md"]
+        assert changes.changed == [
+            "claude-chain/auth/spec.md", "claude-chain/new/spec.md", "claude-chain/with space/spec.md"
+        ]
+
+    def test_from_empty_output(self):
+        """Should return no changes for empty output"""
+        assert FileChanges.from_name_status("") == FileChanges()
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+class TestDetectFileChanges:
+    """Test suite for detecting spec changes in one diff pass"""
+
+    @pytest.fixture
+    def repo(self, tmp_path, monkeypatch):
+        """Repository with a push touching several specs; cwd is the repository"""
+        _git(tmp_path, "init", "-q")
+        for name in ("auth", "api", "old", "moved-from"):
+            (tmp_path / "claude-chain" / name).mkdir(parents=True)
+            (tmp_path / "claude-chain" / name / "spec.md").write_text(f"- [ ] {name} task\n")
+        _git(tmp_path, "add", "-A")
+        _git(tmp_path, "commit", "-qm", "Initial")
+        before = _git(tmp_path, "rev-parse", "HEAD")
+
+        (tmp_path / "claude-chain" / "auth" / "spec.md").write_text("- [x] auth task\n")
+        (tmp_path / "claude-chain" / "new").mkdir()
+        (tmp_path / "claude-chain" / "new" / "spec.md").write_text("- [ ] new task\n")
+        _git(tmp_path, "rm", "-rq", "claude-chain/old")
+        _git(tmp_path, "mv", "claude-chain/moved-from", "claude-chain/moved-to")
+        _git(tmp_path, "add", "-A")
+        _git(tmp_path, "commit", "-qm", "Update specs")
+        after = _git(tmp_path, "rev-parse", "HEAD")
+
+        monkeypatch.chdir(tmp_path)
+        return before, after
+
+    def test_detects_added_modified_and_deleted(self, repo):
+        """Should classify every spec change from a single git diff"""
+        # Arrange
+        before, after = repo
+
+        # Act
+        changes = detect_file_changes(before, after, "claude-chain/*/spec.md")
+
+        # Assert
+        assert changes.added == ["claude-chain/new/spec.md"]
+        assert changes.modified == ["claude-chain/auth/spec.md"]
+        assert changes.deleted == ["claude-chain/old/spec.md"]
+
+    def test_wrappers_match_previous_filters(self, repo):
+        """Should keep the results of the --diff-filter=AM and =D queries"""
+        # Arrange
+        before, after = repo
+
+        # Act / Assert
+        assert detect_changed_files(before, after, "claude-chain/*/spec.md") == [
+            "claude-chain/auth/spec.md", "claude-chain/new/spec.md"
+        ]
+        assert detect_deleted_files(before, after, "claude-chain/*/spec.md") == ["claude-chain/old/spec.md"]
+
+    def test_starts_few_git_processes(self, repo):
+        """Should resolve refs over the shared cat-file process and diff once"""
+        # Arrange
+        before, after = repo
+
+        # Act
+        with patch("subprocess.Popen", wraps=subprocess.Popen) as mock_popen:
+            detect_file_changes(before, after, "claude-chain/*/spec.md")
+
+        # Assert - the partial-clone check, one cat-file process for both refs and the diff
+        commands = [call.args[0][1] for call in mock_popen.call_args_list]
+        assert commands == ["config", "cat-file", "diff"]
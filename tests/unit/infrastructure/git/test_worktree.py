@@ -0,0 +1,64 @@
+"""Tests for git worktree operations"""
+
+import os
+import subprocess
+
+from claudechain.infrastructure.git.worktree import add_worktree, list_worktrees, remove_worktree
+
+
+def _git(cwd, *args) -> str:
+    return subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+class TestWorktrees:
+    """Test suite for adding and removing task worktrees"""
+
+    def test_worktree_shares_object_store(self, mock_git_repo, tmp_path, monkeypatch):
+        """Should check out HEAD without copying objects and see its commits in the main repo"""
+        # Arrange
+        monkeypatch.chdir(mock_git_repo)
+        head = _git(mock_git_repo, "rev-parse", "HEAD")
+
+        # Act
+        path = add_worktree(str(tmp_path / "pool" / "task-1"), head)
+        _git(path, "checkout", "-qb", "task-branch")
+        (tmp_path / "pool" / "task-1" / "change.txt").write_text("change\n")
+        _git(path, "add", "change.txt")
+        _git(path, "commit", "-qm", "Change")
+
+        # Assert
+        assert os.path.isfile(os.path.join(path, "README.md"))
+        assert os.path.isfile(os.path.join(path, ".git"))  # A link to the shared repository, not a copy
+        assert list_worktrees() == [str(mock_git_repo), path]
+        assert _git(mock_git_repo, "log", "-1", "--format=%s", "task-branch") == "Change"
+        assert _git(mock_git_repo, "rev-parse", "HEAD") == head
+
+    def test_remove_worktree_discards_changes_and_branch(self, mock_git_repo, tmp_path, monkeypatch):
+        """Should remove a dirty worktree and delete its branch"""
+        # Arrange
+        monkeypatch.chdir(mock_git_repo)
+        path = add_worktree(str(tmp_path / "task-1"), "HEAD")
+        _git(path, "checkout", "-qb", "task-branch")
+        (tmp_path / "task-1" / "untracked.txt").write_text("dirty\n")
+
+        # Act
+        remove_worktree(path, branch="task-branch")
+
+        # Assert
+        assert not os.path.exists(path)
+        assert list_worktrees() == [str(mock_git_repo)]
+        assert _git(mock_git_repo, "branch", "--list", "task-branch") == ""
+
+    def test_remove_missing_worktree_does_not_raise(self, mock_git_repo, tmp_path, monkeypatch, capsys):
+        """Should log instead of raising when the worktree is already gone"""
+        # Arrange
+        monkeypatch.chdir(mock_git_repo)
+
+        # Act
+        remove_worktree(str(tmp_path / "missing"), branch="no-such-branch")
+
+        # Assert
+        assert "Failed to remove worktree" in capsys.readouterr().out
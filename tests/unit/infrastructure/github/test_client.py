@@ -0,0 +1,344 @@
+"""Tests for the pooled GitHub REST client"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from claudechain.domain.exceptions import GitHubAPIError
+from claudechain.infrastructure.cache.http_cache import HttpCache
+from claudechain.infrastructure.github.client import (
+    GitHubClient,
+    GitHubResponse,
+    get_github_client,
+    reset_github_client,
+)
+
+
+class _RecordingHandler(BaseHTTPRequestHandler):
+    """Serve canned responses and record each request with its client port"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self._handle()
+
+    def do_POST(self):
+        self._handle()
+
+    def _handle(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length) if length else b""
+        self.server.requests.append({
+            "method": self.command,
+            "path": self.path,
+            "headers": dict(self.headers),
+            "body": body,
+            "client_port": self.client_address[1],
+        })
+
+        if self.path.startswith("/redirect"):
+            self._respond(302, b"", {"Location": f"http://localhost:{self.server.server_port}/final"})
+        elif self.path == "/final":
+            self._respond(200, b"zip-bytes")
+        elif self.path == "/etag":
+            if self.headers.get("If-None-Match") == '"v1"':
+                self._respond(304, b"", {"ETag": '"v1"'})
+            else:
+                self._respond(200, json.dumps({"version": 1}).encode(), {"ETag": '"v1"'})
+        elif self.path == "/flaky":
+            self.server.flaky_calls = getattr(self.server, "flaky_calls", 0) + 1
+            if self.server.flaky_calls == 1:
+                self._respond(503, json.dumps({"message": "Service Unavailable"}).encode())
+            else:
+                self._respond(200, json.dumps({"ok": True}).encode(), {"X-RateLimit-Remaining": "4999"})
+        elif self.path.startswith("/missing"):
+            self._respond(404, json.dumps({"message": "Not Found"}).encode())
+        elif self.path == "/graphql":
+            payload = json.loads(body)
+            if "bad" in payload["query"]:
+                self._respond(200, json.dumps({"errors": [{"message": "Field 'bad' doesn't exist"}]}).encode())
+            else:
+                self._respond(200, json.dumps({"data": {"echo": payload.get("variables")}}).encode())
+        else:
+            self._respond(200, json.dumps({"path": self.path}).encode())
+
+    def _respond(self, status, body, headers=None):
+        self.send_response(status)
+        if status != 304:
+            self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def api_server():
+    """Local HTTP/1.1 keep-alive server standing in for api.github.com"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _RecordingHandler)
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(api_server):
+    """GitHubClient pointed at the local server"""
+    github_client = GitHubClient(token="test-token", api_url=f"http://127.0.0.1:{api_server.server_port}")
+    yield github_client
+    github_client.close()
+
+
+class TestGitHubClientApi:
+    """Test suite for GitHubClient.api"""
+
+    def test_api_returns_parsed_json(self, client, api_server):
+        """Should return the parsed JSON body"""
+        # Act
+        result = client.api("/repos/owner/repo")
+
+        # Assert
+        assert result == {"path": "/repos/owner/repo"}
+
+    def test_api_sends_auth_and_version_headers(self, client, api_server):
+        """Should authenticate with the bearer token and pin the API version"""
+        # Act
+        client.api("/repos/owner/repo")
+
+        # Assert
+        headers = api_server.requests[0]["headers"]
+        assert headers["Authorization"] == "Bearer test-token"
+        assert headers["X-GitHub-Api-Version"] == "2022-11-28"
+        assert headers["Accept"] == "application/vnd.github+json"
+
+    def test_api_reuses_connection_across_calls(self, client, api_server):
+        """Should send sequential requests over one keep-alive connection"""
+        # Act
+        for _ in range(5):
+            client.api("/repos/owner/repo")
+
+        # Assert
+        ports = {request["client_port"] for request in api_server.requests}
+        assert len(api_server.requests) == 5
+        assert len(ports) == 1
+
+    def test_api_sends_json_body(self, client, api_server):
+        """Should serialize data as a JSON request body"""
+        # Act
+        client.api("/repos/owner/repo/issues/1/labels", method="POST", data={"labels": ["claudechain"]})
+
+        # Assert
+        request = api_server.requests[0]
+        assert request["method"] == "POST"
+        assert json.loads(request["body"]) == {"labels": ["claudechain"]}
+        assert request["headers"]["Content-Type"] == "application/json"
+
+    def test_api_raises_with_status_code_on_error(self, client):
+        """Should raise GitHubAPIError carrying the HTTP status"""
+        # Act & Assert
+        with pytest.raises(GitHubAPIError) as exc_info:
+            client.api("/missing/file")
+
+        assert exc_info.value.status_code == 404
+        assert "Not Found" in str(exc_info.value)
+        assert "404" in str(exc_info.value)
+
+    def test_api_raises_on_connection_failure(self):
+        """Should wrap socket errors in GitHubAPIError"""
+        # Arrange
+        unreachable = GitHubClient(token="t", api_url="http://127.0.0.1:1", timeout=1)
+
+        # Act & Assert
+        with pytest.raises(GitHubAPIError, match="request failed"):
+            unreachable.api("/repos/owner/repo")
+
+
+class TestGitHubClientRateLimiting:
+    """Test suite for scheduling requests through the rate limiter"""
+
+    def test_retries_transient_server_errors(self, client, api_server):
+        """Should retry a 503 on GET and record the budget"""
+        # Act
+        result = client.api("/flaky")
+
+        # Assert
+        assert result == {"ok": True}
+        assert len(api_server.requests) == 2
+        assert client.rate_limiter.budget.retries == 1
+        assert client.rate_limiter.budget.remaining == 4999
+
+    def test_does_not_retry_post_after_server_error(self, client, api_server):
+        """Should not repeat a non-idempotent request"""
+        # Act & Assert
+        with pytest.raises(GitHubAPIError) as exc_info:
+            client.api("/flaky", method="POST", data={})
+
+        assert exc_info.value.status_code == 503
+        assert len(api_server.requests) == 1
+
+
+class TestGitHubClientDownload:
+    """Test suite for GitHubClient.download"""
+
+    def test_download_follows_redirect(self, client, api_server):
+        """Should follow redirects and return the final body"""
+        # Act
+        result = client.download("/redirect/artifact.zip")
+
+        # Assert
+        assert result == b"zip-bytes"
+        assert [r["path"] for r in api_server.requests] == ["/redirect/artifact.zip", "/final"]
+
+    def test_download_rejects_body_over_max_bytes(self, client, api_server):
+        """Should abort once the body exceeds the size cap"""
+        # Act & Assert
+        with pytest.raises(GitHubAPIError, match="exceeds 4 bytes"):
+            client.download("/redirect/artifact.zip", max_bytes=4)
+
+    def test_download_drops_auth_header_on_other_hosts(self, client, api_server):
+        """Should not forward the token to redirect targets on another host"""
+        # Act
+        client.download("/redirect/artifact.zip")
+
+        # Assert
+        assert "Authorization" in api_server.requests[0]["headers"]
+        assert "Authorization" not in api_server.requests[1]["headers"]
+
+
+class TestGitHubClientGraphql:
+    """Test suite for GitHubClient.graphql"""
+
+    def test_graphql_returns_data(self, client, api_server):
+        """Should post the query and return the data object"""
+        # Act
+        result = client.graphql("query($n: Int) { viewer { login } }", {"n": 1})
+
+        # Assert
+        assert result == {"echo": {"n": 1}}
+        assert api_server.requests[0]["path"] == "/graphql"
+
+    def test_graphql_raises_on_errors(self, client):
+        """Should raise GitHubAPIError when the response contains errors"""
+        # Act & Assert
+        with pytest.raises(GitHubAPIError, match="doesn't exist"):
+            client.graphql("query { bad }")
+
+
+class TestGitHubClientCache:
+    """Test suite for conditional requests through HttpCache"""
+
+    def test_revalidates_with_etag_and_serves_304_from_cache(self, api_server, tmp_path):
+        """Should send If-None-Match and return the cached body on 304"""
+        # Arrange
+        cache = HttpCache(tmp_path)
+        client = GitHubClient(
+            token="t", api_url=f"http://127.0.0.1:{api_server.server_port}", cache=cache
+        )
+
+        # Act
+        first = client.api("/etag")
+        second = client.api("/etag")
+
+        # Assert
+        assert first == second == {"version": 1}
+        assert "If-None-Match" not in api_server.requests[0]["headers"]
+        assert api_server.requests[1]["headers"]["If-None-Match"] == '"v1"'
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        client.close()
+
+    def test_does_not_cache_non_get_requests(self, api_server, tmp_path):
+        """Should bypass the cache for requests with a body"""
+        # Arrange
+        cache = HttpCache(tmp_path)
+        client = GitHubClient(
+            token="t", api_url=f"http://127.0.0.1:{api_server.server_port}", cache=cache
+        )
+
+        # Act
+        client.api("/repos/owner/repo", method="POST", data={"x": 1})
+
+        # Assert
+        assert cache.stats.requests == 0
+        client.close()
+
+    def test_shared_client_uses_cache_dir_env(self, monkeypatch, tmp_path):
+        """Should attach an HttpCache when CLAUDECHAIN_CACHE_DIR is set"""
+        # Arrange
+        monkeypatch.setenv("GH_TOKEN", "abc")
+        monkeypatch.setenv("CLAUDECHAIN_CACHE_DIR", str(tmp_path))
+
+        # Act
+        client = get_github_client()
+
+        # Assert
+        assert client.cache is not None
+        assert client.cache.directory == tmp_path / "http"
+
+
+class TestGitHubResponse:
+    """Test suite for GitHubResponse"""
+
+    def test_json_returns_empty_dict_for_empty_body(self):
+        """Should treat empty bodies (e.g. 204) as {}"""
+        assert GitHubResponse(status=204).json() == {}
+
+    def test_header_lookup_is_case_insensitive(self):
+        """Should look up headers regardless of case"""
+        response = GitHubResponse(status=200, headers={"x-ratelimit-remaining": "42"})
+        assert response.header("X-RateLimit-Remaining") == "42"
+
+
+class TestGetGithubClient:
+    """Test suite for get_github_client"""
+
+    def test_returns_none_without_token(self):
+        """Should return None so callers fall back to the gh CLI"""
+        assert get_github_client() is None
+
+    def test_returns_shared_client_with_token(self, monkeypatch):
+        """Should create one client per process from GH_TOKEN"""
+        # Arrange
+        monkeypatch.setenv("GH_TOKEN", "abc")
+
+        # Act
+        first = get_github_client()
+        second = get_github_client()
+
+        # Assert
+        assert first is not None
+        assert first is second
+        assert first.token == "abc"
+
+    def test_uses_github_token_and_api_url(self, monkeypatch):
+        """Should fall back to GITHUB_TOKEN and honor GITHUB_API_URL"""
+        # Arrange
+        monkeypatch.setenv("GITHUB_TOKEN", "xyz")
+        monkeypatch.setenv("GITHUB_API_URL", "https://ghe.example.com/api/v3")
+
+        # Act
+        client = get_github_client()
+
+        # Assert
+        assert client.token == "xyz"
+        assert client.api_url == "https://ghe.example.com/api/v3"
+
+    def test_reset_discards_client(self, monkeypatch):
+        """Should create a new client after reset"""
+        # Arrange
+        monkeypatch.setenv("GH_TOKEN", "abc")
+        first = get_github_client()
+
+        # Act
+        reset_github_client()
+
+        # Assert
+        assert get_github_client() is not first
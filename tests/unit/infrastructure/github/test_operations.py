@@ -12,6 +12,8 @@ import pytest
 
 from claudechain.domain.exceptions import GitHubAPIError
 from claudechain.infrastructure.github.operations import (
+    FILES_PER_GRAPHQL_QUERY,
+    MAX_ARTIFACT_ZIP_BYTES,
     add_label_to_pr,
     compare_commits,
     detect_project_from_diff,
@@ -19,11 +21,16 @@ from claudechain.infrastructure.github.operations import (
     ensure_label_exists,
     file_exists_in_branch,
     get_file_from_branch,
+    get_files_from_branch,
     gh_api_call,
+    gh_graphql_call,
+    list_all_pull_requests,
     list_merged_pull_requests,
     list_open_pull_requests,
     list_pull_requests,
+    list_pull_requests_updated_since,
     run_gh_command,
+    trigger_workflow,
 )
 
 
@@ -202,28 +209,27 @@ class TestGhApiCall:
 class TestDownloadArtifactJson:
     """Test suite for download_artifact_json function"""
 
+    @staticmethod
+    def _zip_bytes(files):
+        """Build an in-memory zip archive from a name -> content mapping"""
+        import io
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zf:
+            for name, content in files.items():
+                zf.writestr(name, content)
+        return buffer.getvalue()
+
     @patch('claudechain.infrastructure.github.operations.subprocess.run')
-    @patch('claudechain.infrastructure.github.operations.zipfile.ZipFile')
-    @patch('claudechain.infrastructure.github.operations.os.path.exists')
-    @patch('claudechain.infrastructure.github.operations.os.remove')
-    def test_download_artifact_json_success(self, mock_remove, mock_exists, mock_zipfile, mock_subprocess):
+    def test_download_artifact_json_success(self, mock_subprocess):
         """Should download, extract, and parse artifact JSON"""
         # Arrange
         repo = "owner/repo"
         artifact_id = 12345
         expected_data = {"cost": 1.23, "task": "test"}
-
-        mock_subprocess.return_value = Mock(returncode=0)
-        mock_exists.return_value = True
-
-        mock_zip = Mock()
-        mock_zip.namelist.return_value = ["metadata.json", "other.txt"]
-        mock_zip.open.return_value.__enter__ = Mock(return_value=Mock(
-            read=Mock(return_value=json.dumps(expected_data).encode())
-        ))
-        mock_zip.open.return_value.__exit__ = Mock(return_value=False)
-        mock_zipfile.return_value.__enter__.return_value = mock_zip
-        mock_zipfile.return_value.__exit__ = Mock(return_value=False)
+        mock_subprocess.return_value = Mock(
+            returncode=0,
+            stdout=self._zip_bytes({"metadata.json": json.dumps(expected_data), "other.txt": "x"}),
+        )
 
         # Act
         result = download_artifact_json(repo, artifact_id)
@@ -237,53 +243,46 @@ class TestDownloadArtifactJson:
         assert f"/repos/{repo}/actions/artifacts/{artifact_id}/zip" in args
 
     @patch('claudechain.infrastructure.github.operations.subprocess.run')
-    @patch('claudechain.infrastructure.github.operations.zipfile.ZipFile')
-    @patch('claudechain.infrastructure.github.operations.os.path.exists')
-    @patch('claudechain.infrastructure.github.operations.os.remove')
-    def test_download_artifact_json_cleans_up_temp_file(self, mock_remove, mock_exists, mock_zipfile, mock_subprocess):
-        """Should clean up temporary zip file after processing"""
+    def test_download_artifact_json_reads_cli_output_in_memory(self, mock_subprocess):
+        """Should capture the zip from gh stdout instead of writing a temp file"""
         # Arrange
-        repo = "owner/repo"
-        artifact_id = 12345
+        mock_subprocess.return_value = Mock(
+            returncode=0, stdout=self._zip_bytes({"data.json": '{"key": "value"}'})
+        )
 
-        mock_subprocess.return_value = Mock(returncode=0)
-        mock_exists.return_value = True
+        # Act
+        download_artifact_json("owner/repo", 12345)
 
-        mock_zip = Mock()
-        mock_zip.namelist.return_value = ["data.json"]
-        mock_zip.open.return_value.__enter__ = Mock(return_value=Mock(
-            read=Mock(return_value=b'{"key": "value"}')
-        ))
-        mock_zip.open.return_value.__exit__ = Mock(return_value=False)
-        mock_zipfile.return_value.__enter__.return_value = mock_zip
-        mock_zipfile.return_value.__exit__ = Mock(return_value=False)
+        # Assert
+        assert mock_subprocess.call_args[1]["capture_output"] is True
+        assert "stdout" not in mock_subprocess.call_args[1]
+
+    @patch('claudechain.infrastructure.github.operations.subprocess.run')
+    def test_download_artifact_json_rejects_oversized_archive(self, mock_subprocess, capsys):
+        """Should return None when the archive exceeds max_bytes"""
+        # Arrange
+        mock_subprocess.return_value = Mock(
+            returncode=0, stdout=self._zip_bytes({"data.json": '{"key": "value"}'})
+        )
 
         # Act
-        download_artifact_json(repo, artifact_id)
+        result = download_artifact_json("owner/repo", 12345, max_bytes=10)
 
         # Assert
-        mock_remove.assert_called_once()
+        assert result is None
+        captured = capsys.readouterr()
+        assert "exceeds 10 bytes" in captured.out
 
     @patch('claudechain.infrastructure.github.operations.subprocess.run')
-    @patch('claudechain.infrastructure.github.operations.zipfile.ZipFile')
-    @patch('claudechain.infrastructure.github.operations.os.path.exists')
-    @patch('claudechain.infrastructure.github.operations.os.remove')
-    def test_download_artifact_json_returns_none_when_no_json_in_zip(self, mock_remove, mock_exists, mock_zipfile, mock_subprocess, capsys):
+    def test_download_artifact_json_returns_none_when_no_json_in_zip(self, mock_subprocess, capsys):
         """Should return None when no JSON file found in artifact"""
         # Arrange
-        repo = "owner/repo"
-        artifact_id = 12345
-
-        mock_subprocess.return_value = Mock(returncode=0)
-        mock_exists.return_value = True
-
-        mock_zip = Mock()
-        mock_zip.namelist.return_value = ["readme.txt", "data.csv"]  # No JSON files
-        mock_zipfile.return_value.__enter__.return_value = mock_zip
-        mock_zipfile.return_value.__exit__ = Mock(return_value=False)
+        mock_subprocess.return_value = Mock(
+            returncode=0, stdout=self._zip_bytes({"readme.txt": "x", "data.csv": "y"})
+        )
 
         # Act
-        result = download_artifact_json(repo, artifact_id)
+        result = download_artifact_json("owner/repo", 12345)
 
         # Assert
         assert result is None
@@ -307,29 +306,15 @@ class TestDownloadArtifactJson:
         assert "Failed to download/parse artifact" in captured.out
 
     @patch('claudechain.infrastructure.github.operations.subprocess.run')
-    @patch('claudechain.infrastructure.github.operations.zipfile.ZipFile')
-    @patch('claudechain.infrastructure.github.operations.os.path.exists')
-    @patch('claudechain.infrastructure.github.operations.os.remove')
-    def test_download_artifact_json_returns_none_on_parse_error(self, mock_remove, mock_exists, mock_zipfile, mock_subprocess, capsys):
+    def test_download_artifact_json_returns_none_on_parse_error(self, mock_subprocess, capsys):
         """Should return None when JSON parsing fails"""
         # Arrange
-        repo = "owner/repo"
-        artifact_id = 12345
-
-        mock_subprocess.return_value = Mock(returncode=0)
-        mock_exists.return_value = True
-
-        mock_zip = Mock()
-        mock_zip.namelist.return_value = ["data.json"]
-        mock_zip.open.return_value.__enter__ = Mock(return_value=Mock(
-            read=Mock(return_value=b'invalid json {{')
-        ))
-        mock_zip.open.return_value.__exit__ = Mock(return_value=False)
-        mock_zipfile.return_value.__enter__.return_value = mock_zip
-        mock_zipfile.return_value.__exit__ = Mock(return_value=False)
+        mock_subprocess.return_value = Mock(
+            returncode=0, stdout=self._zip_bytes({"data.json": "invalid json {{"})
+        )
 
         # Act
-        result = download_artifact_json(repo, artifact_id)
+        result = download_artifact_json("owner/repo", 12345)
 
         # Assert
         assert result is None
@@ -1227,3 +1212,298 @@ class TestDetectProjectFromDiff:
 
         # Assert
         assert result == "my-project"
+
+
+class TestGitHubClientRouting:
+    """Test suite for routing operations through the pooled GitHubClient"""
+
+    @patch('claudechain.infrastructure.github.operations.run_gh_command')
+    @patch('claudechain.infrastructure.github.operations.get_github_client')
+    def test_gh_api_call_uses_client_when_available(self, mock_get_client, mock_run_gh):
+        """Should call the REST client instead of spawning gh"""
+        # Arrange
+        mock_client = Mock()
+        mock_client.api.return_value = {"id": 1}
+        mock_get_client.return_value = mock_client
+
+        # Act
+        result = gh_api_call("/repos/owner/repo", method="GET")
+
+        # Assert
+        assert result == {"id": 1}
+        mock_client.api.assert_called_once_with("/repos/owner/repo", method="GET")
+        mock_run_gh.assert_not_called()
+
+    @patch('claudechain.infrastructure.github.operations.run_gh_command')
+    def test_gh_graphql_call_falls_back_to_gh_cli(self, mock_run_gh):
+        """Should use gh api graphql with typed fields when no token is set"""
+        # Arrange
+        mock_run_gh.return_value = json.dumps({"data": {"viewer": {"login": "bot"}}})
+
+        # Act
+        result = gh_graphql_call("query { viewer { login } }", {"owner": "o", "first": 5, "labels": ["a"], "after": None})
+
+        # Assert
+        assert result == {"viewer": {"login": "bot"}}
+        args = mock_run_gh.call_args[0][0]
+        assert args[:2] == ["api", "graphql"]
+        assert "owner=o" in args
+        assert "first=5" in args
+        assert "labels[]=a" in args
+        assert not any(arg.startswith("after=") for arg in args)
+
+    @patch('claudechain.infrastructure.github.operations.run_gh_command')
+    def test_gh_graphql_call_raises_on_errors(self, mock_run_gh):
+        """Should raise GitHubAPIError when GraphQL returns errors"""
+        # Arrange
+        mock_run_gh.return_value = json.dumps({"errors": [{"message": "boom"}]})
+
+        # Act & Assert
+        with pytest.raises(GitHubAPIError, match="boom"):
+            gh_graphql_call("query { x }")
+
+    @patch('claudechain.infrastructure.github.operations.gh_graphql_call')
+    def test_get_files_from_branch_uses_aliased_object_expressions(self, mock_graphql):
+        """Should fetch all files in one GraphQL query keyed by alias"""
+        # Arrange
+        mock_graphql.return_value = {"repository": {
+            "f0": {"text": "- [ ] Task", "isBinary": False, "isTruncated": False},
+            "f1": None,
+        }}
+
+        # Act
+        result = get_files_from_branch("owner/repo", "main", ["a/spec.md", "a/configuration.yml"])
+
+        # Assert
+        assert result == {"a/spec.md": "- [ ] Task", "a/configuration.yml": None}
+        mock_graphql.assert_called_once()
+        query, variables = mock_graphql.call_args[0]
+        assert "f0: object(expression: $e0)" in query
+        assert variables["e0"] == "main:a/spec.md"
+        assert variables["e1"] == "main:a/configuration.yml"
+        assert variables["owner"] == "owner"
+
+    @patch('claudechain.infrastructure.github.operations.get_file_from_branch')
+    @patch('claudechain.infrastructure.github.operations.gh_graphql_call')
+    def test_get_files_from_branch_refetches_truncated_blobs(self, mock_graphql, mock_get_file):
+        """Should fall back to the contents API for truncated blobs"""
+        # Arrange
+        mock_graphql.return_value = {"repository": {
+            "f0": {"text": "partial", "isBinary": False, "isTruncated": True},
+        }}
+        mock_get_file.return_value = "full content"
+
+        # Act
+        result = get_files_from_branch("owner/repo", "main", ["big/spec.md"])
+
+        # Assert
+        assert result == {"big/spec.md": "full content"}
+        mock_get_file.assert_called_once_with("owner/repo", "main", "big/spec.md")
+
+    @patch('claudechain.infrastructure.github.operations.gh_graphql_call')
+    def test_get_files_from_branch_batches_large_requests(self, mock_graphql):
+        """Should split requests into batches of FILES_PER_GRAPHQL_QUERY"""
+        # Arrange
+        mock_graphql.return_value = {"repository": {}}
+        paths = [f"p{i}/spec.md" for i in range(FILES_PER_GRAPHQL_QUERY + 1)]
+
+        # Act
+        result = get_files_from_branch("owner/repo", "main", paths)
+
+        # Assert
+        assert mock_graphql.call_count == 2
+        assert len(result) == len(paths)
+
+    @patch('claudechain.infrastructure.github.operations.get_github_client')
+    def test_list_pull_requests_pages_graphql_results(self, mock_get_client):
+        """Should page through GraphQL results and flatten nested connections"""
+        # Arrange
+        def node(number, login):
+            return {
+                "number": number, "title": f"PR {number}", "state": "OPEN",
+                "createdAt": "2024-01-01T00:00:00Z", "mergedAt": None,
+                "headRefName": f"claude-chain-proj-{number:08x}", "baseRefName": "main",
+                "url": f"https://github.com/owner/repo/pull/{number}",
+                "assignees": {"nodes": [{"login": login}]},
+                "labels": {"nodes": [{"name": "claudechain"}]},
+            }
+
+        mock_client = Mock()
+        mock_client.graphql.side_effect = [
+            {"repository": {"pullRequests": {
+                "pageInfo": {"hasNextPage": True, "endCursor": "c1"},
+                "nodes": [node(1, "alice"), node(2, "bob")],
+            }}},
+            {"repository": {"pullRequests": {
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+                "nodes": [node(3, "alice")],
+            }}},
+        ]
+        mock_get_client.return_value = mock_client
+
+        # Act
+        prs = list_pull_requests("owner/repo", state="open", label="claudechain", assignee="alice")
+
+        # Assert
+        assert [pr.number for pr in prs] == [1, 3]
+        assert prs[0].assignees[0].login == "alice"
+        assert prs[0].has_label("claudechain")
+        first_vars = mock_client.graphql.call_args_list[0][0][1]
+        second_vars = mock_client.graphql.call_args_list[1][0][1]
+        assert first_vars["states"] == ["OPEN"]
+        assert first_vars["labels"] == ["claudechain"]
+        assert second_vars["after"] == "c1"
+
+    @patch('claudechain.infrastructure.github.operations.get_github_client')
+    def test_download_artifact_json_reads_zip_in_memory(self, mock_get_client):
+        """Should download the artifact through the client without temp files"""
+        # Arrange
+        import io
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zf:
+            zf.writestr("metadata.json", json.dumps({"cost": 1.5}))
+        mock_client = Mock()
+        mock_client.download.return_value = buffer.getvalue()
+        mock_get_client.return_value = mock_client
+
+        # Act
+        result = download_artifact_json("owner/repo", 42)
+
+        # Assert
+        assert result == {"cost": 1.5}
+        mock_client.download.assert_called_once_with(
+            "/repos/owner/repo/actions/artifacts/42/zip", max_bytes=MAX_ARTIFACT_ZIP_BYTES
+        )
+
+    @patch('claudechain.infrastructure.github.operations.get_github_client')
+    def test_add_label_to_pr_uses_issues_api(self, mock_get_client):
+        """Should add labels through the issues endpoint"""
+        # Arrange
+        mock_client = Mock()
+        mock_get_client.return_value = mock_client
+
+        # Act
+        result = add_label_to_pr("owner/repo", 7, "claudechain")
+
+        # Assert
+        assert result is True
+        mock_client.api.assert_called_once_with(
+            "/repos/owner/repo/issues/7/labels", method="POST", data={"labels": ["claudechain"]}
+        )
+
+    @patch('claudechain.infrastructure.github.operations.get_github_client')
+    def test_trigger_workflow_posts_dispatch(self, mock_get_client):
+        """Should dispatch the workflow through the REST API"""
+        # Arrange
+        mock_client = Mock()
+        mock_get_client.return_value = mock_client
+
+        # Act
+        trigger_workflow("owner/repo", "claudechain.yml", {"project_name": "p"}, "main")
+
+        # Assert
+        mock_client.api.assert_called_once_with(
+            "/repos/owner/repo/actions/workflows/claudechain.yml/dispatches",
+            method="POST",
+            data={"ref": "main", "inputs": {"project_name": "p"}},
+        )
+
+    @patch('claudechain.infrastructure.github.operations.run_gh_command')
+    def test_list_all_pull_requests_pages_until_exhausted(self, mock_run_gh):
+        """Should request every page with GraphQL even without a token"""
+        # Arrange
+        def page(numbers, has_next, cursor):
+            return json.dumps({"data": {"repository": {"pullRequests": {
+                "pageInfo": {"hasNextPage": has_next, "endCursor": cursor},
+                "nodes": [{
+                    "number": n, "title": f"PR {n}", "state": "MERGED",
+                    "createdAt": "2024-01-01T00:00:00Z", "mergedAt": "2024-01-02T00:00:00Z",
+                    "headRefName": f"claude-chain-proj-{n:08x}", "baseRefName": "main",
+                    "url": "", "assignees": {"nodes": []}, "labels": {"nodes": []},
+                } for n in numbers],
+            }}}})
+
+        mock_run_gh.side_effect = [page(range(1, 101), True, "c1"), page([101, 102], False, None)]
+
+        # Act
+        prs = list_all_pull_requests("owner/repo", label="claudechain")
+
+        # Assert
+        assert len(prs) == 102
+        assert mock_run_gh.call_count == 2
+        second_args = mock_run_gh.call_args_list[1][0][0]
+        assert "after=c1" in second_args
+        assert "labels[]=claudechain" in second_args
+
+    @patch('claudechain.infrastructure.github.operations.gh_graphql_call')
+    def test_list_pull_requests_updated_since_stops_at_older_pr(self, mock_graphql):
+        """Should order by update time and stop paging at the first older PR"""
+        # Arrange
+        def node(number, updated_at):
+            return {
+                "number": number, "title": f"PR {number}", "state": "OPEN",
+                "createdAt": "2024-01-01T00:00:00Z", "mergedAt": None, "updatedAt": updated_at,
+                "headRefName": f"claude-chain-proj-{number:08x}", "baseRefName": "main",
+                "url": "", "assignees": {"nodes": []}, "labels": {"nodes": []},
+            }
+
+        mock_graphql.return_value = {"repository": {"pullRequests": {
+            "pageInfo": {"hasNextPage": True, "endCursor": "c1"},
+            "nodes": [node(3, "2024-03-03T00:00:00Z"), node(2, "2024-03-02T00:00:00Z"), node(1, "2024-02-01T00:00:00Z")],
+        }}}
+
+        # Act
+        prs = list_pull_requests_updated_since(
+            "owner/repo", "claudechain", datetime(2024, 3, 1, tzinfo=timezone.utc)
+        )
+
+        # Assert
+        assert [pr.number for pr in prs] == [3, 2]
+        assert prs[0].updated_at == datetime(2024, 3, 3, tzinfo=timezone.utc)
+        mock_graphql.assert_called_once()
+        assert "field: UPDATED_AT" in mock_graphql.call_args[0][0]
+
+
+class TestRunGhCommandRetries:
+    """Test suite for rate-limit retries in run_gh_command"""
+
+    @patch('claudechain.infrastructure.github.operations.run_command')
+    def test_retries_secondary_rate_limit(self, mock_run):
+        """Should retry gh commands rejected by a rate limit"""
+        # Arrange
+        error = subprocess.CalledProcessError(
+            returncode=1, cmd=["gh"], stderr="You have exceeded a secondary rate limit"
+        )
+        mock_run.side_effect = [error, Mock(stdout="ok\n")]
+
+        # Act
+        result = run_gh_command(["pr", "create", "--title", "t"])
+
+        # Assert
+        assert result == "ok"
+        assert mock_run.call_count == 2
+
+    @patch('claudechain.infrastructure.github.operations.run_command')
+    def test_does_not_retry_server_error_for_pr_create(self, mock_run):
+        """Should not repeat PR creation after a 5xx (it may have succeeded)"""
+        # Arrange
+        error = subprocess.CalledProcessError(returncode=1, cmd=["gh"], stderr="HTTP 502: Bad Gateway")
+        mock_run.side_effect = error
+
+        # Act & Assert
+        with pytest.raises(GitHubAPIError):
+            run_gh_command(["pr", "create", "--title", "t"])
+        assert mock_run.call_count == 1
+
+    @patch('claudechain.infrastructure.github.operations.run_command')
+    def test_retries_server_error_for_reads(self, mock_run):
+        """Should retry read-only gh api calls after a 5xx"""
+        # Arrange
+        error = subprocess.CalledProcessError(returncode=1, cmd=["gh"], stderr="HTTP 502: Bad Gateway")
+        mock_run.side_effect = [error, Mock(stdout="{}")]
+
+        # Act
+        result = run_gh_command(["api", "/repos/o/r", "--method", "GET"])
+
+        # Assert
+        assert result == "{}"
@@ -0,0 +1,203 @@
+"""Tests for the GitHub rate limiter"""
+
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from claudechain.domain.exceptions import GitHubAPIError
+from claudechain.infrastructure.github.rate_limiter import (
+    RateLimitBudget,
+    RateLimiter,
+    get_rate_limiter,
+)
+
+
+class FakeClock:
+    """Monotonic clock advanced by the limiter's own sleeps"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def limiter(clock):
+    return RateLimiter(rate_per_second=2.0, burst=2, max_retries=3, sleep=clock.sleep, clock=clock)
+
+
+class TestAcquire:
+    """Test suite for the token bucket"""
+
+    def test_allows_burst_then_throttles_to_rate(self, limiter, clock):
+        """Should start `burst` requests immediately, then one per 1/rate seconds"""
+        # Act
+        for _ in range(4):
+            limiter.acquire()
+
+        # Assert
+        assert clock.sleeps == [pytest.approx(0.5), pytest.approx(0.5)]
+        assert limiter.budget.requests == 4
+        assert limiter.budget.throttled_seconds == pytest.approx(1.0)
+
+    def test_pauses_when_primary_limit_exhausted(self, limiter, clock):
+        """Should wait until reset when X-RateLimit-Remaining hits 0"""
+        # Arrange
+        reset = int(time.time()) + 30
+        limiter.update_from_headers({"x-ratelimit-remaining": "0", "x-ratelimit-reset": str(reset)})
+
+        # Act
+        limiter.acquire()
+
+        # Assert
+        assert clock.sleeps[0] >= 28
+
+    def test_honors_retry_after(self, limiter, clock):
+        """Should pause all callers for Retry-After seconds"""
+        # Arrange
+        limiter.update_from_headers({"retry-after": "7"})
+
+        # Act
+        limiter.acquire()
+
+        # Assert
+        assert clock.sleeps == [pytest.approx(7.0)]
+
+    def test_slows_down_when_budget_is_low(self, limiter):
+        """Should spread the remaining budget over the reset window"""
+        # Arrange
+        reset = int(time.time()) + 100
+
+        # Act
+        limiter.update_from_headers({"x-ratelimit-remaining": "10", "x-ratelimit-reset": str(reset)})
+
+        # Assert
+        assert limiter.rate == pytest.approx(0.1, rel=0.1)
+
+    def test_restores_rate_when_budget_recovers(self, limiter):
+        """Should go back to the base rate after the window resets"""
+        # Arrange
+        reset = int(time.time()) + 100
+        limiter.update_from_headers({"x-ratelimit-remaining": "10", "x-ratelimit-reset": str(reset)})
+
+        # Act
+        limiter.update_from_headers({"x-ratelimit-remaining": "4999", "x-ratelimit-reset": str(reset)})
+
+        # Assert
+        assert limiter.rate == 2.0
+
+
+class TestExecute:
+    """Test suite for retries"""
+
+    def test_retries_rate_limited_calls_until_success(self, limiter):
+        """Should retry 429s and return the eventual result"""
+        # Arrange
+        operation = Mock(side_effect=[GitHubAPIError("slow down", status_code=429), "ok"])
+
+        # Act
+        result = limiter.execute(operation)
+
+        # Assert
+        assert result == "ok"
+        assert operation.call_count == 2
+        assert limiter.budget.retries == 1
+
+    def test_does_not_retry_fatal_errors(self, limiter):
+        """Should raise 404s immediately"""
+        # Arrange
+        operation = Mock(side_effect=GitHubAPIError("Not Found", status_code=404))
+
+        # Act & Assert
+        with pytest.raises(GitHubAPIError):
+            limiter.execute(operation)
+        assert operation.call_count == 1
+
+    def test_gives_up_after_max_retries(self, limiter):
+        """Should re-raise once retries are exhausted"""
+        # Arrange
+        operation = Mock(side_effect=GitHubAPIError("bad gateway", status_code=502))
+
+        # Act & Assert
+        with pytest.raises(GitHubAPIError, match="bad gateway"):
+            limiter.execute(operation)
+        assert operation.call_count == 4
+
+    def test_does_not_retry_server_errors_for_mutations(self, limiter):
+        """Should not repeat non-idempotent requests after a 5xx"""
+        # Arrange
+        operation = Mock(side_effect=GitHubAPIError("server error", status_code=500))
+
+        # Act & Assert
+        with pytest.raises(GitHubAPIError):
+            limiter.execute(operation, idempotent=False)
+        assert operation.call_count == 1
+
+    def test_backoff_is_jittered_and_capped(self, limiter):
+        """Should grow exponentially with jitter and never exceed max_delay"""
+        # Act
+        delays = [limiter.backoff_delay(attempt) for attempt in range(10)]
+
+        # Assert
+        assert 0.5 <= delays[0] <= 1.0
+        assert 4.0 <= delays[3] <= 8.0
+        assert all(delay <= limiter.max_delay for delay in delays)
+
+
+class TestIsRetryable:
+    """Test suite for error classification"""
+
+    @pytest.mark.parametrize("error,idempotent,expected", [
+        (GitHubAPIError("x", status_code=429), False, True),
+        (GitHubAPIError("API rate limit exceeded", status_code=403), False, True),
+        (GitHubAPIError("Resource not accessible", status_code=403), True, False),
+        (GitHubAPIError("x", status_code=503), True, True),
+        (GitHubAPIError("x", status_code=503), False, False),
+        (GitHubAPIError("x", status_code=422), True, False),
+        (GitHubAPIError("GitHub CLI command failed\nYou have exceeded a secondary rate limit"), False, True),
+        (GitHubAPIError("GitHub CLI command failed\nHTTP 502: Bad Gateway"), True, True),
+        (GitHubAPIError("GitHub CLI command failed\nHTTP 404: Not Found"), True, False),
+    ])
+    def test_classification(self, error, idempotent, expected):
+        """Should tell transient failures apart from fatal ones"""
+        assert RateLimiter.is_retryable(error, idempotent) is expected
+
+
+class TestRateLimitBudget:
+    """Test suite for budget reporting"""
+
+    def test_reports_points_used_from_headers(self):
+        """Should compute points used from the first and last remaining counts"""
+        # Arrange
+        limiter = RateLimiter(sleep=lambda s: None)
+        limiter.update_from_headers({"x-ratelimit-remaining": "4990", "x-ratelimit-limit": "5000"})
+        limiter.update_from_headers({"x-ratelimit-remaining": "4980", "x-ratelimit-limit": "5000"})
+
+        # Act
+        line = limiter.budget.format_line("statistics")
+
+        # Assert
+        assert limiter.budget.used == 11
+        assert "GitHub API budget (statistics)" in line
+        assert "4980/5000 remaining" in line
+
+    def test_summary_without_header_data(self):
+        """Should render n/a when only gh CLI calls were made"""
+        summary = RateLimitBudget(requests=3).format_summary()
+        assert "| 3 | 0 | n/a | n/a | 0.0s |" in summary
+
+    def test_shared_limiter_is_process_wide(self):
+        """Should return the same limiter on every call"""
+        assert get_rate_limiter() is get_rate_limiter()
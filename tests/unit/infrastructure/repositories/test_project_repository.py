@@ -814,3 +814,71 @@ Ensure backward compatibility with existing sessions.
 
         assert spec is not None
         assert spec.total_tasks == 2
+
+
+class TestProjectRepositoryLoadAll:
+    """Test suite for ProjectRepository.load_all method"""
+
+    @patch('claudechain.infrastructure.github.operations.get_files_from_branch')
+    def test_load_all_fetches_every_file_in_one_call(self, mock_get_files):
+        """Should request all specs and configs together and parse them"""
+        # Arrange
+        repo = ProjectRepository("owner/repo")
+        api, web = Project("api"), Project("web")
+        mock_get_files.return_value = {
+            api.spec_path: "- [ ] Task 1",
+            api.config_path: "assignee: alice",
+            web.spec_path: "- [x] Done",
+            web.config_path: None,
+        }
+
+        # Act
+        result = repo.load_all([api, web], "develop")
+
+        # Assert
+        mock_get_files.assert_called_once_with(
+            "owner/repo", "develop",
+            [api.spec_path, api.config_path, web.spec_path, web.config_path],
+        )
+        api_config, api_spec = result["api"]
+        web_config, web_spec = result["web"]
+        assert api_config.assignee == "alice"
+        assert api_spec.total_tasks == 1
+        assert web_config.assignee is None
+        assert web_spec.completed_tasks == 1
+
+    @patch('claudechain.infrastructure.github.operations.get_files_from_branch')
+    def test_load_all_returns_none_spec_when_missing(self, mock_get_files):
+        """Should keep the project with a None spec when spec.md is missing"""
+        # Arrange
+        repo = ProjectRepository("owner/repo")
+        project = Project("api")
+        mock_get_files.return_value = {project.spec_path: None, project.config_path: None}
+
+        # Act
+        result = repo.load_all([project], "main")
+
+        # Assert
+        config, spec = result["api"]
+        assert spec is None
+        assert isinstance(config, ProjectConfiguration)
+
+    @patch('claudechain.infrastructure.github.operations.get_files_from_branch')
+    def test_load_all_skips_projects_with_invalid_config(self, mock_get_files, capsys):
+        """Should leave out projects whose configuration cannot be parsed"""
+        # Arrange
+        repo = ProjectRepository("owner/repo")
+        bad, good = Project("bad"), Project("good")
+        mock_get_files.return_value = {
+            bad.spec_path: "- [ ] Task",
+            bad.config_path: "assignee: [unclosed",
+            good.spec_path: "- [ ] Task",
+            good.config_path: None,
+        }
+
+        # Act
+        result = repo.load_all([bad, good], "main")
+
+        # Assert
+        assert list(result) == ["good"]
+        assert "Invalid configuration for project bad" in capsys.readouterr().out
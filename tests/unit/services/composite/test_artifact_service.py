@@ -5,7 +5,7 @@ interface for working with GitHub workflow artifacts containing task metadata.
 """
 
 import json
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, patch
 
 import pytest
@@ -13,13 +13,17 @@ import pytest
 from claudechain.services.composite.artifact_service import (
     ProjectArtifact,
     TaskMetadata,
+    download_artifact_metadata,
+    find_artifacts_for_projects,
     find_in_progress_tasks,
     find_project_artifacts,
     get_artifact_metadata,
     get_assignee_assignments,
+    parse_project_from_artifact_name,
     parse_task_index_from_name,
 )
 from claudechain.domain.models import AITask
+from claudechain.infrastructure.cache.artifact_store import get_artifact_store
 from claudechain.domain.exceptions import GitHubAPIError
 
 
@@ -343,37 +347,35 @@ class TestParseTaskIndexFromName:
         assert result is None
 
 
+def _artifact(artifact_id, name, days_ago=1, run_id=100, expired=False):
+    """Build an artifacts-listing entry created `days_ago` days before now"""
+    created_at = datetime.now(timezone.utc) - timedelta(days=days_ago)
+    return {
+        "id": artifact_id,
+        "name": name,
+        "expired": expired,
+        "created_at": created_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "workflow_run": {"id": run_id},
+    }
+
+
 class TestFindProjectArtifacts:
     """Test suite for find_project_artifacts function"""
 
     @patch("claudechain.services.composite.artifact_service.gh_api_call")
-    def test_find_project_artifacts_queries_specific_workflow(
+    def test_find_project_artifacts_uses_repo_wide_listing(
         self, mock_gh_api_call
     ):
-        """Should query workflow runs for the specific workflow name"""
+        """Should list artifacts repo-wide instead of walking workflow runs"""
         # Arrange
-        mock_gh_api_call.side_effect = [
-            {
-                "workflow_runs": [
-                    {"id": 100, "conclusion": "success"},
-                ]
-            },
-            # Mock artifacts response
-            {
-                "artifacts": [
-                    {
-                        "id": 1,
-                        "name": "task-metadata-test-1.json",
-                    }
-                ]
-            },
-        ]
+        mock_gh_api_call.return_value = {
+            "artifacts": [_artifact(1, "task-metadata-test-1.json", run_id=100)]
+        }
 
         # Act
         result = find_project_artifacts(
             repo="owner/repo",
             project="test",
-            workflow_file="Claude Chain",
             download_metadata=False,
         )
 
@@ -383,37 +385,34 @@ class TestFindProjectArtifacts:
         assert result[0].artifact_name == "task-metadata-test-1.json"
         assert result[0].workflow_run_id == 100
         assert result[0].metadata is None
-        # Verify the workflow-specific API was called with URL-encoded name
-        mock_gh_api_call.assert_any_call(
-            "/repos/owner/repo/actions/workflows/Claude%20Chain/runs?status=completed&per_page=50"
+        assert result[0].created_at is not None
+        mock_gh_api_call.assert_called_once_with(
+            "/repos/owner/repo/actions/artifacts?per_page=100&page=1"
         )
 
     @patch("claudechain.services.composite.artifact_service.gh_api_call")
-    def test_find_project_artifacts_filters_by_project_name(
+    def test_find_project_artifacts_filters_by_exact_project_name(
         self, mock_gh_api_call
     ):
-        """Should only return artifacts matching the project name"""
+        """Should not match projects that merely share a name prefix"""
         # Arrange
-        mock_gh_api_call.side_effect = [
-            {"workflow_runs": [{"id": 100, "conclusion": "success"}]},
-            {
-                "artifacts": [
-                    {"id": 1, "name": "task-metadata-test-1.json"},
-                    {"id": 2, "name": "task-metadata-other-1.json"},
-                    {"id": 3, "name": "task-metadata-test-2.json"},
-                ]
-            },
-        ]
+        mock_gh_api_call.return_value = {
+            "artifacts": [
+                _artifact(1, "task-metadata-api-a3f2b891"),
+                _artifact(2, "task-metadata-api-v2-b4c3d2e1"),
+                _artifact(3, "task-metadata-other-1.json"),
+                _artifact(4, "coverage-report"),
+                _artifact(5, "task-metadata-api-2.json"),
+            ]
+        }
 
         # Act
         result = find_project_artifacts(
-            repo="owner/repo", project="test", workflow_file="Claude Chain"
+            repo="owner/repo", project="api"
         )
 
         # Assert
-        assert len(result) == 2
-        assert result[0].artifact_name == "task-metadata-test-1.json"
-        assert result[1].artifact_name == "task-metadata-test-2.json"
+        assert [a.artifact_id for a in result] == [1, 5]
 
     @patch("claudechain.services.composite.artifact_service.download_artifact_json")
     @patch("claudechain.services.composite.artifact_service.gh_api_call")
@@ -422,10 +421,9 @@ class TestFindProjectArtifacts:
     ):
         """Should download and parse metadata when download_metadata=True"""
         # Arrange
-        mock_gh_api_call.side_effect = [
-            {"workflow_runs": [{"id": 100, "conclusion": "success"}]},
-            {"artifacts": [{"id": 1, "name": "task-metadata-test-1.json"}]},
-        ]
+        mock_gh_api_call.return_value = {
+            "artifacts": [_artifact(1, "task-metadata-test-1.json")]
+        }
         mock_download.return_value = {
             "task_index": 1,
             "task_description": "Test task",
@@ -441,7 +439,6 @@ class TestFindProjectArtifacts:
         result = find_project_artifacts(
             repo="owner/repo",
             project="test",
-            workflow_file="Claude Chain",
             download_metadata=True,
         )
 
@@ -453,61 +450,67 @@ class TestFindProjectArtifacts:
         mock_download.assert_called_once_with("owner/repo", 1)
 
     @patch("claudechain.services.composite.artifact_service.gh_api_call")
-    def test_find_project_artifacts_skips_failed_runs(
+    def test_find_project_artifacts_skips_expired_artifacts(
         self, mock_gh_api_call
     ):
-        """Should only process workflow runs with success conclusion"""
+        """Should ignore artifacts whose contents are no longer downloadable"""
         # Arrange
         mock_gh_api_call.return_value = {
-            "workflow_runs": [
-                {"id": 100, "conclusion": "failure"},
-                {"id": 101, "conclusion": "success"},
-                {"id": 102, "conclusion": "cancelled"},
+            "artifacts": [
+                _artifact(1, "task-metadata-test-1.json", expired=True),
+                _artifact(2, "task-metadata-test-2.json"),
             ]
         }
 
         # Act
         result = find_project_artifacts(
-            repo="owner/repo", project="test", workflow_file="Claude Chain"
+            repo="owner/repo", project="test"
         )
 
         # Assert
-        # Should only query artifacts for run 101 (success)
-        # First call is for workflow runs, second should be for artifacts of run 101
-        assert mock_gh_api_call.call_count == 2
+        assert [a.artifact_id for a in result] == [2]
 
-    @patch(
-        "claudechain.services.composite.artifact_service._get_artifacts_for_run"
-    )
-    @patch(
-        "claudechain.services.composite.artifact_service.gh_api_call"
-    )
-    def test_find_project_artifacts_deduplicates_artifacts(
-        self, mock_gh_api_call, mock_get_artifacts
+    @patch("claudechain.services.composite.artifact_service.gh_api_call")
+    def test_find_project_artifacts_pages_until_short_page(
+        self, mock_gh_api_call
     ):
-        """Should not return duplicate artifacts with same ID"""
+        """Should request further pages only while pages are full"""
         # Arrange
-        # Return two workflow runs with same artifacts (to test deduplication)
-        mock_gh_api_call.return_value = {
-            "workflow_runs": [
-                {"id": 100, "conclusion": "success"},
-                {"id": 101, "conclusion": "success"},
-            ]
-        }
-        # Return same artifact from both runs (same ID = duplicate)
-        mock_get_artifacts.return_value = [
-            {"id": 1, "name": "task-metadata-test-1.json"}
+        full_page = [_artifact(i, f"task-metadata-test-{i}.json") for i in range(100)]
+        mock_gh_api_call.side_effect = [
+            {"artifacts": full_page},
+            {"artifacts": [_artifact(100, "task-metadata-test-100.json")]},
         ]
 
         # Act
         result = find_project_artifacts(
-            repo="owner/repo", project="test", workflow_file="Claude Chain"
+            repo="owner/repo", project="test"
         )
 
         # Assert
-        assert len(result) == 1  # Deduplicated by artifact ID
-        assert mock_gh_api_call.call_count == 1  # Called once for workflow runs
-        assert mock_get_artifacts.call_count == 2  # Called for each successful run
+        assert len(result) == 101
+        assert mock_gh_api_call.call_count == 2
+        mock_gh_api_call.assert_called_with(
+            "/repos/owner/repo/actions/artifacts?per_page=100&page=2"
+        )
+
+    @patch("claudechain.services.composite.artifact_service.gh_api_call")
+    def test_find_project_artifacts_stops_at_time_window(
+        self, mock_gh_api_call
+    ):
+        """Should stop paging once artifacts are older than days_back"""
+        # Arrange
+        page = [_artifact(i, f"task-metadata-test-{i}.json", days_ago=i) for i in range(100)]
+        mock_gh_api_call.return_value = {"artifacts": page}
+
+        # Act
+        result = find_project_artifacts(
+            repo="owner/repo", project="test", days_back=10
+        )
+
+        # Assert
+        assert len(result) == 10
+        assert mock_gh_api_call.call_count == 1
 
     @patch("claudechain.services.composite.artifact_service.download_artifact_json")
     @patch("claudechain.services.composite.artifact_service.gh_api_call")
@@ -516,17 +519,15 @@ class TestFindProjectArtifacts:
     ):
         """Should continue processing when metadata parsing fails"""
         # Arrange
-        mock_gh_api_call.side_effect = [
-            {"workflow_runs": [{"id": 100, "conclusion": "success"}]},
-            {"artifacts": [{"id": 1, "name": "task-metadata-test-1.json"}]},
-        ]
+        mock_gh_api_call.return_value = {
+            "artifacts": [_artifact(1, "task-metadata-test-1.json")]
+        }
         mock_download.return_value = {"invalid": "data"}  # Missing required fields
 
         # Act
         result = find_project_artifacts(
             repo="owner/repo",
             project="test",
-            workflow_file="Claude Chain",
             download_metadata=True,
         )
 
@@ -546,33 +547,128 @@ class TestFindProjectArtifacts:
 
         # Act
         result = find_project_artifacts(
-            repo="owner/repo", project="test", workflow_file="Claude Chain"
+            repo="owner/repo", project="test"
         )
 
         # Assert
         assert len(result) == 0
         captured = capsys.readouterr()
-        assert "Warning: Failed to get workflow runs" in captured.out
+        assert "Warning: Failed to list artifacts" in captured.out
+
+
+class TestFindArtifactsForProjects:
+    """Test suite for find_artifacts_for_projects function"""
 
     @patch("claudechain.services.composite.artifact_service.gh_api_call")
-    def test_find_project_artifacts_url_encodes_workflow_file_with_special_chars(
+    def test_groups_artifacts_for_all_projects_from_one_listing(
         self, mock_gh_api_call
     ):
-        """Should URL-encode workflow names with special characters"""
+        """Should serve every requested project from a single listing"""
         # Arrange
-        mock_gh_api_call.return_value = {"workflow_runs": []}
+        mock_gh_api_call.return_value = {
+            "artifacts": [
+                _artifact(1, "task-metadata-api-a3f2b891"),
+                _artifact(2, "task-metadata-web-b4c3d2e1"),
+                _artifact(3, "task-metadata-unrelated-c5d4e3f2"),
+            ]
+        }
 
         # Act
-        find_project_artifacts(
-            repo="owner/repo",
-            project="test",
-            workflow_file="My Workflow & Tests",
-        )
+        result = find_artifacts_for_projects("owner/repo", ["api", "web", "docs"])
 
-        # Assert - verify the workflow name is URL-encoded
-        mock_gh_api_call.assert_called_once_with(
-            "/repos/owner/repo/actions/workflows/My%20Workflow%20%26%20Tests/runs?status=completed&per_page=50"
-        )
+        # Assert
+        assert [a.artifact_id for a in result["api"]] == [1]
+        assert [a.artifact_id for a in result["web"]] == [2]
+        assert result["docs"] == []
+        assert "unrelated" not in result
+        assert mock_gh_api_call.call_count == 1
+
+    @patch("claudechain.services.composite.artifact_service.gh_api_call")
+    def test_raises_when_a_later_page_fails(self, mock_gh_api_call):
+        """Should not return a partial listing as if it were complete"""
+        # Arrange
+        full_page = [_artifact(i, f"task-metadata-api-{i}.json") for i in range(100)]
+        mock_gh_api_call.side_effect = [
+            {"artifacts": full_page},
+            GitHubAPIError("API rate limit exceeded"),
+        ]
+
+        # Act & Assert
+        with pytest.raises(GitHubAPIError, match="page 2"):
+            find_artifacts_for_projects("owner/repo", ["api"])
+
+
+class TestDownloadArtifactMetadata:
+    """Test suite for download_artifact_metadata function"""
+
+    @patch("claudechain.services.composite.artifact_service.download_artifact_json")
+    def test_downloads_concurrently_and_assigns_metadata(self, mock_download):
+        """Should run downloads on parallel workers and fill in each artifact"""
+        # Arrange
+        import threading
+
+        barrier = threading.Barrier(4, timeout=5)
+
+        def download(repo, artifact_id):
+            barrier.wait()  # Only passes if four downloads are in flight at once
+            return {
+                "task_index": artifact_id,
+                "task_description": f"Task {artifact_id}",
+                "project": "test",
+                "branch_name": f"claude-chain-test-{artifact_id}",
+                "assignee": "alice",
+                "created_at": "2025-12-27T10:00:00Z",
+                "workflow_run_id": 1,
+                "pr_number": artifact_id * 10,
+            }
+
+        mock_download.side_effect = download
+        artifacts = [
+            ProjectArtifact(artifact_id=i, artifact_name=f"task-metadata-test-{i}.json", workflow_run_id=1)
+            for i in range(1, 5)
+        ]
+
+        # Act
+        download_artifact_metadata("owner/repo", artifacts, max_workers=4)
+
+        # Assert
+        assert [a.metadata.pr_number for a in artifacts] == [10, 20, 30, 40]
+        assert mock_download.call_count == 4
+
+    @patch("claudechain.services.composite.artifact_service.download_artifact_json")
+    def test_leaves_metadata_empty_for_failed_downloads(self, mock_download):
+        """Should keep going when a single download fails"""
+        # Arrange
+        mock_download.return_value = None
+        artifacts = [ProjectArtifact(artifact_id=1, artifact_name="task-metadata-test-1.json", workflow_run_id=1)]
+
+        # Act
+        download_artifact_metadata("owner/repo", artifacts)
+
+        # Assert
+        assert artifacts[0].metadata is None
+
+
+class TestParseProjectFromArtifactName:
+    """Test suite for parse_project_from_artifact_name function"""
+
+    @pytest.mark.parametrize(
+        "artifact_name,expected",
+        [
+            ("task-metadata-api-a3f2b891", "api"),
+            ("task-metadata-api-v2-a3f2b891", "api-v2"),
+            ("task-metadata-my-project-3.json", "my-project"),
+            ("task-metadata-api", None),
+            ("coverage-report", None),
+        ],
+    )
+    def test_parses_project_name(self, artifact_name, expected):
+        """Should return the text between the prefix and the last hyphen"""
+        # Act
+        result = parse_project_from_artifact_name(artifact_name)
+
+        # Assert
+        assert result == expected
 
 
 class TestGetArtifactMetadata:
@@ -632,6 +728,31 @@ class TestGetArtifactMetadata:
         captured = capsys.readouterr()
         assert "Warning: Failed to parse metadata" in captured.out
 
+    @patch("claudechain.services.composite.artifact_service.download_artifact_json")
+    def test_get_artifact_metadata_downloads_each_artifact_once(self, mock_download):
+        """Should serve repeat lookups from the artifact store"""
+        # Arrange
+        mock_download.return_value = {
+            "task_index": 5,
+            "task_description": "Test task",
+            "project": "test",
+            "branch_name": "claude-chain-test-5",
+            "assignee": "bob",
+            "created_at": "2025-12-27T10:00:00Z",
+            "workflow_run_id": 200,
+            "pr_number": 10,
+        }
+
+        # Act
+        first = get_artifact_metadata("owner/repo", 42, digest="sha256:abc", size_in_bytes=300)
+        second = get_artifact_metadata("owner/repo", 42, digest="sha256:abc", size_in_bytes=300)
+
+        # Assert
+        assert first.to_dict() == second.to_dict()
+        mock_download.assert_called_once_with("owner/repo", 42)
+        stats = get_artifact_store().stats
+        assert (stats.hits, stats.misses, stats.bytes_saved) == (1, 1, 300)
+
 
 class TestFindInProgressTasks:
     """Test suite for find_in_progress_tasks convenience function"""
@@ -660,7 +781,7 @@ class TestFindInProgressTasks:
 
         # Act
         result = find_in_progress_tasks(
-            repo="owner/repo", project="test", workflow_file="Claude Chain"
+            repo="owner/repo", project="test"
         )
 
         # Assert
@@ -668,7 +789,6 @@ class TestFindInProgressTasks:
         mock_find_artifacts.assert_called_once_with(
             repo="owner/repo",
             project="test",
-            workflow_file="Claude Chain",
             download_metadata=False,
         )
 
@@ -691,7 +811,7 @@ class TestFindInProgressTasks:
 
         # Act
         result = find_in_progress_tasks(
-            repo="owner/repo", project="test", workflow_file="Claude Chain"
+            repo="owner/repo", project="test"
         )
 
         # Assert
@@ -707,7 +827,7 @@ class TestFindInProgressTasks:
 
         # Act
         result = find_in_progress_tasks(
-            repo="owner/repo", project="test", workflow_file="Claude Chain"
+            repo="owner/repo", project="test"
         )
 
         # Assert
@@ -758,7 +878,7 @@ class TestGetAssigneeAssignments:
 
         # Act
         result = get_assignee_assignments(
-            repo="owner/repo", project="test", workflow_file="Claude Chain"
+            repo="owner/repo", project="test"
         )
 
         # Assert
@@ -766,7 +886,6 @@ class TestGetAssigneeAssignments:
         mock_find_artifacts.assert_called_once_with(
             repo="owner/repo",
             project="test",
-            workflow_file="Claude Chain",
             download_metadata=True,
         )
 
@@ -802,7 +921,7 @@ class TestGetAssigneeAssignments:
 
         # Act
         result = get_assignee_assignments(
-            repo="owner/repo", project="test", workflow_file="Claude Chain"
+            repo="owner/repo", project="test"
         )
 
         # Assert
@@ -818,7 +937,7 @@ class TestGetAssigneeAssignments:
 
         # Act
         result = get_assignee_assignments(
-            repo="owner/repo", project="test", workflow_file="Claude Chain"
+            repo="owner/repo", project="test"
         )
 
         # Assert
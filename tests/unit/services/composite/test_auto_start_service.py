@@ -4,19 +4,22 @@ import pytest
 from unittest.mock import Mock, patch
 
 from claudechain.domain.auto_start import AutoStartProject, AutoStartDecision, ProjectChangeType
+from claudechain.infrastructure.git.operations import FileChanges
 from claudechain.services.composite.auto_start_service import AutoStartService
+from claudechain.services.core.pr_service import PRService
 
 
 class TestDetectChangedProjects:
     """Test detect_changed_projects() method"""
 
-    @patch('claudechain.services.composite.auto_start_service.detect_changed_files')
-    @patch('claudechain.services.composite.auto_start_service.detect_deleted_files')
-    def test_detect_added_project(self, mock_deleted, mock_changed):
+    @patch('claudechain.services.composite.auto_start_service.detect_file_changes')
+    def test_detect_added_project(self, mock_changes):
         """Test detecting a newly added project"""
         # Mock git operations
-        mock_changed.return_value = ['claude-chain/new-project/spec.md']
-        mock_deleted.return_value = []
+        mock_changes.return_value = FileChanges(
+            added=['claude-chain/new-project/spec.md'],
+            deleted=[],
+        )
 
         # Create service and test
         mock_pr_service = Mock()
@@ -29,15 +32,15 @@ class TestDetectChangedProjects:
         assert projects[0].spec_path == "claude-chain/new-project/spec.md"
 
         # Verify git operations were called correctly
-        mock_changed.assert_called_once_with("abc123", "def456", "claude-chain/*/spec.md")
-        mock_deleted.assert_called_once_with("abc123", "def456", "claude-chain/*/spec.md")
+        mock_changes.assert_called_once_with("abc123", "def456", "claude-chain/*/spec.md")
 
-    @patch('claudechain.services.composite.auto_start_service.detect_changed_files')
-    @patch('claudechain.services.composite.auto_start_service.detect_deleted_files')
-    def test_detect_modified_project(self, mock_deleted, mock_changed):
+    @patch('claudechain.services.composite.auto_start_service.detect_file_changes')
+    def test_detect_modified_project(self, mock_changes):
         """Test detecting a modified project"""
-        mock_changed.return_value = ['claude-chain/existing-project/spec.md']
-        mock_deleted.return_value = []
+        mock_changes.return_value = FileChanges(
+            modified=['claude-chain/existing-project/spec.md'],
+            deleted=[],
+        )
 
         mock_pr_service = Mock()
         service = AutoStartService("owner/repo", mock_pr_service)
@@ -47,12 +50,13 @@ class TestDetectChangedProjects:
         assert projects[0].name == "existing-project"
         assert projects[0].change_type == ProjectChangeType.MODIFIED
 
-    @patch('claudechain.services.composite.auto_start_service.detect_changed_files')
-    @patch('claudechain.services.composite.auto_start_service.detect_deleted_files')
-    def test_detect_deleted_project(self, mock_deleted, mock_changed):
+    @patch('claudechain.services.composite.auto_start_service.detect_file_changes')
+    def test_detect_deleted_project(self, mock_changes):
         """Test detecting a deleted project"""
-        mock_changed.return_value = []
-        mock_deleted.return_value = ['claude-chain/old-project/spec.md']
+        mock_changes.return_value = FileChanges(
+            modified=[],
+            deleted=['claude-chain/old-project/spec.md'],
+        )
 
         mock_pr_service = Mock()
         service = AutoStartService("owner/repo", mock_pr_service)
@@ -63,15 +67,14 @@ class TestDetectChangedProjects:
         assert projects[0].change_type == ProjectChangeType.DELETED
         assert projects[0].spec_path == "claude-chain/old-project/spec.md"
 
-    @patch('claudechain.services.composite.auto_start_service.detect_changed_files')
-    @patch('claudechain.services.composite.auto_start_service.detect_deleted_files')
-    def test_detect_multiple_projects(self, mock_deleted, mock_changed):
+    @patch('claudechain.services.composite.auto_start_service.detect_file_changes')
+    def test_detect_multiple_projects(self, mock_changes):
         """Test detecting multiple changed projects"""
-        mock_changed.return_value = [
-            'claude-chain/project-a/spec.md',
-            'claude-chain/project-b/spec.md'
-        ]
-        mock_deleted.return_value = ['claude-chain/project-c/spec.md']
+        mock_changes.return_value = FileChanges(
+            added=['claude-chain/project-a/spec.md'],
+            modified=['claude-chain/project-b/spec.md'],
+            deleted=['claude-chain/project-c/spec.md'],
+        )
 
         mock_pr_service = Mock()
         service = AutoStartService("owner/repo", mock_pr_service)
@@ -89,12 +92,13 @@ class TestDetectChangedProjects:
         assert len(deleted) == 1
         assert deleted[0].name == "project-c"
 
-    @patch('claudechain.services.composite.auto_start_service.detect_changed_files')
-    @patch('claudechain.services.composite.auto_start_service.detect_deleted_files')
-    def test_detect_no_changes(self, mock_deleted, mock_changed):
+    @patch('claudechain.services.composite.auto_start_service.detect_file_changes')
+    def test_detect_no_changes(self, mock_changes):
         """Test detecting no changes"""
-        mock_changed.return_value = []
-        mock_deleted.return_value = []
+        mock_changes.return_value = FileChanges(
+            modified=[],
+            deleted=[],
+        )
 
         mock_pr_service = Mock()
         service = AutoStartService("owner/repo", mock_pr_service)
@@ -102,13 +106,14 @@ class TestDetectChangedProjects:
 
         assert len(projects) == 0
 
-    @patch('claudechain.services.composite.auto_start_service.detect_changed_files')
-    @patch('claudechain.services.composite.auto_start_service.detect_deleted_files')
-    def test_detect_invalid_path(self, mock_deleted, mock_changed):
+    @patch('claudechain.services.composite.auto_start_service.detect_file_changes')
+    def test_detect_invalid_path(self, mock_changes):
         """Test detecting changes with invalid path (should be filtered out)"""
         # Invalid path that doesn't match claude-chain/*/spec.md pattern
-        mock_changed.return_value = ['invalid/path/spec.md']
-        mock_deleted.return_value = []
+        mock_changes.return_value = FileChanges(
+            modified=['invalid/path/spec.md'],
+            deleted=[],
+        )
 
         mock_pr_service = Mock()
         service = AutoStartService("owner/repo", mock_pr_service)
@@ -117,19 +122,20 @@ class TestDetectChangedProjects:
         # parse_spec_path_to_project returns None for invalid paths
         assert len(projects) == 0
 
-    @patch('claudechain.services.composite.auto_start_service.detect_changed_files')
-    @patch('claudechain.services.composite.auto_start_service.detect_deleted_files')
-    def test_detect_custom_pattern(self, mock_deleted, mock_changed):
+    @patch('claudechain.services.composite.auto_start_service.detect_file_changes')
+    def test_detect_custom_pattern(self, mock_changes):
         """Test detecting changes with custom pattern"""
-        mock_changed.return_value = ['custom-path/project/spec.md']
-        mock_deleted.return_value = []
+        mock_changes.return_value = FileChanges(
+            modified=['custom-path/project/spec.md'],
+            deleted=[],
+        )
 
         mock_pr_service = Mock()
         service = AutoStartService("owner/repo", mock_pr_service)
         projects = service.detect_changed_projects("abc123", "def456", spec_pattern="custom-path/*/spec.md")
 
         # Verify custom pattern was passed to git operations
-        mock_changed.assert_called_once_with("abc123", "def456", "custom-path/*/spec.md")
+        mock_changes.assert_called_once_with("abc123", "def456", "custom-path/*/spec.md")
 
 
 class TestDetermineNewProjects:
@@ -139,7 +145,7 @@ class TestDetermineNewProjects:
         """Test determining all projects are new"""
         # Mock PRService to return no PRs
         mock_pr_service = Mock()
-        mock_pr_service.get_project_prs.return_value = []
+        mock_pr_service.get_open_prs_by_project.return_value = {"project-a": [], "project-b": []}
 
         projects = [
             AutoStartProject("project-a", ProjectChangeType.MODIFIED, "claude-chain/project-a/spec.md"),
@@ -152,8 +158,9 @@ class TestDetermineNewProjects:
         assert len(new_projects) == 2
         assert {p.name for p in new_projects} == {"project-a", "project-b"}
 
-        # Verify PRService was called for each project
-        assert mock_pr_service.get_project_prs.call_count == 2
+        # Verify open PRs were listed once for all projects
+        mock_pr_service.get_open_prs_by_project.assert_called_once_with(["project-a", "project-b"])
+        mock_pr_service.get_project_prs.assert_not_called()
 
         # Check output messages
         captured = capsys.readouterr()
@@ -164,7 +171,7 @@ class TestDetermineNewProjects:
         """Test determining all projects have existing PRs"""
         # Mock PRService to return existing PRs
         mock_pr_service = Mock()
-        mock_pr_service.get_project_prs.return_value = [Mock(), Mock()]  # 2 existing PRs
+        mock_pr_service.get_open_prs_by_project.return_value = {"project-a": [Mock(), Mock()]}  # 2 existing PRs
 
         projects = [
             AutoStartProject("project-a", ProjectChangeType.MODIFIED, "claude-chain/project-a/spec.md"),
@@ -181,16 +188,12 @@ class TestDetermineNewProjects:
 
     def test_mixed_new_and_existing(self, capsys):
         """Test mix of new and existing projects"""
-        # Mock PRService with different returns for each project
+        # Mock PRService with different open PRs for each project
         mock_pr_service = Mock()
-
-        def get_prs_side_effect(project_name, state="open"):
-            if project_name == "new-project":
-                return []  # No open PRs
-            else:
-                return [Mock()]  # Has open PRs
-
-        mock_pr_service.get_project_prs.side_effect = get_prs_side_effect
+        mock_pr_service.get_open_prs_by_project.return_value = {
+            "new-project": [],  # No open PRs
+            "existing-project": [Mock()],  # Has open PRs
+        }
 
         projects = [
             AutoStartProject("new-project", ProjectChangeType.MODIFIED, "claude-chain/new-project/spec.md"),
@@ -206,7 +209,7 @@ class TestDetermineNewProjects:
     def test_skip_deleted_projects(self):
         """Test deleted projects are skipped"""
         mock_pr_service = Mock()
-        mock_pr_service.get_project_prs.return_value = []
+        mock_pr_service.get_open_prs_by_project.return_value = {"modified-project": []}
 
         projects = [
             AutoStartProject("deleted-project", ProjectChangeType.DELETED, "claude-chain/deleted-project/spec.md"),
@@ -220,14 +223,14 @@ class TestDetermineNewProjects:
         assert len(new_projects) == 1
         assert new_projects[0].name == "modified-project"
 
-        # PRService should only be called once (for modified project)
-        mock_pr_service.get_project_prs.assert_called_once_with("modified-project", state="open")
+        # PRs should only be listed for the modified project
+        mock_pr_service.get_open_prs_by_project.assert_called_once_with(["modified-project"])
 
     def test_github_api_error_handling(self, capsys):
         """Test handling of GitHub API errors"""
         # Mock PRService to raise exception
         mock_pr_service = Mock()
-        mock_pr_service.get_project_prs.side_effect = Exception("GitHub API error")
+        mock_pr_service.get_open_prs_by_project.side_effect = Exception("GitHub API error")
 
         projects = [
             AutoStartProject("project-a", ProjectChangeType.MODIFIED, "claude-chain/project-a/spec.md"),
@@ -251,13 +254,13 @@ class TestDetermineNewProjects:
         new_projects = service.determine_new_projects([])
 
         assert len(new_projects) == 0
-        mock_pr_service.get_project_prs.assert_not_called()
+        mock_pr_service.get_open_prs_by_project.assert_not_called()
 
     def test_determine_new_projects_treats_completed_project_as_ready(self, capsys):
         """Test that projects with only closed PRs (completed) are treated as ready for auto-start"""
         # Mock PRService to return no open PRs (simulating a completed project)
         mock_pr_service = Mock()
-        mock_pr_service.get_project_prs.return_value = []  # No open PRs
+        mock_pr_service.get_open_prs_by_project.return_value = {"completed-project": []}  # No open PRs
 
         project = AutoStartProject(
             "completed-project",
@@ -272,25 +275,52 @@ class TestDetermineNewProjects:
         assert len(new_projects) == 1
         assert new_projects[0].name == "completed-project"
 
-        # Verify PRService was called with state="open"
-        mock_pr_service.get_project_prs.assert_called_once_with("completed-project", state="open")
+        # Verify open PRs were listed for the project
+        mock_pr_service.get_open_prs_by_project.assert_called_once_with(["completed-project"])
 
         # Check output message
         captured = capsys.readouterr()
         assert "✓ completed-project has no open PRs, ready for auto-start" in captured.out
 
-    def test_determine_new_projects_uses_state_open(self):
-        """Test that determine_new_projects() calls PRService with state='open'"""
+    def test_determine_new_projects_lists_open_prs_once(self):
+        """Test that determine_new_projects() fetches open PRs once for all projects"""
         mock_pr_service = Mock()
-        mock_pr_service.get_project_prs.return_value = [Mock()]  # Has open PRs
+        mock_pr_service.get_open_prs_by_project.return_value = {"project-a": [Mock()]}  # Has open PRs
 
-        project = AutoStartProject("project-a", ProjectChangeType.MODIFIED, "claude-chain/project-a/spec.md")
+        projects = [
+            AutoStartProject(name, ProjectChangeType.MODIFIED, f"claude-chain/{name}/spec.md")
+            for name in ("project-a", "project-b", "project-c")
+        ]
 
         service = AutoStartService("owner/repo", mock_pr_service)
-        service.determine_new_projects([project])
+        new_projects = service.determine_new_projects(projects)
 
-        # Verify state="open" is used
-        mock_pr_service.get_project_prs.assert_called_once_with("project-a", state="open")
+        # One bulk listing; projects missing from it have no open PRs
+        mock_pr_service.get_open_prs_by_project.assert_called_once_with(["project-a", "project-b", "project-c"])
+        mock_pr_service.get_project_prs.assert_not_called()
+        assert [p.name for p in new_projects] == ["project-b", "project-c"]
+
+    def test_should_auto_trigger_reuses_bulk_listing(self):
+        """Test that decisions after determine_new_projects() make no further PR queries"""
+        # Arrange
+        pr_service = PRService("owner/repo")
+        projects = [
+            AutoStartProject(name, ProjectChangeType.MODIFIED, f"claude-chain/{name}/spec.md")
+            for name in ("project-a", "project-b")
+        ]
+        service = AutoStartService("owner/repo", pr_service)
+
+        # Act
+        with patch("claudechain.services.core.pr_service.list_all_pull_requests", return_value=[]) as mock_list_all, \
+                patch("claudechain.services.core.pr_service.list_pull_requests") as mock_list:
+            new_projects = service.determine_new_projects(projects)
+            decisions = [service.should_auto_trigger(p) for p in new_projects]
+
+        # Assert
+        mock_list_all.assert_called_once_with(repo="owner/repo", label="claudechain", state="open")
+        mock_list.assert_not_called()
+        assert all(d.should_trigger for d in decisions)
+        assert pr_service.fetch_count == 1
 
 
 class TestShouldAutoTrigger:
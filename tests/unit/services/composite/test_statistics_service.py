@@ -1088,11 +1088,10 @@ This PR was generated using Claude Code with the following costs:
         assert "💰" not in summary
 
 
-class TestGetCostsByPR:
+class TestSumCostsByPR:
     """Test cost retrieval from artifacts in statistics collection"""
 
-    @patch("claudechain.services.composite.statistics_service.find_project_artifacts")
-    def test_get_costs_by_pr_from_multiple_artifacts(self, mock_find_artifacts):
+    def test_sum_costs_by_pr_from_multiple_artifacts(self):
         """Should return costs keyed by PR number"""
         from claudechain.services.composite.artifact_service import ProjectArtifact
         from claudechain.domain.models import TaskMetadata, AITask
@@ -1100,7 +1099,7 @@ class TestGetCostsByPR:
         now = datetime.now(timezone.utc)
 
         # Create mock artifacts with different costs
-        mock_find_artifacts.return_value = [
+        artifacts = [
             ProjectArtifact(
                 artifact_id=1,
                 artifact_name="task-metadata-test-abc12345.json",
@@ -1159,27 +1158,21 @@ class TestGetCostsByPR:
             ),
         ]
 
-        # Create service and test
-        mock_repo = Mock()
-        mock_pr_service = Mock()
-        service = StatisticsService("owner/repo", mock_repo, mock_pr_service, "Claude Chain")
-
-        costs_by_pr = service._get_costs_by_pr("test")
+        costs_by_pr = StatisticsService._sum_costs_by_pr(artifacts)
 
         # Should return dict keyed by PR number
         assert costs_by_pr[10] == pytest.approx(0.17, rel=1e-6)  # 0.15 + 0.02
         assert costs_by_pr[11] == pytest.approx(0.25, rel=1e-6)
         assert costs_by_pr[12] == pytest.approx(0.53, rel=1e-6)  # 0.50 + 0.03
 
-    @patch("claudechain.services.composite.statistics_service.find_project_artifacts")
-    def test_get_costs_by_pr_handles_missing_metadata(self, mock_find_artifacts):
+    def test_sum_costs_by_pr_handles_missing_metadata(self):
         """Should skip artifacts without metadata (legacy PRs)"""
         from claudechain.services.composite.artifact_service import ProjectArtifact
         from claudechain.domain.models import TaskMetadata, AITask
 
         now = datetime.now(timezone.utc)
 
-        mock_find_artifacts.return_value = [
+        artifacts = [
             ProjectArtifact(
                 artifact_id=1,
                 artifact_name="task-metadata-test-abc12345.json",
@@ -1206,28 +1199,124 @@ class TestGetCostsByPR:
             ),
         ]
 
-        mock_repo = Mock()
-        mock_pr_service = Mock()
-        service = StatisticsService("owner/repo", mock_repo, mock_pr_service, "Claude Chain")
-
-        costs_by_pr = service._get_costs_by_pr("test")
+        costs_by_pr = StatisticsService._sum_costs_by_pr(artifacts)
 
         # Should only include the first artifact
         assert len(costs_by_pr) == 1
         assert costs_by_pr[10] == pytest.approx(0.20, rel=1e-6)
 
-    @patch("claudechain.services.composite.statistics_service.find_project_artifacts")
-    def test_get_costs_by_pr_returns_empty_when_no_artifacts(self, mock_find_artifacts):
+    def test_sum_costs_by_pr_returns_empty_when_no_artifacts(self):
         """Should return empty dict when no artifacts are found"""
-        mock_find_artifacts.return_value = []
+        costs_by_pr = StatisticsService._sum_costs_by_pr([])
 
-        mock_repo = Mock()
-        mock_pr_service = Mock()
-        service = StatisticsService("owner/repo", mock_repo, mock_pr_service, "Claude Chain")
+        assert costs_by_pr == {}
 
-        costs_by_pr = service._get_costs_by_pr("test")
+    def test_sum_costs_by_pr_expands_batch_sessions(self):
+        """Should charge each stacked PR of a batch session its own share"""
+        from claudechain.services.composite.artifact_service import ProjectArtifact
+        from claudechain.domain.models import TaskMetadata, AITask, BatchTaskCost
+
+        now = datetime.now(timezone.utc)
+        metadata = TaskMetadata(
+            task_index=1,
+            task_description="Task 1",
+            project="test",
+            branch_name="claude-chain-test-abc12345",
+            assignee="alice",
+            created_at=now,
+            workflow_run_id=100,
+            pr_number=10,
+            ai_tasks=[AITask(type="PRCreation", model="claude-sonnet-4", cost_usd=0.90, created_at=now)],
+            batch_tasks=[
+                BatchTaskCost(1, "Task 1", "abc12345", 10, "claude-chain-test-abc12345", 0.60),
+                BatchTaskCost(2, "Task 2", "def67890", 11, "claude-chain-test-def67890", 0.30),
+            ],
+        )
+        artifacts = [ProjectArtifact(artifact_id=1, artifact_name="a", workflow_run_id=100, metadata=metadata)]
+
+        costs_by_pr = StatisticsService._sum_costs_by_pr(artifacts)
+
+        assert costs_by_pr == pytest.approx({10: 0.60, 11: 0.30})
 
-        assert costs_by_pr == {}
+
+class TestPromptCacheStatistics:
+    """Test prompt cache aggregation per project and per model"""
+
+    @staticmethod
+    def _artifact(pr_number, cache_usage):
+        from claudechain.services.composite.artifact_service import ProjectArtifact
+        from claudechain.domain.models import TaskMetadata
+
+        now = datetime.now(timezone.utc)
+        return ProjectArtifact(
+            artifact_id=pr_number,
+            artifact_name=f"task-metadata-test-{pr_number}.json",
+            workflow_run_id=100,
+            metadata=TaskMetadata(
+                task_index=1, task_description="Task", project="test", branch_name="b",
+                assignee="", created_at=now, workflow_run_id=100, pr_number=pr_number,
+                cache_usage=cache_usage,
+            ),
+        )
+
+    def test_sum_cache_usage_per_model_across_artifacts(self):
+        """Should sum each model's cache usage over all of a project's artifacts"""
+        from claudechain.domain.cost_breakdown import CacheUsage
+
+        # Arrange
+        artifacts = [
+            self._artifact(10, {"claude-sonnet-4": CacheUsage(input_tokens=100, cache_read_tokens=300, savings_usd=0.1)}),
+            self._artifact(11, {
+                "claude-sonnet-4": CacheUsage(input_tokens=100, cache_read_tokens=500, savings_usd=0.2),
+                "claude-3-haiku": CacheUsage(input_tokens=50),
+            }),
+            self._artifact(12, {}),
+        ]
+
+        # Act
+        usage = StatisticsService._sum_cache_usage(artifacts)
+
+        # Assert
+        assert usage["claude-sonnet-4"] == CacheUsage(input_tokens=200, cache_read_tokens=800, savings_usd=pytest.approx(0.3))
+        assert usage["claude-3-haiku"] == CacheUsage(input_tokens=50)
+
+    def test_cache_section_shows_hit_ratio_and_savings_per_project_and_model(self):
+        """Should render one table per project and one per model"""
+        from claudechain.domain.cost_breakdown import CacheUsage
+
+        # Arrange
+        report = StatisticsReport(repo="owner/repo")
+        project_a = ProjectStats("project-a", "/path/a.md")
+        project_a.cache_usage = {"claude-sonnet-4": CacheUsage(input_tokens=250, cache_read_tokens=750, savings_usd=1.5)}
+        project_b = ProjectStats("project-b", "/path/b.md")
+        project_b.cache_usage = {
+            "claude-sonnet-4": CacheUsage(input_tokens=750, cache_read_tokens=250, savings_usd=0.5),
+            "claude-3-haiku": CacheUsage(input_tokens=100),
+        }
+        report.add_project(project_a)
+        report.add_project(project_b)
+
+        # Act
+        output = report.format_cache_section()
+        data = json.loads(report.to_json())
+
+        # Assert
+        assert "Prompt Cache" in output
+        assert "project-a" in output and "75%" in output and "$1.50" in output
+        # claude-sonnet-4 across both projects: 1000 of 2000 prompt tokens cached
+        sonnet_line = next(line for line in output.splitlines() if "claude-sonnet-4" in line)
+        assert "50%" in sonnet_line and "$2.00" in sonnet_line
+        assert data["projects"]["project-a"]["cache"]["hit_ratio"] == pytest.approx(0.75)
+
+    def test_cache_section_empty_without_cache_data(self):
+        """Should omit the section when no project recorded cache usage"""
+        # Arrange
+        report = StatisticsReport(repo="owner/repo")
+        report.add_project(ProjectStats("project-a", "/path/a.md"))
+
+        # Act / Assert
+        assert report.format_cache_section() == ""
+        assert "cache" not in json.loads(report.to_json())["projects"]["project-a"]
 
 
 class TestCollectTeamMemberStats:
@@ -1282,7 +1371,7 @@ class TestCollectTeamMemberStats:
         mock_pr_service.get_all_prs.return_value = [pr1, pr2, pr3]
 
         # Create service and test
-        service = StatisticsService("owner/repo", mock_repo, mock_pr_service, "Claude Chain")
+        service = StatisticsService("owner/repo", mock_repo, mock_pr_service)
         stats = service.collect_team_member_stats(["alice", "bob"], days_back=30)
 
         assert "alice" in stats
@@ -1300,7 +1389,7 @@ class TestCollectTeamMemberStats:
         mock_pr_service.get_all_prs.return_value = []
 
         # Create service and test
-        service = StatisticsService("owner/repo", mock_repo, mock_pr_service, "Claude Chain")
+        service = StatisticsService("owner/repo", mock_repo, mock_pr_service)
         stats = service.collect_team_member_stats(["alice"])
 
         assert "alice" in stats
@@ -1315,7 +1404,7 @@ class TestCollectTeamMemberStats:
         mock_pr_service.get_all_prs.side_effect = Exception("GitHub API error")
 
         # Create service and test
-        service = StatisticsService("owner/repo", mock_repo, mock_pr_service, "Claude Chain")
+        service = StatisticsService("owner/repo", mock_repo, mock_pr_service)
         stats = service.collect_team_member_stats(["alice"])
 
         # Should return empty stats but not crash
@@ -1364,7 +1453,7 @@ class TestCollectProjectStats:
         mock_repo.load_spec.return_value = SpecContent(project, spec_content)
 
         # Create service and test
-        service = StatisticsService("owner/repo", mock_repo, mock_pr_service, "Claude Chain")
+        service = StatisticsService("owner/repo", mock_repo, mock_pr_service)
         stats = service.collect_project_stats("test-project", "main", "claudechain")
 
         assert stats.project_name == "test-project"
@@ -1384,7 +1473,7 @@ class TestCollectProjectStats:
         # Mock PROperationsService
         mock_pr_service = Mock()
 
-        service = StatisticsService("owner/repo", mock_repo, mock_pr_service, "Claude Chain")
+        service = StatisticsService("owner/repo", mock_repo, mock_pr_service)
         stats = service.collect_project_stats("test-project", "main", "claudechain")
 
         assert stats is None
@@ -1406,7 +1495,7 @@ class TestCollectProjectStats:
         mock_repo.load_spec.return_value = SpecContent(project, spec_content)
 
         # Create service and test - exception should propagate
-        service = StatisticsService("owner/repo", mock_repo, mock_pr_service, "Claude Chain")
+        service = StatisticsService("owner/repo", mock_repo, mock_pr_service)
         with pytest.raises(Exception, match="API error"):
             service.collect_project_stats("test-project", "main", "claudechain")
 
@@ -1428,7 +1517,7 @@ class TestCollectProjectStats:
         mock_repo.load_spec.return_value = SpecContent(project, spec_content)
 
         # Create service
-        service = StatisticsService("owner/repo", mock_repo, mock_pr_service, "Claude Chain")
+        service = StatisticsService("owner/repo", mock_repo, mock_pr_service)
         stats = service.collect_project_stats("test-project", "develop", "claudechain")
 
         # Verify the service uses the custom base_branch
@@ -1443,6 +1532,177 @@ class TestCollectProjectStats:
 class TestCollectAllStatistics:
     """Test full statistics collection"""
 
+    @patch("claudechain.services.composite.statistics_service.find_project_artifacts")
+    def test_collect_all_uses_single_bulk_pr_fetch(self, mock_find_artifacts):
+        """Should fetch PRs once for all projects instead of per project"""
+        from datetime import datetime, timezone
+        from claudechain.domain.github_models import GitHubPullRequest, PullRequestIndex
+        from claudechain.domain.project import Project
+        from claudechain.domain.project_configuration import ProjectConfiguration
+        from claudechain.domain.spec_content import SpecContent
+
+        mock_find_artifacts.return_value = []
+        spec_content = "- [ ] Task A\n- [ ] Task B"
+        task_hash = SpecContent(Project("p"), spec_content).tasks[0].task_hash
+        open_pr = GitHubPullRequest(
+            number=7,
+            title="Task A",
+            state="open",
+            created_at=datetime.now(timezone.utc),
+            merged_at=None,
+            assignees=[],
+            labels=["claudechain"],
+            head_ref_name=f"claude-chain-project2-{task_hash}",
+        )
+
+        mock_pr_service = Mock()
+        mock_pr_service.get_all_prs_indexed.return_value = PullRequestIndex.from_pull_requests([open_pr])
+
+        mock_repo = Mock()
+        mock_repo.load_all.side_effect = lambda projects, branch: {
+            p.name: (ProjectConfiguration.default(p), SpecContent(p, spec_content)) for p in projects
+        }
+
+        service = StatisticsService("owner/repo", mock_repo, mock_pr_service)
+        report = service.collect_all_statistics(
+            projects=[("project1", "main"), ("project2", "main"), ("project3", "main")]
+        )
+
+        mock_pr_service.get_all_prs_indexed.assert_called_once_with(label="claudechain")
+        mock_pr_service.get_open_prs_for_project.assert_not_called()
+        mock_pr_service.get_merged_prs_for_project.assert_not_called()
+        assert report.project_stats["project2"].in_progress_tasks == 1
+        assert report.project_stats["project1"].in_progress_tasks == 0
+        mock_repo.load_all.assert_called_once()
+        mock_repo.load_configuration.assert_not_called()
+        mock_repo.load_spec.assert_not_called()
+
+    @patch("claudechain.services.composite.statistics_service.find_project_artifacts")
+    @patch("claudechain.services.composite.statistics_service.find_artifacts_for_projects")
+    def test_collect_all_uses_single_artifact_listing(self, mock_find_all, mock_find_project):
+        """Should list artifacts once for all projects and pass costs through"""
+        from claudechain.domain.github_models import PullRequestIndex
+        from claudechain.domain.project_configuration import ProjectConfiguration
+        from claudechain.domain.spec_content import SpecContent
+        from claudechain.services.composite.artifact_service import ProjectArtifact
+
+        # Arrange
+        metadata = Mock()
+        metadata.pr_number = 7
+        metadata.get_costs_by_pr.return_value = {7: 1.5}
+        metadata.cache_usage = {}
+        mock_find_all.return_value = {
+            "project1": [ProjectArtifact(artifact_id=1, artifact_name="a", workflow_run_id=1, metadata=metadata)],
+            "project2": [],
+        }
+        mock_pr_service = Mock()
+        mock_pr_service.get_all_prs_indexed.return_value = PullRequestIndex.from_pull_requests([])
+        mock_repo = Mock()
+        mock_repo.load_all.side_effect = lambda projects, branch: {
+            p.name: (ProjectConfiguration.default(p), SpecContent(p, "- [ ] Task A")) for p in projects
+        }
+        service = StatisticsService("owner/repo", mock_repo, mock_pr_service)
+
+        # Act
+        with patch.object(service, "collect_project_stats", wraps=service.collect_project_stats) as mock_collect:
+            service.collect_all_statistics(projects=[("project1", "main"), ("project2", "main")])
+
+        # Assert
+        mock_find_all.assert_called_once_with("owner/repo", ["project1", "project2"], download_metadata=True)
+        mock_find_project.assert_not_called()
+        costs = {call.args[0]: call.kwargs["costs_by_pr"] for call in mock_collect.call_args_list}
+        assert costs == {"project1": {7: 1.5}, "project2": {}}
+
+    @patch("claudechain.services.composite.statistics_service.find_project_artifacts")
+    @patch("claudechain.services.composite.statistics_service.find_artifacts_for_projects")
+    def test_collect_all_does_not_relist_artifacts_per_project(self, mock_find_all, mock_find_project):
+        """Should report projects without costs instead of listing artifacts once per project"""
+        from claudechain.domain.exceptions import GitHubAPIError
+        from claudechain.domain.github_models import PullRequestIndex
+        from claudechain.domain.project_configuration import ProjectConfiguration
+        from claudechain.domain.spec_content import SpecContent
+
+        # Arrange
+        mock_find_all.side_effect = GitHubAPIError("rate limited")
+        mock_pr_service = Mock()
+        mock_pr_service.get_all_prs_indexed.return_value = PullRequestIndex.from_pull_requests([])
+        mock_repo = Mock()
+        mock_repo.load_all.side_effect = lambda projects, branch: {
+            p.name: (ProjectConfiguration.default(p), SpecContent(p, "- [ ] Task A")) for p in projects
+        }
+        service = StatisticsService("owner/repo", mock_repo, mock_pr_service)
+
+        # Act
+        report = service.collect_all_statistics(projects=[("project1", "main"), ("project2", "main")])
+
+        # Assert
+        mock_find_all.assert_called_once()
+        mock_find_project.assert_not_called()
+        assert list(report.project_stats) == ["project1", "project2"]
+        assert report.project_stats["project1"].total_cost_usd == 0
+
+    @patch("claudechain.services.composite.statistics_service.find_artifacts_for_projects")
+    def test_collect_all_keeps_input_order_across_spec_branches(self, mock_find_all):
+        """Should report projects in input order even though loading is batched per branch"""
+        from claudechain.domain.github_models import PullRequestIndex
+        from claudechain.domain.project_configuration import ProjectConfiguration
+        from claudechain.domain.spec_content import SpecContent
+
+        # Arrange
+        mock_find_all.return_value = {}
+        mock_pr_service = Mock()
+        mock_pr_service.get_all_prs_indexed.return_value = PullRequestIndex.from_pull_requests([])
+        mock_repo = Mock()
+        mock_repo.load_all.side_effect = lambda projects, branch: {
+            p.name: (ProjectConfiguration.default(p), SpecContent(p, "- [ ] Task A")) for p in projects
+        }
+        service = StatisticsService("owner/repo", mock_repo, mock_pr_service)
+
+        # Act
+        report = service.collect_all_statistics(
+            projects=[("a", "main"), ("b", "develop"), ("c", "main"), ("d", "develop")]
+        )
+
+        # Assert
+        assert mock_repo.load_all.call_count == 2
+        assert list(report.project_stats) == ["a", "b", "c", "d"]
+
+    @patch("claudechain.services.composite.statistics_service.find_artifacts_for_projects")
+    def test_collect_all_parallel_keeps_order_and_isolates_errors(self, mock_find_all):
+        """Should collect projects concurrently, report them in input order and skip failures"""
+        import threading
+        from claudechain.domain.github_models import PullRequestIndex
+        from claudechain.domain.models import ProjectStats
+        from claudechain.domain.project_configuration import ProjectConfiguration
+
+        # Arrange
+        mock_find_all.return_value = {}
+        mock_pr_service = Mock()
+        mock_pr_service.get_all_prs_indexed.return_value = PullRequestIndex.from_pull_requests([])
+        mock_repo = Mock()
+        mock_repo.load_all.side_effect = lambda projects, branch: {
+            p.name: (ProjectConfiguration.default(p), Mock()) for p in projects
+        }
+        service = StatisticsService("owner/repo", mock_repo, mock_pr_service)
+        names = ["p1", "p2", "broken", "p4"]
+        barrier = threading.Barrier(len(names), timeout=5)
+
+        def fake_collect(project_name, *args, **kwargs):
+            barrier.wait()  # Only passes if every project is in flight at once
+            if project_name == "broken":
+                raise RuntimeError("boom")
+            return ProjectStats(project_name, f"claude-chain/{project_name}/spec.md")
+
+        # Act
+        with patch.object(service, "collect_project_stats", side_effect=fake_collect):
+            report = service.collect_all_statistics(
+                projects=[(name, "main") for name in reversed(names)], max_workers=4
+            )
+
+        # Assert
+        assert list(report.project_stats) == ["p4", "p2", "p1"]
+        assert report.generation_time_seconds is not None
+
     def test_collect_all_single_project(self):
         """Test collecting stats for a single project"""
         config_content = """
@@ -1455,6 +1715,8 @@ assignee: alice
         mock_pr_service.get_open_prs_for_project.return_value = []
         mock_pr_service.get_merged_prs_for_project.return_value = []
         mock_pr_service.get_all_prs.return_value = []
+        from claudechain.domain.github_models import PullRequestIndex
+        mock_pr_service.get_all_prs_indexed.return_value = PullRequestIndex.from_pull_requests([])
 
         # Mock ProjectRepository
         mock_repo = Mock()
@@ -1463,11 +1725,15 @@ assignee: alice
         from claudechain.domain.spec_content import SpecContent
 
         project = Project("project1")
-        mock_repo.load_configuration.return_value = ProjectConfiguration.from_yaml_string(project, config_content)
-        mock_repo.load_spec.return_value = SpecContent(project, spec_content)
+        mock_repo.load_all.return_value = {
+            "project1": (
+                ProjectConfiguration.from_yaml_string(project, config_content),
+                SpecContent(project, spec_content),
+            )
+        }
 
         # Create service and test
-        service = StatisticsService("owner/repo", mock_repo, mock_pr_service, "Claude Chain")
+        service = StatisticsService("owner/repo", mock_repo, mock_pr_service)
 
         # Define projects list (caller now provides this)
         projects = [("project1", "main")]
@@ -1493,7 +1759,7 @@ assignee: alice
         # Create service with empty repo
         mock_repo = Mock()
         mock_pr_service = Mock()
-        service = StatisticsService("", mock_repo, mock_pr_service, "Claude Chain")
+        service = StatisticsService("", mock_repo, mock_pr_service)
         report = service.collect_all_statistics(projects=[("project1", "main")])
 
         assert len(report.project_stats) == 0
@@ -1504,7 +1770,7 @@ assignee: alice
         # Create service
         mock_repo = Mock()
         mock_pr_service = Mock()
-        service = StatisticsService("owner/repo", mock_repo, mock_pr_service, "Claude Chain")
+        service = StatisticsService("owner/repo", mock_repo, mock_pr_service)
         report = service.collect_all_statistics(projects=[])
 
         assert len(report.project_stats) == 0
@@ -1512,19 +1778,51 @@ assignee: alice
 
     def test_collect_all_config_error(self):
         """Test handling of config loading errors"""
-        # Mock ProjectRepository to return None (config not found)
+        # Mock ProjectRepository to leave out the project (invalid config)
         mock_repo = Mock()
-        mock_repo.load_configuration.return_value = None
+        mock_repo.load_all.return_value = {}
 
         # Mock PROperationsService
         mock_pr_service = Mock()
 
         # Create service and test
-        service = StatisticsService("owner/repo", mock_repo, mock_pr_service, "Claude Chain")
+        service = StatisticsService("owner/repo", mock_repo, mock_pr_service)
         report = service.collect_all_statistics(projects=[("nonexistent", "main")])
 
         assert len(report.project_stats) == 0
 
+    @patch("claudechain.services.composite.statistics_service.find_artifacts_for_projects")
+    def test_collect_all_falls_back_to_per_project_load(self, mock_find_all):
+        """Should load projects one by one when the bulk load of their branch fails"""
+        from claudechain.domain.github_models import PullRequestIndex
+        from claudechain.domain.project_configuration import ProjectConfiguration
+        from claudechain.domain.spec_content import SpecContent
+
+        # Arrange
+        mock_find_all.return_value = {"p1": [], "p2": []}
+        mock_pr_service = Mock()
+        mock_pr_service.get_all_prs_indexed.return_value = PullRequestIndex.from_pull_requests([])
+        mock_repo = Mock()
+        mock_repo.load_all.side_effect = Exception("GraphQL batch failed")
+
+        def load_configuration(project, branch):
+            if project.name == "broken":
+                raise Exception("invalid configuration")
+            return ProjectConfiguration.default(project)
+
+        mock_repo.load_configuration.side_effect = load_configuration
+        mock_repo.load_spec.side_effect = lambda project, branch: SpecContent(project, "- [ ] Task A")
+        service = StatisticsService("owner/repo", mock_repo, mock_pr_service)
+
+        # Act
+        report = service.collect_all_statistics(
+            projects=[("p1", "main"), ("broken", "main"), ("p2", "main")]
+        )
+
+        # Assert
+        assert list(report.project_stats) == ["p1", "p2"]
+        assert report.project_stats["p1"].total_tasks == 1
+
 
 class TestGitHubPullRequestStaleness:
     """Tests for GitHubPullRequest days_open and is_stale methods"""
@@ -1688,7 +1986,7 @@ class TestStalePRTracking:
         mock_repo.load_spec.return_value = SpecContent(project, spec_content)
 
         # Create service and test with 7-day stale threshold
-        service = StatisticsService("owner/repo", mock_repo, mock_pr_service, "Claude Chain")
+        service = StatisticsService("owner/repo", mock_repo, mock_pr_service)
         stats = service.collect_project_stats("test-project", "main", "claudechain", stale_pr_days=7)
 
         # Assert
@@ -1735,7 +2033,7 @@ class TestStalePRTracking:
         project = Project("test-project")
         mock_repo.load_spec.return_value = SpecContent(project, spec_content)
 
-        service = StatisticsService("owner/repo", mock_repo, mock_pr_service, "Claude Chain")
+        service = StatisticsService("owner/repo", mock_repo, mock_pr_service)
 
         # With 7-day threshold: not stale
         stats_7 = service.collect_project_stats("test-project", "main", "claudechain", stale_pr_days=7)
@@ -1763,7 +2061,7 @@ class TestStalePRTracking:
         project = Project("test-project")
         mock_repo.load_spec.return_value = SpecContent(project, spec_content)
 
-        service = StatisticsService("owner/repo", mock_repo, mock_pr_service, "Claude Chain")
+        service = StatisticsService("owner/repo", mock_repo, mock_pr_service)
         stats = service.collect_project_stats("test-project", "main", "claudechain")
 
         assert len(stats.open_prs) == 0
@@ -1806,7 +2104,7 @@ class TestTaskPRMappings:
         mock_repo.load_spec.return_value = spec
 
         # Collect stats
-        service = StatisticsService("owner/repo", mock_repo, mock_pr_service, "Claude Chain")
+        service = StatisticsService("owner/repo", mock_repo, mock_pr_service)
         stats = service.collect_project_stats("test-project", "main", "claudechain")
 
         # Assert
@@ -1847,7 +2145,7 @@ class TestTaskPRMappings:
         mock_repo.load_spec.return_value = spec
 
         # Collect stats
-        service = StatisticsService("owner/repo", mock_repo, mock_pr_service, "Claude Chain")
+        service = StatisticsService("owner/repo", mock_repo, mock_pr_service)
         stats = service.collect_project_stats("test-project", "main", "claudechain")
 
         # Assert
@@ -1874,7 +2172,7 @@ class TestTaskPRMappings:
         mock_repo.load_spec.return_value = spec
 
         # Collect stats
-        service = StatisticsService("owner/repo", mock_repo, mock_pr_service, "Claude Chain")
+        service = StatisticsService("owner/repo", mock_repo, mock_pr_service)
         stats = service.collect_project_stats("test-project", "main", "claudechain")
 
         # Assert
@@ -1913,7 +2211,7 @@ class TestTaskPRMappings:
         mock_repo.load_spec.return_value = spec
 
         # Collect stats
-        service = StatisticsService("owner/repo", mock_repo, mock_pr_service, "Claude Chain")
+        service = StatisticsService("owner/repo", mock_repo, mock_pr_service)
         stats = service.collect_project_stats("test-project", "main", "claudechain")
 
         # Assert - task A has no PR, orphaned PR detected
@@ -1984,7 +2282,7 @@ class TestTaskPRMappings:
         mock_repo.load_spec.return_value = spec
 
         # Collect stats
-        service = StatisticsService("owner/repo", mock_repo, mock_pr_service, "Claude Chain")
+        service = StatisticsService("owner/repo", mock_repo, mock_pr_service)
         stats = service.collect_project_stats("test-project", "main", "claudechain")
 
         # Assert task statuses
@@ -2026,7 +2324,7 @@ class TestTaskPRMappings:
         mock_repo.load_spec.return_value = spec
 
         # Collect stats
-        service = StatisticsService("owner/repo", mock_repo, mock_pr_service, "Claude Chain")
+        service = StatisticsService("owner/repo", mock_repo, mock_pr_service)
         stats = service.collect_project_stats("test-project", "main", "claudechain")
 
         # Assert - status comes from spec checkbox, not PR
@@ -2065,7 +2363,7 @@ class TestTaskPRMappings:
         mock_repo.load_spec.return_value = spec
 
         # Collect stats
-        service = StatisticsService("owner/repo", mock_repo, mock_pr_service, "Claude Chain")
+        service = StatisticsService("owner/repo", mock_repo, mock_pr_service)
         stats = service.collect_project_stats("test-project", "main", "claudechain")
 
         # Assert - PR has no task hash, so it's not tracked as orphaned
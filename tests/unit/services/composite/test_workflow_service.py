@@ -0,0 +1,143 @@
+"""Tests for workflow dispatch"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from claudechain.domain.exceptions import GitHubAPIError
+from claudechain.infrastructure.github.rate_limiter import RateLimiter
+from claudechain.services.composite.workflow_service import (
+    DEFAULT_DISPATCH_CONCURRENCY,
+    WorkflowService,
+)
+
+
+class FakeClock:
+    """Clock advanced by the limiter's sleep calls"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTriggerClaudechainWorkflow:
+    """Test suite for dispatching a single workflow"""
+
+    @patch("claudechain.services.composite.workflow_service.run_gh_command")
+    def test_runs_workflow_with_inputs(self, mock_run):
+        """Should dispatch claudechain.yml with the project inputs"""
+        # Act
+        WorkflowService().trigger_claudechain_workflow("my-project", "main", "abc123")
+
+        # Assert
+        mock_run.assert_called_once_with([
+            "workflow", "run", "claudechain.yml",
+            "-f", "project_name=my-project",
+            "-f", "base_branch=main",
+            "-f", "checkout_ref=abc123",
+        ])
+
+    @patch("claudechain.services.composite.workflow_service.run_gh_command")
+    def test_wraps_failure_with_project_name(self, mock_run):
+        """Should raise GitHubAPIError naming the project"""
+        # Arrange
+        mock_run.side_effect = GitHubAPIError("HTTP 422")
+
+        # Act / Assert
+        with pytest.raises(GitHubAPIError, match="Failed to trigger workflow for project 'my-project'"):
+            WorkflowService().trigger_claudechain_workflow("my-project", "main", "main")
+
+
+class TestBatchTriggerClaudechainWorkflows:
+    """Test suite for concurrent, budgeted batch dispatch"""
+
+    @patch("claudechain.services.composite.workflow_service.run_gh_command")
+    def test_reports_results_in_project_order(self, mock_run, capsys):
+        """Should collect successes and failures per project in input order"""
+        # Arrange
+        def run(args):
+            if "project_name=project-b" in args:
+                raise GitHubAPIError("HTTP 500")
+
+        mock_run.side_effect = run
+        projects = ["project-a", "project-b", "project-c", "project-d"]
+
+        # Act
+        successful, failed = WorkflowService().batch_trigger_claudechain_workflows(projects, "main", "main")
+
+        # Assert
+        assert successful == ["project-a", "project-c", "project-d"]
+        assert failed == ["project-b"]
+        output = capsys.readouterr().out
+        assert output.index("project: project-a") < output.index("project 'project-b'") < output.index("project: project-d")
+
+    @patch("claudechain.services.composite.workflow_service.run_gh_command")
+    def test_dispatches_concurrently_up_to_max_workers(self, mock_run):
+        """Should keep at most max_workers dispatches in flight"""
+        # Arrange
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def run(args):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.05)
+            with lock:
+                state["active"] -= 1
+
+        mock_run.side_effect = run
+        limiter = RateLimiter(rate_per_second=1000, burst=100, max_retries=0)
+        service = WorkflowService(max_workers=3, dispatch_limiter=limiter)
+
+        # Act
+        successful, failed = service.batch_trigger_claudechain_workflows(
+            [f"project-{i}" for i in range(9)], "main", "main"
+        )
+
+        # Assert
+        assert len(successful) == 9 and failed == []
+        assert state["peak"] == 3
+
+    @patch("claudechain.services.composite.workflow_service.run_gh_command")
+    def test_dispatches_wait_for_budget(self, mock_run):
+        """Should start dispatches beyond the burst only as the budget refills"""
+        # Arrange
+        clock = FakeClock()
+        limiter = RateLimiter(rate_per_second=1.0, burst=2, max_retries=0, sleep=clock.sleep, clock=clock)
+        service = WorkflowService(max_workers=1, dispatch_limiter=limiter)
+
+        # Act
+        successful, _ = service.batch_trigger_claudechain_workflows(
+            ["project-a", "project-b", "project-c", "project-d"], "main", "main"
+        )
+
+        # Assert - two dispatches fit the burst, the other two wait a second each
+        assert len(successful) == 4
+        assert clock.now == pytest.approx(2.0)
+        assert limiter.budget.requests == 4
+
+    @patch("claudechain.services.composite.workflow_service.run_gh_command")
+    def test_empty_batch_dispatches_nothing(self, mock_run):
+        """Should return empty results without starting a pool"""
+        assert WorkflowService().batch_trigger_claudechain_workflows([], "main", "main") == ([], [])
+        mock_run.assert_not_called()
+
+    def test_default_budget(self):
+        """Should default to the dispatch concurrency with a matching burst"""
+        # Act
+        service = WorkflowService()
+
+        # Assert
+        assert service.max_workers == DEFAULT_DISPATCH_CONCURRENCY
+        assert service.dispatch_limiter.burst == DEFAULT_DISPATCH_CONCURRENCY
+        assert service.dispatch_limiter.rate == pytest.approx(1.0)
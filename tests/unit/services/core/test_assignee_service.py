@@ -105,6 +105,43 @@ class TestCheckCapacity:
         assert result.has_capacity is False
         assert result.open_count == 1
 
+    def test_check_capacity_allows_up_to_max_open_prs(
+        self, assignee_service, mock_pr_service
+    ):
+        """Should have capacity while open PRs are below the configured maxOpenPRs"""
+        # Arrange
+        config = ProjectConfiguration(project=Project("test-project"), max_open_prs=3)
+        mock_pr_service.get_open_prs_for_project.return_value = [
+            create_github_pr(101, "00000001"),
+            create_github_pr(102, "00000002"),
+        ]
+
+        # Act
+        result = assignee_service.check_capacity(config, "claudechain", "myproject")
+
+        # Assert
+        assert result.has_capacity is True
+        assert result.max_open_prs == 3
+        assert result.available_slots == 1
+
+    def test_check_capacity_at_max_open_prs(
+        self, assignee_service, mock_pr_service
+    ):
+        """Should have no capacity once open PRs reach maxOpenPRs"""
+        # Arrange
+        config = ProjectConfiguration(project=Project("test-project"), max_open_prs=2)
+        mock_pr_service.get_open_prs_for_project.return_value = [
+            create_github_pr(101, "00000001"),
+            create_github_pr(102, "00000002"),
+        ]
+
+        # Act
+        result = assignee_service.check_capacity(config, "claudechain", "myproject")
+
+        # Assert
+        assert result.has_capacity is False
+        assert result.available_slots == 0
+
     def test_check_capacity_returns_assignee_from_config(
         self, config_with_assignee, assignee_service, mock_pr_service
     ):
@@ -186,6 +223,23 @@ class TestCheckCapacity:
         # Assert
         assert result.project_name == "test-project"
 
+    def test_check_capacity_uses_prefetched_open_prs(
+        self, config_with_assignee, assignee_service, mock_pr_service
+    ):
+        """Should count pre-fetched open PRs without querying GitHub"""
+        # Arrange
+        open_prs = [create_github_pr(301, "00000007")]
+
+        # Act
+        result = assignee_service.check_capacity(
+            config_with_assignee, "claudechain", "myproject", open_prs=open_prs
+        )
+
+        # Assert
+        assert result.has_capacity is False
+        assert result.open_prs[0]["pr_number"] == 301
+        mock_pr_service.get_open_prs_for_project.assert_not_called()
+
 
 class TestCapacityResultFormatSummary:
     """Test suite for CapacityResult.format_summary()"""
@@ -239,3 +293,20 @@ class TestCapacityResultFormatSummary:
         summary = result.format_summary()
 
         assert "without assignee" in summary
+
+    def test_format_summary_shows_configured_limit(self):
+        """Should show the project's maxOpenPRs in the summary"""
+        from claudechain.domain.models import CapacityResult
+
+        result = CapacityResult(
+            has_capacity=True,
+            assignee=None,
+            open_prs=[{"pr_number": 1, "task_description": "Some task"}],
+            project_name="test-project",
+            max_open_prs=3
+        )
+
+        summary = result.format_summary()
+
+        assert "**Max PRs Allowed:** 3" in summary
+        assert "**Currently Open:** 1/3" in summary
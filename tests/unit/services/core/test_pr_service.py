@@ -7,6 +7,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from claudechain.domain.github_models import GitHubPullRequest
+from claudechain.infrastructure.cache.pr_snapshot import SYNC_OVERLAP, PullRequestSnapshotStore
 from claudechain.services.core.pr_service import PRService
 
 
@@ -404,6 +405,80 @@ class TestGetOpenPrsForProject:
         assert result == []
 
 
+class TestGetOpenPrsByProject:
+    """Tests for fetching open PRs once for many projects"""
+
+    @staticmethod
+    def _pr(number: int, branch: str) -> GitHubPullRequest:
+        return GitHubPullRequest(
+            number=number,
+            state="open",
+            head_ref_name=branch,
+            title=f"PR {number}",
+            labels=["claudechain"],
+            assignees=[],
+            created_at=datetime.now(timezone.utc),
+            merged_at=None,
+        )
+
+    @patch("claudechain.services.core.pr_service.list_pull_requests")
+    @patch("claudechain.services.core.pr_service.list_all_pull_requests")
+    def test_fetches_once_and_partitions_by_project(self, mock_list_all, mock_list_prs):
+        """Should issue one listing and serve later per-project queries from it"""
+        # Arrange
+        mock_list_all.return_value = [
+            self._pr(1, "claude-chain-auth-a3f2b891"),
+            self._pr(2, "claude-chain-api-b4c3d2e1"),
+            self._pr(3, "claude-chain-auth-c5d4e3f2"),
+            self._pr(4, "feature/unrelated"),
+        ]
+        service = PRService("owner/repo")
+
+        # Act
+        result = service.get_open_prs_by_project(["auth", "api", "docs"])
+        api_prs = service.get_open_prs_for_project("api")
+
+        # Assert
+        assert [pr.number for pr in result["auth"]] == [1, 3]
+        assert [pr.number for pr in result["api"]] == [2]
+        assert result["docs"] == []
+        assert [pr.number for pr in api_prs] == [2]
+        mock_list_all.assert_called_once_with(repo="owner/repo", label="claudechain", state="open")
+        mock_list_prs.assert_not_called()
+        assert service.fetch_count == 1
+
+    @patch("claudechain.services.core.pr_service.list_all_pull_requests")
+    def test_reuses_existing_snapshot(self, mock_list_all):
+        """Should not fetch again when the open listing is already snapshotted"""
+        # Arrange
+        mock_list_all.return_value = [self._pr(5, "claude-chain-auth-a3f2b891")]
+        service = PRService("owner/repo")
+        service.get_open_prs_by_project(["auth"])
+
+        # Act
+        result = service.get_open_prs_by_project(["auth"])
+
+        # Assert
+        assert [pr.number for pr in result["auth"]] == [5]
+        mock_list_all.assert_called_once()
+
+    def test_partition_matches_branch_prefix(self):
+        """Should assign PRs the same way get_project_prs filters them"""
+        # Arrange
+        prs = [
+            self._pr(1, "claude-chain-auth-a3f2b891"),
+            self._pr(2, "claude-chain-auth-v2-b4c3d2e1"),
+            self._pr(3, ""),
+        ]
+
+        # Act
+        result = PRService.partition_by_project(prs, ["auth", "auth-v2"])
+
+        # Assert
+        assert [pr.number for pr in result["auth"]] == [1, 2]
+        assert [pr.number for pr in result["auth-v2"]] == [2]
+
+
 class TestGetAllPrs:
     """Tests for get_all_prs method"""
 
@@ -520,6 +595,220 @@ class TestGetAllPrs:
         assert all(isinstance(pr, GitHubPullRequest) for pr in result)
 
 
+class TestGetAllPrsIndexed:
+    """Tests for get_all_prs_indexed method"""
+
+    @patch("claudechain.services.core.pr_service.list_all_pull_requests")
+    def test_fetches_once_and_indexes_by_project(self, mock_list_all):
+        """Should fetch all labeled PRs in one paginated call and index them"""
+        mock_list_all.return_value = [
+            GitHubPullRequest(
+                number=1,
+                state="open",
+                head_ref_name="claude-chain-my-refactor-a3f2b891",
+                title="Task 1",
+                labels=[],
+                assignees=[],
+                created_at=datetime.now(timezone.utc),
+                merged_at=None,
+            ),
+            GitHubPullRequest(
+                number=2,
+                state="merged",
+                head_ref_name="claude-chain-other-f7c4d3e2",
+                title="Task 2",
+                labels=[],
+                assignees=[],
+                created_at=datetime.now(timezone.utc),
+                merged_at=datetime.now(timezone.utc),
+            ),
+        ]
+
+        service = PRService("owner/repo")
+        index = service.get_all_prs_indexed(label="custom-label")
+
+        mock_list_all.assert_called_once_with(repo="owner/repo", label="custom-label", state="all")
+        assert index.project_names == ["my-refactor", "other"]
+        assert index.get_open_prs("my-refactor")[0].number == 1
+        assert index.get_task_prs("other", "f7c4d3e2")[0].number == 2
+
+
+class TestGetAllPrsIndexedWithSnapshotStore:
+    """Tests for incremental PR syncs through a persisted snapshot"""
+
+    @staticmethod
+    def _pr(number, state="open", updated_day=1):
+        return GitHubPullRequest(
+            number=number,
+            state=state,
+            head_ref_name=f"claude-chain-my-refactor-a3f2b89{number}",
+            title=f"Task {number}",
+            labels=["claudechain"],
+            assignees=[],
+            created_at=datetime(2024, 1, number, tzinfo=timezone.utc),
+            merged_at=None,
+            updated_at=datetime(2024, 3, updated_day, tzinfo=timezone.utc),
+        )
+
+    @patch("claudechain.services.core.pr_service.list_pull_requests_updated_since")
+    @patch("claudechain.services.core.pr_service.list_all_pull_requests")
+    def test_cold_run_lists_everything_and_saves_snapshot(self, mock_list_all, mock_updated, tmp_path):
+        """Should do a full listing when no snapshot exists yet"""
+        # Arrange
+        store = PullRequestSnapshotStore(tmp_path)
+        mock_list_all.return_value = [self._pr(1), self._pr(2, updated_day=5)]
+        service = PRService("owner/repo", snapshot_store=store)
+
+        # Act
+        index = service.get_all_prs_indexed()
+
+        # Assert
+        mock_list_all.assert_called_once_with(repo="owner/repo", label="claudechain", state="all")
+        mock_updated.assert_not_called()
+        assert len(index) == 2
+        snapshot = store.load("owner/repo", "claudechain")
+        assert snapshot.synced_at == datetime(2024, 3, 5, tzinfo=timezone.utc)
+
+    @patch("claudechain.services.core.pr_service.list_pull_requests_updated_since")
+    @patch("claudechain.services.core.pr_service.list_all_pull_requests")
+    def test_warm_run_fetches_only_updated_prs_and_merges(self, mock_list_all, mock_updated, tmp_path):
+        """Should fetch PRs updated since the last sync and merge them by number"""
+        # Arrange
+        store = PullRequestSnapshotStore(tmp_path)
+        mock_list_all.return_value = [self._pr(1), self._pr(2, updated_day=5)]
+        PRService("owner/repo", snapshot_store=store).get_all_prs_indexed()
+        mock_list_all.reset_mock()
+        mock_updated.return_value = [self._pr(2, state="merged", updated_day=9), self._pr(3, updated_day=8)]
+
+        # Act
+        index = PRService("owner/repo", snapshot_store=store).get_all_prs_indexed()
+
+        # Assert
+        mock_list_all.assert_not_called()
+        mock_updated.assert_called_once_with(
+            "owner/repo", None, datetime(2024, 3, 5, tzinfo=timezone.utc) - SYNC_OVERLAP
+        )
+        assert len(index) == 3
+        assert [pr.number for pr in index.get_open_prs("my-refactor")] == [3, 1]
+        assert store.load("owner/repo", "claudechain").synced_at == datetime(2024, 3, 9, tzinfo=timezone.utc)
+
+    @patch("claudechain.services.core.pr_service.list_pull_requests_updated_since")
+    @patch("claudechain.services.core.pr_service.list_all_pull_requests")
+    def test_warm_run_drops_prs_whose_label_was_removed(self, mock_list_all, mock_updated, tmp_path):
+        """Should remove a PR from the snapshot once it no longer carries the label"""
+        # Arrange
+        store = PullRequestSnapshotStore(tmp_path)
+        mock_list_all.return_value = [self._pr(1), self._pr(2, updated_day=5)]
+        PRService("owner/repo", snapshot_store=store).get_all_prs_indexed()
+        unlabeled = self._pr(2, updated_day=9)
+        unlabeled.labels = []
+        mock_updated.return_value = [unlabeled]
+
+        # Act
+        index = PRService("owner/repo", snapshot_store=store).get_all_prs_indexed()
+
+        # Assert
+        assert [pr.number for pr in index.get_open_prs("my-refactor")] == [1]
+        assert [pr.number for pr in store.load("owner/repo", "claudechain").pull_requests] == [1]
+
+
+class TestPrSnapshot:
+    """Tests for the per-invocation PR snapshot"""
+
+    @staticmethod
+    def _open_pr(number, project):
+        return GitHubPullRequest(
+            number=number,
+            state="open",
+            head_ref_name=f"claude-chain-{project}-a3f2b89{number}",
+            title=f"Task {number}",
+            labels=[],
+            assignees=[],
+            created_at=datetime.now(timezone.utc),
+            merged_at=None,
+        )
+
+    @patch("claudechain.services.core.pr_service.list_pull_requests")
+    def test_repeated_reads_fetch_once(self, mock_list):
+        """Should serve repeated open-PR reads from one fetch and count the savings"""
+        # Arrange
+        mock_list.return_value = [self._open_pr(1, "my-refactor"), self._open_pr(2, "other")]
+        service = PRService("owner/repo")
+
+        # Act
+        first = service.get_open_prs_for_project("my-refactor")
+        second = service.get_open_prs_for_project("my-refactor")
+        other = service.get_open_prs_for_project("other")
+
+        # Assert
+        mock_list.assert_called_once()
+        assert [pr.number for pr in first] == [pr.number for pr in second] == [1]
+        assert [pr.number for pr in other] == [2]
+        assert service.fetch_count == 1
+        assert service.fetches_saved == 2
+
+    @patch("claudechain.services.core.pr_service.list_pull_requests")
+    def test_snapshot_is_keyed_by_state_and_label(self, mock_list):
+        """Should fetch separately for different states or labels"""
+        # Arrange
+        mock_list.return_value = []
+        service = PRService("owner/repo")
+
+        # Act
+        service.get_project_prs("p", state="open")
+        service.get_project_prs("p", state="merged")
+        service.get_project_prs("p", state="open", label="other")
+
+        # Assert
+        assert mock_list.call_count == 3
+
+    @patch("claudechain.services.core.pr_service.list_pull_requests")
+    def test_failed_fetch_is_not_snapshotted(self, mock_list):
+        """Should retry the fetch after an API error"""
+        # Arrange
+        from claudechain.domain.exceptions import GitHubAPIError
+
+        mock_list.side_effect = [GitHubAPIError("boom"), [self._open_pr(1, "p")]]
+        service = PRService("owner/repo")
+
+        # Act
+        first = service.get_open_prs_for_project("p")
+        second = service.get_open_prs_for_project("p")
+
+        # Assert
+        assert first == []
+        assert [pr.number for pr in second] == [1]
+
+    @patch("claudechain.services.core.pr_service.list_pull_requests")
+    def test_concurrent_reads_share_one_fetch(self, mock_list):
+        """Should let concurrent callers wait for the in-flight fetch"""
+        # Arrange
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_list(**kwargs):
+            started.set()
+            release.wait(timeout=5)
+            return [self._open_pr(1, "p")]
+
+        mock_list.side_effect = slow_list
+        service = PRService("owner/repo")
+
+        # Act
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(service.get_open_prs_for_project, "p") for _ in range(4)]
+            started.wait(timeout=5)
+            release.set()
+            results = [f.result() for f in futures]
+
+        # Assert
+        mock_list.assert_called_once()
+        assert all([pr.number for pr in r] == [1] for r in results)
+
+
 class TestGetUniqueProjects:
     """Tests for get_unique_projects method
 
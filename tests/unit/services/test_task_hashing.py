@@ -7,6 +7,7 @@ from datetime import datetime, timezone
 from claudechain.domain.project import Project
 from claudechain.domain.spec_content import SpecTask, SpecContent, generate_task_hash
 from claudechain.domain.github_models import GitHubPullRequest
+from claudechain.infrastructure.filesystem.operations import write_file_atomic
 from claudechain.services.core.task_service import TaskService
 
 
@@ -327,3 +328,125 @@ class TestGetInProgressTasks:
         assert hashes == {hash_1, hash_2}
 
 
+
+
+class TestFindNextAvailableTask:
+    """Test suite for TaskService.find_next_available_task"""
+
+    def test_skips_in_progress_tasks_and_reports_them(self, capsys):
+        """Should return the first pending task not in progress and log the skipped ones"""
+        # Arrange
+        spec = SpecContent(Project("my-project"), "- [x] Done\n- [ ] Busy\n- [ ] Next\n- [ ] Later")
+        busy_hash = generate_task_hash("Busy")
+        service = TaskService("owner/repo", MagicMock())
+
+        # Act
+        result = service.find_next_available_task(spec, {busy_hash})
+
+        # Assert
+        assert result == (3, "Next", generate_task_hash("Next"))
+        assert f"Skipping task 2 (already in progress - hash {busy_hash[:6]}...)" in capsys.readouterr().out
+
+    def test_returns_none_without_logging_when_everything_is_taken(self, capsys):
+        """Should return None and print nothing when no task is available"""
+        # Arrange
+        spec = SpecContent(Project("my-project"), "- [x] Done\n- [ ] Busy")
+        service = TaskService("owner/repo", MagicMock())
+
+        # Act
+        result = service.find_next_available_task(spec, {generate_task_hash("Busy")})
+
+        # Assert
+        assert result is None
+        assert capsys.readouterr().out == ""
+
+
+
+class TestFindReadyTasks:
+    """Test suite for TaskService.find_ready_tasks"""
+
+    def test_find_ready_tasks_returns_independent_tasks_up_to_limit(self):
+        """Should return ready tasks from independent groups, capped by limit"""
+        # Arrange
+        spec = SpecContent(
+            Project("my-project"),
+            "- [ ] Core 1\n- [ ] Docs 1 <!-- group: docs -->\n- [ ] Tests 1 <!-- group: tests -->\n",
+        )
+        service = TaskService("owner/repo", MagicMock())
+
+        # Act
+        ready = service.find_ready_tasks(spec, {generate_task_hash("Core 1")}, limit=1)
+
+        # Assert
+        assert [task.description for task in ready] == ["Docs 1"]
+
+    def test_find_ready_tasks_matches_next_available_task_without_annotations(self):
+        """Should pick the same task as find_next_available_task for a plain spec"""
+        # Arrange
+        spec = SpecContent(Project("my-project"), "- [x] Task 1\n- [ ] Task 2\n- [ ] Task 3\n")
+        service = TaskService("owner/repo", MagicMock())
+
+        # Act
+        ready = service.find_ready_tasks(spec, set(), limit=1)
+
+        # Assert
+        assert [(t.index, t.description, t.task_hash) for t in ready] == [
+            service.find_next_available_task(spec, set())
+        ]
+
+
+class TestMarkTasksComplete:
+    """Test suite for TaskService.mark_tasks_complete"""
+
+    def test_mark_tasks_complete_updates_spec_in_one_write(self, tmp_path):
+        """Should check off all requested tasks with a single atomic write"""
+        # Arrange
+        spec_file = tmp_path / "my-project" / "spec.md"
+        spec_file.parent.mkdir()
+        spec_file.write_bytes(b"- [ ] Task 1\r\n- [ ] Task 2\r\n- [ ] Task 3\r\n")
+        hashes = [generate_task_hash("Task 1"), generate_task_hash("Task 3")]
+
+        # Act
+        with patch(
+            "claudechain.services.core.task_service.write_file_atomic",
+            wraps=write_file_atomic,
+        ) as mock_write:
+            completed = TaskService.mark_tasks_complete(str(spec_file), hashes)
+
+        # Assert
+        assert [task.description for task in completed] == ["Task 1", "Task 3"]
+        assert spec_file.read_bytes() == b"- [x] Task 1\r\n- [ ] Task 2\r\n- [x] Task 3\r\n"
+        mock_write.assert_called_once()
+
+    def test_mark_tasks_complete_skips_write_when_nothing_matches(self, tmp_path):
+        """Should leave the file untouched when no pending task matches"""
+        # Arrange
+        spec_file = tmp_path / "spec.md"
+        spec_file.write_text("- [x] Task 1\n")
+
+        # Act
+        with patch("claudechain.services.core.task_service.write_file_atomic") as mock_write:
+            completed = TaskService.mark_tasks_complete(str(spec_file), [generate_task_hash("Task 1")])
+
+        # Assert
+        assert completed == []
+        mock_write.assert_not_called()
+
+    def test_mark_tasks_complete_missing_file_raises(self, tmp_path):
+        """Should raise the domain FileNotFoundError for a missing spec"""
+        from claudechain.domain.exceptions import FileNotFoundError as SpecNotFoundError
+
+        with pytest.raises(SpecNotFoundError):
+            TaskService.mark_tasks_complete(str(tmp_path / "spec.md"), ["00000000"])
+
+    def test_mark_task_complete_matches_exact_description(self, tmp_path):
+        """Should complete the task with the exact description, not a prefix match"""
+        # Arrange
+        spec_file = tmp_path / "spec.md"
+        spec_file.write_text("- [ ] Fix $1 (regex) bug later\n- [ ] Fix $1 (regex) bug\n")
+
+        # Act
+        TaskService.mark_task_complete(str(spec_file), "Fix $1 (regex) bug")
+
+        # Assert
+        assert spec_file.read_text() == "- [ ] Fix $1 (regex) bug later\n- [x] Fix $1 (regex) bug\n"